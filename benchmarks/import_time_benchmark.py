@@ -0,0 +1,51 @@
+"""Measure the time it takes to import stellar_sdk, and to import it and use
+a few common names, in fresh interpreters.
+
+``tests/test_init.py`` checks that ``import stellar_sdk`` does not load the
+HTTP clients and the XDR tables.
+
+Usage::
+
+    python benchmarks/import_time_benchmark.py [runs]
+"""
+
+import subprocess
+import sys
+
+CASES = (
+    ("import stellar_sdk", "import stellar_sdk"),
+    ("from stellar_sdk import Keypair", "from stellar_sdk import Keypair"),
+    (
+        "from stellar_sdk import Server, TransactionBuilder",
+        "from stellar_sdk import Server, TransactionBuilder",
+    ),
+    ("from stellar_sdk import *", "from stellar_sdk import *"),
+)
+
+TIMER = (
+    "import time; start = time.perf_counter(); {}; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def measure(statement, runs):
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement)],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+        timings.append(float(out))
+    return min(timings)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for label, statement in CASES:
+        print("{:<55} {:8.2f} ms".format(label, measure(statement, runs) * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Compare SignatureVerifier with the previous SEP-10 signature check, which
+tried every signer against every signature.
+
+Usage::
+
+    python benchmarks/sep10_verification_benchmark.py [signers] [envelopes]
+"""
+import sys
+import timeit
+
+from stellar_sdk import Keypair, Network
+from stellar_sdk.exceptions import BadSignatureError
+from stellar_sdk.operation import BumpSequence
+from stellar_sdk.sep.ed25519_public_key_signer import Ed25519PublicKeySigner
+from stellar_sdk.sep.signature_verifier import SignatureVerifier
+from stellar_sdk.transaction import Transaction
+from stellar_sdk.transaction_envelope import TransactionEnvelope
+
+
+def legacy_verify(transaction_envelope, signers):
+    tx_hash = transaction_envelope.hash()
+    signers_found = []
+    signature_used = set()
+    for signer in signers:
+        kp = Keypair.from_public_key(signer.account_id)
+        for index, decorated_signature in enumerate(transaction_envelope.signatures):
+            if index in signature_used:
+                continue
+            if decorated_signature.hint != kp.signature_hint():
+                continue
+            try:
+                kp.verify(tx_hash, decorated_signature.signature)
+                signature_used.add(index)
+                signers_found.append(signer)
+                break
+            except BadSignatureError:
+                pass
+    return signers_found
+
+
+def main(signer_count=20, envelope_count=200):
+    keypairs = [Keypair.random() for _ in range(signer_count)]
+    signers = [Ed25519PublicKeySigner(kp.public_key, 1) for kp in keypairs]
+    envelopes = []
+    for i in range(envelope_count):
+        tx = Transaction(keypairs[0], i, 100, [BumpSequence(0)], v1=True)
+        te = TransactionEnvelope(tx, Network.TESTNET_NETWORK_PASSPHRASE)
+        # half of the signers sign, the others do not
+        for kp in keypairs[::2]:
+            te.sign(kp)
+        envelopes.append(te)
+
+    verifier = SignatureVerifier(signers)
+    assert verifier.verify_many(envelopes) == [
+        legacy_verify(te, signers) for te in envelopes
+    ]
+
+    legacy = min(
+        timeit.repeat(
+            lambda: [legacy_verify(te, signers) for te in envelopes],
+            number=1,
+            repeat=3,
+        )
+    )
+    batch = min(
+        timeit.repeat(
+            lambda: SignatureVerifier(signers).verify_many(envelopes),
+            number=1,
+            repeat=3,
+        )
+    )
+    print(
+        "%d envelopes, %d signers, %d signatures each"
+        % (envelope_count, signer_count, len(envelopes[0].signatures))
+    )
+    print("legacy:   %8.2f ms" % (legacy * 1e3))
+    print("verifier: %8.2f ms" % (batch * 1e3))
+    print("speedup:  %8.2fx" % (legacy / batch))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
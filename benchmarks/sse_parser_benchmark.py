@@ -0,0 +1,105 @@
+"""Measure the throughput of the SSE parser on a replayed event log.
+
+The log is the raw body of a Horizon stream, ex. captured with
+``curl -H "Accept: text/event-stream" "https://horizon.stellar.org/operations?cursor=now" > operations.log``.
+Without a log, a stream of synthetic operation events is generated.
+
+The parser is compared with a line based parser working like ``sseclient``,
+which the sync client used before: decode every chunk, find the end of the
+event with a regular expression and split it in lines.
+
+Usage::
+
+    python benchmarks/sse_parser_benchmark.py [log] [chunk_size]
+"""
+import json
+import re
+import sys
+import time
+
+from stellar_sdk.client.sse import SSEParser
+
+
+def synthetic_log(events=20000):
+    parts = [b'retry: 1000\nevent: open\ndata: "hello"\n\n']
+    for i in range(events):
+        paging_token = "%d-%d" % (123456789 + i // 50, i % 50 + 1)
+        record = {
+            "_links": {"self": {"href": "https://horizon.stellar.org/operations/%d" % i}},
+            "id": str(i),
+            "paging_token": paging_token,
+            "transaction_successful": True,
+            "source_account": "GAAZI4TCR3TY5OJHCTJC2A4QSY6CJWJH5IAJTGKIN2ER7LBNVKOCCWN7",
+            "type": "payment",
+            "type_i": 1,
+            "created_at": "2020-01-01T00:00:00Z",
+            "transaction_hash": "%064x" % i,
+            "asset_type": "native",
+            "from": "GAAZI4TCR3TY5OJHCTJC2A4QSY6CJWJH5IAJTGKIN2ER7LBNVKOCCWN7",
+            "to": "GBRPYHIL2CI3FNQ4BXLFMNDLFJUNPU2HY3ZMFSHONUCEOASW7QC7OX2H",
+            "amount": "%d.0000000" % i,
+        }
+        parts.append(
+            b"id: %s\ndata: %s\n\n"
+            % (paging_token.encode(), json.dumps(record).encode())
+        )
+    parts.append(b'event: close\ndata: "byebye"\n\n')
+    return b"".join(parts)
+
+
+_end_of_event = re.compile(r"\r\n\r\n|\r\r|\n\n")
+_field = re.compile(r"(?P<name>[^:]*):?( ?(?P<value>.*))?")
+
+
+def line_parser(chunks):
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk.decode("utf-8")
+        while _end_of_event.search(buffer):
+            head, buffer = _end_of_event.split(buffer, maxsplit=1)
+            data = []
+            for line in head.splitlines():
+                match = _field.match(line)
+                if match.group("name") == "data":
+                    data.append(match.group("value"))
+            data = "\n".join(data)
+            if data and data != '"hello"' and data != '"byebye"':
+                yield data
+
+
+def sse_parser(chunks):
+    parser = SSEParser()
+    for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event.data
+
+
+def bench(parse, chunks, size):
+    start = time.perf_counter()
+    count = sum(1 for _ in parse(chunks))
+    elapsed = time.perf_counter() - start
+    return count, size / elapsed / 1024 / 1024, count / elapsed
+
+
+def main(path=None, chunk_size=65536):
+    if path is None:
+        log = synthetic_log()
+    else:
+        with open(path, "rb") as f:
+            log = f.read()
+    chunk_size = int(chunk_size)
+    for name, parse, size in (
+        ("sseclient-like (1 KiB)", line_parser, 1024),
+        ("SSEParser (1 KiB)", sse_parser, 1024),
+        ("SSEParser (%d KiB)" % (chunk_size // 1024), sse_parser, chunk_size),
+    ):
+        chunks = [log[i : i + size] for i in range(0, len(log), size)]
+        count, mb_per_s, events_per_s = bench(parse, chunks, len(log))
+        print(
+            "%-24s %7d events  %8.1f MiB/s  %10.0f events/s"
+            % (name, count, mb_per_s, events_per_s)
+        )
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
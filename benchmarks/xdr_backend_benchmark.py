@@ -0,0 +1,54 @@
+"""Compare the xdrlib and the fast XDR codec backends.
+
+Usage::
+
+    python benchmarks/xdr_backend_benchmark.py [number]
+"""
+import base64
+import sys
+import timeit
+
+from stellar_sdk.xdr import StellarXDR_fastpack as fastpack
+from stellar_sdk.xdr import StellarXDR_pack as xdrlibpack
+
+ENVELOPE = base64.b64decode(
+    "AAAAAMvXcdYjKhx0qxnsDsczxKuqa/65lZz6sjjHHczyh50JAAAAyAAAAAAAAAABAAAAAQAAAAAAADA5AAAAAAAA3dUAAAACAAAAAAAAAGQAAAACAAAAAAAAAAEAAAAA0pjFgVcRZZHpMgnpXHpb/xIbLh0/YYto0PzI7+Xl5HAAAAAAAAAAAlQL5AAAAAAAAAAACgAAAAVoZWxsbwAAAAAAAAEAAAAFd29ybGQAAAAAAAAAAAAAAvKHnQkAAABAM4dg0J1LEFBmbDESJ5d+60WCuZC8lnA80g45qyEgz2oRBSNw1mOfZETnL/BgrebkG/K03oI2Wqcs9lvDKrDGDE0sOBsAAAAglOgiOlGKwWqMsRCrGVLvFNosELJkZFw4yLPYK9KyAAA="
+)
+
+
+def bench(module, number):
+    envelope = module.StellarXDRUnpacker(ENVELOPE).unpack_TransactionEnvelope()
+
+    def pack():
+        packer = module.StellarXDRPacker()
+        packer.pack_TransactionEnvelope(envelope)
+        return packer.get_buffer()
+
+    def unpack():
+        return module.StellarXDRUnpacker(ENVELOPE).unpack_TransactionEnvelope()
+
+    return (
+        min(timeit.repeat(pack, number=number, repeat=5)) / number,
+        min(timeit.repeat(unpack, number=number, repeat=5)) / number,
+    )
+
+
+def main(number=10000):
+    results = {}
+    for name, module in (("xdrlib", xdrlibpack), ("fast", fastpack)):
+        results[name] = bench(module, number)
+        print(
+            "%-8s pack: %7.2f us  unpack: %7.2f us"
+            % (name, results[name][0] * 1e6, results[name][1] * 1e6)
+        )
+    print(
+        "speedup  pack: %6.2fx    unpack: %6.2fx"
+        % (
+            results["xdrlib"][0] / results["fast"][0],
+            results["xdrlib"][1] / results["fast"][1],
+        )
+    )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -1,3 +1,6 @@
+import importlib
+import sys
+
 from .__version__ import (
     __title__,
     __description__,
@@ -8,58 +11,91 @@ from .__version__ import (
     __license__,
 )
 
-from .operation import *
-from .operation import __all__ as operation_all
+# The public names of the package and the modules they are defined in. They are
+# imported on first access (PEP 562), so that ``import stellar_sdk`` does not load
+# the HTTP clients and the XDR tables until they are needed.
+_LAZY_IMPORTS = {
+    "Account": ".account",
+    "Asset": ".asset",
+    "FeeBumpTransaction": ".fee_bump_transaction",
+    "FeeBumpTransactionEnvelope": ".fee_bump_transaction_envelope",
+    "Keypair": ".keypair",
+    "LazyTransactionEnvelope": ".lazy_transaction_envelope",
+    "Memo": ".memo",
+    "NoneMemo": ".memo",
+    "TextMemo": ".memo",
+    "IdMemo": ".memo",
+    "HashMemo": ".memo",
+    "ReturnHashMemo": ".memo",
+    "Network": ".network",
+    "Price": ".price",
+    "Server": ".server",
+    "Signer": ".signer",
+    "TimeBounds": ".time_bounds",
+    "Transaction": ".transaction",
+    "TransactionBuilder": ".transaction_builder",
+    "TransactionEnvelope": ".transaction_envelope",
+    "RequestsClient": ".client.requests_client",
+    "AiohttpClient": ".client.aiohttp_client",
+    "MultiHorizonClient": ".client.multi_horizon_client",
+    "AsyncMultiHorizonClient": ".client.multi_horizon_client",
+    "read_xdr_records": ".xdr_stream",
+    # operation
+    "Operation": ".operation",
+    "AccountMerge": ".operation",
+    "AllowTrust": ".operation",
+    "BumpSequence": ".operation",
+    "ChangeTrust": ".operation",
+    "CreateAccount": ".operation",
+    "CreatePassiveSellOffer": ".operation",
+    "Inflation": ".operation",
+    "ManageBuyOffer": ".operation",
+    "ManageData": ".operation",
+    "ManageSellOffer": ".operation",
+    "PathPayment": ".operation",
+    "PathPaymentStrictReceive": ".operation",
+    "PathPaymentStrictSend": ".operation",
+    "Payment": ".operation",
+    "SetOptions": ".operation",
+    "TrustLineEntryFlag": ".operation",
+    "Flag": ".operation",
+    # helpers
+    "parse_transaction_envelope_from_xdr": ".helpers",
+    "sign_many": ".helpers",
+}
 
-from .account import Account
-from .asset import Asset
-from .fee_bump_transaction import FeeBumpTransaction
-from .fee_bump_transaction_envelope import FeeBumpTransactionEnvelope
-from .keypair import Keypair
-from .memo import Memo, NoneMemo, TextMemo, IdMemo, HashMemo, ReturnHashMemo
-from .network import Network
-from .price import Price
-from .server import Server
-from .signer import Signer
-from .time_bounds import TimeBounds
-from .transaction import Transaction
-from .transaction_builder import TransactionBuilder
-from .transaction_envelope import TransactionEnvelope
-from .client.requests_client import RequestsClient
-from .client.aiohttp_client import AiohttpClient
-from .helpers import *
+__all__ = [
+    "__title__",
+    "__description__",
+    "__url__",
+    "__version__",
+    "__author__",
+    "__author_email__",
+    "__license__",
+] + list(_LAZY_IMPORTS)
 
-__all__ = (
-    [
-        "__title__",
-        "__description__",
-        "__url__",
-        "__version__",
-        "__author__",
-        "__author_email__",
-        "__license__",
-        "Account",
-        "Asset",
-        "FeeBumpTransaction",
-        "FeeBumpTransactionEnvelope",
-        "Keypair",
-        "Memo",
-        "NoneMemo",
-        "TextMemo",
-        "IdMemo",
-        "HashMemo",
-        "ReturnHashMemo",
-        "Network",
-        "Price",
-        "Server",
-        "Signer",
-        "TimeBounds",
-        "Transaction",
-        "TransactionBuilder",
-        "TransactionEnvelope",
-        "RequestsClient",
-        "AiohttpClient",
-    ]
-    + operation_all
-    + helpers.__all__
-)
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        # Submodules used to be reachable as attributes after ``import stellar_sdk``.
+        try:
+            return importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != __name__ + "." + name:
+                raise
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # Module __getattr__ is not supported before Python 3.7.
+    for _name in _LAZY_IMPORTS:
+        __getattr__(_name)
+    del _name
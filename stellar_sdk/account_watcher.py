@@ -0,0 +1,269 @@
+import base64
+import binascii
+import inspect
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .call_builder.effects_call_builder import EffectsCallBuilder
+from .call_builder.operations_call_builder import OperationsCallBuilder
+from .call_builder.payments_call_builder import PaymentsCallBuilder
+from .client.base_async_client import BaseAsyncClient
+from .exceptions import TypeError, ValueError
+from .strkey import StrKey
+
+__all__ = ["AccountWatcher", "DEFAULT_ACCOUNT_FIELDS"]
+
+DEFAULT_ACCOUNT_FIELDS: Tuple[str, ...] = (
+    "source_account",
+    "account",
+    "from",
+    "to",
+    "funder",
+    "into",
+    "trustor",
+    "trustee",
+    "sponsored_id",
+)
+"""The fields of the operations, payments and effects holding the accounts they concern."""
+
+WatchCallBuilder = Union[PaymentsCallBuilder, OperationsCallBuilder, EffectsCallBuilder]
+
+Handler = Callable[[str, Any], Any]
+"""A function called with the watched account ID and the event."""
+
+
+class AccountWatcher:
+    """The :class:`AccountWatcher` object watches the payments, operations or effects
+    of many accounts through a single stream.
+
+    Instead of opening a stream per account with ``for_account``, the watcher
+    streams the whole collection (ex. ``server.payments()``) and calls the handlers
+    of the watched accounts found in the ``account_fields`` of each event. The
+    accounts are indexed by their raw 32 bytes public key in a hash table, the
+    lookup cost does not depend on the number of watched accounts, and they can
+    be added and removed while the stream is running, from any thread, without
+    reconnecting.
+
+    A handler is called once per event even if the account appears in several
+    fields (ex. a payment to itself). It is called with the account ID and the
+    event, with the async client it may also be a coroutine function.
+
+    An example::
+
+        watcher = AccountWatcher(server.payments().cursor("now"))
+        for account_id in custodial_accounts:
+            watcher.add_account(account_id, on_payment)
+        watcher.run()
+
+    :param call_builder: the call builder of the payments, operations or effects stream,
+        without ``for_account``.
+    :param account_fields: the fields of the events holding account IDs.
+    :raise: :exc:`TypeError <stellar_sdk.exceptions.TypeError>`: if the call builder is
+        not one of the call builders above.
+    """
+
+    def __init__(
+        self,
+        call_builder: WatchCallBuilder,
+        account_fields: Iterable[str] = DEFAULT_ACCOUNT_FIELDS,
+    ) -> None:
+        if not isinstance(
+            call_builder,
+            (PaymentsCallBuilder, OperationsCallBuilder, EffectsCallBuilder),
+        ):
+            raise TypeError(
+                "AccountWatcher supports payments, operations and effects "
+                "call builders, got {}.".format(type(call_builder).__name__)
+            )
+        self.call_builder: WatchCallBuilder = call_builder
+        self.account_fields: Tuple[str, ...] = tuple(account_fields)
+        #: The number of events received.
+        self.events: int = 0
+        #: The number of events concerning at least one watched account.
+        self.matched_events: int = 0
+        #: The number of handler calls.
+        self.handler_calls: int = 0
+        #: The total time spent dispatching the events, handlers included, in seconds.
+        self.total_dispatch_time: float = 0.0
+        #: The longest time spent dispatching an event, handlers included, in seconds.
+        self.max_dispatch_time: float = 0.0
+        # The handler tuples are replaced, never modified, so the stream can
+        # read them without holding the lock.
+        self._handlers: Dict[bytes, Tuple[Handler, ...]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def mean_dispatch_time(self) -> float:
+        """The mean time spent dispatching an event, handlers included, in seconds."""
+        return self.total_dispatch_time / self.events if self.events else 0.0
+
+    def add_account(self, account_id: str, handler: Handler) -> None:
+        """Watch an account, calling ``handler`` for its events.
+
+        An account can have several handlers, adding the same handler twice has no effect.
+
+        :param account_id: the account ID (``G...``).
+        :param handler: the function called with the account ID and the event.
+        :raise: :exc:`Ed25519PublicKeyInvalidError <stellar_sdk.exceptions.Ed25519PublicKeyInvalidError>`:
+            if ``account_id`` is invalid.
+        """
+        key = _decode_account_id(account_id)
+        with self._lock:
+            handlers = self._handlers.get(key, ())
+            if handler not in handlers:
+                self._handlers[key] = handlers + (handler,)
+
+    def remove_account(self, account_id: str, handler: Optional[Handler] = None) -> None:
+        """Stop watching an account, or remove one of its handlers.
+
+        :param account_id: the account ID (``G...``).
+        :param handler: the handler to remove, all of them by default.
+        :raise: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if the account
+            or the handler is not watched.
+        """
+        key = _decode_account_id(account_id)
+        with self._lock:
+            handlers = self._handlers.get(key)
+            if handlers is None or (handler is not None and handler not in handlers):
+                raise ValueError("{} is not watched.".format(account_id))
+            if handler is None:
+                handlers = ()
+            else:
+                handlers = tuple(h for h in handlers if h != handler)
+            if handlers:
+                self._handlers[key] = handlers
+            else:
+                del self._handlers[key]
+
+    def dispatch(self, event: Any) -> int:
+        """Call the handlers of the watched accounts of an event.
+
+        :param event: an operation, payment or effect, as a dict or a typed record.
+        :return: the number of handlers called.
+        """
+        start = time.monotonic()
+        calls = 0
+        for account_id, handler in self._match(event):
+            handler(account_id, event)
+            calls += 1
+        self._record_dispatch(calls, time.monotonic() - start)
+        return calls
+
+    async def adispatch(self, event: Any) -> int:
+        """Call the handlers of the watched accounts of an event,
+        awaiting the handlers that return an awaitable.
+
+        :param event: an operation, payment or effect, as a dict or a typed record.
+        :return: the number of handlers called.
+        """
+        start = time.monotonic()
+        calls = 0
+        for account_id, handler in self._match(event):
+            result = handler(account_id, event)
+            if inspect.isawaitable(result):
+                await result
+            calls += 1
+        self._record_dispatch(calls, time.monotonic() - start)
+        return calls
+
+    def run(self) -> None:
+        """Stream the events and dispatch them, with a synchronous client.
+
+        It returns when the stream ends.
+
+        :raise: :exc:`StreamClientError <stellar_sdk.exceptions.StreamClientError>` - Failed to fetch stream resource.
+        """
+        if isinstance(self.call_builder.client, BaseAsyncClient):
+            raise TypeError("Use arun() with an asynchronous client.")
+        for event in self.call_builder.stream():
+            self.dispatch(event)
+
+    async def arun(self) -> None:
+        """Stream the events and dispatch them, with an asynchronous client.
+
+        It returns when the stream ends.
+
+        :raise: :exc:`StreamClientError <stellar_sdk.exceptions.StreamClientError>` - Failed to fetch stream resource.
+        """
+        if not isinstance(self.call_builder.client, BaseAsyncClient):
+            raise TypeError("Use run() with a synchronous client.")
+        async for event in self.call_builder.stream():
+            await self.adispatch(event)
+
+    def reset_counters(self) -> None:
+        """Set the event, handler call and dispatch time counters to 0."""
+        self.events = 0
+        self.matched_events = 0
+        self.handler_calls = 0
+        self.total_dispatch_time = 0.0
+        self.max_dispatch_time = 0.0
+
+    def _match(self, event: Any) -> List[Tuple[str, Handler]]:
+        # The matches are collected before calling the handlers, accounts added
+        # or removed by a handler apply from the next event.
+        index = self._handlers
+        matched = []
+        matched_keys = None
+        for field in self.account_fields:
+            try:
+                account_id = event[field]
+            except KeyError:
+                continue
+            key = _raw_key(account_id)
+            if key is None:
+                continue
+            handlers = index.get(key)
+            if handlers is None:
+                continue
+            if matched_keys is None:
+                matched_keys = set()
+            elif key in matched_keys:
+                continue
+            matched_keys.add(key)
+            for handler in handlers:
+                matched.append((account_id, handler))
+        return matched
+
+    def _record_dispatch(self, calls: int, elapsed: float) -> None:
+        self.events += 1
+        if calls:
+            self.matched_events += 1
+            self.handler_calls += calls
+        self.total_dispatch_time += elapsed
+        if elapsed > self.max_dispatch_time:
+            self.max_dispatch_time = elapsed
+
+    def __contains__(self, account_id: str) -> bool:
+        key = _raw_key(account_id)
+        return key is not None and key in self._handlers
+
+    def __len__(self) -> int:
+        return len(self._handlers)
+
+    def __repr__(self) -> str:
+        return "<AccountWatcher [accounts={}, events={}, matched_events={}]>".format(
+            len(self), self.events, self.matched_events
+        )
+
+
+def _decode_account_id(account_id: str) -> bytes:
+    # Validates the checksum, unlike the lookups of the events.
+    return StrKey.decode_ed25519_public_key(account_id)
+
+
+def _raw_key(account_id: Any) -> Optional[bytes]:
+    if not isinstance(account_id, str) or len(account_id) != 56 or account_id[0] != "G":
+        return None
+    return _decode_event_account_id(account_id)
+
+
+@lru_cache(maxsize=65536)
+def _decode_event_account_id(account_id: str) -> Optional[bytes]:
+    # The account IDs of the events come from Horizon, they are not validated
+    # again, base32 decoding is enough to find them in the index.
+    try:
+        return base64.b32decode(account_id)[1:33]
+    except binascii.Error:
+        return None
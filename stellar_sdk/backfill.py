@@ -0,0 +1,195 @@
+import asyncio
+import copy
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
+
+from .call_builder.effects_call_builder import EffectsCallBuilder
+from .call_builder.ledgers_call_builder import LedgersCallBuilder
+from .call_builder.operations_call_builder import OperationsCallBuilder
+from .call_builder.payments_call_builder import PaymentsCallBuilder
+from .call_builder.transactions_call_builder import TransactionsCallBuilder
+from .client.base_async_client import BaseAsyncClient
+from .exceptions import TypeError, ValueError
+
+__all__ = ["backfill_records"]
+
+_END = object()
+
+BackfillCallBuilder = Union[
+    LedgersCallBuilder,
+    TransactionsCallBuilder,
+    OperationsCallBuilder,
+    PaymentsCallBuilder,
+    EffectsCallBuilder,
+]
+
+
+class _PartitionError:
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+def backfill_records(
+    call_builder: BackfillCallBuilder,
+    start_ledger: int,
+    end_ledger: int,
+    concurrency: int = 4,
+    partitions: Optional[int] = None,
+    limit: int = 200,
+    buffer_pages: int = 2,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """Fetch the records of a collection between two ledgers, splitting the
+    ledger range in partitions that are fetched concurrently.
+
+    The paging token of ledgers, transactions, operations, payments and effects
+    holds the ledger sequence in its high 32 bits, so the range
+    ``[start_ledger, end_ledger]`` is split in ``partitions`` contiguous ledger
+    ranges, each one paged in ascending order from its own cursor. Up to
+    ``concurrency`` partitions are fetched at the same time, and the records are
+    yielded in ascending order, as if the whole range was paged through one cursor.
+
+    The call builder must use an asynchronous client, its endpoint and
+    filters (ex. :meth:`OperationsCallBuilder.for_account
+    <stellar_sdk.call_builder.OperationsCallBuilder.for_account>`) are kept, its
+    ``cursor``, ``order`` and ``limit`` are replaced.
+
+    An example::
+
+        async with Server(horizon_url, AiohttpClient()) as server:
+            async for operation in backfill_records(
+                server.operations(), 28000000, 28100000, concurrency=8
+            ):
+                print(operation["id"])
+
+    :param call_builder: the call builder of the collection.
+    :param start_ledger: the first ledger of the range.
+    :param end_ledger: the last ledger of the range, included.
+    :param concurrency: the maximum number of partitions fetched at the same time.
+    :param partitions: the number of partitions, defaults to ``concurrency``.
+    :param limit: the number of records per page.
+    :param buffer_pages: the number of pages each running partition may fetch
+        ahead of the caller.
+    :return: an async generator yielding the records in ascending order.
+    :raises:
+        | :exc:`TypeError <stellar_sdk.exceptions.TypeError>`: if the call builder is not
+            one of the call builders above or does not use an asynchronous client.
+        | :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if an argument is out of range.
+        | The exceptions of :meth:`BaseCallBuilder.call <stellar_sdk.call_builder.BaseCallBuilder.call>`
+            while iterating.
+    """
+    if not isinstance(
+        call_builder,
+        (
+            LedgersCallBuilder,
+            TransactionsCallBuilder,
+            OperationsCallBuilder,
+            PaymentsCallBuilder,
+            EffectsCallBuilder,
+        ),
+    ):
+        raise TypeError(
+            "backfill_records supports ledgers, transactions, operations, "
+            "payments and effects call builders, got {}.".format(
+                type(call_builder).__name__
+            )
+        )
+    if not isinstance(call_builder.client, BaseAsyncClient):
+        raise TypeError("backfill_records requires an asynchronous client.")
+    if partitions is None:
+        partitions = concurrency
+    if start_ledger < 1 or end_ledger < start_ledger:
+        raise ValueError(
+            "Invalid ledger range [{}, {}].".format(start_ledger, end_ledger)
+        )
+    for name, value in (
+        ("concurrency", concurrency),
+        ("partitions", partitions),
+        ("limit", limit),
+        ("buffer_pages", buffer_pages),
+    ):
+        if value < 1:
+            raise ValueError("{} should be greater than 0, got {}.".format(name, value))
+    ranges = _split_range(start_ledger, end_ledger, partitions)
+    builders = [
+        _partition_call_builder(call_builder, first, limit) for first, _ in ranges
+    ]
+    return _backfill(builders, ranges, concurrency, limit * buffer_pages)
+
+
+def _split_range(start: int, end: int, partitions: int) -> List[Tuple[int, int]]:
+    count = end - start + 1
+    partitions = min(partitions, count)
+    size, remainder = divmod(count, partitions)
+    ranges = []
+    first = start
+    for i in range(partitions):
+        last = first + size - 1 + (1 if i < remainder else 0)
+        ranges.append((first, last))
+        first = last + 1
+    return ranges
+
+
+def _partition_call_builder(
+    call_builder: BackfillCallBuilder, first_ledger: int, limit: int
+) -> BackfillCallBuilder:
+    builder = copy.copy(call_builder)
+    builder.params = dict(call_builder.params)
+    # records strictly after the cursor are returned, so start right before the
+    # first paging token of the ledger.
+    cursor = (first_ledger << 32) - 1
+    if isinstance(builder, EffectsCallBuilder):
+        builder.cursor("{}-0".format(cursor))
+    else:
+        builder.cursor(cursor)
+    return builder.order(desc=False).limit(limit)
+
+
+def _ledger_of(record: Dict[str, Any]) -> int:
+    return int(record["paging_token"].split("-")[0]) >> 32
+
+
+async def _backfill(
+    builders: List[BackfillCallBuilder],
+    ranges: List[Tuple[int, int]],
+    concurrency: int,
+    buffer_size: int,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    semaphore = asyncio.Semaphore(concurrency)
+    queues = [asyncio.Queue(buffer_size) for _ in builders]
+
+    async def fetch(
+        builder: BackfillCallBuilder, last_ledger: int, buffer: asyncio.Queue
+    ) -> None:
+        async with semaphore:
+            try:
+                records = builder.aiter_records(prefetch=1)
+                try:
+                    async for record in records:
+                        if _ledger_of(record) > last_ledger:
+                            break
+                        await buffer.put(record)
+                finally:
+                    await records.aclose()
+            except Exception as e:
+                await buffer.put(_PartitionError(e))
+                return
+            await buffer.put(_END)
+
+    # Partitions are started in order, so the partitions holding the semaphore
+    # are always the first unfinished ones, the one being consumed included.
+    tasks = [
+        asyncio.ensure_future(fetch(builder, last, buffer))
+        for builder, (_, last), buffer in zip(builders, ranges, queues)
+    ]
+    try:
+        for buffer in queues:
+            while True:
+                record = await buffer.get()
+                if record is _END:
+                    break
+                if isinstance(record, _PartitionError):
+                    raise record.error
+                yield record
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import List, Union, Generic, TypeVar
+from typing import Any, Callable, List, Optional, Tuple, Union, Generic, TypeVar
 
 from .exceptions import SignatureExistError
 from .keypair import Keypair
@@ -18,6 +18,8 @@ class BaseTransactionEnvelope(Generic[T]):
     ) -> None:
         self.network_id: bytes = Network(network_passphrase).network_id()
         self.signatures: List[Xdr.types.DecoratedSignature] = signatures or []
+        self._hash_cache: Optional[Tuple[bytes, bytes]] = None
+        self._signature_base_cache: Optional[Tuple[Any, bytes]] = None
 
     def hash(self) -> bytes:
         """Get the XDR Hash of the signature base.
@@ -29,7 +31,33 @@ class BaseTransactionEnvelope(Generic[T]):
         :return: The XDR Hash of this transaction envelope's signature base.
 
         """
-        return sha256(self.signature_base())
+        signature_base = self.signature_base()
+        cache = self._hash_cache
+        if cache is not None and cache[0] is signature_base:
+            return cache[1]
+        tx_hash = sha256(signature_base)
+        self._hash_cache = (signature_base, tx_hash)
+        return tx_hash
+
+    def invalidate(self) -> None:
+        """Drop the cached signature base and hash of this transaction envelope.
+
+        The signature base is packed once and reused until an attribute of the
+        transaction, of its operations, memo or time bounds is assigned, or one
+        of them is replaced. Call it after changing another object of the
+        transaction in place (ex. the :class:`Asset <stellar_sdk.asset.Asset>` of
+        an operation, or the inner transaction envelope of a fee bump transaction).
+        """
+        self._signature_base_cache = None
+        self._hash_cache = None
+
+    def _cached_signature_base(self, key: Any, build: Callable[[], bytes]) -> bytes:
+        cache = self._signature_base_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        signature_base = build()
+        self._signature_base_cache = (key, signature_base)
+        return signature_base
 
     def hash_hex(self) -> str:
         """Return a hex encoded hash for this transaction envelope.
@@ -5,6 +5,7 @@ from ..asset import Asset
 from ..call_builder.base_call_builder import BaseCallBuilder
 from ..client.base_async_client import BaseAsyncClient
 from ..client.base_sync_client import BaseSyncClient
+from ..records import AccountRecord
 from ..utils import convert_assets_to_horizon_param
 
 
@@ -16,6 +17,8 @@ class AccountsCallBuilder(BaseCallBuilder):
     :param client: The client instance used to send request.
     """
 
+    _record_type = AccountRecord
+
     def __init__(
         self, horizon_url, client: Union[BaseAsyncClient, BaseSyncClient]
     ) -> None:
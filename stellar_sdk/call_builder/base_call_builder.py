@@ -1,17 +1,34 @@
+import asyncio
+import queue
+import threading
+from urllib.parse import urlencode
 from typing import (
     Union,
     Coroutine,
     Any,
     Dict,
+    Iterator,
+    List,
     Mapping,
     Generator,
     AsyncGenerator,
+    AsyncIterator,
     Optional,
+    Tuple,
+    Type,
 )
 
+from ..checkpoint import Checkpointer, CheckpointStore, _paging_token
 from ..client.base_async_client import BaseAsyncClient
 from ..client.base_sync_client import BaseSyncClient
-from ..exceptions import raise_request_exception, NotPageableError
+from ..exceptions import (
+    raise_request_exception,
+    NotPageableError,
+    TypeError,
+    ValueError,
+)
+from ..records import Record, _typed_records, _typed_response
+from ..stream_batching import Batch, abatch_stream, batch_stream
 from ..utils import urljoin_with_query
 
 
@@ -24,6 +41,9 @@ class BaseCallBuilder:
     :param client: The client instance used to send request.
     """
 
+    #: The record class of the resources of this endpoint, used by :meth:`typed`.
+    _record_type: Optional[Type[Record]] = None
+
     def __init__(
         self, horizon_url: str, client: Union[BaseAsyncClient, BaseSyncClient]
     ) -> None:
@@ -38,6 +58,9 @@ class BaseCallBuilder:
         self.endpoint: str = ""
         self.prev_href: Optional[str] = None
         self.next_href: Optional[str] = None
+        self._typed: bool = False
+        self._keep_links: bool = False
+        self._checkpointer: Optional[Checkpointer] = None
 
     def call(self) -> Union[Dict[str, Any], Coroutine[Any, Any, Dict[str, Any]]]:
         """Triggers a HTTP request using this builder's current configuration.
@@ -68,14 +91,14 @@ class BaseCallBuilder:
         raise_request_exception(raw_resp)
         resp = raw_resp.json()
         self._check_pageable(resp)
-        return resp
+        return self._to_typed_response(resp)
 
     async def __call_async(self, url: str, params: dict = None) -> Dict[str, Any]:
         raw_resp = await self.client.get(url, params)
         raise_request_exception(raw_resp)
         resp = raw_resp.json()
         self._check_pageable(resp)
-        return resp
+        return self._to_typed_response(resp)
 
     def stream(
         self,
@@ -88,25 +111,260 @@ class BaseCallBuilder:
 
         See `MDN EventSource <https://developer.mozilla.org/en-US/docs/Web/API/EventSource>`_
 
+        With :meth:`checkpoint`, the stream resumes from the committed cursor.
+
         :return: If it is called synchronous, it will return ``Generator``, If
             it is called asynchronously, it will return ``AsyncGenerator``.
 
         :raise: :exc:`StreamClientError <stellar_sdk.exceptions.StreamClientError>` - Failed to fetch stream resource.
         """
+        params = self._resume_params()
         if self.__async:
-            return self.__stream_async()
+            stream = self.__stream_async(params)
+            if self._checkpointer is not None:
+                stream = _checkpointed_async(stream, self._checkpointer)
         else:
-            return self.__stream_sync()
-
-    async def __stream_async(self) -> AsyncGenerator[Dict[str, Any], None]:
+            stream = self.__stream_sync(params)
+            if self._checkpointer is not None:
+                stream = _checkpointed_sync(stream, self._checkpointer)
+        return stream
+
+    async def __stream_async(
+        self, params: Dict[str, str]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
         url = urljoin_with_query(self.horizon_url, self.endpoint)
-        stream = self.client.stream(url, self.params)
-        while True:
-            yield await stream.__anext__()
+        async for event in self.client.stream(url, params):
+            if self._typed:
+                event = self._record_type.from_dict(event, self._keep_links)
+            yield event
+
+    def __stream_sync(
+        self, params: Dict[str, str]
+    ) -> Generator[Dict[str, Any], None, None]:
+        url = urljoin_with_query(self.horizon_url, self.endpoint)
+        stream = self.client.stream(url, params)
+        if not self._typed:
+            return stream
+        return _typed_stream(stream, self._record_type, self._keep_links)
+
+    def stream_batches(
+        self, max_size: int = 100, max_linger: float = 1.0
+    ) -> Union[AsyncGenerator[Batch, None], Generator[Batch, None, None]]:
+        """Stream the events in batches, see :func:`batch_stream <stellar_sdk.stream_batching.batch_stream>`.
+
+        A batch (:class:`Batch <stellar_sdk.stream_batching.Batch>`) is a list of
+        events in the order of the stream, it is yielded once it holds ``max_size``
+        events, or ``max_linger`` seconds after its first event was received.
+        With :meth:`checkpoint`, the stream resumes from the committed cursor and the
+        cursor of a batch is tracked once the caller asks for the next batch.
+
+        An example::
+
+            builder = server.payments().cursor("now").checkpoint(store, "payments", every_events=1000)
+            for batch in builder.stream_batches(max_size=500, max_linger=2.0):
+                insert_payments(batch)
+
+        :param max_size: the maximum number of events of a batch.
+        :param max_linger: the maximum time an event waits in a batch, in seconds.
+        :return: If it is called synchronous, it will return ``Generator``, If
+            it is called asynchronously, it will return ``AsyncGenerator``.
+        :raises:
+            | :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``max_size`` or ``max_linger`` is invalid.
+            | :exc:`StreamClientError <stellar_sdk.exceptions.StreamClientError>` - Failed to fetch stream resource.
+        """
+        params = self._resume_params()
+        if self.__async:
+            batches = abatch_stream(self.__stream_async(params), max_size, max_linger)
+            if self._checkpointer is not None:
+                batches = _checkpointed_async(batches, self._checkpointer)
+        else:
+            batches = batch_stream(self.__stream_sync(params), max_size, max_linger)
+            if self._checkpointer is not None:
+                batches = _checkpointed_sync(batches, self._checkpointer)
+        return batches
+
+    def typed(self, keep_links: bool = False) -> "BaseCallBuilder":
+        """Return typed records (see :mod:`stellar_sdk.records`) instead of dicts.
+        Returns the CallBuilder object on which this method has been called.
+
+        :meth:`call` replaces the records of a collection (``resp["_embedded"]["records"]``),
+        or a single resource, by records, :meth:`stream`, :meth:`iter_records` and
+        :meth:`aiter_records` yield records. The fields are decoded on first access,
+        amounts are converted to stroops.
+
+        An example::
+
+            for operation in server.operations().for_account(account_id).typed().iter_records():
+                if isinstance(operation, PaymentOperationRecord):
+                    print(operation.from_, operation.amount)
+
+        :param keep_links: keep the ``_links`` block of the resources, it is dropped by default.
+        :return: current CallBuilder instance
+        :raise: :exc:`TypeError <stellar_sdk.exceptions.TypeError>`: if the resources of
+            this endpoint have no record type.
+        """
+        if self._record_type is None:
+            raise TypeError(
+                "{} does not support typed records.".format(type(self).__name__)
+            )
+        self._typed = True
+        self._keep_links = keep_links
+        return self
+
+    def iter_records(
+        self, prefetch: int = 1, max_records: Optional[int] = None
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Iterate over the records of all the pages of the collection, following the
+        ``next`` links. Only available with a synchronous client, see :meth:`aiter_records`.
+
+        While the records of a page are being consumed, the next pages are fetched in a
+        background thread, up to ``prefetch`` pages ahead. The iteration stops on the
+        first empty page, or once ``max_records`` records have been yielded.
+
+        An example::
+
+            for operation in server.operations().for_account(account_id).limit(200).iter_records():
+                print(operation["id"])
 
-    def __stream_sync(self) -> Generator[Dict[str, Any], None, None]:
+        :param prefetch: The maximum number of pages fetched ahead of the caller,
+            ``0`` fetches each page when the previous one has been consumed.
+        :param max_records: The maximum number of records to yield, ``None`` means no limit.
+        :return: A generator yielding the records.
+        :raises:
+            | :exc:`TypeError <stellar_sdk.exceptions.TypeError>`: if the client is asynchronous.
+            | :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``prefetch`` or ``max_records`` is negative.
+            | :exc:`NotPageableError <stellar_sdk.exceptions.NotPageableError>`: while iterating,
+                if the resource is not a collection.
+            | The exceptions of :meth:`call` while iterating.
+        """
+        if self.__async:
+            raise TypeError(
+                "iter_records requires a synchronous client, use aiter_records instead."
+            )
+        _check_iter_records_args(prefetch, max_records)
+        url = urljoin_with_query(self.horizon_url, self.endpoint)
+        pages = self.__pages_sync(url, self._resume_params(), max_records)
+        if prefetch:
+            pages = _prefetch_sync(pages, prefetch)
+        records = _records_sync(pages, max_records)
+        if self._checkpointer is not None:
+            records = _checkpointed_sync(records, self._checkpointer)
+        return records
+
+    def aiter_records(
+        self, prefetch: int = 1, max_records: Optional[int] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Iterate over the records of all the pages of the collection, following the
+        ``next`` links. Only available with an asynchronous client, see :meth:`iter_records`.
+
+        While the records of a page are being consumed, the next pages are fetched in a
+        background task, up to ``prefetch`` pages ahead. The iteration stops on the
+        first empty page, or once ``max_records`` records have been yielded.
+
+        An example::
+
+            async for operation in server.operations().for_account(account_id).limit(200).aiter_records():
+                print(operation["id"])
+
+        :param prefetch: The maximum number of pages fetched ahead of the caller,
+            ``0`` fetches each page when the previous one has been consumed.
+        :param max_records: The maximum number of records to yield, ``None`` means no limit.
+        :return: An async generator yielding the records.
+        :raises:
+            | :exc:`TypeError <stellar_sdk.exceptions.TypeError>`: if the client is synchronous.
+            | :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``prefetch`` or ``max_records`` is negative.
+            | :exc:`NotPageableError <stellar_sdk.exceptions.NotPageableError>`: while iterating,
+                if the resource is not a collection.
+            | The exceptions of :meth:`call` while iterating.
+        """
+        if not self.__async:
+            raise TypeError(
+                "aiter_records requires an asynchronous client, use iter_records instead."
+            )
+        _check_iter_records_args(prefetch, max_records)
         url = urljoin_with_query(self.horizon_url, self.endpoint)
-        return self.client.stream(url, self.params)
+        pages = self.__pages_async(url, self._resume_params(), max_records)
+        if prefetch:
+            pages = _prefetch_async(pages, prefetch)
+        records = _records_async(pages, max_records)
+        if self._checkpointer is not None:
+            records = _checkpointed_async(records, self._checkpointer)
+        return records
+
+    def __pages_sync(
+        self, url: str, params: Optional[dict], max_records: Optional[int]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        fetched = 0
+        while max_records is None or fetched < max_records:
+            raw_resp = self.client.get(url, params)
+            raise_request_exception(raw_resp)
+            records, url = _parse_page(raw_resp.json())
+            if not records:
+                return
+            if self._typed:
+                records = _typed_records(self._record_type, records, self._keep_links)
+            yield records
+            fetched += len(records)
+            if url is None:
+                return
+            params = None
+
+    async def __pages_async(
+        self, url: str, params: Optional[dict], max_records: Optional[int]
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        fetched = 0
+        while max_records is None or fetched < max_records:
+            raw_resp = await self.client.get(url, params)
+            raise_request_exception(raw_resp)
+            records, url = _parse_page(raw_resp.json())
+            if not records:
+                return
+            if self._typed:
+                records = _typed_records(self._record_type, records, self._keep_links)
+            yield records
+            fetched += len(records)
+            if url is None:
+                return
+            params = None
+
+    def checkpoint(
+        self,
+        store: CheckpointStore,
+        key: Optional[str] = None,
+        every_events: int = 100,
+        every_seconds: float = 5.0,
+    ) -> "BaseCallBuilder":
+        """Commit the cursor of the processed events to a checkpoint store, and resume
+        from it. Returns the CallBuilder object on which this method has been called.
+
+        :meth:`stream`, :meth:`iter_records` and :meth:`aiter_records` start from the
+        cursor found in ``store`` under ``key``, or from the ``cursor`` parameter when
+        there is none. The paging token of an event is tracked once the caller asks
+        for the next event, and committed in batches, see
+        :class:`Checkpointer <stellar_sdk.checkpoint.Checkpointer>`. The pending cursor
+        is committed when the iteration ends, fails or is closed, but the event being
+        processed at that time is not, so it is received again after a restart:
+        the delivery is at-least-once.
+
+        An example::
+
+            store = SQLiteCheckpointStore("checkpoints.db")
+            for payment in server.payments().cursor("now").checkpoint(store, "payments").stream():
+                save_payment(payment)
+
+        :param store: the store of the cursors, see :mod:`stellar_sdk.checkpoint`.
+        :param key: the key of the cursor in the store, by default the URL of the
+            endpoint with its parameters, except ``cursor``.
+        :param every_events: commit after this number of events.
+        :param every_seconds: commit after this number of seconds.
+        :return: current CallBuilder instance
+        :raise: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``every_events``
+            or ``every_seconds`` is invalid.
+        """
+        if key is None:
+            key = self._checkpoint_key()
+        self._checkpointer = Checkpointer(store, key, every_events, every_seconds)
+        return self
 
     def cursor(self, cursor: Union) -> "BaseCallBuilder":
         """Sets ``cursor`` parameter for the current call. Returns the CallBuilder object on which this method has been called.
@@ -162,6 +420,26 @@ class BaseCallBuilder:
         else:
             self.params[key] = str(value)
 
+    def _checkpoint_key(self) -> str:
+        url = urljoin_with_query(self.horizon_url, self.endpoint)
+        params = sorted((k, v) for k, v in self.params.items() if k != "cursor")
+        if not params:
+            return url
+        return "{}?{}".format(url, urlencode(params))
+
+    def _resume_params(self) -> Dict[str, str]:
+        params = dict(self.params)
+        if self._checkpointer is not None:
+            cursor = self._checkpointer.resume()
+            if cursor is not None:
+                params["cursor"] = cursor
+        return params
+
+    def _to_typed_response(self, response: dict) -> Any:
+        if not self._typed:
+            return response
+        return _typed_response(self._record_type, response, self._keep_links)
+
     def _check_pageable(self, response: dict) -> None:
         links = response.get("_links")
         if not links:
@@ -188,3 +466,192 @@ class BaseCallBuilder:
             and self.endpoint == other.endpoint
             and self.horizon_url == other.horizon_url
         )
+
+
+_END = object()
+
+
+class _PageError:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _check_iter_records_args(prefetch: int, max_records: Optional[int]) -> None:
+    if prefetch < 0:
+        raise ValueError("prefetch should not be negative, got {}.".format(prefetch))
+    if max_records is not None and max_records < 0:
+        raise ValueError(
+            "max_records should not be negative, got {}.".format(max_records)
+        )
+
+
+def _parse_page(resp: dict) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    try:
+        records = resp["_embedded"]["records"]
+    except (KeyError, TypeError):
+        raise NotPageableError("The resource is not a collection.")
+    next_page = (resp.get("_links") or {}).get("next")
+    return records, next_page.get("href") if next_page else None
+
+
+def _typed_stream(
+    stream: Generator[Dict[str, Any], None, None],
+    record_type: Type[Record],
+    keep_links: bool,
+) -> Generator[Record, None, None]:
+    try:
+        for event in stream:
+            yield record_type.from_dict(event, keep_links)
+    finally:
+        stream.close()
+
+
+def _track(checkpointer: Checkpointer, event: Any) -> None:
+    if isinstance(event, Batch):
+        if event.cursor is not None:
+            checkpointer.track(event.cursor, len(event))
+        return
+    paging_token = _paging_token(event)
+    if paging_token is not None:
+        checkpointer.track(paging_token)
+
+
+def _checkpointed_sync(
+    events: Generator[Any, None, None], checkpointer: Checkpointer
+) -> Generator[Any, None, None]:
+    try:
+        for event in events:
+            yield event
+            # The caller asks for the next event, the previous one is processed.
+            _track(checkpointer, event)
+    finally:
+        try:
+            events.close()
+        finally:
+            checkpointer.commit()
+
+
+async def _checkpointed_async(
+    events: AsyncGenerator[Any, None], checkpointer: Checkpointer
+) -> AsyncGenerator[Any, None]:
+    try:
+        async for event in events:
+            yield event
+            _track(checkpointer, event)
+    finally:
+        try:
+            await events.aclose()
+        finally:
+            checkpointer.commit()
+
+
+def _records_sync(
+    pages: Iterator[List[Dict[str, Any]]], max_records: Optional[int]
+) -> Generator[Dict[str, Any], None, None]:
+    remaining = max_records
+    try:
+        for records in pages:
+            if remaining is not None:
+                records = records[:remaining]
+                remaining -= len(records)
+            yield from records
+            if remaining == 0:
+                return
+    finally:
+        pages.close()
+
+
+async def _records_async(
+    pages: AsyncIterator[List[Dict[str, Any]]], max_records: Optional[int]
+) -> AsyncGenerator[Dict[str, Any], None]:
+    remaining = max_records
+    try:
+        async for records in pages:
+            if remaining is not None:
+                records = records[:remaining]
+                remaining -= len(records)
+            for record in records:
+                yield record
+            if remaining == 0:
+                return
+    finally:
+        await pages.aclose()
+
+
+def _prefetch_sync(
+    pages: Iterator[List[Dict[str, Any]]], depth: int
+) -> Generator[List[Dict[str, Any]], None, None]:
+    # The worker thread may only fetch a page when one of the ``depth`` slots is
+    # free, a slot is freed each time the consumer takes a page.
+    slots = threading.Semaphore(depth)
+    results: queue.Queue = queue.Queue()
+    stopped = threading.Event()
+
+    def worker() -> None:
+        try:
+            while True:
+                while not slots.acquire(timeout=0.1):
+                    if stopped.is_set():
+                        return
+                if stopped.is_set():
+                    return
+                page = next(pages, _END)
+                results.put(page)
+                if page is _END:
+                    return
+        except BaseException as e:
+            results.put(_PageError(e))
+        finally:
+            pages.close()
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        while True:
+            page = results.get()
+            if page is _END:
+                return
+            if isinstance(page, _PageError):
+                raise page.error
+            slots.release()
+            yield page
+    finally:
+        stopped.set()
+
+
+async def _prefetch_async(
+    pages: AsyncIterator[List[Dict[str, Any]]], depth: int
+) -> AsyncGenerator[List[Dict[str, Any]], None]:
+    slots = asyncio.Semaphore(depth)
+    results: asyncio.Queue = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            while True:
+                await slots.acquire()
+                page = await pages.__anext__()
+                results.put_nowait(page)
+        except StopAsyncIteration:
+            results.put_nowait(_END)
+        except Exception as e:
+            results.put_nowait(_PageError(e))
+        finally:
+            await pages.aclose()
+
+    task = asyncio.ensure_future(worker())
+    try:
+        while True:
+            page = await results.get()
+            if page is _END:
+                return
+            if isinstance(page, _PageError):
+                raise page.error
+            slots.release()
+            yield page
+    finally:
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
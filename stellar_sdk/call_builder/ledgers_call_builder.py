@@ -3,6 +3,7 @@ from typing import Union
 from ..call_builder.base_call_builder import BaseCallBuilder
 from ..client.base_async_client import BaseAsyncClient
 from ..client.base_sync_client import BaseSyncClient
+from ..records import LedgerRecord
 
 
 class LedgersCallBuilder(BaseCallBuilder):
@@ -15,6 +16,8 @@ class LedgersCallBuilder(BaseCallBuilder):
     :param client: The client instance used to send request.
     """
 
+    _record_type = LedgerRecord
+
     def __init__(
         self, horizon_url: str, client: Union[BaseAsyncClient, BaseSyncClient]
     ) -> None:
@@ -5,6 +5,7 @@ from ..asset import Asset
 from ..call_builder import BaseCallBuilder
 from ..client.base_async_client import BaseAsyncClient
 from ..client.base_sync_client import BaseSyncClient
+from ..records import OfferRecord
 
 
 class OffersCallBuilder(BaseCallBuilder):
@@ -18,6 +19,8 @@ class OffersCallBuilder(BaseCallBuilder):
     :param client: The client instance used to send request.
     """
 
+    _record_type = OfferRecord
+
     def __init__(
         self, horizon_url: str, client: Union[BaseAsyncClient, BaseSyncClient]
     ) -> None:
@@ -3,6 +3,7 @@ from typing import Union
 from ..call_builder.base_call_builder import BaseCallBuilder
 from ..client.base_async_client import BaseAsyncClient
 from ..client.base_sync_client import BaseSyncClient
+from ..records import OperationRecord
 
 
 class OperationsCallBuilder(BaseCallBuilder):
@@ -15,6 +16,8 @@ class OperationsCallBuilder(BaseCallBuilder):
     :param client: The client instance used to send request.
     """
 
+    _record_type = OperationRecord
+
     def __init__(
         self, horizon_url, client: Union[BaseAsyncClient, BaseSyncClient]
     ) -> None:
@@ -0,0 +1,281 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Any, Dict, Optional
+
+from .exceptions import ValueError
+
+__all__ = [
+    "CheckpointStore",
+    "MemoryCheckpointStore",
+    "FileCheckpointStore",
+    "SQLiteCheckpointStore",
+    "Checkpointer",
+]
+
+
+class CheckpointStore(metaclass=ABCMeta):
+    """This is an abstract class, the stores of the cursors committed by a
+    :class:`Checkpointer`, by key.
+
+    If you want to keep the cursors somewhere else (ex. in the database of your
+    application), you **must** implement this class. The methods may be called
+    from several threads.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[str]:
+        """Load the cursor of a key.
+
+        :param key: the checkpoint key
+        :return: the cursor, ``None`` if there is none
+        """
+        pass
+
+    @abstractmethod
+    def save(self, key: str, cursor: str) -> None:
+        """Save the cursor of a key, durably, replacing the previous one.
+
+        :param key: the checkpoint key
+        :param cursor: the cursor
+        """
+        pass
+
+    def close(self) -> None:
+        """Release the resources of the store."""
+        pass
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """A :class:`CheckpointStore` keeping the cursors in a dict, they are lost
+    when the process exits. Use it in tests, or to share cursors between the
+    streams of a process."""
+
+    def __init__(self) -> None:
+        #: The cursors, by key.
+        self.cursors: Dict[str, str] = {}
+
+    def load(self, key: str) -> Optional[str]:
+        return self.cursors.get(key)
+
+    def save(self, key: str, cursor: str) -> None:
+        self.cursors[key] = cursor
+
+    def __repr__(self) -> str:
+        return "<MemoryCheckpointStore [keys={}]>".format(len(self.cursors))
+
+
+class FileCheckpointStore(CheckpointStore):
+    """A :class:`CheckpointStore` keeping the cursors of all the keys in a JSON file.
+
+    Each save writes the whole file to a temporary file in the same directory,
+    flushes it to the disk and renames it over the previous one, a crash never
+    leaves a truncated file.
+
+    :param path: the path of the file, it is created on the first save.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = os.path.abspath(path)
+        self._lock: threading.Lock = threading.Lock()
+        self._cursors: Optional[Dict[str, str]] = None
+
+    def load(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, cursor: str) -> None:
+        with self._lock:
+            cursors = self._read()
+            cursors[key] = cursor
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".{}.".format(os.path.basename(self.path)),
+                dir=os.path.dirname(self.path),
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(cursors, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def _read(self) -> Dict[str, str]:
+        if self._cursors is None:
+            try:
+                with open(self.path) as f:
+                    self._cursors = json.load(f)
+            except FileNotFoundError:
+                self._cursors = {}
+        return self._cursors
+
+    def __repr__(self) -> str:
+        return "<FileCheckpointStore [path={}]>".format(self.path)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """A :class:`CheckpointStore` keeping the cursors in a SQLite database,
+    in the ``table`` table (``key`` and ``cursor`` columns), which is created if needed.
+
+    Several processes can share the database.
+
+    :param path: the path of the database.
+    :param table: the name of the table.
+    """
+
+    def __init__(self, path: str, table: str = "stellar_checkpoints") -> None:
+        if not table.isidentifier():
+            raise ValueError("table should be an identifier, got {!r}.".format(table))
+        self.path: str = path
+        self.table: str = table
+        self._lock: threading.Lock = threading.Lock()
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            path, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS {} "
+                "(key TEXT PRIMARY KEY, cursor TEXT NOT NULL)".format(table)
+            )
+
+    def load(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT cursor FROM {} WHERE key = ?".format(self.table), (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def save(self, key: str, cursor: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO {} (key, cursor) VALUES (?, ?)".format(
+                    self.table
+                ),
+                (key, cursor),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __repr__(self) -> str:
+        return "<SQLiteCheckpointStore [path={}, table={}]>".format(
+            self.path, self.table
+        )
+
+
+class Checkpointer:
+    """The :class:`Checkpointer` object commits the cursor of a stream or of a
+    pagination to a :class:`CheckpointStore`, in batches.
+
+    The cursor of each processed event is tracked, and committed every
+    ``every_events`` events or when ``every_seconds`` seconds have passed since
+    the last commit, whichever comes first. The time is checked when an event is tracked.
+    Resuming from the committed cursor gives at-least-once delivery: the events
+    processed after the last commit are received again.
+
+    Use :meth:`BaseCallBuilder.checkpoint <stellar_sdk.call_builder.base_call_builder.BaseCallBuilder.checkpoint>`
+    rather than creating it directly.
+
+    :param store: the store of the cursors.
+    :param key: the key of the cursor in the store.
+    :param every_events: commit after this number of events.
+    :param every_seconds: commit after this number of seconds, ``0`` commits every event.
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore,
+        key: str,
+        every_events: int = 100,
+        every_seconds: float = 5.0,
+    ) -> None:
+        if every_events < 1:
+            raise ValueError(
+                "every_events should be greater than 0, got {}.".format(every_events)
+            )
+        if every_seconds < 0:
+            raise ValueError(
+                "every_seconds should not be negative, got {}.".format(every_seconds)
+            )
+        self.store: CheckpointStore = store
+        self.key: str = key
+        self.every_events: int = every_events
+        self.every_seconds: float = every_seconds
+        #: The cursor of the last processed event.
+        self.cursor: Optional[str] = None
+        #: The last cursor committed to the store.
+        self.committed_cursor: Optional[str] = None
+        #: The number of commits.
+        self.commits: int = 0
+        self._pending: int = 0
+        self._last_commit: float = time.monotonic()
+        self._lock: threading.Lock = threading.Lock()
+
+    def load(self) -> Optional[str]:
+        """Load the committed cursor from the store.
+
+        :return: the cursor, ``None`` if there is none.
+        """
+        cursor = self.store.load(self.key)
+        with self._lock:
+            self.cursor = self.committed_cursor = cursor
+            self._pending = 0
+            self._last_commit = time.monotonic()
+        return cursor
+
+    def resume(self) -> Optional[str]:
+        """The cursor to resume from: the cursor of the last processed event if
+        one was tracked, else the committed cursor loaded from the store.
+
+        :return: the cursor, ``None`` if there is none.
+        """
+        if self.cursor is not None:
+            return self.cursor
+        return self.load()
+
+    def track(self, cursor: str, events: int = 1) -> None:
+        """Record the cursor of a processed event, and commit if a batch is complete.
+
+        :param cursor: the paging token of the event.
+        :param events: the number of events processed up to this cursor, for a batch of events.
+        """
+        with self._lock:
+            self.cursor = cursor
+            self._pending += events
+            if (
+                self._pending >= self.every_events
+                or time.monotonic() - self._last_commit >= self.every_seconds
+            ):
+                self._commit()
+
+    def commit(self) -> None:
+        """Commit the cursor of the last processed event, if it is not committed yet."""
+        with self._lock:
+            self._commit()
+
+    def _commit(self) -> None:
+        if self._pending:
+            self.store.save(self.key, self.cursor)
+            self.committed_cursor = self.cursor
+            self.commits += 1
+            self._pending = 0
+        self._last_commit = time.monotonic()
+
+    def __repr__(self) -> str:
+        return "<Checkpointer [key={}, cursor={}, committed_cursor={}, commits={}]>".format(
+            self.key, self.cursor, self.committed_cursor, self.commits
+        )
+
+
+def _paging_token(event: Any) -> Optional[str]:
+    try:
+        return event["paging_token"]
+    except (KeyError, TypeError):
+        return None
@@ -1,20 +1,25 @@
 import asyncio
-import json
 import logging
-from typing import Optional, AsyncGenerator, Any, Dict
+import time
+from typing import Optional, AsyncGenerator, Any, Dict, Tuple
 import aiohttp
 
-from aiohttp_sse_client.client import EventSource
 from . import defines
 from .base_async_client import BaseAsyncClient
+from .coalescing import RequestCoalescer
+from .hedging import HedgingPolicy, _is_hedge_success
+from .json_decoder import JsonDecoder, default_json_decoder
+from .rate_limit import RateLimiter
 from .response import Response
+from .sse import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_EVENT_SIZE, SSEParser
 from ..__version__ import __version__
-from ..exceptions import StreamClientError
+from ..exceptions import ConnectionError, StreamClientError, ValueError as SdkValueError
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_NUM_RETRIES = 3
 DEFAULT_BACKOFF_FACTOR = 0.5
+SSE_HEADERS = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
 USER_AGENT = "py-stellar-sdk/%s/AiohttpClient" % __version__
 IDENTIFICATION_HEADERS = {
     "X-Client-Name": "py-stellar-sdk",
@@ -24,42 +29,6 @@ IDENTIFICATION_HEADERS = {
 __all__ = ["AiohttpClient"]
 
 
-# Temporary solution to solve the problem that
-# `aiohttp_sse_client` cannot read long stream messages.
-# Let's rewrite a stream lib later.
-async def __readline(self) -> bytes:
-    if self._exception is not None:
-        raise self._exception
-
-    line = []
-    line_size = 0
-    not_enough = True
-
-    while not_enough:
-        while self._buffer and not_enough:
-            offset = self._buffer_offset
-            ichar = self._buffer[0].find(b'\n', offset) + 1
-            # Read from current offset to found b'\n' or to the end.
-            data = self._read_nowait_chunk(ichar - offset if ichar else -1)
-            line.append(data)
-            line_size += len(data)
-            if ichar:
-                not_enough = False
-            #
-            # if line_size > self._high_water:
-            #     raise ValueError('Line is too long')
-        if self._eof:
-            break
-
-        if not_enough:
-            await self._wait('readline')
-
-    return b''.join(line)
-
-
-aiohttp.streams.StreamReader.readline = __readline
-
-
 class AiohttpClient(BaseAsyncClient):
     """The :class:`AiohttpClient` object is a asynchronous http client,
     which represents the interface for making requests to a server instance.
@@ -69,6 +38,16 @@ class AiohttpClient(BaseAsyncClient):
     :param post_timeout: the timeout for all POST requests
     :param backoff_factor: a backoff factor to apply between attempts after the second try
     :param user_agent: the server can use it to identify you
+    :param json_decoder: the function used to decode JSON responses and stream events,
+        defaults to :data:`stellar_sdk.client.json_decoder.default_json_decoder`
+    :param hedging: the policy of hedged GET requests, see :class:`HedgingPolicy
+        <stellar_sdk.client.hedging.HedgingPolicy>`, GET requests are not hedged by default.
+    :param coalescer: merges identical concurrent GET requests, see :class:`RequestCoalescer
+        <stellar_sdk.client.coalescing.RequestCoalescer>`, GET requests are not merged by default.
+    :param rate_limiter: throttles the GET and POST requests to stay under the rate limit
+        of Horizon, see :class:`RateLimiter <stellar_sdk.client.rate_limit.RateLimiter>`,
+        requests are not throttled by default.
+    :param max_event_size: the maximum size of a stream event in bytes.
     """
 
     def __init__(
@@ -78,9 +57,19 @@ class AiohttpClient(BaseAsyncClient):
         post_timeout: float = defines.DEFAULT_POST_TIMEOUT_SECONDS,
         backoff_factor: Optional[float] = DEFAULT_BACKOFF_FACTOR,
         user_agent: Optional[str] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        max_event_size: int = DEFAULT_MAX_EVENT_SIZE,
         **kwargs,
     ) -> None:
         self.backoff_factor: Optional[float] = backoff_factor
+        self.json_decoder: JsonDecoder = json_decoder or default_json_decoder
+        self.hedging: Optional[HedgingPolicy] = hedging
+        self.coalescer: Optional[RequestCoalescer] = coalescer
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.max_event_size: int = max_event_size
         self.request_timeout: float = request_timeout
         self.post_timeout: float = post_timeout
 
@@ -117,17 +106,89 @@ class AiohttpClient(BaseAsyncClient):
         :return: the response from server
         :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
         """
+        if self.coalescer is not None:
+            return await self.coalescer.arun(url, params, self.__send_get)
+        return await self.__send_get(url, params)
+
+    async def __send_get(self, url: str, params: Optional[Dict[str, str]]) -> Response:
+        if self.hedging is None:
+            return await self.__get(url, params)
+        return await self.__hedged_get(url, params, self.hedging)
+
+    async def __get(self, url: str, params: Optional[Dict[str, str]]) -> Response:
+        if self.rate_limiter is not None:
+            return await self.rate_limiter.arun(
+                lambda: self.__fetch(url, params), retry=True
+            )
+        return await self.__fetch(url, params)
+
+    async def __fetch(self, url: str, params: Optional[Dict[str, str]]) -> Response:
         try:
             response = await self._session.get(url, params=params)
             return Response(
                 status_code=response.status,
-                text=await response.text(),
+                text=None,
                 headers=dict(response.headers),
                 url=str(response.url),
+                content=await response.read(),
+                json_decoder=self.json_decoder,
             )
         except aiohttp.ClientError as e:  # TODO: need more research
             raise ConnectionError(e)
 
+    async def __timed_get(
+        self, url: str, params: Optional[Dict[str, str]]
+    ) -> Tuple[Response, float]:
+        start = time.monotonic()
+        response = await self.__get(url, params)
+        return response, time.monotonic() - start
+
+    async def __hedged_get(
+        self, url: str, params: Optional[Dict[str, str]], policy: HedgingPolicy
+    ) -> Response:
+        policy._record_request()
+        delay = policy.hedging_delay()
+        if delay is None:
+            response, latency = await self.__timed_get(url, params)
+            policy._record_latency(latency)
+            return response
+
+        primary = asyncio.ensure_future(self.__timed_get(url, params))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait([primary], timeout=delay)
+            if done:
+                response, latency = primary.result()
+                policy._record_latency(latency)
+                return response
+
+            hedge = asyncio.ensure_future(
+                self.__timed_get(policy.hedge_url(url), params)
+            )
+            policy._record_hedge_fired()
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    response, latency = task.result()
+                    if _is_hedge_success(response):
+                        # The latency of the winning request alone, the hedge
+                        # started ``delay`` seconds after the original request.
+                        policy._record_latency(latency)
+                        if task is hedge:
+                            policy._record_hedge_won()
+                        return response
+            # Both requests failed, report the outcome of the original request.
+            return primary.result()[0]
+        finally:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+
     async def post(self, url: str, data: Dict[str, str] = None) -> Response:
         """Perform HTTP POST request.
 
@@ -136,13 +197,20 @@ class AiohttpClient(BaseAsyncClient):
         :return: the response from server
         :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
         """
+        if self.rate_limiter is not None:
+            return await self.rate_limiter.arun(lambda: self.__post(url, data))
+        return await self.__post(url, data)
+
+    async def __post(self, url: str, data: Optional[Dict[str, str]]) -> Response:
         try:
             response = await self._session.post(url, data=data, timeout=aiohttp.ClientTimeout(total=self.post_timeout))
             return Response(
                 status_code=response.status,
-                text=await response.text(),
+                text=None,
                 headers=dict(response.headers),
                 url=str(response.url),
+                content=await response.read(),
+                json_decoder=self.json_decoder,
             )
         except aiohttp.ClientConnectionError as e:
             raise ConnectionError(e)
@@ -161,7 +229,6 @@ class AiohttpClient(BaseAsyncClient):
         # Init the sse session
         if self._sse_session is None:
             # No special connector
-            # Other headers such as "Accept: text/event-stream" are added by thr SSEClient
             timeout = aiohttp.ClientTimeout(total=60 * 5)
             self._sse_session = aiohttp.ClientSession(timeout=timeout)
 
@@ -174,18 +241,21 @@ class AiohttpClient(BaseAsyncClient):
         retry = 0.1
 
         while True:
+            parser = SSEParser(self.max_event_size)
             try:
-                """
-                Create a new SSEClient:
-                Using the last id as the cursor
-                Headers are needed because of a bug that makes "params" override the default headers
-                """
-                async with EventSource(
+                # Headers are needed because of a bug that makes "params" override the default headers
+                async with self._sse_session.get(
                     url,
-                    session=self._sse_session,
                     params=query_params,
-                    headers=self.headers.copy(),
-                ) as client:
+                    headers={**self.headers, **SSE_HEADERS},
+                ) as response:
+                    if response.status != 200:
+                        raise StreamClientError(
+                            query_params["cursor"],
+                            "Failed to get stream message, status code: {}.".format(
+                                response.status
+                            ),
+                        )
                     """
                     We want to throw a TimeoutError if we didnt get any event in the last x seconds.
                     read_timeout in aiohttp is not implemented correctly https://github.com/aio-libs/aiohttp/issues/1954
@@ -193,29 +263,32 @@ class AiohttpClient(BaseAsyncClient):
 
                     Note that the timeout starts from the first event forward. There is no until we get the first event.
                     """
-                    async for event in client:
-                        if event.last_event_id:
-                            query_params["cursor"] = event.last_event_id
+                    async for chunk in response.content.iter_chunked(DEFAULT_CHUNK_SIZE):
+                        for event in parser.feed(chunk):
                             # Events that dont have an id are not useful for us (hello/byebye events)
-                        retry = client._reconnection_time.total_seconds()
-                        try:
-                            data = event.data
-                            if data != '"hello"' and data != '"byebye"':
-                                yield json.loads(data)
-                        except json.JSONDecodeError:
-                            # Content was not json-decodable
-                            pass
+                            if event.id:
+                                query_params["cursor"] = event.id
+                            try:
+                                message = self.json_decoder(event.data)
+                            except ValueError:
+                                # Content was not json-decodable
+                                continue
+                            yield message
             except aiohttp.ClientError as e:
                 raise StreamClientError(
                     query_params["cursor"], "Failed to get stream message."
                 ) from e
+            except SdkValueError as e:
+                raise StreamClientError(query_params["cursor"], str(e)) from e
             except asyncio.exceptions.TimeoutError:
                 logger.warning(
                     "We have encountered an timeout error and we will try to reconnect, cursor = {}".format(
                         query_params.get("cursor")
                     )
                 )
-                await asyncio.sleep(retry)
+            if parser.retry is not None:
+                retry = parser.retry / 1000
+            await asyncio.sleep(retry)
 
     async def __aenter__(self) -> "AiohttpClient":
         return self
@@ -0,0 +1,138 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from .response import Response
+
+__all__ = ["RequestCoalescer"]
+
+_Key = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class RequestCoalescer:
+    """The :class:`RequestCoalescer` object merges identical concurrent GET requests of
+    :class:`RequestsClient <stellar_sdk.client.requests_client.RequestsClient>` and
+    :class:`AiohttpClient <stellar_sdk.client.aiohttp_client.AiohttpClient>`.
+
+    While a GET request to an URL with some params is in flight, the GET requests
+    to the same URL with the same params wait for it instead of being sent,
+    and all of them get its :class:`Response <stellar_sdk.client.response.Response>`
+    (or its exception). Only concurrent requests are merged, nothing is cached once
+    the request has completed.
+
+    The response is shared, but every call to :meth:`Response.json
+    <stellar_sdk.client.response.Response.json>` decodes a new dict, so the callers
+    can modify the result.
+
+    It can be used from many threads with a :class:`RequestsClient
+    <stellar_sdk.client.requests_client.RequestsClient>` and from many coroutines with an
+    :class:`AiohttpClient <stellar_sdk.client.aiohttp_client.AiohttpClient>`.
+
+    An example::
+
+        coalescer = RequestCoalescer()
+        client = AiohttpClient(coalescer=coalescer)
+        async with Server(horizon_url, client=client) as server:
+            await asyncio.gather(*[server.fee_stats() for _ in range(50)])
+        print(coalescer.requests, coalescer.coalesced)
+    """
+
+    def __init__(self) -> None:
+        #: The number of GET requests received.
+        self.requests: int = 0
+        #: The number of GET requests that waited for an identical request in flight.
+        self.coalesced: int = 0
+        self._futures: Dict[_Key, concurrent.futures.Future] = {}
+        self._tasks: Dict[Tuple[Hashable, _Key], asyncio.Future] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def run(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]],
+        send: Callable[[str, Optional[Dict[str, str]]], Response],
+    ) -> Response:
+        """Send a GET request with ``send``, or wait for an identical request in flight.
+
+        :param url: the request url
+        :param params: the request params
+        :param send: the function sending the request
+        :return: the response from server
+        """
+        key = _request_key(url, params)
+        with self._lock:
+            self.requests += 1
+            future = self._futures.get(key)
+            leader = future is None
+            if leader:
+                future = self._futures[key] = concurrent.futures.Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            response = send(url, params)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._futures[key]
+
+    async def arun(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]],
+        send: Callable[[str, Optional[Dict[str, str]]], Awaitable[Response]],
+    ) -> Response:
+        """Send a GET request with the coroutine function ``send``, or wait for an
+        identical request in flight in the same event loop.
+
+        The request runs in its own task, cancelling a caller does not cancel
+        the request of the others.
+
+        :param url: the request url
+        :param params: the request params
+        :param send: the coroutine function sending the request
+        :return: the response from server
+        """
+        key = (id(asyncio.get_event_loop()), _request_key(url, params))
+        with self._lock:
+            self.requests += 1
+            task = self._tasks.get(key)
+            if task is not None:
+                self.coalesced += 1
+            else:
+                task = asyncio.ensure_future(send(url, params))
+                self._tasks[key] = task
+                task.add_done_callback(lambda t: self._forget_task(key, t))
+        return await asyncio.shield(task)
+
+    def _forget_task(self, key: Tuple[Hashable, _Key], task: asyncio.Future) -> None:
+        with self._lock:
+            self._tasks.pop(key, None)
+        if not task.cancelled():
+            # Mark the exception as retrieved, every caller may have been cancelled.
+            task.exception()
+
+    def reset_counters(self) -> None:
+        """Set :attr:`requests` and :attr:`coalesced` to 0."""
+        with self._lock:
+            self.requests = 0
+            self.coalesced = 0
+
+    def __repr__(self) -> str:
+        return "<RequestCoalescer [requests={}, coalesced={}]>".format(
+            self.requests, self.coalesced
+        )
+
+
+def _request_key(url: str, params: Optional[Dict[str, str]]) -> _Key:
+    if not params:
+        return url, ()
+    return url, tuple(sorted((str(k), str(v)) for k, v in params.items()))
@@ -0,0 +1,138 @@
+import collections
+import threading
+from typing import Callable, Deque, Optional
+
+from .response import Response
+from ..exceptions import ValueError
+
+__all__ = ["HedgingPolicy"]
+
+
+class HedgingPolicy:
+    """The :class:`HedgingPolicy` object configures the hedged GET requests of
+    :class:`RequestsClient <stellar_sdk.client.requests_client.RequestsClient>` and
+    :class:`AiohttpClient <stellar_sdk.client.aiohttp_client.AiohttpClient>`.
+
+    When a GET request has not completed after the hedging delay, a duplicate
+    request is sent, to the same URL or to the one returned by ``alternate_url``.
+    The first successful response (no connection error and a status lower than
+    500) is returned and the other request is cancelled.
+
+    The delay is ``delay`` seconds if it is set, otherwise the ``percentile`` of
+    the latencies of the last ``window`` requests, no request is hedged before
+    ``min_samples`` latencies have been observed.
+
+    An example::
+
+        policy = HedgingPolicy(percentile=95)
+        server = Server(horizon_url, client=RequestsClient(hedging=policy))
+        ...
+        print(policy.hedges_fired, policy.hedges_won)
+
+    :param delay: the fixed hedging delay in seconds, ``None`` to use the observed latencies.
+    :param percentile: the percentile of the observed latencies used as the delay, in (0, 100].
+    :param window: the number of latencies kept to compute the percentile.
+    :param min_samples: the number of latencies observed before the first hedge.
+    :param alternate_url: a function returning the URL of the duplicate request
+        (ex. the same path on another Horizon instance), defaults to the same URL.
+    :raise: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if a parameter is out of range.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        percentile: float = 95,
+        window: int = 1000,
+        min_samples: int = 20,
+        alternate_url: Callable[[str], str] = None,
+    ) -> None:
+        if delay is not None and delay < 0:
+            raise ValueError("delay should not be negative, got {}.".format(delay))
+        if not 0 < percentile <= 100:
+            raise ValueError(
+                "percentile should be in (0, 100], got {}.".format(percentile)
+            )
+        if window < 1:
+            raise ValueError("window should be greater than 0, got {}.".format(window))
+        if min_samples < 1 or min_samples > window:
+            raise ValueError(
+                "min_samples should be in [1, window], got {}.".format(min_samples)
+            )
+        self.delay: Optional[float] = delay
+        self.percentile: float = percentile
+        self.min_samples: int = min_samples
+        self.alternate_url: Optional[Callable[[str], str]] = alternate_url
+        #: The number of GET requests sent through the policy.
+        self.requests: int = 0
+        #: The number of duplicate requests sent.
+        self.hedges_fired: int = 0
+        #: The number of duplicate requests whose response was returned.
+        self.hedges_won: int = 0
+        self._latencies: Deque[float] = collections.deque(maxlen=window)
+        self._observed_delay: Optional[float] = None
+        self._samples_since_update: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def hedging_delay(self) -> Optional[float]:
+        """The current hedging delay in seconds, ``None`` if requests are not hedged yet.
+
+        :return: the delay.
+        """
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            # Sorting the window on every request would dominate the cost of
+            # short requests, the percentile is refreshed every few samples.
+            if self._observed_delay is None or self._samples_since_update >= max(
+                self.min_samples // 2, 1
+            ):
+                latencies = sorted(self._latencies)
+                index = int(len(latencies) * self.percentile / 100 + 0.5) - 1
+                self._observed_delay = latencies[min(max(index, 0), len(latencies) - 1)]
+                self._samples_since_update = 0
+            return self._observed_delay
+
+    def hedge_url(self, url: str) -> str:
+        """The URL of the duplicate request of a request to ``url``.
+
+        :param url: the URL of the original request.
+        :return: the URL of the duplicate request.
+        """
+        if self.alternate_url is None:
+            return url
+        return self.alternate_url(url)
+
+    def reset_counters(self) -> None:
+        """Set :attr:`requests`, :attr:`hedges_fired` and :attr:`hedges_won` to 0."""
+        with self._lock:
+            self.requests = 0
+            self.hedges_fired = 0
+            self.hedges_won = 0
+
+    def _record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def _record_latency(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+            self._samples_since_update += 1
+
+    def _record_hedge_fired(self) -> None:
+        with self._lock:
+            self.hedges_fired += 1
+
+    def _record_hedge_won(self) -> None:
+        with self._lock:
+            self.hedges_won += 1
+
+    def __repr__(self) -> str:
+        return "<HedgingPolicy [requests={}, hedges_fired={}, hedges_won={}]>".format(
+            self.requests, self.hedges_fired, self.hedges_won
+        )
+
+
+def _is_hedge_success(response: Response) -> bool:
+    return response.status_code < 500
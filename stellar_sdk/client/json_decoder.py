@@ -0,0 +1,29 @@
+import json
+from typing import Any, Callable, Union
+
+__all__ = ["JsonDecoder", "default_json_decoder"]
+
+JsonDecoder = Callable[[Union[str, bytes]], Any]
+"""A function decoding a JSON document, given as ``str`` or UTF-8 ``bytes``."""
+
+
+def _find_json_decoder() -> JsonDecoder:
+    try:
+        import orjson
+
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import ujson
+
+        return ujson.loads
+    except ImportError:
+        pass
+    return json.loads
+
+
+default_json_decoder: JsonDecoder = _find_json_decoder()
+"""The JSON decoder used when none is passed to the client: ``orjson.loads`` if
+`orjson <https://pypi.org/project/orjson/>`_ is installed, else ``ujson.loads`` if
+`ujson <https://pypi.org/project/ujson/>`_ is installed, else ``json.loads``."""
@@ -0,0 +1,487 @@
+import asyncio
+import threading
+import time
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Sequence
+
+from .base_async_client import BaseAsyncClient
+from .base_sync_client import BaseSyncClient
+from .response import Response
+from ..exceptions import ConnectionError, ValueError
+
+__all__ = ["HorizonNode", "MultiHorizonClient", "AsyncMultiHorizonClient"]
+
+
+class HorizonNode:
+    """The routing state of a Horizon instance used by :class:`MultiHorizonClient`
+    and :class:`AsyncMultiHorizonClient`.
+
+    :param url: the base URL of the Horizon instance.
+    """
+
+    def __init__(self, url: str) -> None:
+        self.url: str = url.rstrip("/")
+        #: The moving average of the GET latencies in seconds, ``None`` before the first success.
+        self.latency: Optional[float] = None
+        #: The moving average of the failures, between ``0`` (no failure) and ``1``.
+        self.error_rate: float = 0.0
+        self.consecutive_failures: int = 0
+        #: The time (``time.monotonic()``) until which the node is down, ``None`` if it is up.
+        self.down_until: Optional[float] = None
+        self.probing: bool = False
+
+    @property
+    def is_down(self) -> bool:
+        """``True`` if the node is down, it may be probed once its recovery timeout expired."""
+        return self.down_until is not None
+
+    def _score(self) -> float:
+        # The expected time of a successful request, nodes that have not been
+        # measured yet come first.
+        if self.latency is None:
+            return 0.0
+        return self.latency / max(1.0 - self.error_rate, 0.1)
+
+    def __repr__(self) -> str:
+        return "<HorizonNode [url={}, latency={}, error_rate={:.3f}, down={}]>".format(
+            self.url, self.latency, self.error_rate, self.is_down
+        )
+
+
+class _NodePool:
+    """The nodes of a multi Horizon client and their health, safe to share
+    between threads."""
+
+    def __init__(
+        self,
+        horizon_urls: Sequence[str],
+        failure_threshold: int,
+        recovery_timeout: float,
+        ewma_alpha: float,
+    ) -> None:
+        if not horizon_urls:
+            raise ValueError("At least one Horizon URL is required.")
+        if failure_threshold < 1:
+            raise ValueError(
+                "failure_threshold should be greater than 0, got {}.".format(
+                    failure_threshold
+                )
+            )
+        if recovery_timeout < 0:
+            raise ValueError(
+                "recovery_timeout should not be negative, got {}.".format(
+                    recovery_timeout
+                )
+            )
+        if not 0 < ewma_alpha <= 1:
+            raise ValueError(
+                "ewma_alpha should be in (0, 1], got {}.".format(ewma_alpha)
+            )
+        self.nodes: List[HorizonNode] = [HorizonNode(url) for url in horizon_urls]
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout: float = recovery_timeout
+        self.ewma_alpha: float = ewma_alpha
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def primary(self) -> HorizonNode:
+        return self.nodes[0]
+
+    def relative_path(self, url: str) -> Optional[str]:
+        """The part of ``url`` after the base URL of a node, ``None`` if the URL
+        does not belong to any node."""
+        for node in self.nodes:
+            size = len(node.url)
+            if url.startswith(node.url) and url[size : size + 1] in ("", "/", "?"):
+                return url[size:]
+        return None
+
+    def select(self, exclude: Sequence[HorizonNode] = ()) -> Optional[HorizonNode]:
+        """Pick the node of the next request, ``None`` if all the nodes are excluded.
+
+        A down node whose recovery timeout expired is picked for a single probe
+        request. Otherwise the healthy node with the lowest score is picked, and
+        if all the nodes are down, the one that will recover first.
+        """
+        now = time.monotonic()
+        with self._lock:
+            healthy = []
+            down = []
+            probing = []
+            for node in self.nodes:
+                if node in exclude:
+                    continue
+                if node.down_until is None:
+                    healthy.append(node)
+                elif node.probing:
+                    probing.append(node)
+                elif node.down_until <= now:
+                    node.probing = True
+                    return node
+                else:
+                    down.append(node)
+            if healthy:
+                return min(healthy, key=HorizonNode._score)
+            if down:
+                node = min(down, key=lambda n: n.down_until)
+                node.probing = True
+                return node
+            if probing:
+                # Every remaining node is being probed, do not wait for the probes.
+                return min(probing, key=lambda n: n.down_until)
+            return None
+
+    def best(self) -> HorizonNode:
+        """The healthy node with the lowest score, or the primary node if all
+        the nodes are down."""
+        with self._lock:
+            healthy = [node for node in self.nodes if node.down_until is None]
+            return min(healthy, key=HorizonNode._score) if healthy else self.primary
+
+    def record_success(self, node: HorizonNode, latency: float) -> None:
+        alpha = self.ewma_alpha
+        with self._lock:
+            if node.latency is None:
+                node.latency = latency
+            else:
+                node.latency += alpha * (latency - node.latency)
+            node.error_rate -= alpha * node.error_rate
+            node.consecutive_failures = 0
+            node.down_until = None
+            node.probing = False
+
+    def record_failure(self, node: HorizonNode) -> None:
+        with self._lock:
+            node.error_rate += self.ewma_alpha * (1.0 - node.error_rate)
+            node.consecutive_failures += 1
+            if node.probing or node.consecutive_failures >= self.failure_threshold:
+                # A failed probe puts the node down for another recovery timeout.
+                node.down_until = time.monotonic() + self.recovery_timeout
+            node.probing = False
+
+    def release(self, node: HorizonNode) -> None:
+        with self._lock:
+            node.probing = False
+
+
+def _is_node_failure(response: Response) -> bool:
+    return response.status_code >= 500
+
+
+class MultiHorizonClient(BaseSyncClient):
+    """The :class:`MultiHorizonClient` object is a synchronous http client which
+    spreads the requests over several Horizon instances.
+
+    GET requests are sent to the healthy node with the lowest latency, the
+    latency and the error rate of each node are tracked as exponentially weighted
+    moving averages. A request that fails on a node (connection error or 5xx
+    status) is retried on the next best node. After ``failure_threshold``
+    consecutive failures a node is marked down, once ``recovery_timeout``
+    seconds have passed a single request is sent to it as a probe: the node is
+    up again if it succeeds, and down for another ``recovery_timeout`` otherwise.
+
+    Transactions (POST requests) are always submitted to the primary node, the
+    first one of ``horizon_urls``. Streams are opened on the best node.
+
+    The URLs of the requests must start with the URL of one of the nodes, the
+    :class:`Server <stellar_sdk.server.Server>` uses the primary node when it
+    is given no ``horizon_url``::
+
+        client = MultiHorizonClient(["https://horizon-1.example.com", "https://horizon-2.example.com"])
+        server = Server(client=client)
+
+    :param horizon_urls: the base URLs of the Horizon instances, the first one is the primary node.
+    :param client: the client used to send the requests,
+        defaults to :class:`RequestsClient <stellar_sdk.client.requests_client.RequestsClient>`.
+    :param failure_threshold: the number of consecutive failures after which a node is marked down.
+    :param recovery_timeout: the number of seconds a node stays down before it is probed.
+    :param ewma_alpha: the weight of the latest sample in the moving averages, in (0, 1].
+    :raise: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``horizon_urls``
+        is empty or a parameter is out of range.
+    """
+
+    def __init__(
+        self,
+        horizon_urls: Sequence[str],
+        client: BaseSyncClient = None,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30,
+        ewma_alpha: float = 0.3,
+    ) -> None:
+        self._pool: _NodePool = _NodePool(
+            horizon_urls, failure_threshold, recovery_timeout, ewma_alpha
+        )
+        if client is None:
+            from .requests_client import RequestsClient
+
+            client = RequestsClient()
+        self.client: BaseSyncClient = client
+
+    @property
+    def nodes(self) -> List[HorizonNode]:
+        """The nodes, the primary node first."""
+        return self._pool.nodes
+
+    @property
+    def horizon_url(self) -> str:
+        """The URL of the primary node."""
+        return self._pool.primary.url
+
+    def get(self, url: str, params: Dict[str, str] = None) -> Response:
+        """Perform HTTP GET request on the best node, failing over to the next
+        ones if it fails.
+
+        :param url: the request url
+        :param params: the request params
+        :return: the response from server, the last one if all the nodes returned a 5xx status.
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`:
+            if the request failed on every node.
+        """
+        path = self._pool.relative_path(url)
+        if path is None:
+            return self.client.get(url, params)
+        tried: List[HorizonNode] = []
+        response: Optional[Response] = None
+        error: Optional[Exception] = None
+        while True:
+            node = self._pool.select(tried)
+            if node is None:
+                break
+            tried.append(node)
+            start = time.monotonic()
+            try:
+                response = self.client.get(node.url + path, params)
+            except ConnectionError as e:
+                error = e
+                self._pool.record_failure(node)
+                continue
+            except BaseException:
+                self._pool.release(node)
+                raise
+            if _is_node_failure(response):
+                self._pool.record_failure(node)
+                continue
+            self._pool.record_success(node, time.monotonic() - start)
+            return response
+        if response is not None:
+            return response
+        raise error
+
+    def post(self, url: str, data: Dict[str, str] = None) -> Response:
+        """Perform HTTP POST request on the primary node.
+
+        :param url: the request url
+        :param data: the data send to server
+        :return: the response from server
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
+        """
+        path = self._pool.relative_path(url)
+        if path is None:
+            return self.client.post(url, data)
+        node = self._pool.primary
+        start = time.monotonic()
+        try:
+            response = self.client.post(node.url + path, data)
+        except ConnectionError:
+            self._pool.record_failure(node)
+            raise
+        if _is_node_failure(response):
+            self._pool.record_failure(node)
+        else:
+            self._pool.record_success(node, time.monotonic() - start)
+        return response
+
+    def stream(
+        self, url: str, params: Dict[str, str] = None
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Creates an EventSource on the best node that listens for incoming messages from the server.
+
+        :param url: the request url
+        :param params: the request params
+        :return: a Generator for server response
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
+        """
+        path = self._pool.relative_path(url)
+        if path is not None:
+            url = self._pool.best().url + path
+        return self.client.stream(url, params)
+
+    def check_health(self) -> None:
+        """Send a request to the root endpoint of every node and update their state,
+        down nodes included."""
+        for node in self.nodes:
+            start = time.monotonic()
+            try:
+                response = self.client.get(node.url + "/")
+            except ConnectionError:
+                self._pool.record_failure(node)
+                continue
+            if _is_node_failure(response):
+                self._pool.record_failure(node)
+            else:
+                self._pool.record_success(node, time.monotonic() - start)
+
+    def close(self) -> None:
+        """Close underlying client.
+
+        Release all acquired resources.
+        """
+        self.client.close()
+
+    def __enter__(self) -> "MultiHorizonClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class AsyncMultiHorizonClient(BaseAsyncClient):
+    """The :class:`AsyncMultiHorizonClient` object is an asynchronous http client which
+    spreads the requests over several Horizon instances, see :class:`MultiHorizonClient`.
+
+    :param horizon_urls: the base URLs of the Horizon instances, the first one is the primary node.
+    :param client: the client used to send the requests,
+        defaults to :class:`AiohttpClient <stellar_sdk.client.aiohttp_client.AiohttpClient>`.
+    :param failure_threshold: the number of consecutive failures after which a node is marked down.
+    :param recovery_timeout: the number of seconds a node stays down before it is probed.
+    :param ewma_alpha: the weight of the latest sample in the moving averages, in (0, 1].
+    :raise: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``horizon_urls``
+        is empty or a parameter is out of range.
+    """
+
+    def __init__(
+        self,
+        horizon_urls: Sequence[str],
+        client: BaseAsyncClient = None,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30,
+        ewma_alpha: float = 0.3,
+    ) -> None:
+        self._pool: _NodePool = _NodePool(
+            horizon_urls, failure_threshold, recovery_timeout, ewma_alpha
+        )
+        if client is None:
+            from .aiohttp_client import AiohttpClient
+
+            client = AiohttpClient()
+        self.client: BaseAsyncClient = client
+
+    @property
+    def nodes(self) -> List[HorizonNode]:
+        """The nodes, the primary node first."""
+        return self._pool.nodes
+
+    @property
+    def horizon_url(self) -> str:
+        """The URL of the primary node."""
+        return self._pool.primary.url
+
+    async def get(self, url: str, params: Dict[str, str] = None) -> Response:
+        """Perform HTTP GET request on the best node, failing over to the next
+        ones if it fails.
+
+        :param url: the request url
+        :param params: the request params
+        :return: the response from server, the last one if all the nodes returned a 5xx status.
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`:
+            if the request failed on every node.
+        """
+        path = self._pool.relative_path(url)
+        if path is None:
+            return await self.client.get(url, params)
+        tried: List[HorizonNode] = []
+        response: Optional[Response] = None
+        error: Optional[Exception] = None
+        while True:
+            node = self._pool.select(tried)
+            if node is None:
+                break
+            tried.append(node)
+            start = time.monotonic()
+            try:
+                response = await self.client.get(node.url + path, params)
+            except (ConnectionError, asyncio.TimeoutError) as e:
+                error = e
+                self._pool.record_failure(node)
+                continue
+            except BaseException:
+                self._pool.release(node)
+                raise
+            if _is_node_failure(response):
+                self._pool.record_failure(node)
+                continue
+            self._pool.record_success(node, time.monotonic() - start)
+            return response
+        if response is not None:
+            return response
+        raise error
+
+    async def post(self, url: str, data: Dict[str, str] = None) -> Response:
+        """Perform HTTP POST request on the primary node.
+
+        :param url: the request url
+        :param data: the data send to server
+        :return: the response from server
+        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
+        """
+        path = self._pool.relative_path(url)
+        if path is None:
+            return await self.client.post(url, data)
+        node = self._pool.primary
+        start = time.monotonic()
+        try:
+            response = await self.client.post(node.url + path, data)
+        except (ConnectionError, asyncio.TimeoutError):
+            self._pool.record_failure(node)
+            raise
+        if _is_node_failure(response):
+            self._pool.record_failure(node)
+        else:
+            self._pool.record_success(node, time.monotonic() - start)
+        return response
+
+    async def stream(
+        self, url: str, params: Dict[str, str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Creates an EventSource on the best node that listens for incoming messages from the server.
+
+        :param url: the request url
+        :param params: the request params
+        :return: a dict AsyncGenerator for server response
+        :raise: :exc:`StreamClientError <stellar_sdk.exceptions.StreamClientError>` - Failed to fetch stream resource.
+        """
+        path = self._pool.relative_path(url)
+        if path is not None:
+            url = self._pool.best().url + path
+        async for event in self.client.stream(url, params):
+            yield event
+
+    async def check_health(self) -> None:
+        """Send a request to the root endpoint of every node at the same time and
+        update their state, down nodes included."""
+
+        async def check(node: HorizonNode) -> None:
+            start = time.monotonic()
+            try:
+                response = await self.client.get(node.url + "/")
+            except (ConnectionError, asyncio.TimeoutError):
+                self._pool.record_failure(node)
+                return
+            if _is_node_failure(response):
+                self._pool.record_failure(node)
+            else:
+                self._pool.record_success(node, time.monotonic() - start)
+
+        await asyncio.gather(*(check(node) for node in self.nodes))
+
+    async def close(self) -> None:
+        """Close underlying client.
+
+        Release all acquired resources.
+        """
+        await self.client.close()
+
+    async def __aenter__(self) -> "AsyncMultiHorizonClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -0,0 +1,243 @@
+import asyncio
+import email.utils
+import threading
+import time
+from typing import Awaitable, Callable, Mapping, Optional
+
+from .response import Response
+from ..exceptions import BuildInValueError, ValueError
+
+__all__ = ["RateLimiter"]
+
+_RETRY_STATUS_CODES = (429, 503)
+
+
+class RateLimiter:
+    """The :class:`RateLimiter` object throttles the requests of
+    :class:`RequestsClient <stellar_sdk.client.requests_client.RequestsClient>` and
+    :class:`AiohttpClient <stellar_sdk.client.aiohttp_client.AiohttpClient>`
+    to stay under the rate limit of Horizon.
+
+    It is a token bucket of ``limit`` requests refilled at ``limit / period`` requests
+    per second. Each request takes a token, when the bucket is empty the request waits
+    for its token, so a burst of concurrent requests is spread out instead of being
+    rejected. The bucket learns from the ``X-Ratelimit-Limit``, ``X-Ratelimit-Remaining``
+    and ``X-Ratelimit-Reset`` headers of the responses: the size of the bucket follows
+    the limit, the tokens never exceed the remaining requests, the bucket is full again
+    when the limit resets, and no request is sent before the reset when none remains.
+
+    When a response has the status 429 or 503, no request is sent before the
+    ``Retry-After`` delay (or the reset of the limit) has elapsed, and a GET request
+    is sent again up to ``max_retries`` times. The limiter does not send a POST request
+    again, the clients leave the responses with the status 429 or 503 to the limiter.
+
+    A :class:`RateLimiter` can be shared by several clients talking to the same
+    Horizon instance, from threads or coroutines.
+
+    An example::
+
+        limiter = RateLimiter()
+        server = Server(horizon_url, client=AiohttpClient(rate_limiter=limiter))
+        ...
+        print(limiter.remaining, limiter.throttled, limiter.total_wait)
+
+    :param limit: the initial number of requests allowed per ``period``, before a
+        response tells the actual limit. Horizon allows 3600 requests per hour by default.
+    :param period: the duration of the rate limit window in seconds.
+    :param max_retries: the number of times a GET request rejected with the status
+        429 or 503 is sent again.
+    :raise: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if a parameter is out of range.
+    """
+
+    def __init__(
+        self, limit: int = 3600, period: float = 3600, max_retries: int = 1
+    ) -> None:
+        if limit < 1:
+            raise ValueError("limit should be greater than 0, got {}.".format(limit))
+        if period <= 0:
+            raise ValueError("period should be greater than 0, got {}.".format(period))
+        if max_retries < 0:
+            raise ValueError(
+                "max_retries should not be negative, got {}.".format(max_retries)
+            )
+        self.period: float = period
+        self.max_retries: int = max_retries
+        #: The number of requests sent through the limiter.
+        self.requests: int = 0
+        #: The number of requests that waited before being sent.
+        self.throttled: int = 0
+        #: The number of responses with the status 429 or 503.
+        self.rejected: int = 0
+        #: The total time the requests waited, in seconds.
+        self.total_wait: float = 0.0
+        self._limit: int = limit
+        self._rate: float = limit / period
+        self._tokens: float = limit
+        self._updated_at: float = time.monotonic()
+        self._blocked_until: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """The number of requests allowed per :attr:`period`."""
+        return self._limit
+
+    @property
+    def remaining(self) -> float:
+        """The number of requests that can be sent now without waiting,
+        negative when requests are queued for the next tokens."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    @property
+    def wait_time(self) -> float:
+        """The time a request sent now would wait, in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return self._wait_time(now, self._tokens - 1)
+
+    def run(self, send: Callable[[], Response], retry: bool = False) -> Response:
+        """Wait for a token and send a request with ``send``.
+
+        :param send: the function sending the request
+        :param retry: send the request again when it is rejected with the status 429 or 503
+        :return: the response from server
+        """
+        attempts = self.max_retries + 1 if retry else 1
+        for attempt in range(attempts):
+            wait = self._reserve()
+            if wait > 0:
+                time.sleep(wait)
+            response = send()
+            self.update(response)
+            if response.status_code not in _RETRY_STATUS_CODES:
+                break
+        return response
+
+    async def arun(
+        self, send: Callable[[], Awaitable[Response]], retry: bool = False
+    ) -> Response:
+        """Wait for a token and send a request with the coroutine function ``send``.
+
+        :param send: the coroutine function sending the request
+        :param retry: send the request again when it is rejected with the status 429 or 503
+        :return: the response from server
+        """
+        attempts = self.max_retries + 1 if retry else 1
+        for attempt in range(attempts):
+            wait = self._reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            response = await send()
+            self.update(response)
+            if response.status_code not in _RETRY_STATUS_CODES:
+                break
+        return response
+
+    def update(self, response: Response) -> None:
+        """Update the bucket from the rate limit headers and the status of a response.
+
+        :param response: the response from server
+        """
+        headers = response.headers
+        limit = _int_header(headers, "X-Ratelimit-Limit")
+        remaining = _int_header(headers, "X-Ratelimit-Remaining")
+        reset = _int_header(headers, "X-Ratelimit-Reset")
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if limit is not None and limit > 0:
+                self._limit = limit
+                self._rate = limit / self.period
+                self._tokens = min(self._tokens, limit)
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+                if reset is not None and reset > 0 and self._limit > remaining:
+                    self._rate = (self._limit - remaining) / reset
+                if remaining <= 0 and reset is not None:
+                    self._block(now + reset)
+            if response.status_code in _RETRY_STATUS_CODES:
+                self.rejected += 1
+                retry_after = _retry_after(headers)
+                if retry_after is None:
+                    retry_after = reset if response.status_code == 429 else None
+                if retry_after is not None:
+                    self._block(now + retry_after)
+
+    def reset_counters(self) -> None:
+        """Set :attr:`requests`, :attr:`throttled`, :attr:`rejected` and :attr:`total_wait` to 0."""
+        with self._lock:
+            self.requests = 0
+            self.throttled = 0
+            self.rejected = 0
+            self.total_wait = 0.0
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = self._wait_time(now, self._tokens)
+            self.requests += 1
+            if wait > 0:
+                self.throttled += 1
+                self.total_wait += wait
+            return wait
+
+    def _wait_time(self, now: float, tokens: float) -> float:
+        wait = max(self._blocked_until - now, 0.0)
+        if tokens < 0:
+            wait = max(wait, -tokens / self._rate)
+        return wait
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self._limit, self._tokens + elapsed * self._rate)
+            self._updated_at = now
+
+    def _block(self, until: float) -> None:
+        self._blocked_until = max(self._blocked_until, until)
+
+    def __repr__(self) -> str:
+        return "<RateLimiter [limit={}, requests={}, throttled={}, rejected={}]>".format(
+            self.limit, self.requests, self.throttled, self.rejected
+        )
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+    value = headers.get(name)
+    if value is not None:
+        return value
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = _header(headers, name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except BuildInValueError:
+        return None
+
+
+def _retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    value = _header(headers, "Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except BuildInValueError:
+        pass
+    # Retry-After can also be an HTTP date.
+    timestamp = email.utils.parsedate_tz(value)
+    if timestamp is None:
+        return None
+    return max(email.utils.mktime_tz(timestamp) - time.time(), 0.0)
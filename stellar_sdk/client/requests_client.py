@@ -1,21 +1,33 @@
-import json
-from typing import Generator, Union, Dict, Any, Tuple
+import concurrent.futures
+import threading
+import time
+from typing import Generator, Union, Dict, Any, Optional, Tuple
 
 import requests
 from requests import Session, RequestException
 from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
-from sseclient import SSEClient
 from urllib3.exceptions import NewConnectionError
 from urllib3.util import Retry
 
 from . import defines
 from ..__version__ import __version__
 from ..client.base_sync_client import BaseSyncClient
+from ..client.coalescing import RequestCoalescer
+from ..client.hedging import HedgingPolicy, _is_hedge_success
+from ..client.json_decoder import JsonDecoder, default_json_decoder
+from ..client.rate_limit import _RETRY_STATUS_CODES, RateLimiter
 from ..client.response import Response
-from ..exceptions import ConnectionError
+from ..client.sse import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_EVENT_SIZE, SSEParser
+from ..exceptions import (
+    BuildInValueError,
+    ConnectionError,
+    StreamClientError,
+    ValueError,
+)
 
 DEFAULT_NUM_RETRIES = 3
 DEFAULT_BACKOFF_FACTOR = 0.5
+SSE_HEADERS = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
 USER_AGENT = "py-stellar-sdk/%s/RequestsClient" % __version__
 IDENTIFICATION_HEADERS = {
     "X-Client-Name": "py-stellar-sdk",
@@ -36,6 +48,20 @@ class RequestsClient(BaseSyncClient):
     :param backoff_factor: a backoff factor to apply between attempts after the second try
     :param session: the request session
     :param stream_session: the stream request session
+    :param json_decoder: the function used to decode JSON responses and stream events,
+        defaults to :data:`stellar_sdk.client.json_decoder.default_json_decoder`
+    :param hedging: the policy of hedged GET requests, see :class:`HedgingPolicy
+        <stellar_sdk.client.hedging.HedgingPolicy>`, GET requests are not hedged by default.
+        The requests are sent from a thread pool, a request that loses the race
+        runs to completion in the background and its response is dropped.
+    :param coalescer: merges identical concurrent GET requests (ex. from a thread pool),
+        see :class:`RequestCoalescer <stellar_sdk.client.coalescing.RequestCoalescer>`,
+        GET requests are not merged by default.
+    :param rate_limiter: throttles the GET and POST requests to stay under the rate limit
+        of Horizon, see :class:`RateLimiter <stellar_sdk.client.rate_limit.RateLimiter>`,
+        requests are not throttled by default. With a rate limiter, the responses with
+        the status 429 or 503 are retried by the rate limiter only, not by the retry handler.
+    :param max_event_size: the maximum size of a stream event in bytes.
     """
 
     def __init__(
@@ -47,12 +73,24 @@ class RequestsClient(BaseSyncClient):
         backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
         session: Session = None,
         stream_session: Session = None,
+        json_decoder: JsonDecoder = None,
+        hedging: HedgingPolicy = None,
+        coalescer: RequestCoalescer = None,
+        rate_limiter: RateLimiter = None,
+        max_event_size: int = DEFAULT_MAX_EVENT_SIZE,
     ):
         self.pool_size: int = pool_size
         self.num_retries: int = num_retries
         self.request_timeout: int = request_timeout
         self.post_timeout: float = post_timeout
         self.backoff_factor: float = backoff_factor
+        self.json_decoder: JsonDecoder = json_decoder or default_json_decoder
+        self.hedging: Optional[HedgingPolicy] = hedging
+        self.coalescer: Optional[RequestCoalescer] = coalescer
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.max_event_size: int = max_event_size
+        self._hedging_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._hedging_executor_lock: threading.Lock = threading.Lock()
 
         # adding 504 to the tuple of statuses to retry
         self.status_forcelist: Tuple[int] = tuple(Retry.RETRY_AFTER_STATUS_CODES) + (
@@ -62,13 +100,23 @@ class RequestsClient(BaseSyncClient):
         # configure standard session
 
         # configure retry handler
+        status_forcelist = self.status_forcelist
+        if self.rate_limiter is not None:
+            # the rate limiter waits for the Retry-After delay and retries
+            # the rejected requests itself, it has to see every rejection
+            status_forcelist = tuple(
+                status
+                for status in status_forcelist
+                if status not in _RETRY_STATUS_CODES
+            )
         retry = Retry(
             total=self.num_retries,
             backoff_factor=self.backoff_factor,
             redirect=0,
-            status_forcelist=self.status_forcelist,
+            status_forcelist=status_forcelist,
             method_whitelist=frozenset(["GET", "POST"]),
             raise_on_status=False,
+            respect_retry_after_header=self.rate_limiter is None,
         )
         # init transport adapter
         adapter = HTTPAdapter(
@@ -116,17 +164,87 @@ class RequestsClient(BaseSyncClient):
         :return: the response from server
         :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
         """
+        if self.coalescer is not None:
+            return self.coalescer.run(url, params, self.__send_get)
+        return self.__send_get(url, params)
+
+    def __send_get(self, url: str, params: Optional[Dict[str, str]]) -> Response:
+        if self.hedging is None:
+            return self.__get(url, params)
+        return self.__hedged_get(url, params, self.hedging)
+
+    def __get(self, url: str, params: Optional[Dict[str, str]]) -> Response:
+        if self.rate_limiter is not None:
+            return self.rate_limiter.run(lambda: self.__fetch(url, params), retry=True)
+        return self.__fetch(url, params)
+
+    def __fetch(self, url: str, params: Optional[Dict[str, str]]) -> Response:
         try:
             resp = self._session.get(url, params=params, timeout=self.request_timeout)
         except (RequestException, NewConnectionError) as err:
             raise ConnectionError(err)
         return Response(
             status_code=resp.status_code,
-            text=resp.text,
+            text=None,
             headers=dict(resp.headers),
             url=resp.url,
+            content=resp.content,
+            json_decoder=self.json_decoder,
         )
 
+    def __timed_get(
+        self, url: str, params: Optional[Dict[str, str]]
+    ) -> Tuple[Response, float]:
+        start = time.monotonic()
+        response = self.__get(url, params)
+        return response, time.monotonic() - start
+
+    def __hedged_get(
+        self, url: str, params: Optional[Dict[str, str]], policy: HedgingPolicy
+    ) -> Response:
+        policy._record_request()
+        delay = policy.hedging_delay()
+        if delay is None:
+            response, latency = self.__timed_get(url, params)
+            policy._record_latency(latency)
+            return response
+
+        with self._hedging_executor_lock:
+            if self._hedging_executor is None:
+                self._hedging_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=2 * self.pool_size
+                )
+            executor = self._hedging_executor
+        primary = executor.submit(self.__timed_get, url, params)
+        done, _ = concurrent.futures.wait([primary], timeout=delay)
+        if done:
+            response, latency = primary.result()
+            policy._record_latency(latency)
+            return response
+
+        hedge = executor.submit(self.__timed_get, policy.hedge_url(url), params)
+        policy._record_hedge_fired()
+        pending = {primary, hedge}
+        while pending:
+            done, pending = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future.exception() is not None:
+                    continue
+                response, latency = future.result()
+                if _is_hedge_success(response):
+                    for loser in pending:
+                        loser.cancel()
+                    # The latency of the winning request alone, the hedge
+                    # started ``delay`` seconds after the original request.
+                    policy._record_latency(latency)
+                    if future is hedge:
+                        policy._record_hedge_won()
+                    return response
+        # Both requests failed, report the outcome of the original request.
+        return primary.result()[0]
+
     def post(self, url: str, data: Dict[str, str] = None) -> Response:
         """Perform HTTP POST request.
 
@@ -135,15 +253,22 @@ class RequestsClient(BaseSyncClient):
         :return: the response from server
         :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
         """
+        if self.rate_limiter is not None:
+            return self.rate_limiter.run(lambda: self.__post(url, data))
+        return self.__post(url, data)
+
+    def __post(self, url: str, data: Optional[Dict[str, str]]) -> Response:
         try:
             resp = self._session.post(url, data=data, timeout=self.post_timeout)
         except (RequestException, NewConnectionError) as err:
             raise ConnectionError(err)
         return Response(
             status_code=resp.status_code,
-            text=resp.text,
+            text=None,
             headers=dict(resp.headers),
             url=resp.url,
+            content=resp.content,
+            json_decoder=self.json_decoder,
         )
 
     def stream(
@@ -158,20 +283,44 @@ class RequestsClient(BaseSyncClient):
         :param url: the request url
         :param params: the request params
         :return: a Generator for server response
-        :raise: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`
+        :raise: :exc:`StreamClientError <stellar_sdk.exceptions.StreamClientError>` - Failed to fetch stream resource.
         """
         query_params: Dict[str, Union[int, float, str]] = {**IDENTIFICATION_HEADERS}
         if params:
             query_params = {**params, **query_params}
-        stream_client = _SSEClient(
-            url,
-            retry=0,
-            session=self._stream_session,
-            connect_retry=-1,
-            params=query_params,
-        )
-        for message in stream_client:
-            yield message
+        retry = 0.0
+
+        while True:
+            parser = SSEParser(self.max_event_size)
+            try:
+                with self._stream_session.get(
+                    url, params=query_params, headers=SSE_HEADERS, stream=True
+                ) as resp:
+                    if resp.status_code != 200:
+                        raise StreamClientError(
+                            query_params.get("cursor"),
+                            "Failed to get stream message, status code: {}.".format(
+                                resp.status_code
+                            ),
+                        )
+                    for chunk in resp.iter_content(chunk_size=DEFAULT_CHUNK_SIZE):
+                        for event in parser.feed(chunk):
+                            if event.id:
+                                query_params["cursor"] = event.id
+                            try:
+                                message = self.json_decoder(event.data)
+                            except BuildInValueError:
+                                # Content was not json-decodable
+                                continue
+                            yield message
+            except (RequestException, NewConnectionError):
+                # The connection was lost, reconnect from the last cursor.
+                pass
+            except ValueError as e:
+                raise StreamClientError(query_params.get("cursor"), str(e)) from e
+            if parser.retry is not None:
+                retry = parser.retry / 1000
+            time.sleep(retry)
 
     def close(self) -> None:
         """Close underlying connector.
@@ -180,6 +329,8 @@ class RequestsClient(BaseSyncClient):
         """
         self._session.close()
         self._stream_session.close()
+        if self._hedging_executor is not None:
+            self._hedging_executor.shutdown(wait=False)
 
     def __enter__(self):
         return self
@@ -187,33 +338,3 @@ class RequestsClient(BaseSyncClient):
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-
-class _SSEClient:
-    def __init__(
-        self,
-        url: str,
-        last_id: Union[str, int] = None,
-        retry: int = 3000,
-        session: Session = None,
-        chunk_size: int = 1024,
-        connect_retry: int = 0,
-        **kwargs
-    ):
-        if SSEClient is None:
-            raise ImportError(
-                "SSE not supported, missing `stellar-base-sseclient` module"
-            )  # pragma: no cover
-
-        self.client = SSEClient(
-            url, last_id, retry, session, chunk_size, connect_retry, **kwargs
-        )
-
-    def __iter__(self):
-        return self
-
-    def __next__(self) -> Dict[str, Any]:
-        while True:
-            msg = next(self.client)
-            data = msg.data
-            if data != '"hello"' and data != '"byebye"':
-                return json.loads(data)
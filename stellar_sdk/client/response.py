@@ -1,4 +1,6 @@
-import json
+from typing import Optional
+
+from .json_decoder import JsonDecoder, default_json_decoder
 
 __all__ = ["Response"]
 
@@ -7,24 +9,66 @@ class Response:
     """The :class:`Response <Response>` object, which contains a
     server's response to an HTTP request.
 
+    The response can be built from the decoded ``text`` or from the raw ``content``,
+    in which case ``text`` is only decoded when it is accessed and :meth:`json`
+    decodes the raw content directly.
+
     :param status_code: response status code
     :param text: response content
     :param headers: response headers
     :param url: request url
+    :param content: raw response content, used when ``text`` is `None`
+    :param json_decoder: the function used by :meth:`json`, defaults to
+        :data:`stellar_sdk.client.json_decoder.default_json_decoder`
     """
 
-    def __init__(self, status_code: int, text: str, headers: dict, url: str) -> None:
+    def __init__(
+        self,
+        status_code: int,
+        text: Optional[str],
+        headers: dict,
+        url: str,
+        content: Optional[bytes] = None,
+        json_decoder: Optional[JsonDecoder] = None,
+    ) -> None:
         self.status_code: int = status_code
-        self.text: str = text
+        self._text: Optional[str] = text
+        self.content: Optional[bytes] = content
         self.headers: dict = headers
         self.url: str = url
+        self.json_decoder: JsonDecoder = json_decoder or default_json_decoder
+
+    @property
+    def text(self) -> str:
+        """The response content, decoded from ``content`` on first access."""
+        if self._text is None:
+            content = self.content if self.content is not None else b""
+            try:
+                self._text = content.decode(self._encoding(), errors="replace")
+            except LookupError:  # unknown charset
+                self._text = content.decode("utf-8", errors="replace")
+        return self._text
 
     def json(self) -> dict:
         """convert the content to dict
 
         :return: the content from server
         """
-        return json.loads(self.text)
+        if self._text is None and self.content is not None:
+            return self.json_decoder(self.content)
+        return self.json_decoder(self.text)
+
+    def _encoding(self) -> str:
+        content_type = ""
+        for key, value in self.headers.items():
+            if key.lower() == "content-type":
+                content_type = value
+                break
+        for param in content_type.split(";")[1:]:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "charset" and value.strip():
+                return value.strip().strip('"')
+        return "utf-8"
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, self.__class__):
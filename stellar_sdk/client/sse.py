@@ -0,0 +1,158 @@
+from typing import List, Optional
+
+from ..exceptions import ValueError
+
+__all__ = ["Event", "SSEParser", "DEFAULT_MAX_EVENT_SIZE", "DEFAULT_CHUNK_SIZE"]
+
+DEFAULT_MAX_EVENT_SIZE = 16 * 1024 * 1024
+"""The default maximum size of a server-sent event, in bytes."""
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+"""The default size of the reads from a stream, in bytes."""
+
+# Horizon opens and closes every stream with these messages, they carry no data.
+_SKIPPED_MESSAGES = (b'"hello"', b'"byebye"')
+
+
+class Event:
+    """A server-sent event.
+
+    :param data: the data of the event, the ``data`` lines joined with ``\\n``
+    :param id: the last event ID of the stream when the event was received
+    :param event: the type of the event
+    """
+
+    __slots__ = ("data", "id", "event")
+
+    def __init__(
+        self, data: bytes, id: Optional[str] = None, event: Optional[str] = None
+    ) -> None:
+        self.data: bytes = data
+        self.id: Optional[str] = id
+        self.event: Optional[str] = event
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented  # pragma: no cover
+        return (
+            self.data == other.data
+            and self.id == other.id
+            and self.event == other.event
+        )
+
+    def __repr__(self) -> str:
+        return "<Event [id={}, event={}, data={!r}]>".format(
+            self.id, self.event, self.data
+        )
+
+
+class SSEParser:
+    """The :class:`SSEParser` object is an incremental parser of
+    `server-sent events <https://html.spec.whatwg.org/multipage/server-sent-events.html>`_,
+    used by the streams of :class:`RequestsClient <stellar_sdk.client.requests_client.RequestsClient>`
+    and :class:`AiohttpClient <stellar_sdk.client.aiohttp_client.AiohttpClient>`.
+
+    Feed it the raw chunks of a response, in any size, and it returns the complete events.
+    Only the bytes after the last event are kept between chunks, the boundaries of
+    the events are found with ``bytes.find`` and a byte is never scanned twice.
+    The ``"hello"`` and ``"byebye"`` messages of Horizon are skipped without building
+    an event.
+
+    :param max_event_size: the maximum size of an event in bytes.
+    """
+
+    def __init__(self, max_event_size: int = DEFAULT_MAX_EVENT_SIZE) -> None:
+        if max_event_size < 1:
+            raise ValueError(
+                "max_event_size should be greater than 0, got {}.".format(
+                    max_event_size
+                )
+            )
+        self.max_event_size: int = max_event_size
+        #: The ID of the last event received, to resume the stream.
+        self.last_event_id: Optional[str] = None
+        #: The reconnection time sent by the server, in milliseconds.
+        self.retry: Optional[int] = None
+        self._buffer: bytearray = bytearray()
+        self._scan_from: int = 0
+        self._pending_cr: bool = False
+
+    def feed(self, chunk: bytes) -> List[Event]:
+        """Parse a chunk of the stream.
+
+        :param chunk: the next bytes of the stream
+        :return: the events completed by the chunk
+        :raise: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if an event is
+            larger than ``max_event_size``.
+        """
+        if self._pending_cr:
+            chunk = b"\r" + chunk
+            self._pending_cr = False
+        if b"\r" in chunk:
+            # A "\r" ending the chunk may be the first half of a "\r\n".
+            if chunk.endswith(b"\r"):
+                chunk = chunk[:-1]
+                self._pending_cr = True
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        buffer = self._buffer
+        buffer += chunk
+        events = []
+        start = 0
+        end = buffer.find(b"\n\n", self._scan_from)
+        while end >= 0:
+            event = self._parse(buffer, start, end)
+            if event is not None:
+                events.append(event)
+            start = end + 2
+            end = buffer.find(b"\n\n", start)
+        if start:
+            del buffer[:start]
+        if len(buffer) > self.max_event_size:
+            raise ValueError(
+                "The event is larger than max_event_size ({} bytes).".format(
+                    self.max_event_size
+                )
+            )
+        # The last byte may be the first "\n" of a boundary.
+        self._scan_from = max(len(buffer) - 1, 0)
+        return events
+
+    def _parse(self, buffer: bytearray, start: int, end: int) -> Optional[Event]:
+        if buffer.endswith(_SKIPPED_MESSAGES, start, end):
+            # Only the reconnection time of these messages is used.
+            retry = buffer.find(b"retry:", start, end)
+            if retry >= 0:
+                line_end = buffer.find(b"\n", retry, end)
+                if line_end < 0:
+                    line_end = end
+                self._set_retry(bytes(buffer[retry + 6 : line_end]))
+            return None
+
+        data = []
+        event = None
+        for line in bytes(buffer[start:end]).split(b"\n"):
+            if not line or line[0] == 58:  # empty line or ":" comment
+                continue
+            field, _, value = line.partition(b":")
+            if value[:1] == b" ":
+                value = value[1:]
+            if field == b"data":
+                data.append(value)
+            elif field == b"id":
+                if b"\0" not in value:
+                    self.last_event_id = value.decode("utf-8", errors="replace")
+            elif field == b"event":
+                event = value.decode("utf-8", errors="replace")
+            elif field == b"retry":
+                self._set_retry(value)
+        if not data:
+            return None
+        return Event(
+            data[0] if len(data) == 1 else b"\n".join(data), self.last_event_id, event
+        )
+
+    def _set_retry(self, value: bytes) -> None:
+        value = value.strip()
+        if value.isdigit():
+            self.retry = int(value)
@@ -1,4 +1,3 @@
-from json import JSONDecodeError
 from typing import Optional
 
 from .client.response import Response
@@ -133,7 +132,7 @@ class BaseHorizonError(BaseRequestError):
         message = {}
         try:
             message = response.json()
-        except JSONDecodeError:
+        except BuildInValueError:  # json, orjson and ujson decode errors
             pass
         self.type: Optional[str] = message.get("type")
         self.title: Optional[str] = message.get("title")
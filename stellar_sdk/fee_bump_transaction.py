@@ -1,10 +1,10 @@
-from typing import Union, Optional
+from typing import Any, Union, Optional
 
 from .exceptions import ValueError
 from .keypair import Keypair
 from .transaction import Transaction
 from .transaction_envelope import TransactionEnvelope
-from .utils import parse_ed25519_account_id_from_muxed_account_xdr_object
+from .utils import new_stamp, parse_ed25519_account_id_from_muxed_account_xdr_object
 from .xdr import Xdr
 
 BASE_FEE = 100
@@ -56,6 +56,11 @@ class FeeBumpTransaction:
                 )
             )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # See Transaction.__setattr__
+        object.__setattr__(self, "_stamp", new_stamp())
+        object.__setattr__(self, name, value)
+
     @property
     def fee_source(self) -> Keypair:
         return self._fee_source
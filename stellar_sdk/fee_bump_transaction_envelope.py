@@ -1,7 +1,8 @@
-from typing import List
+from typing import Any, List, Tuple
 
 from .base_transaction_envelope import BaseTransactionEnvelope
 from .fee_bump_transaction import FeeBumpTransaction
+from .utils import get_stamp
 from .xdr import Xdr
 
 __all__ = ["FeeBumpTransactionEnvelope"]
@@ -42,9 +43,29 @@ class FeeBumpTransactionEnvelope(BaseTransactionEnvelope["FeeBumpTransactionEnve
         It is composed of a 4 prefix bytes followed by the xdr-encoded form of
         this transaction.
 
+        The transaction is packed once, the same object is returned until the
+        network, the fee bump transaction, its inner transaction or the signatures
+        of its inner transaction envelope change, so :meth:`hash` packs and hashes
+        it once whatever the number of signers. See :meth:`invalidate` for the
+        changes that are not detected.
+
         :return: The signature base of this transaction envelope.
 
         """
+        return self._cached_signature_base(
+            self._signature_base_key(), self._build_signature_base
+        )
+
+    def _signature_base_key(self) -> Tuple[Any, ...]:
+        inner = self.transaction.inner_transaction_envelope
+        return (
+            self.network_id,
+            get_stamp(self.transaction),
+            inner._signature_base_key(),
+            tuple((s.hint, s.signature) for s in inner.signatures),
+        )
+
+    def _build_signature_base(self) -> bytes:
         network_id = self.network_id
         tx_type = Xdr.StellarXDRPacker()
         tx_packer = Xdr.StellarXDRPacker()
@@ -1,12 +1,15 @@
-from typing import Union
+from concurrent.futures import Executor
+from typing import List, Sequence, Union
 
+from .base_transaction_envelope import BaseTransactionEnvelope
 from .exceptions import ValueError
 from .fee_bump_transaction_envelope import FeeBumpTransactionEnvelope
+from .keypair import Keypair
 from .transaction_envelope import TransactionEnvelope
 from .xdr import Xdr
 
 
-__all__ = ["parse_transaction_envelope_from_xdr"]
+__all__ = ["parse_transaction_envelope_from_xdr", "sign_many"]
 
 
 def parse_transaction_envelope_from_xdr(
@@ -40,3 +43,73 @@ def parse_transaction_envelope_from_xdr(
                 te_type
             )
         )
+
+
+def sign_many(
+    envelopes: Sequence[BaseTransactionEnvelope],
+    signers: Sequence[Union[Keypair, str]],
+    executor: Executor = None,
+    chunk_size: int = 1000,
+) -> None:
+    """Sign every envelope with every signer.
+
+    Each envelope is hashed once, whatever the number of signers. Signatures
+    which are already on an envelope are skipped instead of raising
+    :exc:`SignatureExistError <stellar_sdk.exceptions.SignatureExistError>`
+    like :meth:`BaseTransactionEnvelope.sign` does.
+
+    For very large batches, pass a :class:`concurrent.futures.ProcessPoolExecutor`
+    as ``executor``: the hashes are split in chunks of ``chunk_size`` and signed in
+    the pool, the raw secret seeds of the signers are sent to the worker processes.
+
+    An example::
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor() as executor:
+            sign_many(envelopes, [channel_keypair, source_keypair], executor)
+
+    :param envelopes: the transaction envelopes to sign.
+    :param signers: the keypairs or secrets to sign with.
+    :param executor: an optional executor to sign the envelopes in.
+    :param chunk_size: the number of envelopes signed per task when
+        ``executor`` is given.
+    :raise: :exc:`MissingEd25519SecretSeedError <stellar_sdk.exceptions.MissingEd25519SecretSeedError>`:
+        if a keypair does not contain secret seed.
+    """
+    keypairs = [
+        Keypair.from_secret(signer) if isinstance(signer, str) else signer
+        for signer in signers
+    ]
+    hashes = [envelope.hash() for envelope in envelopes]
+    if executor is None:
+        signatures = _sign_hashes(keypairs, hashes)
+    else:
+        for keypair in keypairs:
+            # raise in the caller rather than in the pool
+            keypair.sign(b"")
+        seeds = [keypair.raw_secret_key() for keypair in keypairs]
+        futures = [
+            executor.submit(_sign_hashes, seeds, hashes[i : i + chunk_size])
+            for i in range(0, len(hashes), chunk_size)
+        ]
+        signatures = [row for future in futures for row in future.result()]
+
+    hints = [keypair.signature_hint() for keypair in keypairs]
+    for envelope, row in zip(envelopes, signatures):
+        existing = {(sig.hint, sig.signature) for sig in envelope.signatures}
+        for hint, signature in zip(hints, row):
+            if (hint, signature) in existing:
+                continue
+            existing.add((hint, signature))
+            envelope.signatures.append(Xdr.types.DecoratedSignature(hint, signature))
+
+
+def _sign_hashes(
+    signers: Sequence[Union[Keypair, bytes]], hashes: Sequence[bytes]
+) -> List[List[bytes]]:
+    keypairs = [
+        Keypair.from_raw_ed25519_seed(signer) if isinstance(signer, bytes) else signer
+        for signer in signers
+    ]
+    return [[keypair.sign(tx_hash) for keypair in keypairs] for tx_hash in hashes]
@@ -1,5 +1,8 @@
 import os
-from typing import Any, Union
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Executor
+from typing import Any, List, Optional, Union
 
 import nacl.signing as ed25519
 from nacl.exceptions import BadSignatureError as NaclBadSignatureError
@@ -9,6 +12,7 @@ from .exceptions import (
     BadSignatureError,
     MissingEd25519SecretSeedError,
     TypeError,
+    ValueError,
     AttributeError,
 )
 from .strkey import StrKey
@@ -16,6 +20,8 @@ from .xdr import Xdr
 
 __all__ = ["Keypair"]
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
 
 class Keypair:
     """The :class:`Keypair` object, which represents a signing and
@@ -32,6 +38,8 @@ class Keypair:
     :param signing_key: The signing (private) Ed25519 key in the keypair.
     """
 
+    _public_key_cache: Optional["_PublicKeyCache"] = None
+
     def __init__(
         self, verify_key: ed25519.VerifyKey, signing_key: ed25519.SigningKey = None
     ) -> None:
@@ -73,8 +81,52 @@ class Keypair:
         :raise: :exc:`Ed25519PublicKeyInvalidError <stellar_sdk.exceptions.Ed25519PublicKeyInvalidError>`:
             if ``public_key`` is not a valid ed25519 public key.
         """
-        key = StrKey.decode_ed25519_public_key(public_key)
-        return cls.from_raw_ed25519_public_key(key)
+        cache = Keypair._public_key_cache
+        if cache is None or cls is not Keypair:
+            key = StrKey.decode_ed25519_public_key(public_key)
+            return cls.from_raw_ed25519_public_key(key)
+        kp = cache.get(public_key)
+        if kp is None:
+            key = StrKey.decode_ed25519_public_key(public_key)
+            kp = _FrozenKeypair.from_raw_ed25519_public_key(key)
+            cache.put(public_key, kp)
+        return kp
+
+    @staticmethod
+    def enable_public_key_cache(maxsize: int = 1024) -> None:
+        """Cache the keypairs created by :meth:`Keypair.from_public_key`.
+
+        Once enabled, :meth:`Keypair.from_public_key` returns the same public-only
+        :class:`Keypair` object for the same public key, saving the strkey decoding
+        and the ``VerifyKey`` construction. At most ``maxsize`` keypairs are kept,
+        the least recently used one is evicted first. Calling it again replaces
+        the cache with an empty one.
+
+        The cached keypairs are shared, their attributes cannot be modified.
+
+        :param maxsize: The maximum number of keypairs to keep.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize should be greater than 0.")
+        Keypair._public_key_cache = _PublicKeyCache(maxsize)
+
+    @staticmethod
+    def disable_public_key_cache() -> None:
+        """Disable and clear the cache enabled by :meth:`Keypair.enable_public_key_cache`.
+        """
+        Keypair._public_key_cache = None
+
+    @staticmethod
+    def public_key_cache_info() -> Optional[CacheInfo]:
+        """Get the statistics of the cache enabled by :meth:`Keypair.enable_public_key_cache`.
+
+        :return: a named tuple ``(hits, misses, maxsize, currsize)``, or `None`
+            if the cache is disabled.
+        """
+        cache = Keypair._public_key_cache
+        if cache is None:
+            return None
+        return cache.info()
 
     @classmethod
     def from_raw_ed25519_seed(cls, raw_seed: bytes) -> "Keypair":
@@ -213,7 +265,7 @@ class Keypair:
         :param strength: The complexity of the mnemonic.
         :return: A mnemonic phrase.
         """
-        mnemonic_phrase = StellarMnemonic(language).generate(strength)
+        mnemonic_phrase = StellarMnemonic.for_language(language).generate(strength)
         return mnemonic_phrase
 
     @classmethod
@@ -240,6 +292,66 @@ class Keypair:
         raw_ed25519_seed = StellarMnemonic.to_seed(mnemonic_phrase, passphrase, index)
         return cls.from_raw_ed25519_seed(raw_ed25519_seed)
 
+    @classmethod
+    def from_mnemonic_phrase_range(
+        cls,
+        mnemonic_phrase: str,
+        passphrase: str = "",
+        start: int = 0,
+        count: int = 1,
+        executor: Executor = None,
+        chunk_size: int = 1000,
+    ) -> List["Keypair"]:
+        """Generate the :class:`Keypair` objects of a range of indexes via a
+        mnemonic phrase.
+
+        The PBKDF2 stretching of the mnemonic phrase, the slow part of
+        :meth:`from_mnemonic_phrase`, is only done once for the whole range.
+        Pass a :class:`concurrent.futures.ProcessPoolExecutor` as ``executor`` to
+        derive very large ranges in parallel, the range is split in chunks of
+        ``chunk_size`` indexes and the stretched seed is sent to the worker processes.
+
+        An example::
+
+            >>> from stellar_sdk.keypair import Keypair
+            >>> mnemonic = 'update hello cry airport drive chunk elite boat shaft sea describe number'  # Don't use this mnemonic in practice.
+            >>> kps = Keypair.from_mnemonic_phrase_range(mnemonic, start=0, count=100)
+            >>> kps[1] == Keypair.from_mnemonic_phrase(mnemonic, index=1)
+            True
+
+        :param mnemonic_phrase: A unique string used to deterministically generate keypairs.
+        :param passphrase: An optional passphrase used as part of the salt
+            during PBKDF2 rounds when generating the seed from the mnemonic.
+        :param start: The index of the first keypair.
+        :param count: The number of keypairs.
+        :param executor: An optional executor to derive the keypairs in.
+        :param chunk_size: The number of indexes derived per task when ``executor`` is given.
+        :return: A list of ``count`` new :class:`Keypair` instances, in index order.
+        :raises: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``start``
+            or ``count`` is negative, or ``chunk_size`` is less than 1.
+        """
+        if start < 0 or count < 0:
+            raise ValueError("start and count should not be negative.")
+        if chunk_size < 1:
+            raise ValueError("chunk_size should be greater than 0.")
+        seed = StellarMnemonic.stretch(mnemonic_phrase, passphrase)
+        if executor is None:
+            raw_ed25519_seeds = StellarMnemonic.derive_range(seed, start, count)
+        else:
+            futures = [
+                executor.submit(
+                    StellarMnemonic.derive_range,
+                    seed,
+                    index,
+                    min(chunk_size, start + count - index),
+                )
+                for index in range(start, start + count, chunk_size)
+            ]
+            raw_ed25519_seeds = [
+                raw_seed for future in futures for raw_seed in future.result()
+            ]
+        return [cls.from_raw_ed25519_seed(raw_seed) for raw_seed in raw_ed25519_seeds]
+
     def sign_decorated(self, data) -> Xdr.types.DecoratedSignature:
         """Sign the provided data with the keypair's private key and returns DecoratedSignature.
 
@@ -262,9 +374,58 @@ class Keypair:
         return "<Keypair [public_key={public_key}]>".format(public_key=self.public_key)
 
 
+class _FrozenKeypair(Keypair):
+    """A public-only :class:`Keypair` shared by the cache of
+    :meth:`Keypair.from_public_key`, its attributes cannot be modified."""
+
+    def __init__(self, verify_key: ed25519.VerifyKey) -> None:
+        super().__init__(verify_key)
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(
+                "The keypairs cached by Keypair.from_public_key are shared "
+                "and cannot be modified."
+            )
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        self.__setattr__(name, None)
+
+
 def _get_key_of_expected_type(key: Any, expected_type: Any) -> Any:
     if key is not None and not isinstance(key, expected_type):
         raise TypeError(
             "The given key_type={} is not of type {}.".format(type(key), expected_type)
         )
     return key
+
+
+class _PublicKeyCache:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._keypairs: "OrderedDict[str, Keypair]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, public_key: str) -> Optional[Keypair]:
+        with self._lock:
+            kp = self._keypairs.get(public_key)
+            if kp is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._keypairs.move_to_end(public_key)
+            return kp
+
+    def put(self, public_key: str, kp: Keypair) -> None:
+        with self._lock:
+            self._keypairs[public_key] = kp
+            if len(self._keypairs) > self.maxsize:
+                self._keypairs.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._keypairs))
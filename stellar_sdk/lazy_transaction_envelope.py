@@ -0,0 +1,207 @@
+import base64
+from typing import List, Optional, Union
+
+from .exceptions import ValueError
+from .memo import Memo
+from .network import Network
+from .operation.operation import Operation
+from .strkey import StrKey
+from .time_bounds import TimeBounds
+from .transaction_envelope import TransactionEnvelope
+from .utils import (
+    sha256,
+    unpack_xdr_array,
+    parse_ed25519_account_id_from_muxed_account_xdr_object,
+)
+from .xdr import Xdr
+from .xdr.StellarXDR_fastpack import StellarXDRUnpacker as _SkipUnpacker
+
+__all__ = ["LazyTransactionEnvelope"]
+
+
+class LazyTransactionEnvelope:
+    """The :class:`LazyTransactionEnvelope` object, which represents a read-only
+    transaction envelope (:class:`TransactionEnvelope <stellar_sdk.transaction_envelope.TransactionEnvelope>`
+    XDR, V0 or V1) that is decoded on demand.
+
+    Only the fixed size transaction header (source, fee, sequence and time bounds)
+    is decoded when the object is created. The memo, operations and signatures are
+    decoded the first time one of them is accessed, and :meth:`hash` is computed
+    straight from the raw XDR buffer, without repacking the transaction: the end of
+    the transaction is found by skipping over the memo and the operations, reading
+    only their lengths and union discriminants. Use it
+    when you need to look at many envelopes but only at a few of their fields, and
+    call :meth:`to_transaction_envelope` to get a regular, mutable envelope.
+
+    An example::
+
+        te = LazyTransactionEnvelope.from_xdr(xdr, Network.PUBLIC_NETWORK_PASSPHRASE)
+        print(te.hash_hex(), te.source, te.sequence)
+
+    :param data: The raw (not base64 encoded) XDR TransactionEnvelope.
+    :param network_passphrase: The network to connect to for verifying and retrieving additional attributes from.
+    :raises: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if the envelope is not a
+        ``ENVELOPE_TYPE_TX_V0`` or ``ENVELOPE_TYPE_TX`` envelope.
+    """
+
+    def __init__(self, data: bytes, network_passphrase: str) -> None:
+        self.network_passphrase: str = network_passphrase
+        self.network_id: bytes = Network(network_passphrase).network_id()
+        self._data: bytes = bytes(data)
+
+        unpacker = Xdr.StellarXDRUnpacker(self._data)
+        te_type = unpacker.unpack_EnvelopeType()
+        if te_type == Xdr.const.ENVELOPE_TYPE_TX_V0:
+            self.v1: bool = False
+            self._source_ed25519: Optional[bytes] = unpacker.unpack_fopaque(32)
+            self._source_muxed: Optional[Xdr.types.MuxedAccount] = None
+        elif te_type == Xdr.const.ENVELOPE_TYPE_TX:
+            self.v1 = True
+            self._source_ed25519 = None
+            self._source_muxed = unpacker.unpack_MuxedAccount()
+        else:
+            raise ValueError("Invalid EnvelopeType: {}.".format(te_type))
+        self.fee: int = unpacker.unpack_uint()
+        self.sequence: int = unpacker.unpack_hyper()
+        time_bounds = unpack_xdr_array(unpacker.unpack_array(unpacker.unpack_TimeBounds))
+        self.time_bounds: Optional[TimeBounds] = (
+            TimeBounds.from_xdr_object(time_bounds) if time_bounds else None
+        )
+        self._body_position: int = unpacker.get_position()
+
+        self._source: Optional[str] = None
+        self._tx_end: Optional[int] = None
+        self._signatures: Optional[List[Xdr.types.DecoratedSignature]] = None
+        self._memo: Optional[Memo] = None
+        self._operations: Optional[List[Operation]] = None
+        self._signature_base: Optional[bytes] = None
+
+    @property
+    def source(self) -> str:
+        """The account ID of the transaction source account."""
+        if self._source is None:
+            if self.v1:
+                self._source = parse_ed25519_account_id_from_muxed_account_xdr_object(
+                    self._source_muxed
+                )
+            else:
+                self._source = StrKey.encode_ed25519_public_key(self._source_ed25519)
+        return self._source
+
+    @property
+    def memo(self) -> Memo:
+        """The memo of the transaction, decoded on first access."""
+        if self._memo is None:
+            unpacker = Xdr.StellarXDRUnpacker(self._data)
+            unpacker.set_position(self._body_position)
+            self._memo = Memo.from_xdr_object(unpacker.unpack_Memo())
+        return self._memo
+
+    @property
+    def operations(self) -> List[Operation]:
+        """The operations of the transaction, decoded on first access."""
+        if self._operations is None:
+            skipper = _SkipUnpacker(self._data)
+            skipper.set_position(self._body_position)
+            skipper.skip_Memo()
+            unpacker = Xdr.StellarXDRUnpacker(self._data)
+            unpacker.set_position(skipper.get_position())
+            self._operations = [
+                Operation.from_xdr_object(op)
+                for op in unpacker.unpack_array(unpacker.unpack_Operation)
+            ]
+        return self._operations
+
+    @property
+    def signatures(self) -> List[Xdr.types.DecoratedSignature]:
+        """The signatures of the envelope, decoded on first access."""
+        if self._signatures is None:
+            unpacker = Xdr.StellarXDRUnpacker(self._data)
+            unpacker.set_position(self._find_tx_end())
+            signatures = unpacker.unpack_array(unpacker.unpack_DecoratedSignature)
+            unpacker.done()
+            self._signatures = signatures
+        return self._signatures
+
+    def _find_tx_end(self) -> int:
+        # The transaction is skipped over, reading only the lengths and the
+        # union discriminants, no memo, operation or signature is built.
+        if self._tx_end is None:
+            skipper = _SkipUnpacker(self._data)
+            skipper.set_position(4)
+            if self.v1:
+                skipper.skip_Transaction()
+            else:
+                skipper.skip_TransactionV0()
+            tx_end = skipper.get_position()
+            n = skipper.unpack_uint()
+            for _ in range(n):
+                skipper.skip_DecoratedSignature()
+            skipper.done()
+            self._tx_end = tx_end
+        return self._tx_end
+
+    def signature_base(self) -> bytes:
+        """Get the signature base of this transaction envelope.
+
+        It is built from slices of the raw XDR: a V0 transaction is turned into
+        its V1 form by prefixing the source ed25519 key with the
+        ``KEY_TYPE_ED25519`` discriminant, the rest of the encoding is shared.
+
+        :return: The signature base of this transaction envelope.
+        """
+        if self._signature_base is None:
+            tx_end = self._find_tx_end()
+            tx_type = Xdr.StellarXDRPacker()
+            tx_type.pack_EnvelopeType(Xdr.const.ENVELOPE_TYPE_TX)
+            if not self.v1:
+                tx_type.pack_CryptoKeyType(Xdr.const.KEY_TYPE_ED25519)
+            self._signature_base = (
+                self.network_id + tx_type.get_buffer() + self._data[4:tx_end]
+            )
+        return self._signature_base
+
+    def hash(self) -> bytes:
+        """Get the XDR Hash of the signature base.
+
+        :return: The XDR Hash of this transaction envelope's signature base.
+        """
+        return sha256(self.signature_base())
+
+    def hash_hex(self) -> str:
+        """Return a hex encoded hash for this transaction envelope.
+
+        :return: A hex encoded hash for this transaction envelope.
+        """
+        return self.hash().hex()
+
+    def to_xdr(self) -> str:
+        """Get the base64 encoded XDR string representing this envelope.
+
+        :return: XDR TransactionEnvelope base64 string object
+        """
+        return base64.b64encode(self._data).decode()
+
+    def to_transaction_envelope(self) -> TransactionEnvelope:
+        """Fully decode this envelope into a :class:`TransactionEnvelope
+        <stellar_sdk.transaction_envelope.TransactionEnvelope>`.
+
+        :return: A new :class:`TransactionEnvelope <stellar_sdk.transaction_envelope.TransactionEnvelope>` object.
+        """
+        unpacker = Xdr.StellarXDRUnpacker(self._data)
+        te_xdr_object = unpacker.unpack_TransactionEnvelope()
+        return TransactionEnvelope.from_xdr_object(
+            te_xdr_object, self.network_passphrase
+        )
+
+    @classmethod
+    def from_xdr(
+        cls, xdr: Union[str, bytes], network_passphrase: str
+    ) -> "LazyTransactionEnvelope":
+        """Create a new :class:`LazyTransactionEnvelope` from an XDR string.
+
+        :param xdr: The base64 encoded XDR string that represents a transaction envelope.
+        :param network_passphrase: which network this transaction envelope is associated with.
+        :return: A new :class:`LazyTransactionEnvelope` object.
+        """
+        return cls(base64.b64decode(xdr), network_passphrase)
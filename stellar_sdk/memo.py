@@ -1,7 +1,7 @@
 import abc
-from typing import Union
+from typing import Any, Union
 
-from .utils import hex_to_bytes
+from .utils import hex_to_bytes, new_stamp
 from .exceptions import MemoInvalidException
 from .xdr import Xdr
 
@@ -32,6 +32,11 @@ class Memo(object, metaclass=abc.ABCMeta):
 
     """
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # See Transaction.__setattr__
+        object.__setattr__(self, "_stamp", new_stamp())
+        object.__setattr__(self, name, value)
+
     @abc.abstractmethod
     def to_xdr_object(self) -> Xdr.types.Memo:
         """Creates an XDR Memo object that represents this :class:`Memo`."""
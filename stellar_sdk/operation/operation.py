@@ -1,12 +1,12 @@
 import decimal
 from abc import ABCMeta, abstractmethod
 from decimal import Decimal, Context, Inexact
-from typing import Optional, List, Union
+from typing import Any, Dict, Optional, List, Type, Union
 
 from .utils import check_source
 from ..keypair import Keypair
 from ..exceptions import ValueError, TypeError
-from ..utils import parse_ed25519_account_id_from_muxed_account_xdr_object
+from ..utils import new_stamp, parse_ed25519_account_id_from_muxed_account_xdr_object
 from ..xdr import Xdr
 
 
@@ -38,12 +38,18 @@ class Operation(metaclass=ABCMeta):
     """
 
     _ONE = Decimal(10 ** 7)
+    _sub_classes: Dict[int, Type["Operation"]] = {}
 
     def __init__(self, source: str = None) -> None:
         check_source(source)
         self._source: Optional[str] = source
         self._source_muxed: Optional[Xdr.types.MuxedAccount] = None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # See Transaction.__setattr__
+        object.__setattr__(self, "_stamp", new_stamp())
+        object.__setattr__(self, name, value)
+
     @property
     def source(self) -> str:
         return self._source
@@ -144,9 +150,15 @@ class Operation(metaclass=ABCMeta):
         :param operation_xdr_object: The XDR object to create an :class:`Operation` (or
             subclass) instance from.
         """
-        for sub_cls in cls.__subclasses__():
-            if sub_cls.type_code() == operation_xdr_object.type:
-                return sub_cls.from_xdr_object(operation_xdr_object)
+        sub_cls = cls._sub_classes.get(operation_xdr_object.type)
+        if sub_cls is None:
+            # rebuild the lookup table, subclasses may have been defined since
+            cls._sub_classes = {
+                sub_cls.type_code(): sub_cls for sub_cls in cls.__subclasses__()
+            }
+            sub_cls = cls._sub_classes.get(operation_xdr_object.type)
+        if sub_cls is not None:
+            return sub_cls.from_xdr_object(operation_xdr_object)
         raise NotImplementedError(
             "Operation of type={} is not implemented"
             ".".format(operation_xdr_object.type)
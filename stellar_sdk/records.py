@@ -0,0 +1,614 @@
+"""Typed records for the resources returned by Horizon.
+
+Each record class declares the fields of a resource with ``__slots__``, so a
+record does not carry a per-instance ``__dict__``. The values received from
+Horizon are stored as they are when the record is created, and a field is only
+decoded (amounts to stroops, timestamps to :class:`datetime.datetime`, prices to
+:class:`stellar_sdk.price.Price`...) the first time it is read.
+
+The ``_links`` block of the resources is dropped unless ``keep_links`` is set,
+the keys that are not declared as fields are kept in :attr:`Record.extra`.
+
+Use :meth:`BaseCallBuilder.typed <stellar_sdk.call_builder.BaseCallBuilder.typed>`
+to get records instead of dicts from a call builder.
+"""
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from .exceptions import ValueError
+from .price import Price
+
+__all__ = [
+    "Record",
+    "AccountRecord",
+    "BalanceRecord",
+    "SignerRecord",
+    "LedgerRecord",
+    "TransactionRecord",
+    "OperationRecord",
+    "CreateAccountOperationRecord",
+    "PaymentOperationRecord",
+    "PathPaymentStrictReceiveOperationRecord",
+    "PathPaymentStrictSendOperationRecord",
+    "ManageSellOfferOperationRecord",
+    "ManageBuyOfferOperationRecord",
+    "CreatePassiveSellOfferOperationRecord",
+    "SetOptionsOperationRecord",
+    "ChangeTrustOperationRecord",
+    "AllowTrustOperationRecord",
+    "AccountMergeOperationRecord",
+    "InflationOperationRecord",
+    "ManageDataOperationRecord",
+    "BumpSequenceOperationRecord",
+    "EffectRecord",
+    "TradeRecord",
+    "OfferRecord",
+    "to_stroops",
+]
+
+_ONE = 10 ** 7
+
+
+def to_stroops(amount: str) -> int:
+    """Convert an amount returned by Horizon (ex. ``"10.0000100"``) to stroops.
+
+    :param amount: the amount, with at most 7 decimal places.
+    :return: the amount in stroops (ex. ``100000100``).
+    :raise: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if the amount is malformed.
+    """
+    whole, _, fraction = amount.partition(".")
+    negative = whole.startswith("-")
+    if negative:
+        whole = whole[1:]
+    if (
+        len(fraction) > 7
+        or not (whole.isdigit() or (not whole and fraction))
+        or not (fraction.isdigit() or not fraction)
+    ):
+        raise ValueError("Invalid amount: {!r}.".format(amount))
+    stroops = int(whole or 0) * _ONE + int(fraction.ljust(7, "0"))
+    return -stroops if negative else stroops
+
+
+def _int(value: Any) -> int:
+    # Horizon returns some 64 bits values (ex. fee_charged) as strings.
+    return int(value)
+
+
+def _datetime(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+
+
+def _price(value: Dict[str, int]) -> Price:
+    return Price(value["n"], value["d"])
+
+
+class _Field:
+    __slots__ = ("key", "decode", "slot", "bit")
+
+    def __init__(
+        self, key: Optional[str] = None, decode: Optional[Callable] = None
+    ) -> None:
+        self.key = key
+        self.decode = decode
+        self.slot: Any = None
+        self.bit: int = 0
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = self.slot.__get__(instance, owner)
+        if self.decode is None or instance._decoded & self.bit:
+            return value
+        if value is not None:
+            value = self.decode(value)
+        self.slot.__set__(instance, value)
+        instance._decoded |= self.bit
+        return value
+
+    def __set__(self, instance, value) -> None:
+        raise AttributeError("can't set attribute")
+
+
+class _RecordMeta(type):
+    def __new__(mcs, name, bases, namespace):
+        fields = {k: v for k, v in namespace.items() if isinstance(v, _Field)}
+        namespace["__slots__"] = tuple(namespace.get("__slots__", ())) + tuple(
+            "_" + field_name for field_name in fields
+        )
+        cls = super().__new__(mcs, name, bases, namespace)
+        all_fields = dict(getattr(cls, "_fields", {}))
+        for field_name, field in fields.items():
+            field.key = field.key or field_name
+            field.slot = cls.__dict__["_" + field_name]
+            if field.decode is not None:
+                field.bit = 1 << len(all_fields)
+            all_fields[field_name] = field
+        cls._fields = all_fields
+        cls._names = {field.key: name for name, field in all_fields.items()}
+        return cls
+
+
+class Record(metaclass=_RecordMeta):
+    """The base class of the typed records.
+
+    Fields are read as attributes, ``record["key"]`` reads a field by its
+    Horizon key or an extra key, so that code written for the dict responses
+    keeps working. :meth:`get`, ``in``, :meth:`keys` and :meth:`items` behave as
+    on the resource: a field without a value in the resource is not one of its keys.
+
+    :param data: the resource, as decoded from the JSON response, the record
+        takes ownership of it.
+    :param keep_links: keep the ``_links`` block of the resource in :attr:`links`.
+    """
+
+    __slots__ = ("_decoded", "extra")
+
+    #: The ``_links`` block of the resource, ``None`` unless ``keep_links`` is set.
+    links = _Field("_links")
+
+    def __init__(self, data: Dict[str, Any], keep_links: bool = False) -> None:
+        if not keep_links:
+            data.pop("_links", None)
+        self._decoded: int = 0
+        for field in self._fields.values():
+            field.slot.__set__(self, data.get(field.key))
+        names = self._names
+        #: The keys of the resource that are not fields of the record, ``None`` if there are none.
+        self.extra: Optional[Dict[str, Any]] = {
+            k: v for k, v in data.items() if k not in names
+        } or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], keep_links: bool = False) -> "Record":
+        """Create a record from a resource.
+
+        :param data: the resource, as decoded from the JSON response.
+        :param keep_links: keep the ``_links`` block of the resource.
+        :return: the record.
+        """
+        return cls(data, keep_links)
+
+    def __getitem__(self, key: str) -> Any:
+        name = self._names.get(key)
+        if name is not None:
+            return getattr(self, name)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        name = self._names.get(key)
+        if name is not None:
+            return self._fields[name].slot.__get__(self, None) is not None
+        return self.extra is not None and key in self.extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a field by its Horizon key or an extra key.
+
+        :param key: the key.
+        :param default: the value returned if the resource has no value for the key.
+        :return: the value of the key, or ``default``.
+        """
+        if key not in self:
+            return default
+        return self[key]
+
+    def keys(self) -> List[str]:
+        """The Horizon keys of the fields with a value, then the extra keys.
+
+        :return: the keys.
+        """
+        keys = [
+            key
+            for key, name in self._names.items()
+            if self._fields[name].slot.__get__(self, None) is not None
+        ]
+        if self.extra is not None:
+            keys.extend(self.extra)
+        return keys
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """The ``(key, value)`` pairs of :meth:`keys`, the values of the fields are decoded.
+
+        :return: the pairs.
+        """
+        return [(key, self[key]) for key in self.keys()]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented  # pragma: no cover
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self._fields
+        ) and (self.extra or None) == (other.extra or None)
+
+    def __repr__(self) -> str:
+        return "<{} [{}]>".format(
+            self.__class__.__name__,
+            ", ".join(
+                "{}={!r}".format(name, getattr(self, name))
+                for name in self._fields
+                if name != "links"
+            ),
+        )
+
+
+class BalanceRecord(Record):
+    """A balance of an :class:`AccountRecord`, the amounts are in stroops."""
+
+    __slots__ = ()
+
+    balance = _Field(decode=to_stroops)
+    limit = _Field(decode=to_stroops)
+    buying_liabilities = _Field(decode=to_stroops)
+    selling_liabilities = _Field(decode=to_stroops)
+    last_modified_ledger = _Field()
+    is_authorized = _Field()
+    asset_type = _Field()
+    asset_code = _Field()
+    asset_issuer = _Field()
+
+
+class SignerRecord(Record):
+    """A signer of an :class:`AccountRecord`."""
+
+    __slots__ = ()
+
+    weight = _Field()
+    key = _Field()
+    type = _Field()
+
+
+def _balances(value: List[Dict[str, Any]]) -> List[BalanceRecord]:
+    return [BalanceRecord(balance) for balance in value]
+
+
+def _signers(value: List[Dict[str, Any]]) -> List[SignerRecord]:
+    return [SignerRecord(signer) for signer in value]
+
+
+class AccountRecord(Record):
+    """An account, see `Account <https://www.stellar.org/developers/horizon/reference/resources/account.html>`_."""
+
+    __slots__ = ()
+
+    id = _Field()
+    account_id = _Field()
+    sequence = _Field(decode=_int)
+    subentry_count = _Field()
+    inflation_destination = _Field()
+    home_domain = _Field()
+    last_modified_ledger = _Field()
+    thresholds = _Field()
+    flags = _Field()
+    balances = _Field(decode=_balances)
+    signers = _Field(decode=_signers)
+    data = _Field()
+    paging_token = _Field()
+
+
+class LedgerRecord(Record):
+    """A ledger, see `Ledger <https://www.stellar.org/developers/horizon/reference/resources/ledger.html>`_."""
+
+    __slots__ = ()
+
+    id = _Field()
+    paging_token = _Field()
+    hash = _Field()
+    prev_hash = _Field()
+    sequence = _Field()
+    successful_transaction_count = _Field()
+    failed_transaction_count = _Field()
+    operation_count = _Field()
+    closed_at = _Field(decode=_datetime)
+    total_coins = _Field(decode=to_stroops)
+    fee_pool = _Field(decode=to_stroops)
+    base_fee_in_stroops = _Field()
+    base_reserve_in_stroops = _Field()
+    max_tx_set_size = _Field()
+    protocol_version = _Field()
+    header_xdr = _Field()
+
+
+class TransactionRecord(Record):
+    """A transaction, see `Transaction <https://www.stellar.org/developers/horizon/reference/resources/transaction.html>`_."""
+
+    __slots__ = ()
+
+    id = _Field()
+    paging_token = _Field()
+    successful = _Field()
+    hash = _Field()
+    ledger = _Field()
+    created_at = _Field(decode=_datetime)
+    source_account = _Field()
+    source_account_sequence = _Field(decode=_int)
+    fee_account = _Field()
+    fee_charged = _Field(decode=_int)
+    max_fee = _Field(decode=_int)
+    operation_count = _Field()
+    envelope_xdr = _Field()
+    result_xdr = _Field()
+    result_meta_xdr = _Field()
+    fee_meta_xdr = _Field()
+    memo_type = _Field()
+    memo = _Field()
+    signatures = _Field()
+    valid_after = _Field(decode=_datetime)
+    valid_before = _Field(decode=_datetime)
+
+
+class OperationRecord(Record):
+    """An operation, see `Operation <https://www.stellar.org/developers/horizon/reference/resources/operation.html>`_.
+
+    :meth:`from_dict` returns an instance of the subclass matching the ``type`` of
+    the operation, or of :class:`OperationRecord` for an unknown type.
+    """
+
+    __slots__ = ()
+
+    #: The operation records by Horizon operation type.
+    types: Dict[str, Type["OperationRecord"]] = {}
+
+    id = _Field()
+    paging_token = _Field()
+    transaction_successful = _Field()
+    source_account = _Field()
+    type = _Field()
+    type_i = _Field()
+    created_at = _Field(decode=_datetime)
+    transaction_hash = _Field()
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], keep_links: bool = False
+    ) -> "OperationRecord":
+        """Create the record of an operation.
+
+        :param data: the operation, as decoded from the JSON response.
+        :param keep_links: keep the ``_links`` block of the operation.
+        :return: the record, an instance of the subclass matching the operation type.
+        """
+        return cls.types.get(data.get("type"), cls)(data, keep_links)
+
+
+def _operation_type(
+    operation_type: str,
+) -> Callable[[Type[OperationRecord]], Type[OperationRecord]]:
+    def register(cls: Type[OperationRecord]) -> Type[OperationRecord]:
+        OperationRecord.types[operation_type] = cls
+        return cls
+
+    return register
+
+
+@_operation_type("create_account")
+class CreateAccountOperationRecord(OperationRecord):
+    __slots__ = ()
+
+    starting_balance = _Field(decode=to_stroops)
+    funder = _Field()
+    account = _Field()
+
+
+@_operation_type("payment")
+class PaymentOperationRecord(OperationRecord):
+    __slots__ = ()
+
+    asset_type = _Field()
+    asset_code = _Field()
+    asset_issuer = _Field()
+    from_ = _Field("from")
+    to = _Field()
+    amount = _Field(decode=to_stroops)
+
+
+@_operation_type("path_payment_strict_receive")
+class PathPaymentStrictReceiveOperationRecord(PaymentOperationRecord):
+    __slots__ = ()
+
+    path = _Field()
+    source_amount = _Field(decode=to_stroops)
+    source_max = _Field(decode=to_stroops)
+    source_asset_type = _Field()
+    source_asset_code = _Field()
+    source_asset_issuer = _Field()
+
+
+@_operation_type("path_payment_strict_send")
+class PathPaymentStrictSendOperationRecord(PaymentOperationRecord):
+    __slots__ = ()
+
+    path = _Field()
+    source_amount = _Field(decode=to_stroops)
+    destination_min = _Field(decode=to_stroops)
+    source_asset_type = _Field()
+    source_asset_code = _Field()
+    source_asset_issuer = _Field()
+
+
+class _OfferOperationRecord(OperationRecord):
+    __slots__ = ()
+
+    amount = _Field(decode=to_stroops)
+    price = _Field()
+    price_r = _Field(decode=_price)
+    buying_asset_type = _Field()
+    buying_asset_code = _Field()
+    buying_asset_issuer = _Field()
+    selling_asset_type = _Field()
+    selling_asset_code = _Field()
+    selling_asset_issuer = _Field()
+
+
+@_operation_type("manage_sell_offer")
+class ManageSellOfferOperationRecord(_OfferOperationRecord):
+    __slots__ = ()
+
+    offer_id = _Field(decode=_int)
+
+
+@_operation_type("manage_buy_offer")
+class ManageBuyOfferOperationRecord(_OfferOperationRecord):
+    __slots__ = ()
+
+    offer_id = _Field(decode=_int)
+
+
+@_operation_type("create_passive_sell_offer")
+class CreatePassiveSellOfferOperationRecord(_OfferOperationRecord):
+    __slots__ = ()
+
+
+@_operation_type("set_options")
+class SetOptionsOperationRecord(OperationRecord):
+    __slots__ = ()
+
+    signer_key = _Field()
+    signer_weight = _Field()
+    master_key_weight = _Field()
+    low_threshold = _Field()
+    med_threshold = _Field()
+    high_threshold = _Field()
+    home_domain = _Field()
+    set_flags = _Field()
+    set_flags_s = _Field()
+    clear_flags = _Field()
+    clear_flags_s = _Field()
+    inflation_dest = _Field()
+
+
+@_operation_type("change_trust")
+class ChangeTrustOperationRecord(OperationRecord):
+    __slots__ = ()
+
+    asset_type = _Field()
+    asset_code = _Field()
+    asset_issuer = _Field()
+    limit = _Field(decode=to_stroops)
+    trustee = _Field()
+    trustor = _Field()
+
+
+@_operation_type("allow_trust")
+class AllowTrustOperationRecord(OperationRecord):
+    __slots__ = ()
+
+    asset_type = _Field()
+    asset_code = _Field()
+    asset_issuer = _Field()
+    authorize = _Field()
+    trustee = _Field()
+    trustor = _Field()
+
+
+@_operation_type("account_merge")
+class AccountMergeOperationRecord(OperationRecord):
+    __slots__ = ()
+
+    account = _Field()
+    into = _Field()
+
+
+@_operation_type("inflation")
+class InflationOperationRecord(OperationRecord):
+    __slots__ = ()
+
+
+@_operation_type("manage_data")
+class ManageDataOperationRecord(OperationRecord):
+    __slots__ = ()
+
+    name = _Field()
+    value = _Field()
+
+
+@_operation_type("bump_sequence")
+class BumpSequenceOperationRecord(OperationRecord):
+    __slots__ = ()
+
+    bump_to = _Field(decode=_int)
+
+
+class EffectRecord(Record):
+    """An effect, see `Effect <https://www.stellar.org/developers/horizon/reference/resources/effect.html>`_.
+
+    The fields specific to the effect types that are not listed below are kept in :attr:`extra`.
+    """
+
+    __slots__ = ()
+
+    id = _Field()
+    paging_token = _Field()
+    account = _Field()
+    type = _Field()
+    type_i = _Field()
+    created_at = _Field(decode=_datetime)
+    amount = _Field(decode=to_stroops)
+    starting_balance = _Field(decode=to_stroops)
+    asset_type = _Field()
+    asset_code = _Field()
+    asset_issuer = _Field()
+
+
+class TradeRecord(Record):
+    """A trade, see `Trade <https://www.stellar.org/developers/horizon/reference/resources/trade.html>`_."""
+
+    __slots__ = ()
+
+    id = _Field()
+    paging_token = _Field()
+    ledger_close_time = _Field(decode=_datetime)
+    offer_id = _Field(decode=_int)
+    base_offer_id = _Field(decode=_int)
+    base_account = _Field()
+    base_amount = _Field(decode=to_stroops)
+    base_asset_type = _Field()
+    base_asset_code = _Field()
+    base_asset_issuer = _Field()
+    counter_offer_id = _Field(decode=_int)
+    counter_account = _Field()
+    counter_amount = _Field(decode=to_stroops)
+    counter_asset_type = _Field()
+    counter_asset_code = _Field()
+    counter_asset_issuer = _Field()
+    base_is_seller = _Field()
+    price = _Field(decode=_price)
+
+
+class OfferRecord(Record):
+    """An offer, see `Offer <https://www.stellar.org/developers/horizon/reference/resources/offer.html>`_."""
+
+    __slots__ = ()
+
+    id = _Field(decode=_int)
+    paging_token = _Field()
+    seller = _Field()
+    selling = _Field()
+    buying = _Field()
+    amount = _Field(decode=to_stroops)
+    price_r = _Field(decode=_price)
+    price = _Field()
+    last_modified_ledger = _Field()
+    last_modified_time = _Field(decode=_datetime)
+
+
+def _typed_response(
+    record_type: Type[Record], response: Dict[str, Any], keep_links: bool
+) -> Any:
+    """Replace the resources of a response by records: the records of a
+    collection, or the response itself if it is a single resource."""
+    embedded = response.get("_embedded")
+    if isinstance(embedded, dict) and "records" in embedded:
+        embedded["records"] = _typed_records(
+            record_type, embedded["records"], keep_links
+        )
+        return response
+    return record_type.from_dict(response, keep_links)
+
+
+def _typed_records(
+    record_type: Type[Record], records: List[Dict[str, Any]], keep_links: bool
+) -> List[Record]:
+    from_dict = record_type.from_dict
+    return [from_dict(record, keep_links) for record in records]
@@ -8,7 +8,7 @@ import hmac
 import os
 import struct
 from enum import Enum, unique
-from typing import Union
+from typing import Dict, List, Tuple, Union
 
 from mnemonic import Mnemonic
 from mnemonic.mnemonic import PBKDF2_ROUNDS
@@ -33,10 +33,16 @@ class Language(Enum):
 class StellarMnemonic(Mnemonic):
     """Please use :meth:`Keypair.generate_mnemonic_phrase` and :meth:`Keypair.from_mnemonic_phrase`"""
 
-    STELLAR_ACCOUNT_PATH_FORMAT = "m/44'/148'/%d'"
+    #: The hardened indexes of the ``m/44'/148'`` parent key of the Stellar accounts (SEP-0005).
+    STELLAR_ACCOUNT_PATH_PREFIX = (44, 148)
+    STELLAR_ACCOUNT_PATH_FORMAT = (
+        "m/" + "".join("%d'/" % index for index in STELLAR_ACCOUNT_PATH_PREFIX) + "%d'"
+    )
     FIRST_HARDENED_INDEX = 0x80000000
     SEED_MODIFIER = b"ed25519 seed"
 
+    _instances: Dict[Tuple[type, str], "StellarMnemonic"] = {}
+
     def __init__(self, language: Union[str, Language] = Language.ENGLISH) -> None:
         if isinstance(language, Language):
             language = language.value
@@ -46,15 +52,44 @@ class StellarMnemonic(Mnemonic):
 
         super().__init__(language)
 
+    @classmethod
+    def for_language(
+        cls, language: Union[str, Language] = Language.ENGLISH
+    ) -> "StellarMnemonic":
+        """Get the shared instance for a language, so that its wordlist is only
+        loaded once.
+
+        :param language: The language of the mnemonic phrase, defaults to english.
+        :return: A :class:`StellarMnemonic` instance.
+        """
+        if isinstance(language, Language):
+            language = language.value
+        key = (cls, language)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances.setdefault(key, cls(language))
+        return instance
+
     @classmethod
     def to_seed(cls, mnemonic: str, passphrase: str = "", index: int = 0) -> bytes:
+        return cls.derive(cls.stretch(mnemonic, passphrase), index)
+
+    @classmethod
+    def stretch(cls, mnemonic: str, passphrase: str = "") -> bytes:
+        """Run the PBKDF2 key stretching of BIP-0039 on the mnemonic, the
+        result is the seed passed to :meth:`derive` and :meth:`derive_range`.
+
+        :param mnemonic: The mnemonic phrase.
+        :param passphrase: An optional passphrase used as part of the salt.
+        :return: The 64 bytes seed.
+        """
         mnemonic = cls.normalize_string(mnemonic)
         passphrase = cls.normalize_string(passphrase)
         passphrase = "mnemonic" + passphrase
         mnemonic = mnemonic.encode("utf-8")
         passphrase = passphrase.encode("utf-8")
         stretched = hashlib.pbkdf2_hmac("sha512", mnemonic, passphrase, PBKDF2_ROUNDS)
-        return cls.derive(stretched[:64], index)
+        return stretched[:64]
 
     def generate(self, strength: int = 128) -> str:
         if strength not in (128, 160, 192, 224, 256):
@@ -67,19 +102,37 @@ class StellarMnemonic(Mnemonic):
     @staticmethod
     def derive(seed: bytes, index: int) -> bytes:
         # References https://github.com/satoshilabs/slips/blob/master/slip-0010.md
+        return StellarMnemonic.derive_range(seed, index, 1)[0]
+
+    @staticmethod
+    def derive_range(seed: bytes, start: int, count: int) -> List[bytes]:
+        """Derive the raw ed25519 seeds of the accounts ``start`` to
+        ``start + count - 1``, the ``m/44'/148'`` parent key is derived once.
+
+        :param seed: The seed returned by :meth:`stretch`.
+        :param start: The index of the first account.
+        :param count: The number of accounts.
+        :return: The raw ed25519 seeds, in index order.
+        """
         master_hmac = hmac.new(StellarMnemonic.SEED_MODIFIER, digestmod=hashlib.sha512)
         master_hmac.update(seed)
-        il = master_hmac.digest()[:32]
-        ir = master_hmac.digest()[32:]
-        path = StellarMnemonic.STELLAR_ACCOUNT_PATH_FORMAT % index
-        for x in path.split("/")[1:]:
-            data = (
-                struct.pack("x")
-                + il
-                + struct.pack(">I", StellarMnemonic.FIRST_HARDENED_INDEX + int(x[:-1]))
-            )
-            i = hmac.new(ir, digestmod=hashlib.sha512)
-            i.update(data)
-            il = i.digest()[:32]
-            ir = i.digest()[32:]
-        return il
+        digest = master_hmac.digest()
+        il, ir = digest[:32], digest[32:]
+        for index in StellarMnemonic.STELLAR_ACCOUNT_PATH_PREFIX:
+            il, ir = StellarMnemonic._derive_hardened(il, ir, index)
+        return [
+            StellarMnemonic._derive_hardened(il, ir, index)[0]
+            for index in range(start, start + count)
+        ]
+
+    @staticmethod
+    def _derive_hardened(
+        key: bytes, chain_code: bytes, index: int
+    ) -> Tuple[bytes, bytes]:
+        data = (
+            struct.pack("x")
+            + key
+            + struct.pack(">I", StellarMnemonic.FIRST_HARDENED_INDEX + index)
+        )
+        digest = hmac.new(chain_code, data, digestmod=hashlib.sha512).digest()
+        return digest[:32], digest[32:]
@@ -0,0 +1,90 @@
+from typing import Dict, List, Sequence, Tuple
+
+from .ed25519_public_key_signer import Ed25519PublicKeySigner
+from ..base_transaction_envelope import BaseTransactionEnvelope
+from ..exceptions import BadSignatureError
+from ..keypair import Keypair
+from ..xdr import Xdr
+
+__all__ = ["SignatureVerifier"]
+
+
+class SignatureVerifier:
+    """The :class:`SignatureVerifier` object, which finds the signers of a fixed
+    set of ed25519 signers that signed a transaction envelope.
+
+    The keypairs and signature hints of the signers are built once, when the
+    verifier is created, and reused for every envelope. For each envelope the
+    signatures are indexed by hint, so a signer is only verified against the
+    signatures carrying its hint instead of against all of them.
+
+    An example::
+
+        verifier = SignatureVerifier(signers)
+        for signers_found in verifier.verify_many(envelopes):
+            weight = sum(signer.weight for signer in signers_found)
+
+    :param signers: The signers to look for.
+    :raise: :exc:`Ed25519PublicKeyInvalidError <stellar_sdk.exceptions.Ed25519PublicKeyInvalidError>`:
+        if the account ID of a signer is not a valid ed25519 public key.
+    """
+
+    def __init__(self, signers: Sequence[Ed25519PublicKeySigner]) -> None:
+        self.signers: List[Ed25519PublicKeySigner] = list(signers)
+        self._keys: List[Tuple[bytes, Keypair]] = []
+        for signer in self.signers:
+            kp = Keypair.from_public_key(signer.account_id)
+            self._keys.append((kp.signature_hint(), kp))
+
+    def verify(
+        self, transaction_envelope: BaseTransactionEnvelope
+    ) -> List[Ed25519PublicKeySigner]:
+        """Get the signers which signed the transaction envelope.
+
+        A signature is used by one signer at most, if a signer appears more than
+        once it is only found as many times as it has distinct signatures.
+
+        :param transaction_envelope: The transaction envelope to check.
+        :return: The signers found, in the order they were passed to the verifier.
+        """
+        return self.verify_hash(
+            transaction_envelope.hash(), transaction_envelope.signatures
+        )
+
+    def verify_hash(
+        self, tx_hash: bytes, signatures: Sequence[Xdr.types.DecoratedSignature]
+    ) -> List[Ed25519PublicKeySigner]:
+        """Get the signers which signed the transaction hash.
+
+        :param tx_hash: The hash of the transaction.
+        :param signatures: The signatures of the transaction.
+        :return: The signers found, in the order they were passed to the verifier.
+        """
+        candidates: Dict[bytes, List[int]] = {}
+        for index, decorated_signature in enumerate(signatures):
+            candidates.setdefault(bytes(decorated_signature.hint), []).append(index)
+
+        signers_found = []
+        signature_used = set()  # prevent a signature from being reused
+        for signer, (hint, kp) in zip(self.signers, self._keys):
+            for index in candidates.get(hint, ()):
+                if index in signature_used:
+                    continue
+                try:
+                    kp.verify(tx_hash, signatures[index].signature)
+                except BadSignatureError:
+                    continue
+                signature_used.add(index)
+                signers_found.append(signer)
+                break
+        return signers_found
+
+    def verify_many(
+        self, transaction_envelopes: Sequence[BaseTransactionEnvelope]
+    ) -> List[List[Ed25519PublicKeySigner]]:
+        """Get the signers which signed each of the transaction envelopes.
+
+        :param transaction_envelopes: The transaction envelopes to check.
+        :return: The signers found for each envelope, see :meth:`verify`.
+        """
+        return [self.verify(te) for te in transaction_envelopes]
@@ -15,8 +15,9 @@ from typing import List, Tuple
 
 from .ed25519_public_key_signer import Ed25519PublicKeySigner
 from .exceptions import InvalidSep10ChallengeError
+from .signature_verifier import SignatureVerifier
 from ..account import Account
-from ..exceptions import BadSignatureError, ValueError
+from ..exceptions import ValueError
 from ..keypair import Keypair
 from ..operation.manage_data import ManageData
 from ..transaction_builder import TransactionBuilder
@@ -394,27 +395,9 @@ def _verify_transaction_signatures(
     if not signatures:
         raise InvalidSep10ChallengeError("Transaction has no signatures.")
 
-    tx_hash = transaction_envelope.hash()
-
-    signers_found = []  # prevent a signature from being reused
-    signature_used = set()
-    for signer in signers:
-        kp = Keypair.from_public_key(signer.account_id)
-        for index, decorated_signature in enumerate(transaction_envelope.signatures):
-            # Special thanks to Leigh McCulloch for his help
-            # See https://github.com/StellarCN/py-stellar-base/issues/252#issuecomment-580882560
-            if index in signature_used:
-                continue
-            if decorated_signature.hint != kp.signature_hint():
-                continue
-            try:
-                kp.verify(tx_hash, decorated_signature.signature)
-                signature_used.add(index)
-                signers_found.append(signer)
-                break
-            except BadSignatureError:
-                pass
-    return signers_found
+    # Special thanks to Leigh McCulloch for his help
+    # See https://github.com/StellarCN/py-stellar-base/issues/252#issuecomment-580882560
+    return SignatureVerifier(signers).verify(transaction_envelope)
 
 
 def _verify_te_signed_by_account_id(
@@ -1,5 +1,10 @@
+import asyncio
+import threading
+import time
 import warnings
-from typing import Union, Coroutine, Any, Dict, List, Tuple, Generator
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, Coroutine, Any, Dict, List, Tuple, Generator, Optional
 
 from .account import Account, Thresholds
 from .asset import Asset
@@ -26,7 +31,12 @@ from .call_builder.transactions_call_builder import TransactionsCallBuilder
 from .client.base_async_client import BaseAsyncClient
 from .client.base_sync_client import BaseSyncClient
 from .client.requests_client import RequestsClient
-from .exceptions import TypeError, NotFoundError, raise_request_exception
+from .exceptions import (
+    TypeError,
+    ValueError,
+    NotFoundError,
+    raise_request_exception,
+)
 from .fee_bump_transaction import FeeBumpTransaction
 from .fee_bump_transaction_envelope import FeeBumpTransactionEnvelope
 from .helpers import parse_transaction_envelope_from_xdr
@@ -43,6 +53,8 @@ from .xdr import Xdr
 
 __all__ = ["Server"]
 
+DEFAULT_HORIZON_URL = "https://horizon-testnet.stellar.org/"
+
 
 class Server:
     """Server handles the network connection to a `Horizon <https://www.stellar.org/developers/horizon/reference/>`_
@@ -55,17 +67,56 @@ class Server:
     then all requests are synchronous. If you use an asynchronous client,
     then all requests are asynchronous. The choice is in your hands.
 
-    :param horizon_url: Horizon Server URL (ex. `https://horizon-testnet.stellar.org`)
+    Before a transaction without memo is submitted, the destination accounts of its
+    operations are loaded to check whether they require a memo
+    (`SEP-0029 <https://github.com/stellar/stellar-protocol/blob/master/ecosystem/sep-0029.md>`_).
+    The accounts are loaded concurrently, at most ``memo_required_check_concurrency``
+    at a time, from a thread pool of the server with a synchronous client. The
+    ``config.memo_required`` flag of each account can be cached for
+    ``memo_required_cache_ttl`` seconds: a transaction submitted while the flag of
+    a destination is cached is not checked against a memo requirement added to the
+    account in the meantime, so the cache is disabled by default.
+
+    :param horizon_url: Horizon Server URL (ex. `https://horizon-testnet.stellar.org`),
+        defaults to the ``horizon_url`` of the client if it has one (ex.
+        :class:`MultiHorizonClient <stellar_sdk.client.multi_horizon_client.MultiHorizonClient>`),
+        else to `https://horizon-testnet.stellar.org/`.
     :param client: Http Client used to send the request
+    :param memo_required_check_concurrency: the maximum number of destination accounts
+        loaded at the same time by the memo required check.
+    :param memo_required_cache_ttl: the number of seconds the memo required flag of
+        an account is cached for, 0 (the default) disables the cache.
     :raises: :exc:`TypeError <stellar_sdk.exceptions.TypeError>`: if the ``client`` does not meet the standard.
+    :raises: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``memo_required_check_concurrency``
+        is less than 1 or ``memo_required_cache_ttl`` is negative.
     """
 
     def __init__(
         self,
-        horizon_url: str = "https://horizon-testnet.stellar.org/",
+        horizon_url: str = None,
         client: Union[BaseAsyncClient, BaseSyncClient] = None,
+        memo_required_check_concurrency: int = 10,
+        memo_required_cache_ttl: float = 0,
     ) -> None:
+        if memo_required_check_concurrency < 1:
+            raise ValueError(
+                "memo_required_check_concurrency should be greater than 0, got {}.".format(
+                    memo_required_check_concurrency
+                )
+            )
+        if memo_required_cache_ttl < 0:
+            raise ValueError(
+                "memo_required_cache_ttl should not be negative, got {}.".format(
+                    memo_required_cache_ttl
+                )
+            )
+        if horizon_url is None:
+            horizon_url = getattr(client, "horizon_url", DEFAULT_HORIZON_URL)
         self.horizon_url: str = horizon_url
+        self.memo_required_check_concurrency: int = memo_required_check_concurrency
+        self._memo_required_cache: _MemoRequiredCache = _MemoRequiredCache(
+            memo_required_cache_ttl
+        )
 
         if not client:
             client = RequestsClient()
@@ -81,6 +132,9 @@ class Server:
                 "of `stellar_sdk.client.base_async_client.BaseAsyncClient` "
                 "or `stellar_sdk.client.base_sync_client.BaseSyncClient`."
             )
+        # created by the first memo required check loading several accounts
+        self._memo_required_executor: Optional[ThreadPoolExecutor] = None
+        self._memo_required_executor_lock: threading.Lock = threading.Lock()
 
     def submit_transaction(
         self,
@@ -424,52 +478,107 @@ class Server:
         account.thresholds = thresholds
         return account
 
-    def __check_memo_required_sync(self, transaction: Transaction) -> None:
-        if isinstance(transaction, FeeBumpTransaction):
-            transaction = transaction.inner_transaction_envelope.transaction
-        if not (transaction.memo is None or isinstance(transaction.memo, NoneMemo)):
-            return
-        for index, destination in self.__get_check_memo_required_destinations(
-            transaction
-        ):
-            if destination.startswith(MUXED_ACCOUNT_STARTING_LETTER):
-                continue
-            try:
-                account_resp = self.accounts().account_id(destination).call()
-            except NotFoundError:
-                continue
-            self.__check_destination_memo(account_resp, index, destination)
-
-    async def __check_memo_required_async(
+    def __check_memo_required_sync(
         self, transaction: Union[Transaction, FeeBumpTransaction]
     ) -> None:
-        if isinstance(transaction, FeeBumpTransaction):
-            transaction = transaction.inner_transaction_envelope.transaction
-        if not (transaction.memo is None or isinstance(transaction.memo, NoneMemo)):
-            return
-        for index, destination in self.__get_check_memo_required_destinations(
-            transaction
-        ):
-            if destination.startswith(MUXED_ACCOUNT_STARTING_LETTER):
-                continue
-            try:
-                account_resp = await self.accounts().account_id(destination).call()
-            except NotFoundError:
-                continue
-            self.__check_destination_memo(account_resp, index, destination)
+        destinations = self.__get_memo_required_check_destinations(transaction)
+        results: List[Union[bool, Exception]] = []
+        uncached: List[Tuple[int, str]] = []
+        for _, destination in destinations:
+            results.append(self._memo_required_cache.get(destination))
+            if results[-1] is None:
+                uncached.append((len(results) - 1, destination))
+        if len(uncached) == 1:
+            results[uncached[0][0]] = self.__fetch_memo_required_sync(uncached[0][1])
+        elif uncached:
+            with self._memo_required_executor_lock:
+                if self._memo_required_executor is None:
+                    self._memo_required_executor = ThreadPoolExecutor(
+                        max_workers=self.memo_required_check_concurrency
+                    )
+                executor = self._memo_required_executor
+            fetched = executor.map(
+                self.__fetch_memo_required_sync, [d for _, d in uncached]
+            )
+            for (position, _), result in zip(uncached, fetched):
+                results[position] = result
+        self.__check_memo_required_results(destinations, results)
 
-    def __check_destination_memo(
-        self, account_resp: dict, index: int, destination: str
+    async def __check_memo_required_async(
+        self, transaction: Union[Transaction, FeeBumpTransaction]
     ) -> None:
+        destinations = self.__get_memo_required_check_destinations(transaction)
+        semaphore = asyncio.Semaphore(self.memo_required_check_concurrency)
+
+        async def fetch(destination: str) -> Union[bool, Exception]:
+            memo_required = self._memo_required_cache.get(destination)
+            if memo_required is not None:
+                return memo_required
+            async with semaphore:
+                return await self.__fetch_memo_required_async(destination)
+
+        results = await asyncio.gather(*(fetch(d) for _, d in destinations))
+        self.__check_memo_required_results(destinations, results)
+
+    def __fetch_memo_required_sync(self, destination: str) -> Union[bool, Exception]:
+        try:
+            account_resp = self.accounts().account_id(destination).call()
+        except NotFoundError:
+            return False
+        except Exception as e:
+            return e
+        return self.__handle_memo_required_response(account_resp, destination)
+
+    async def __fetch_memo_required_async(
+        self, destination: str
+    ) -> Union[bool, Exception]:
+        try:
+            account_resp = await self.accounts().account_id(destination).call()
+        except NotFoundError:
+            return False
+        except Exception as e:
+            return e
+        return self.__handle_memo_required_response(account_resp, destination)
+
+    def __handle_memo_required_response(
+        self, account_resp: dict, destination: str
+    ) -> bool:
         memo_required_config_key = "config.memo_required"
         memo_required_config_value = "MQ=="
         data = account_resp["data"]
-        if data.get(memo_required_config_key) == memo_required_config_value:
-            raise AccountRequiresMemoError(
-                "Destination account requires a memo in the transaction.",
-                destination,
-                index,
+        memo_required = data.get(memo_required_config_key) == memo_required_config_value
+        self._memo_required_cache.set(destination, memo_required)
+        return memo_required
+
+    @staticmethod
+    def __check_memo_required_results(
+        destinations: List[Tuple[int, str]], results: List[Union[bool, Exception]]
+    ) -> None:
+        # Report the first failing destination, as a sequential check would.
+        for (index, destination), result in zip(destinations, results):
+            if isinstance(result, Exception):
+                raise result
+            if result:
+                raise AccountRequiresMemoError(
+                    "Destination account requires a memo in the transaction.",
+                    destination,
+                    index,
+                )
+
+    def __get_memo_required_check_destinations(
+        self, transaction: Union[Transaction, FeeBumpTransaction]
+    ) -> List[Tuple[int, str]]:
+        if isinstance(transaction, FeeBumpTransaction):
+            transaction = transaction.inner_transaction_envelope.transaction
+        if not (transaction.memo is None or isinstance(transaction.memo, NoneMemo)):
+            return []
+        return [
+            (index, destination)
+            for index, destination in self.__get_check_memo_required_destinations(
+                transaction
             )
+            if not destination.startswith(MUXED_ACCOUNT_STARTING_LETTER)
+        ]
 
     def __get_check_memo_required_destinations(
         self, transaction: Transaction
@@ -544,6 +653,11 @@ class Server:
 
     def __close_sync(self) -> None:
         self._client.close()
+        with self._memo_required_executor_lock:
+            executor = self._memo_required_executor
+            self._memo_required_executor = None
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     async def __aenter__(self) -> "Server":
         return self
@@ -556,3 +670,42 @@ class Server:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class _MemoRequiredCache:
+    """A thread safe cache of the memo required flag of accounts, each entry
+    expires ``ttl`` seconds after it was set. At most ``maxsize`` entries are
+    kept, the oldest one is evicted first."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl: float = ttl
+        self.maxsize: int = maxsize
+        # By time of insertion, which is also the order of expiration.
+        self._data: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, account_id: str) -> Optional[bool]:
+        if not self.ttl:
+            return None
+        with self._lock:
+            entry = self._data.get(account_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._data[account_id]
+                return None
+            return entry[1]
+
+    def set(self, account_id: str, memo_required: bool) -> None:
+        if not self.ttl:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._data.pop(account_id, None)
+            self._data[account_id] = (now + self.ttl, memo_required)
+            # Expired entries are at the front, stop at the first live one.
+            while self._data:
+                oldest = next(iter(self._data.values()))
+                if oldest[0] > now and len(self._data) <= self.maxsize:
+                    break
+                self._data.popitem(last=False)
@@ -0,0 +1,234 @@
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, AsyncGenerator, AsyncIterable, Generator, Iterable, Optional
+
+from .checkpoint import _paging_token
+from .exceptions import ValueError
+
+__all__ = ["Batch", "batch_stream", "abatch_stream"]
+
+_END = object()
+
+
+class _StreamError:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+class Batch(list):
+    """A list of consecutive events of a stream, in the order of the stream."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        #: The paging token of the last event of the batch, the cursor to
+        #: checkpoint once the batch is processed.
+        self.cursor: Optional[str] = None
+
+    def _add(self, event: Any) -> None:
+        self.append(event)
+        paging_token = _paging_token(event)
+        if paging_token is not None:
+            self.cursor = paging_token
+
+    def __repr__(self) -> str:
+        return "<Batch [size={}, cursor={}]>".format(len(self), self.cursor)
+
+
+def batch_stream(
+    events: Iterable[Any], max_size: int = 100, max_linger: float = 1.0
+) -> Generator[Batch, None, None]:
+    """Group the events of a synchronous stream in batches.
+
+    A batch is yielded once it holds ``max_size`` events, or ``max_linger`` seconds
+    after its first event was received, whichever comes first, so a quiet stream
+    does not hold events back. The events are read in a background thread, at most
+    ``max_size`` events ahead of the caller. When the stream ends or fails, the
+    events received so far are yielded before the stream error is raised.
+
+    When the caller stops iterating before the end of the stream (``break``,
+    ``close()``), the reader thread cannot interrupt a pending read of the stream:
+    it stays blocked on the connection until the next event arrives or the
+    connection ends, then it closes the stream and exits. The thread is a daemon
+    thread, it does not keep the process alive, but a quiet stream holds its thread
+    and its connection until then.
+
+    An example::
+
+        for batch in batch_stream(server.payments().cursor("now").stream(), 500, 2.0):
+            insert_payments(batch)
+            print("processed up to", batch.cursor)
+
+    With a call builder, :meth:`BaseCallBuilder.stream_batches
+    <stellar_sdk.call_builder.base_call_builder.BaseCallBuilder.stream_batches>` also
+    checkpoints the cursor of each batch.
+
+    :param events: the stream, ex. :meth:`BaseCallBuilder.stream
+        <stellar_sdk.call_builder.base_call_builder.BaseCallBuilder.stream>`
+        with a synchronous client.
+    :param max_size: the maximum number of events of a batch.
+    :param max_linger: the maximum time an event waits in a batch, in seconds.
+    :return: a generator yielding the batches.
+    :raise: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``max_size``
+        or ``max_linger`` is invalid.
+    """
+    _check_batch_args(max_size, max_linger)
+    return _batches_sync(iter(events), max_size, max_linger)
+
+
+def abatch_stream(
+    events: AsyncIterable[Any], max_size: int = 100, max_linger: float = 1.0
+) -> AsyncGenerator[Batch, None]:
+    """Group the events of an asynchronous stream in batches, see :func:`batch_stream`.
+
+    The events are read in a background task, at most ``max_size`` events ahead of the caller.
+
+    An example::
+
+        async for batch in abatch_stream(server.payments().cursor("now").stream(), 500, 2.0):
+            await insert_payments(batch)
+
+    :param events: the stream, ex. :meth:`BaseCallBuilder.stream
+        <stellar_sdk.call_builder.base_call_builder.BaseCallBuilder.stream>`
+        with an asynchronous client.
+    :param max_size: the maximum number of events of a batch.
+    :param max_linger: the maximum time an event waits in a batch, in seconds.
+    :return: an async generator yielding the batches.
+    :raise: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``max_size``
+        or ``max_linger`` is invalid.
+    """
+    _check_batch_args(max_size, max_linger)
+    return _batches_async(events.__aiter__(), max_size, max_linger)
+
+
+def _check_batch_args(max_size: int, max_linger: float) -> None:
+    if max_size < 1:
+        raise ValueError("max_size should be greater than 0, got {}.".format(max_size))
+    if max_linger < 0:
+        raise ValueError(
+            "max_linger should not be negative, got {}.".format(max_linger)
+        )
+
+
+def _batches_sync(
+    events: Any, max_size: int, max_linger: float
+) -> Generator[Batch, None, None]:
+    results: queue.Queue = queue.Queue(max_size)
+    stopped = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def reader() -> None:
+        try:
+            for event in events:
+                if not put(event):
+                    return
+            put(_END)
+        except BaseException as e:
+            put(_StreamError(e))
+        finally:
+            close = getattr(events, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=reader, daemon=True)
+    thread.start()
+    try:
+        while True:
+            batch = Batch()
+            item = results.get()
+            # The linger time starts with the first event of the batch.
+            deadline = time.monotonic() + max_linger
+            while item is not _END and not isinstance(item, _StreamError):
+                batch._add(item)
+                timeout = deadline - time.monotonic()
+                if len(batch) >= max_size or timeout <= 0:
+                    break
+                try:
+                    item = results.get(timeout=timeout)
+                except queue.Empty:
+                    break
+            if batch:
+                yield batch
+            if item is _END:
+                return
+            if isinstance(item, _StreamError):
+                raise item.error
+    finally:
+        stopped.set()
+
+
+async def _batches_async(
+    events: Any, max_size: int, max_linger: float
+) -> AsyncGenerator[Batch, None]:
+    results: asyncio.Queue = asyncio.Queue(max_size)
+
+    async def reader() -> None:
+        end: Any = _END
+        try:
+            async for event in events:
+                await results.put(event)
+        except asyncio.CancelledError:
+            # The consumer stopped, nobody waits for the end.
+            end = None
+            raise
+        except BaseException as e:
+            end = _StreamError(e)
+        finally:
+            try:
+                aclose = getattr(events, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+            finally:
+                # However the stream ends, the consumer is told, else it waits forever.
+                if end is not None:
+                    await results.put(end)
+
+    task = asyncio.ensure_future(reader())
+    # A pending get is kept for the next batch instead of being cancelled on
+    # timeout, an event is never lost between two batches.
+    get: Optional[asyncio.Future] = None
+    try:
+        while True:
+            batch = Batch()
+            if get is None:
+                get = asyncio.ensure_future(results.get())
+            item = await get
+            get = None
+            deadline = time.monotonic() + max_linger
+            while item is not _END and not isinstance(item, _StreamError):
+                batch._add(item)
+                timeout = deadline - time.monotonic()
+                if len(batch) >= max_size or timeout <= 0:
+                    break
+                if not results.empty():
+                    item = results.get_nowait()
+                    continue
+                get = asyncio.ensure_future(results.get())
+                done, _ = await asyncio.wait([get], timeout=timeout)
+                if not done:
+                    break
+                item = get.result()
+                get = None
+            if batch:
+                yield batch
+            if item is _END:
+                return
+            if isinstance(item, _StreamError):
+                raise item.error
+    finally:
+        for future in (get, task):
+            if future is not None and not future.done():
+                future.cancel()
+                try:
+                    await future
+                except asyncio.CancelledError:
+                    pass
@@ -0,0 +1,344 @@
+import asyncio
+import calendar
+import copy
+import json
+import logging
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .call_builder.base_call_builder import BaseCallBuilder
+from .client.base_async_client import BaseAsyncClient
+from .client.json_decoder import default_json_decoder
+from .exceptions import ConnectionError, StreamClientError, TypeError, ValueError
+
+__all__ = ["StreamSupervisor", "SupervisedStream", "OVERFLOW_POLICIES"]
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "spill")
+"""The overflow policies of a :class:`SupervisedStream`."""
+
+_MAX_RETRY_DELAY = 60.0
+
+
+class SupervisedStream:
+    """A stream run by a :class:`StreamSupervisor`, use
+    :meth:`StreamSupervisor.add_stream` to create it.
+
+    The events are buffered in a bounded :class:`asyncio.Queue` of ``maxsize`` events.
+    When the consumer falls behind and the queue is full, the ``overflow`` policy applies:
+
+    * ``"block"``: the stream stops reading until the consumer takes an event,
+      the backpressure reaches the socket and Horizon.
+    * ``"drop_oldest"``: the oldest event of the queue is dropped.
+    * ``"spill"``: the events are appended to a temporary file in ``spill_dir``
+      and read back, in order, once the queue is drained. The events must be dicts.
+
+    Consume the events with ``async for event in stream`` or :meth:`get`.
+
+    :param name: the name of the stream.
+    :param call_builder: the call builder of the stream.
+    :param maxsize: the maximum number of events in the queue.
+    :param overflow: the overflow policy, one of :data:`OVERFLOW_POLICIES`.
+    :param spill_dir: the directory of the spill file, defaults to the temporary directory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        call_builder: BaseCallBuilder,
+        maxsize: int = 1000,
+        overflow: str = "block",
+        spill_dir: Optional[str] = None,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize should be greater than 0, got {}.".format(maxsize))
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                "overflow should be one of {}, got {!r}.".format(
+                    ", ".join(OVERFLOW_POLICIES), overflow
+                )
+            )
+        self.name: str = name
+        self.call_builder: BaseCallBuilder = call_builder
+        self.maxsize: int = maxsize
+        self.overflow: str = overflow
+        self.spill_dir: Optional[str] = spill_dir
+        #: The paging token of the last event received, the stream resumes from it.
+        self.cursor: Optional[str] = call_builder.params.get("cursor")
+        #: The time between the close of the ledger of the last event and its reception, in seconds.
+        self.lag: Optional[float] = None
+        #: The number of events received.
+        self.received: int = 0
+        #: The number of events dropped by the ``"drop_oldest"`` policy.
+        self.dropped: int = 0
+        #: The number of events written to the spill file.
+        self.spilled: int = 0
+        #: The number of times the stream reconnected after an error.
+        self.reconnects: int = 0
+        #: The last error of the stream, the stream stops on errors other than
+        #: :exc:`StreamClientError <stellar_sdk.exceptions.StreamClientError>` and
+        #: :exc:`ConnectionError <stellar_sdk.exceptions.ConnectionError>`.
+        self.last_error: Optional[Exception] = None
+        # Created by the first coroutine using it, an asyncio.Queue created
+        # outside of the event loop is bound to the wrong loop before Python 3.10.
+        self._queue: Optional[asyncio.Queue] = None
+        self._spill_file = None
+        self._spill_read_offset: int = 0
+        self._spill_unread: int = 0
+
+    @property
+    def qsize(self) -> int:
+        """The number of events waiting for the consumer, spilled events included."""
+        queue_size = self._queue.qsize() if self._queue is not None else 0
+        return queue_size + self._spill_unread
+
+    async def get(self) -> Any:
+        """Remove and return the next event, waiting for one if there is none.
+
+        :return: the event.
+        """
+        queue = self._get_queue()
+        if queue.empty() and self._spill_unread:
+            return self._read_spill()
+        return await queue.get()
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self._events()
+
+    async def _events(self) -> AsyncIterator[Any]:
+        while True:
+            yield await self.get()
+
+    def _get_queue(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.maxsize)
+        return self._queue
+
+    async def _put(self, event: Any) -> None:
+        self.received += 1
+        queue = self._get_queue()
+        if self.overflow == "block":
+            await queue.put(event)
+        elif self.overflow == "drop_oldest":
+            if queue.full():
+                queue.get_nowait()
+                self.dropped += 1
+            queue.put_nowait(event)
+        elif self._spill_unread or queue.full():
+            # Once spilling, the events keep going to the file to stay in order.
+            self._write_spill(event)
+        else:
+            queue.put_nowait(event)
+
+    def _write_spill(self, event: Any) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(
+                prefix="stellar-sdk-{}-".format(self.name), dir=self.spill_dir
+            )
+        self._spill_file.seek(0, 2)
+        self._spill_file.write(json.dumps(event).encode() + b"\n")
+        self._spill_unread += 1
+        self.spilled += 1
+
+    def _read_spill(self) -> Any:
+        self._spill_file.seek(self._spill_read_offset)
+        line = self._spill_file.readline()
+        self._spill_read_offset += len(line)
+        self._spill_unread -= 1
+        if not self._spill_unread:
+            self._spill_file.seek(0)
+            self._spill_file.truncate()
+            self._spill_read_offset = 0
+        return default_json_decoder(line)
+
+    def _close(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+            self._spill_read_offset = 0
+            self._spill_unread = 0
+
+    def __repr__(self) -> str:
+        return (
+            "<SupervisedStream [name={}, cursor={}, qsize={}, lag={}, reconnects={}]>".format(
+                self.name, self.cursor, self.qsize, self.lag, self.reconnects
+            )
+        )
+
+
+class StreamSupervisor:
+    """The :class:`StreamSupervisor` object runs many call builder streams in one
+    event loop, each one feeding the bounded queue of a :class:`SupervisedStream`.
+
+    Each stream tracks its cursor (the paging token of the last event), its lag
+    behind the ledger close time (``created_at`` or ``closed_at`` of the events)
+    and its reconnections. When a stream fails, it is restarted from its cursor
+    after an exponential backoff starting at ``retry_delay`` seconds.
+
+    An example::
+
+        async with Server(horizon_url, AiohttpClient()) as server:
+            async with StreamSupervisor() as supervisor:
+                payments = supervisor.add_stream("payments", server.payments().cursor("now"))
+                effects = supervisor.add_stream(
+                    "effects", server.effects().cursor("now"), maxsize=10000, overflow="drop_oldest"
+                )
+                async for payment in payments:
+                    print(payment["id"], payments.lag, effects.dropped)
+
+    :param retry_delay: the delay before the first reconnection, in seconds.
+    """
+
+    def __init__(self, retry_delay: float = 1.0) -> None:
+        if retry_delay < 0:
+            raise ValueError(
+                "retry_delay should not be negative, got {}.".format(retry_delay)
+            )
+        self.retry_delay: float = retry_delay
+        #: The supervised streams, by name.
+        self.streams: Dict[str, SupervisedStream] = {}
+        self._tasks: Dict[str, asyncio.Future] = {}
+        self._started: bool = False
+
+    def add_stream(
+        self,
+        name: str,
+        call_builder: BaseCallBuilder,
+        maxsize: int = 1000,
+        overflow: str = "block",
+        spill_dir: Optional[str] = None,
+    ) -> SupervisedStream:
+        """Add a stream, it starts at once if the supervisor is running.
+
+        See :class:`SupervisedStream` for the parameters.
+
+        :return: the supervised stream.
+        :raises:
+            | :exc:`TypeError <stellar_sdk.exceptions.TypeError>`: if the call builder does not use an asynchronous client.
+            | :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if the name is already used or a parameter is invalid.
+        """
+        if not isinstance(call_builder.client, BaseAsyncClient):
+            raise TypeError("StreamSupervisor requires an asynchronous client.")
+        if name in self.streams:
+            raise ValueError("A stream named {!r} already exists.".format(name))
+        stream = SupervisedStream(name, call_builder, maxsize, overflow, spill_dir)
+        self.streams[name] = stream
+        if self._started:
+            self._tasks[name] = asyncio.ensure_future(self._run(stream))
+        return stream
+
+    async def remove_stream(self, name: str) -> None:
+        """Stop a stream and remove it.
+
+        :param name: the name of the stream.
+        """
+        stream = self.streams.pop(name)
+        task = self._tasks.pop(name, None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        stream._close()
+
+    def start(self) -> None:
+        """Start the streams."""
+        if self._started:
+            return
+        self._started = True
+        for name, stream in self.streams.items():
+            self._tasks[name] = asyncio.ensure_future(self._run(stream))
+
+    async def stop(self) -> None:
+        """Stop the streams, the events in their queues stay available."""
+        self._started = False
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """The statistics of the streams, for monitoring.
+
+        :return: a dict per stream with its ``name``, ``cursor``, ``lag``, ``qsize``,
+            ``received``, ``dropped``, ``spilled`` and ``reconnects``.
+        """
+        return [
+            {
+                "name": stream.name,
+                "cursor": stream.cursor,
+                "lag": stream.lag,
+                "qsize": stream.qsize,
+                "received": stream.received,
+                "dropped": stream.dropped,
+                "spilled": stream.spilled,
+                "reconnects": stream.reconnects,
+            }
+            for stream in self.streams.values()
+        ]
+
+    async def _run(self, stream: SupervisedStream) -> None:
+        delay = self.retry_delay
+        while True:
+            call_builder = copy.copy(stream.call_builder)
+            call_builder.params = dict(stream.call_builder.params)
+            if stream.cursor is not None:
+                call_builder.cursor(stream.cursor)
+            events = call_builder.stream()
+            try:
+                async for event in events:
+                    _track(stream, event)
+                    await stream._put(event)
+                    delay = self.retry_delay
+                error = None
+            except (StreamClientError, ConnectionError) as e:
+                error = e
+            except Exception as e:
+                # The error is reported by last_error, the task ends without it.
+                stream.last_error = e
+                logger.exception("Stream {} failed.".format(stream.name))
+                return
+            finally:
+                await events.aclose()
+            stream.reconnects += 1
+            stream.last_error = error
+            logger.warning(
+                "Stream {} stopped ({}), reconnecting from cursor {} in {} seconds.".format(
+                    stream.name, error or "end of stream", stream.cursor, delay
+                )
+            )
+            await asyncio.sleep(delay)
+            delay = min(max(delay * 2, 0.1), _MAX_RETRY_DELAY)
+
+    async def __aenter__(self) -> "StreamSupervisor":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+        for stream in self.streams.values():
+            stream._close()
+
+
+def _track(stream: SupervisedStream, event: Any) -> None:
+    paging_token = _get(event, "paging_token")
+    if paging_token is not None:
+        stream.cursor = paging_token
+    close_time = _get(event, "created_at") or _get(event, "closed_at")
+    if close_time is not None:
+        stream.lag = time.time() - _timestamp(close_time)
+
+
+def _get(event: Any, key: str) -> Any:
+    try:
+        return event[key]
+    except KeyError:
+        return None
+
+
+def _timestamp(value: Any) -> float:
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return calendar.timegm(time.strptime(value, "%Y-%m-%dT%H:%M:%SZ"))
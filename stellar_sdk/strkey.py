@@ -1,9 +1,7 @@
 import base64
 import binascii
-import struct
-from typing import Union
-
-from crc16 import crc16xmodem
+from binascii import crc_hqx
+from typing import Iterable, List, NamedTuple, Optional, Union
 
 from .exceptions import (
     Ed25519SecretSeedInvalidError,
@@ -153,43 +151,65 @@ class StrKey:
         return decode_check("sha256_hash", data)
 
 
-def decode_check(version_byte_name: str, encoded: str) -> bytes:
-    encoded_data = _bytes_from_decode_data(encoded)
-    encoded_data = encoded_data + b"=" * ((4 - len(encoded_data) % 4) % 4)
+class DecodeResult(NamedTuple):
+    """The result of :func:`try_decode_check`, either ``data`` or ``error`` is `None`."""
 
-    try:
-        decoded_data = base64.b32decode(encoded_data)
-    except binascii.Error:
-        raise ValueError("Incorrect padding.")
+    data: Optional[bytes]
+    error: Optional[Exception]
 
-    if encoded_data != base64.b32encode(decoded_data):  # Is that even possible?
-        raise ValueError("Invalid encoded bytes.")
 
-    version_byte = decoded_data[0:1]
-    payload = decoded_data[0:-2]
-    data = decoded_data[1:-2]
-    checksum = decoded_data[-2:]
+def try_decode_check(version_byte_name: str, encoded: str) -> DecodeResult:
+    """Decode and validate a strkey in a single pass, without raising.
 
+    :param version_byte_name: the expected version byte name, ex. ``"ed25519_public_key"``.
+    :param encoded: the strkey to decode.
+    :return: the decoded data, or the :exc:`ValueError <stellar_sdk.exceptions.ValueError>`
+        or :exc:`TypeError <stellar_sdk.exceptions.TypeError>` :func:`decode_check` would raise.
+    """
     expected_version = _version_bytes.get(version_byte_name)
     if expected_version is None:
-        raise TypeError(
-            '{} is not a valid version byte name. expected one of "ed25519_public_key", '
-            '"ed25519_secret_seed", "pre_auth_tx", "sha256_hash"'.format(
-                version_byte_name
-            )
-        )
+        return DecodeResult(None, _invalid_version_byte_name(version_byte_name))
 
-    if version_byte != expected_version:
-        raise TypeError(
-            "Invalid version byte. Expected {}, got {}".format(
-                str(expected_version), str(version_byte)
-            )
+    try:
+        encoded_data = _bytes_from_decode_data(encoded)
+    except (ValueError, TypeError) as e:
+        return DecodeResult(None, e)
+    remainder = len(encoded_data) % 8
+    if remainder:
+        encoded_data = encoded_data + b"=" * (8 - remainder)
+
+    try:
+        decoded_data = base64.b32decode(encoded_data)
+    except binascii.Error:
+        return DecodeResult(None, ValueError("Incorrect padding."))
+
+    # A strkey is 35 bytes, which is exactly 56 base32 characters. Other lengths
+    # leave unused bits in the last character, they must be zero.
+    if remainder and encoded_data != base64.b32encode(decoded_data):
+        return DecodeResult(None, ValueError("Invalid encoded bytes."))
+
+    if not decoded_data or decoded_data[0] != expected_version[0]:
+        return DecodeResult(
+            None,
+            TypeError(
+                "Invalid version byte. Expected {}, got {}".format(
+                    str(expected_version), str(decoded_data[0:1])
+                )
+            ),
         )
 
-    expected_checksum = _calculate_checksum(payload)
-    if expected_checksum != checksum:
-        raise ValueError("Invalid checksum")
+    if len(decoded_data) < 3 or crc_hqx(decoded_data[:-2], 0) != (
+        decoded_data[-2] | decoded_data[-1] << 8
+    ):
+        return DecodeResult(None, ValueError("Invalid checksum"))
+
+    return DecodeResult(decoded_data[1:-2], None)
 
+
+def decode_check(version_byte_name: str, encoded: str) -> bytes:
+    data, error = try_decode_check(version_byte_name, encoded)
+    if error is not None:
+        raise error
     return data
 
 
@@ -199,12 +219,7 @@ def encode_check(version_byte_name: str, data: bytes) -> str:
 
     version_byte = _version_bytes.get(version_byte_name)
     if version_byte is None:
-        raise TypeError(
-            '{} is not a valid version byte name. expected one of "ed25519_public_key", '
-            '"ed25519_secret_seed", "pre_auth_tx", "sha256_hash"'.format(
-                version_byte_name
-            )
-        )
+        raise _invalid_version_byte_name(version_byte_name)
     payload = version_byte + data
     crc = _calculate_checksum(payload)
     return base64.b32encode(payload + crc).decode("utf-8").rstrip("=")
@@ -213,13 +228,56 @@ def encode_check(version_byte_name: str, data: bytes) -> str:
 def is_valid(version_byte_name: str, encoded: str) -> bool:
     if encoded and len(encoded) != 56:
         return False
-    try:
-        decoded = decode_check(version_byte_name, encoded)
-        # if len(decoded) != 32:
-        #     return False
-    except (ValueError, TypeError):
-        return False
-    return True
+    return try_decode_check(version_byte_name, encoded).error is None
+
+
+def encode_many(version_byte_name: str, data_list: Iterable[bytes]) -> List[str]:
+    """Encode many raw keys to strkeys of the same type.
+
+    :param version_byte_name: the version byte name, ex. ``"ed25519_public_key"``.
+    :param data_list: the raw keys to encode.
+    :return: the strkeys, in the same order as ``data_list``.
+    :raises:
+        :exc:`ValueError <stellar_sdk.exceptions.ValueError>`
+        :exc:`TypeError <stellar_sdk.exceptions.TypeError>`
+    """
+    version_byte = _version_bytes.get(version_byte_name)
+    if version_byte is None:
+        raise _invalid_version_byte_name(version_byte_name)
+    b32encode = base64.b32encode
+    result = []
+    for data in data_list:
+        if data is None:
+            raise ValueError("cannot encode null data")
+        payload = version_byte + data
+        crc = crc_hqx(payload, 0)
+        result.append(
+            b32encode(payload + bytes((crc & 0xFF, crc >> 8))).decode().rstrip("=")
+        )
+    return result
+
+
+def decode_many(version_byte_name: str, encoded_list: Iterable[str]) -> List[bytes]:
+    """Decode many strkeys of the same type to raw keys.
+
+    Use :func:`try_decode_check` to find out which of the strkeys are invalid
+    without stopping at the first one.
+
+    :param version_byte_name: the expected version byte name, ex. ``"ed25519_public_key"``.
+    :param encoded_list: the strkeys to decode.
+    :return: the raw keys, in the same order as ``encoded_list``.
+    :raises:
+        :exc:`ValueError <stellar_sdk.exceptions.ValueError>`
+        :exc:`TypeError <stellar_sdk.exceptions.TypeError>`
+    """
+    return [decode_check(version_byte_name, encoded) for encoded in encoded_list]
+
+
+def _invalid_version_byte_name(version_byte_name: str) -> TypeError:
+    return TypeError(
+        '{} is not a valid version byte name. expected one of "ed25519_public_key", '
+        '"ed25519_secret_seed", "pre_auth_tx", "sha256_hash"'.format(version_byte_name)
+    )
 
 
 def _bytes_from_decode_data(s: Union[str, bytes, bytearray]) -> bytes:
@@ -243,8 +301,8 @@ def _bytes_from_decode_data(s: Union[str, bytes, bytearray]) -> bytes:
 
 
 def _calculate_checksum(payload):
-    # This code calculates CRC16-XModem checksum of payload
-    checksum = crc16xmodem(payload)
+    # This code calculates CRC16-XModem checksum of payload, crc_hqx is
+    # the table driven CRC-CCITT (XModem when the initial value is 0).
+    checksum = crc_hqx(payload, 0)
     # Ensure that the checksum is in LSB order.
-    checksum = struct.pack("<H", checksum)
-    return checksum
+    return bytes((checksum & 0xFF, checksum >> 8))
@@ -1,5 +1,8 @@
+from typing import Any
+
 from .xdr import Xdr
 from .exceptions import ValueError
+from .utils import new_stamp
 
 __all__ = ["TimeBounds"]
 
@@ -36,6 +39,11 @@ class TimeBounds:
         self.min_time: int = min_time
         self.max_time: int = max_time
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # See Transaction.__setattr__
+        object.__setattr__(self, "_stamp", new_stamp())
+        object.__setattr__(self, name, value)
+
     def to_xdr_object(self) -> Xdr.types.TimeBounds:
         """Returns the xdr object for this TimeBounds object.
 
@@ -1,4 +1,4 @@
-from typing import List, Union, Optional
+from typing import Any, List, Union, Optional
 
 from .keypair import Keypair
 from .memo import NoneMemo, Memo
@@ -6,6 +6,7 @@ from .operation.operation import Operation
 from .strkey import StrKey
 from .time_bounds import TimeBounds
 from .utils import (
+    new_stamp,
     pack_xdr_array,
     unpack_xdr_array,
     parse_ed25519_account_id_from_muxed_account_xdr_object,
@@ -80,6 +81,12 @@ class Transaction:
         self.time_bounds: TimeBounds = time_bounds
         self.v1: bool = v1
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Envelopes cache the signature base of this transaction, a new
+        # stamp on every assignment tells them it is stale.
+        object.__setattr__(self, "_stamp", new_stamp())
+        object.__setattr__(self, name, value)
+
     @property
     def source(self) -> Keypair:
         return self._source
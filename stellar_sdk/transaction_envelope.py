@@ -1,11 +1,14 @@
-from typing import List
+from typing import Any, List, Tuple
 
 from .base_transaction_envelope import BaseTransactionEnvelope
 from .transaction import Transaction
+from .utils import get_stamp
 from .xdr import Xdr
 
 __all__ = ["TransactionEnvelope"]
 
+_ENVELOPE_TYPE_TX = Xdr.const.ENVELOPE_TYPE_TX.to_bytes(4, "big")
+
 
 class TransactionEnvelope(BaseTransactionEnvelope["TransactionEnvelope"]):
     """The :class:`TransactionEnvelope` object, which represents a transaction
@@ -42,21 +45,40 @@ class TransactionEnvelope(BaseTransactionEnvelope["TransactionEnvelope"]):
         It is composed of a 4 prefix bytes followed by the xdr-encoded form of
         this transaction.
 
+        The transaction is packed once, the same object is returned until the
+        network, the transaction or one of its operations, memo or time bounds
+        changes, so :meth:`hash` packs and hashes it once whatever the number of
+        signers. See :meth:`invalidate` for the changes that are not detected.
+
         :return: The signature base of this transaction envelope.
 
         """
-        network_id = self.network_id
-        tx_type = Xdr.StellarXDRPacker()
-        tx_packer = Xdr.StellarXDRPacker()
+        return self._cached_signature_base(
+            self._signature_base_key(), self._build_signature_base
+        )
+
+    def _signature_base_key(self) -> Tuple[Any, ...]:
+        # Every attribute assignment gives the object a new stamp.
         tx = self.transaction
-        if isinstance(self.transaction, Transaction) and not self.transaction.v1:
-            tx = Transaction.from_xdr_object(self.transaction.to_xdr_object(), v1=False)
-            tx.v1 = True
-        tx_type.pack_EnvelopeType(Xdr.const.ENVELOPE_TYPE_TX)
-        tx_packer.pack_Transaction(tx.to_xdr_object())
-        tx_type_buffer = tx_type.get_buffer()
-        tx_buffer = tx_packer.get_buffer()
-        return network_id + tx_type_buffer + tx_buffer
+        return (
+            self.network_id,
+            get_stamp(tx),
+            get_stamp(tx.memo),
+            get_stamp(tx.time_bounds),
+            tuple(get_stamp(op) for op in tx.operations),
+        )
+
+    def _build_signature_base(self) -> bytes:
+        tx = self.transaction
+        packer = Xdr.StellarXDRPacker()
+        if tx.v1:
+            packer.pack_Transaction(tx.to_xdr_object())
+        else:
+            # A TransactionV0 is encoded like a Transaction whose source is a
+            # KEY_TYPE_ED25519 MuxedAccount, minus the discriminant.
+            packer.pack_CryptoKeyType(Xdr.const.KEY_TYPE_ED25519)
+            packer.pack_TransactionV0(tx.to_xdr_object())
+        return self.network_id + _ENVELOPE_TYPE_TX + packer.get_buffer()
 
     def to_xdr_object(self) -> Xdr.types.TransactionEnvelope:
         """Get an XDR object representation of this :class:`TransactionEnvelope`.
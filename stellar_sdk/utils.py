@@ -1,7 +1,8 @@
 import hashlib
+import itertools
 import os
 from decimal import Decimal, ROUND_FLOOR
-from typing import List
+from typing import Any, List, Optional
 from urllib.parse import urlsplit, urlunsplit
 
 from .asset import Asset
@@ -13,10 +14,29 @@ MUXED_ACCOUNT_STARTING_LETTER: str = "M"
 ED25519_PUBLIC_KEY_STARTING_LETTER: str = "G"
 
 
+_stamps = itertools.count()
+
+
 def sha256(data: bytes) -> bytes:
     return hashlib.sha256(data).digest()
 
 
+def new_stamp() -> int:
+    """Return a process wide unique, increasing number.
+
+    The objects packed in the signature base of a transaction envelope
+    (transactions, operations, memos and time bounds) take a new stamp on
+    every attribute assignment, see
+    :meth:`stellar_sdk.transaction_envelope.TransactionEnvelope.signature_base`.
+    """
+    return next(_stamps)
+
+
+def get_stamp(obj: Any) -> Optional[int]:
+    """Return the last stamp taken by ``obj``, ``None`` if it has none."""
+    return getattr(obj, "_stamp", None)
+
+
 def best_rational_approximation(x):
     x = Decimal(x)
     int32_max = Decimal(2147483647)
@@ -0,0 +1,7711 @@
+# Generated by xdrgen.py from ../../.xdr/ on Fri Oct 16 22:38:46 2026
+import struct
+
+from . import StellarXDR_const as const
+from . import StellarXDR_type as types
+
+
+class XDRError(Exception):
+    pass
+
+
+class ConversionError(XDRError):
+    pass
+
+
+class nullclass(object):
+    pass
+
+
+_TRUE = b"\0\0\0\1"
+_FALSE = b"\0\0\0\0"
+_PAD = (b"", b"\0\0\0", b"\0\0", b"\0")
+
+_S_12s = struct.Struct('>12s')
+_S_16s = struct.Struct('>16s')
+_S_32s = struct.Struct('>32s')
+_S_4s = struct.Struct('>4s')
+_S_I = struct.Struct('>I')
+_S_II = struct.Struct('>II')
+_S_III = struct.Struct('>III')
+_S_Iq = struct.Struct('>Iq')
+_S_IqqIQIII = struct.Struct('>IqqIQIII')
+_S_Q = struct.Struct('>Q')
+_S_QQ = struct.Struct('>QQ')
+_S_QQQQQQQQQQQQQ = struct.Struct('>QQQQQQQQQQQQQ')
+_S_d = struct.Struct('>d')
+_S_f = struct.Struct('>f')
+_S_i = struct.Struct('>i')
+_S_ii = struct.Struct('>ii')
+_S_q = struct.Struct('>q')
+_S_qq = struct.Struct('>qq')
+_S_qqI = struct.Struct('>qqI')
+
+_ENUM_CryptoKeyType = frozenset([const.KEY_TYPE_ED25519, const.KEY_TYPE_PRE_AUTH_TX, const.KEY_TYPE_HASH_X, const.KEY_TYPE_MUXED_ED25519])
+_ENUM_PublicKeyType = frozenset([const.PUBLIC_KEY_TYPE_ED25519])
+_ENUM_SignerKeyType = frozenset([const.SIGNER_KEY_TYPE_ED25519, const.SIGNER_KEY_TYPE_PRE_AUTH_TX, const.SIGNER_KEY_TYPE_HASH_X])
+_ENUM_SCPStatementType = frozenset([const.SCP_ST_PREPARE, const.SCP_ST_CONFIRM, const.SCP_ST_EXTERNALIZE, const.SCP_ST_NOMINATE])
+_ENUM_StellarValueType = frozenset([const.STELLAR_VALUE_BASIC, const.STELLAR_VALUE_SIGNED])
+_ENUM_LedgerUpgradeType = frozenset([const.LEDGER_UPGRADE_VERSION, const.LEDGER_UPGRADE_BASE_FEE, const.LEDGER_UPGRADE_MAX_TX_SET_SIZE, const.LEDGER_UPGRADE_BASE_RESERVE])
+_ENUM_LedgerEntryType = frozenset([const.ACCOUNT, const.TRUSTLINE, const.OFFER, const.DATA])
+_ENUM_BucketEntryType = frozenset([const.METAENTRY, const.LIVEENTRY, const.DEADENTRY, const.INITENTRY])
+_ENUM_LedgerEntryChangeType = frozenset([const.LEDGER_ENTRY_CREATED, const.LEDGER_ENTRY_UPDATED, const.LEDGER_ENTRY_REMOVED, const.LEDGER_ENTRY_STATE])
+_ENUM_AssetType = frozenset([const.ASSET_TYPE_NATIVE, const.ASSET_TYPE_CREDIT_ALPHANUM4, const.ASSET_TYPE_CREDIT_ALPHANUM12])
+_ENUM_ThresholdIndexes = frozenset([const.THRESHOLD_MASTER_WEIGHT, const.THRESHOLD_LOW, const.THRESHOLD_MED, const.THRESHOLD_HIGH])
+_ENUM_AccountFlags = frozenset([const.AUTH_REQUIRED_FLAG, const.AUTH_REVOCABLE_FLAG, const.AUTH_IMMUTABLE_FLAG])
+_ENUM_TrustLineFlags = frozenset([const.AUTHORIZED_FLAG, const.AUTHORIZED_TO_MAINTAIN_LIABILITIES_FLAG])
+_ENUM_OfferEntryFlags = frozenset([const.PASSIVE_FLAG])
+_ENUM_EnvelopeType = frozenset([const.ENVELOPE_TYPE_TX_V0, const.ENVELOPE_TYPE_SCP, const.ENVELOPE_TYPE_TX, const.ENVELOPE_TYPE_AUTH, const.ENVELOPE_TYPE_SCPVALUE, const.ENVELOPE_TYPE_TX_FEE_BUMP])
+_ENUM_OperationType = frozenset([const.CREATE_ACCOUNT, const.PAYMENT, const.PATH_PAYMENT_STRICT_RECEIVE, const.MANAGE_SELL_OFFER, const.CREATE_PASSIVE_SELL_OFFER, const.SET_OPTIONS, const.CHANGE_TRUST, const.ALLOW_TRUST, const.ACCOUNT_MERGE, const.INFLATION, const.MANAGE_DATA, const.BUMP_SEQUENCE, const.MANAGE_BUY_OFFER, const.PATH_PAYMENT_STRICT_SEND])
+_ENUM_MemoType = frozenset([const.MEMO_NONE, const.MEMO_TEXT, const.MEMO_ID, const.MEMO_HASH, const.MEMO_RETURN])
+_ENUM_CreateAccountResultCode = frozenset([const.CREATE_ACCOUNT_SUCCESS, const.CREATE_ACCOUNT_MALFORMED, const.CREATE_ACCOUNT_UNDERFUNDED, const.CREATE_ACCOUNT_LOW_RESERVE, const.CREATE_ACCOUNT_ALREADY_EXIST])
+_ENUM_PaymentResultCode = frozenset([const.PAYMENT_SUCCESS, const.PAYMENT_MALFORMED, const.PAYMENT_UNDERFUNDED, const.PAYMENT_SRC_NO_TRUST, const.PAYMENT_SRC_NOT_AUTHORIZED, const.PAYMENT_NO_DESTINATION, const.PAYMENT_NO_TRUST, const.PAYMENT_NOT_AUTHORIZED, const.PAYMENT_LINE_FULL, const.PAYMENT_NO_ISSUER])
+_ENUM_PathPaymentStrictReceiveResultCode = frozenset([const.PATH_PAYMENT_STRICT_RECEIVE_SUCCESS, const.PATH_PAYMENT_STRICT_RECEIVE_MALFORMED, const.PATH_PAYMENT_STRICT_RECEIVE_UNDERFUNDED, const.PATH_PAYMENT_STRICT_RECEIVE_SRC_NO_TRUST, const.PATH_PAYMENT_STRICT_RECEIVE_SRC_NOT_AUTHORIZED, const.PATH_PAYMENT_STRICT_RECEIVE_NO_DESTINATION, const.PATH_PAYMENT_STRICT_RECEIVE_NO_TRUST, const.PATH_PAYMENT_STRICT_RECEIVE_NOT_AUTHORIZED, const.PATH_PAYMENT_STRICT_RECEIVE_LINE_FULL, const.PATH_PAYMENT_STRICT_RECEIVE_NO_ISSUER, const.PATH_PAYMENT_STRICT_RECEIVE_TOO_FEW_OFFERS, const.PATH_PAYMENT_STRICT_RECEIVE_OFFER_CROSS_SELF, const.PATH_PAYMENT_STRICT_RECEIVE_OVER_SENDMAX])
+_ENUM_PathPaymentStrictSendResultCode = frozenset([const.PATH_PAYMENT_STRICT_SEND_SUCCESS, const.PATH_PAYMENT_STRICT_SEND_MALFORMED, const.PATH_PAYMENT_STRICT_SEND_UNDERFUNDED, const.PATH_PAYMENT_STRICT_SEND_SRC_NO_TRUST, const.PATH_PAYMENT_STRICT_SEND_SRC_NOT_AUTHORIZED, const.PATH_PAYMENT_STRICT_SEND_NO_DESTINATION, const.PATH_PAYMENT_STRICT_SEND_NO_TRUST, const.PATH_PAYMENT_STRICT_SEND_NOT_AUTHORIZED, const.PATH_PAYMENT_STRICT_SEND_LINE_FULL, const.PATH_PAYMENT_STRICT_SEND_NO_ISSUER, const.PATH_PAYMENT_STRICT_SEND_TOO_FEW_OFFERS, const.PATH_PAYMENT_STRICT_SEND_OFFER_CROSS_SELF, const.PATH_PAYMENT_STRICT_SEND_UNDER_DESTMIN])
+_ENUM_ManageSellOfferResultCode = frozenset([const.MANAGE_SELL_OFFER_SUCCESS, const.MANAGE_SELL_OFFER_MALFORMED, const.MANAGE_SELL_OFFER_SELL_NO_TRUST, const.MANAGE_SELL_OFFER_BUY_NO_TRUST, const.MANAGE_SELL_OFFER_SELL_NOT_AUTHORIZED, const.MANAGE_SELL_OFFER_BUY_NOT_AUTHORIZED, const.MANAGE_SELL_OFFER_LINE_FULL, const.MANAGE_SELL_OFFER_UNDERFUNDED, const.MANAGE_SELL_OFFER_CROSS_SELF, const.MANAGE_SELL_OFFER_SELL_NO_ISSUER, const.MANAGE_SELL_OFFER_BUY_NO_ISSUER, const.MANAGE_SELL_OFFER_NOT_FOUND, const.MANAGE_SELL_OFFER_LOW_RESERVE])
+_ENUM_ManageOfferEffect = frozenset([const.MANAGE_OFFER_CREATED, const.MANAGE_OFFER_UPDATED, const.MANAGE_OFFER_DELETED])
+_ENUM_ManageBuyOfferResultCode = frozenset([const.MANAGE_BUY_OFFER_SUCCESS, const.MANAGE_BUY_OFFER_MALFORMED, const.MANAGE_BUY_OFFER_SELL_NO_TRUST, const.MANAGE_BUY_OFFER_BUY_NO_TRUST, const.MANAGE_BUY_OFFER_SELL_NOT_AUTHORIZED, const.MANAGE_BUY_OFFER_BUY_NOT_AUTHORIZED, const.MANAGE_BUY_OFFER_LINE_FULL, const.MANAGE_BUY_OFFER_UNDERFUNDED, const.MANAGE_BUY_OFFER_CROSS_SELF, const.MANAGE_BUY_OFFER_SELL_NO_ISSUER, const.MANAGE_BUY_OFFER_BUY_NO_ISSUER, const.MANAGE_BUY_OFFER_NOT_FOUND, const.MANAGE_BUY_OFFER_LOW_RESERVE])
+_ENUM_SetOptionsResultCode = frozenset([const.SET_OPTIONS_SUCCESS, const.SET_OPTIONS_LOW_RESERVE, const.SET_OPTIONS_TOO_MANY_SIGNERS, const.SET_OPTIONS_BAD_FLAGS, const.SET_OPTIONS_INVALID_INFLATION, const.SET_OPTIONS_CANT_CHANGE, const.SET_OPTIONS_UNKNOWN_FLAG, const.SET_OPTIONS_THRESHOLD_OUT_OF_RANGE, const.SET_OPTIONS_BAD_SIGNER, const.SET_OPTIONS_INVALID_HOME_DOMAIN])
+_ENUM_ChangeTrustResultCode = frozenset([const.CHANGE_TRUST_SUCCESS, const.CHANGE_TRUST_MALFORMED, const.CHANGE_TRUST_NO_ISSUER, const.CHANGE_TRUST_INVALID_LIMIT, const.CHANGE_TRUST_LOW_RESERVE, const.CHANGE_TRUST_SELF_NOT_ALLOWED])
+_ENUM_AllowTrustResultCode = frozenset([const.ALLOW_TRUST_SUCCESS, const.ALLOW_TRUST_MALFORMED, const.ALLOW_TRUST_NO_TRUST_LINE, const.ALLOW_TRUST_TRUST_NOT_REQUIRED, const.ALLOW_TRUST_CANT_REVOKE, const.ALLOW_TRUST_SELF_NOT_ALLOWED])
+_ENUM_AccountMergeResultCode = frozenset([const.ACCOUNT_MERGE_SUCCESS, const.ACCOUNT_MERGE_MALFORMED, const.ACCOUNT_MERGE_NO_ACCOUNT, const.ACCOUNT_MERGE_IMMUTABLE_SET, const.ACCOUNT_MERGE_HAS_SUB_ENTRIES, const.ACCOUNT_MERGE_SEQNUM_TOO_FAR, const.ACCOUNT_MERGE_DEST_FULL])
+_ENUM_InflationResultCode = frozenset([const.INFLATION_SUCCESS, const.INFLATION_NOT_TIME])
+_ENUM_ManageDataResultCode = frozenset([const.MANAGE_DATA_SUCCESS, const.MANAGE_DATA_NOT_SUPPORTED_YET, const.MANAGE_DATA_NAME_NOT_FOUND, const.MANAGE_DATA_LOW_RESERVE, const.MANAGE_DATA_INVALID_NAME])
+_ENUM_BumpSequenceResultCode = frozenset([const.BUMP_SEQUENCE_SUCCESS, const.BUMP_SEQUENCE_BAD_SEQ])
+_ENUM_OperationResultCode = frozenset([const.opINNER, const.opBAD_AUTH, const.opNO_ACCOUNT, const.opNOT_SUPPORTED, const.opTOO_MANY_SUBENTRIES, const.opEXCEEDED_WORK_LIMIT])
+_ENUM_TransactionResultCode = frozenset([const.txFEE_BUMP_INNER_SUCCESS, const.txSUCCESS, const.txFAILED, const.txTOO_EARLY, const.txTOO_LATE, const.txMISSING_OPERATION, const.txBAD_SEQ, const.txBAD_AUTH, const.txINSUFFICIENT_BALANCE, const.txNO_ACCOUNT, const.txINSUFFICIENT_FEE, const.txBAD_AUTH_EXTRA, const.txINTERNAL_ERROR, const.txNOT_SUPPORTED, const.txFEE_BUMP_INNER_FAILED])
+_ENUM_ErrorCode = frozenset([const.ERR_MISC, const.ERR_DATA, const.ERR_CONF, const.ERR_AUTH, const.ERR_LOAD])
+_ENUM_IPAddrType = frozenset([const.IPv4, const.IPv6])
+_ENUM_MessageType = frozenset([const.ERROR_MSG, const.AUTH, const.DONT_HAVE, const.GET_PEERS, const.PEERS, const.GET_TX_SET, const.TX_SET, const.TRANSACTION, const.GET_SCP_QUORUMSET, const.SCP_QUORUMSET, const.SCP_MESSAGE, const.GET_SCP_STATE, const.HELLO, const.SURVEY_REQUEST, const.SURVEY_RESPONSE])
+_ENUM_SurveyMessageCommandType = frozenset([const.SURVEY_TOPOLOGY])
+
+
+class StellarXDRPacker(object):
+    def __init__(self, check_enum=True, check_array=True):
+        self.check_enum = check_enum
+        self.check_array = check_array
+        self.reset()
+
+    def reset(self):
+        self._buf = bytearray()
+
+    def get_buffer(self):
+        return bytes(self._buf)
+
+    get_buf = get_buffer
+
+    def pack_int(self, x):
+        try:
+            self._buf += _S_i.pack(x)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_uint(self, x):
+        try:
+            self._buf += _S_I.pack(x)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_hyper(self, x):
+        try:
+            self._buf += _S_q.pack(x)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_uhyper(self, x):
+        try:
+            self._buf += _S_Q.pack(x)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_float(self, x):
+        try:
+            self._buf += _S_f.pack(x)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_double(self, x):
+        try:
+            self._buf += _S_d.pack(x)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_bool(self, x):
+        self._buf += _TRUE if x else _FALSE
+
+    def pack_fstring(self, n, s):
+        if n < 0:
+            raise ValueError('fstring size must be nonnegative')
+        data = s[:n]
+        self._buf += data
+        self._buf += bytes((n + 3) // 4 * 4 - len(data))
+
+    def pack_string(self, s):
+        n = len(s)
+        self.pack_uint(n)
+        self.pack_fstring(n, s)
+
+    def pack_list(self, list, pack_item):
+        for item in list:
+            self.pack_uint(1)
+            pack_item(item)
+        self.pack_uint(0)
+
+    def pack_farray(self, n, list, pack_item):
+        if len(list) != n:
+            raise ValueError('wrong array size')
+        for item in list:
+            pack_item(item)
+
+    def pack_array(self, list, pack_item):
+        n = len(list)
+        self.pack_uint(n)
+        self.pack_farray(n, list, pack_item)
+
+    pack_enum = pack_int
+    pack_unsigned = pack_uint
+    pack_quadruple = pack_double
+    pack_fopaque = pack_fstring
+    pack_opaque = pack_string
+    pack_bytes = pack_string
+
+    def pack_Hash(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_uint256(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    pack_uint32 = pack_uint
+
+    pack_int32 = pack_int
+
+    pack_uint64 = pack_uhyper
+
+    pack_int64 = pack_hyper
+
+    def pack_CryptoKeyType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_CryptoKeyType:
+                raise XDRError('value=%s not in enum CryptoKeyType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PublicKeyType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_PublicKeyType:
+                raise XDRError('value=%s not in enum PublicKeyType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SignerKeyType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_SignerKeyType:
+                raise XDRError('value=%s not in enum SignerKeyType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PublicKey(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_PublicKeyType:
+                raise XDRError('value=%s not in enum PublicKeyType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.PUBLIC_KEY_TYPE_ED25519:
+                buf += _S_32s.pack(data.ed25519)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SignerKey(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_SignerKeyType:
+                raise XDRError('value=%s not in enum SignerKeyType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.SIGNER_KEY_TYPE_ED25519:
+                buf += _S_32s.pack(data.ed25519)
+            elif data.type == const.SIGNER_KEY_TYPE_PRE_AUTH_TX:
+                buf += _S_32s.pack(data.preAuthTx)
+            elif data.type == const.SIGNER_KEY_TYPE_HASH_X:
+                buf += _S_32s.pack(data.hashX)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Signature(self, data):
+        buf = self._buf
+        try:
+            v2 = data
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SignatureHint(self, data):
+        buf = self._buf
+        try:
+            buf += _S_4s.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    pack_NodeID = pack_PublicKey
+
+    def pack_Curve25519Secret(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.key)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Curve25519Public(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.key)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_HmacSha256Key(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.key)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_HmacSha256Mac(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.mac)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Value(self, data):
+        buf = self._buf
+        try:
+            v2 = data
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SCPBallot(self, data):
+        buf = self._buf
+        try:
+            buf += _S_I.pack(data.counter)
+            v2 = data.value
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SCPStatementType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_SCPStatementType:
+                raise XDRError('value=%s not in enum SCPStatementType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SCPNomination(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.quorumSetHash)
+            v2 = data.votes
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                v3 = i2
+                buf += _S_I.pack(len(v3))
+                buf += v3
+                buf += _PAD[len(v3) & 3]
+            v2 = data.accepted
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                v3 = i2
+                buf += _S_I.pack(len(v3))
+                buf += v3
+                buf += _PAD[len(v3) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SCPStatement(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.nodeID)
+            buf += _S_Q.pack(data.slotIndex)
+            if self.check_enum and data.pledges.type not in _ENUM_SCPStatementType:
+                raise XDRError('value=%s not in enum SCPStatementType' % data.pledges.type)
+            buf += _S_i.pack(data.pledges.type)
+            if data.pledges.type == const.SCP_ST_PREPARE:
+                buf += _S_32s.pack(data.pledges.prepare.quorumSetHash)
+                self.pack_SCPBallot(data.pledges.prepare.ballot)
+                v3 = data.pledges.prepare.prepared
+                if len(v3) > 1 and self.check_array:
+                    raise XDRError('array length too long for data.pledges.prepare.prepared')
+                buf += _S_I.pack(len(v3))
+                pack_i3 = self.pack_SCPBallot
+                for i3 in v3:
+                    pack_i3(i3)
+                v3 = data.pledges.prepare.preparedPrime
+                if len(v3) > 1 and self.check_array:
+                    raise XDRError('array length too long for data.pledges.prepare.preparedPrime')
+                buf += _S_I.pack(len(v3))
+                pack_i3 = self.pack_SCPBallot
+                for i3 in v3:
+                    pack_i3(i3)
+                buf += _S_II.pack(data.pledges.prepare.nC, data.pledges.prepare.nH)
+            elif data.pledges.type == const.SCP_ST_CONFIRM:
+                self.pack_SCPBallot(data.pledges.confirm.ballot)
+                buf += _S_III.pack(data.pledges.confirm.nPrepared, data.pledges.confirm.nCommit, data.pledges.confirm.nH)
+                buf += _S_32s.pack(data.pledges.confirm.quorumSetHash)
+            elif data.pledges.type == const.SCP_ST_EXTERNALIZE:
+                self.pack_SCPBallot(data.pledges.externalize.commit)
+                buf += _S_I.pack(data.pledges.externalize.nH)
+                buf += _S_32s.pack(data.pledges.externalize.commitQuorumSetHash)
+            elif data.pledges.type == const.SCP_ST_NOMINATE:
+                self.pack_SCPNomination(data.pledges.nominate)
+            else:
+                raise XDRError('bad switch=%s' % data.pledges.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SCPEnvelope(self, data):
+        buf = self._buf
+        try:
+            self.pack_SCPStatement(data.statement)
+            v2 = data.signature
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data.signature')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SCPQuorumSet(self, data):
+        buf = self._buf
+        try:
+            buf += _S_I.pack(data.threshold)
+            v2 = data.validators
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_PublicKey
+            for i2 in v2:
+                pack_i2(i2)
+            v2 = data.innerSets
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_SCPQuorumSet
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_UpgradeType(self, data):
+        buf = self._buf
+        try:
+            v2 = data
+            if len(v2) > 128 and self.check_array:
+                raise XDRError('array length too long for data')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_StellarValueType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_StellarValueType:
+                raise XDRError('value=%s not in enum StellarValueType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerCloseValueSignature(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.nodeID)
+            v2 = data.signature
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data.signature')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_StellarValue(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.txSetHash)
+            buf += _S_Q.pack(data.closeTime)
+            v2 = data.upgrades
+            if len(v2) > 6 and self.check_array:
+                raise XDRError('array length too long for data.upgrades')
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                v3 = i2
+                if len(v3) > 128 and self.check_array:
+                    raise XDRError('array length too long for i2')
+                buf += _S_I.pack(len(v3))
+                buf += v3
+                buf += _PAD[len(v3) & 3]
+            if self.check_enum and data.ext.v not in _ENUM_StellarValueType:
+                raise XDRError('value=%s not in enum StellarValueType' % data.ext.v)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == const.STELLAR_VALUE_BASIC:
+                pass
+            elif data.ext.v == const.STELLAR_VALUE_SIGNED:
+                self.pack_LedgerCloseValueSignature(data.ext.lcValueSignature)
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerHeader(self, data):
+        buf = self._buf
+        try:
+            buf += _S_I.pack(data.ledgerVersion)
+            buf += _S_32s.pack(data.previousLedgerHash)
+            self.pack_StellarValue(data.scpValue)
+            buf += _S_32s.pack(data.txSetResultHash)
+            buf += _S_32s.pack(data.bucketListHash)
+            buf += _S_IqqIQIII.pack(data.ledgerSeq, data.totalCoins, data.feePool, data.inflationSeq, data.idPool, data.baseFee, data.baseReserve, data.maxTxSetSize)
+            v2 = data.skipList
+            if len(v2) != 4:
+                raise ValueError('wrong array size')
+            for i2 in v2:
+                buf += _S_32s.pack(i2)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerUpgradeType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_LedgerUpgradeType:
+                raise XDRError('value=%s not in enum LedgerUpgradeType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerUpgrade(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_LedgerUpgradeType:
+                raise XDRError('value=%s not in enum LedgerUpgradeType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.LEDGER_UPGRADE_VERSION:
+                buf += _S_I.pack(data.newLedgerVersion)
+            elif data.type == const.LEDGER_UPGRADE_BASE_FEE:
+                buf += _S_I.pack(data.newBaseFee)
+            elif data.type == const.LEDGER_UPGRADE_MAX_TX_SET_SIZE:
+                buf += _S_I.pack(data.newMaxTxSetSize)
+            elif data.type == const.LEDGER_UPGRADE_BASE_RESERVE:
+                buf += _S_I.pack(data.newBaseReserve)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerKey(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_LedgerEntryType:
+                raise XDRError('value=%s not in enum LedgerEntryType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.ACCOUNT:
+                self.pack_PublicKey(data.account.accountID)
+            elif data.type == const.TRUSTLINE:
+                self.pack_PublicKey(data.trustLine.accountID)
+                self.pack_Asset(data.trustLine.asset)
+            elif data.type == const.OFFER:
+                self.pack_PublicKey(data.offer.sellerID)
+                buf += _S_q.pack(data.offer.offerID)
+            elif data.type == const.DATA:
+                self.pack_PublicKey(data.data.accountID)
+                v3 = data.data.dataName
+                if len(v3) > 64 and self.check_array:
+                    raise XDRError('array length too long for data.data.dataName')
+                buf += _S_I.pack(len(v3))
+                buf += v3
+                buf += _PAD[len(v3) & 3]
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_BucketEntryType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_BucketEntryType:
+                raise XDRError('value=%s not in enum BucketEntryType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_BucketMetadata(self, data):
+        buf = self._buf
+        try:
+            buf += _S_I.pack(data.ledgerVersion)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_BucketEntry(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_BucketEntryType:
+                raise XDRError('value=%s not in enum BucketEntryType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type in (const.LIVEENTRY, const.INITENTRY):
+                self.pack_LedgerEntry(data.liveEntry)
+            elif data.type == const.DEADENTRY:
+                self.pack_LedgerKey(data.deadEntry)
+            elif data.type == const.METAENTRY:
+                self.pack_BucketMetadata(data.metaEntry)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionSet(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.previousLedgerHash)
+            v2 = data.txs
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_TransactionEnvelope
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionResultPair(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.transactionHash)
+            self.pack_TransactionResult(data.result)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionResultSet(self, data):
+        buf = self._buf
+        try:
+            v2 = data.results
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_TransactionResultPair
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionHistoryEntry(self, data):
+        buf = self._buf
+        try:
+            buf += _S_I.pack(data.ledgerSeq)
+            self.pack_TransactionSet(data.txSet)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionHistoryResultEntry(self, data):
+        buf = self._buf
+        try:
+            buf += _S_I.pack(data.ledgerSeq)
+            self.pack_TransactionResultSet(data.txResultSet)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerHeaderHistoryEntry(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.hash)
+            self.pack_LedgerHeader(data.header)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerSCPMessages(self, data):
+        buf = self._buf
+        try:
+            buf += _S_I.pack(data.ledgerSeq)
+            v2 = data.messages
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_SCPEnvelope
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SCPHistoryEntryV0(self, data):
+        buf = self._buf
+        try:
+            v2 = data.quorumSets
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_SCPQuorumSet
+            for i2 in v2:
+                pack_i2(i2)
+            self.pack_LedgerSCPMessages(data.ledgerMessages)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SCPHistoryEntry(self, data):
+        buf = self._buf
+        try:
+            buf += _S_i.pack(data.v)
+            if data.v == 0:
+                self.pack_SCPHistoryEntryV0(data.v0)
+            else:
+                raise XDRError('bad switch=%s' % data.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerEntryChangeType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_LedgerEntryChangeType:
+                raise XDRError('value=%s not in enum LedgerEntryChangeType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerEntryChange(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_LedgerEntryChangeType:
+                raise XDRError('value=%s not in enum LedgerEntryChangeType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.LEDGER_ENTRY_CREATED:
+                self.pack_LedgerEntry(data.created)
+            elif data.type == const.LEDGER_ENTRY_UPDATED:
+                self.pack_LedgerEntry(data.updated)
+            elif data.type == const.LEDGER_ENTRY_REMOVED:
+                self.pack_LedgerKey(data.removed)
+            elif data.type == const.LEDGER_ENTRY_STATE:
+                self.pack_LedgerEntry(data.state)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerEntryChanges(self, data):
+        buf = self._buf
+        try:
+            v2 = data
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_LedgerEntryChange
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_OperationMeta(self, data):
+        buf = self._buf
+        try:
+            v2 = data.changes
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_LedgerEntryChange
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionMetaV1(self, data):
+        buf = self._buf
+        try:
+            v2 = data.txChanges
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_LedgerEntryChange
+            for i2 in v2:
+                pack_i2(i2)
+            v2 = data.operations
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_OperationMeta
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionMetaV2(self, data):
+        buf = self._buf
+        try:
+            v2 = data.txChangesBefore
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_LedgerEntryChange
+            for i2 in v2:
+                pack_i2(i2)
+            v2 = data.operations
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_OperationMeta
+            for i2 in v2:
+                pack_i2(i2)
+            v2 = data.txChangesAfter
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_LedgerEntryChange
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionMeta(self, data):
+        buf = self._buf
+        try:
+            buf += _S_i.pack(data.v)
+            if data.v == 0:
+                v3 = data.operations
+                buf += _S_I.pack(len(v3))
+                pack_i3 = self.pack_OperationMeta
+                for i3 in v3:
+                    pack_i3(i3)
+            elif data.v == 1:
+                self.pack_TransactionMetaV1(data.v1)
+            elif data.v == 2:
+                self.pack_TransactionMetaV2(data.v2)
+            else:
+                raise XDRError('bad switch=%s' % data.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionResultMeta(self, data):
+        buf = self._buf
+        try:
+            self.pack_TransactionResultPair(data.result)
+            v2 = data.feeProcessing
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_LedgerEntryChange
+            for i2 in v2:
+                pack_i2(i2)
+            self.pack_TransactionMeta(data.txApplyProcessing)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_UpgradeEntryMeta(self, data):
+        buf = self._buf
+        try:
+            self.pack_LedgerUpgrade(data.upgrade)
+            v2 = data.changes
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_LedgerEntryChange
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerCloseMetaV0(self, data):
+        buf = self._buf
+        try:
+            self.pack_LedgerHeaderHistoryEntry(data.ledgerHeader)
+            self.pack_TransactionSet(data.txSet)
+            v2 = data.txProcessing
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_TransactionResultMeta
+            for i2 in v2:
+                pack_i2(i2)
+            v2 = data.upgradesProcessing
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_UpgradeEntryMeta
+            for i2 in v2:
+                pack_i2(i2)
+            v2 = data.scpInfo
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_SCPHistoryEntry
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerCloseMeta(self, data):
+        buf = self._buf
+        try:
+            buf += _S_i.pack(data.v)
+            if data.v == 0:
+                self.pack_LedgerCloseMetaV0(data.v0)
+            else:
+                raise XDRError('bad switch=%s' % data.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    pack_AccountID = pack_PublicKey
+
+    def pack_Thresholds(self, data):
+        buf = self._buf
+        try:
+            buf += _S_4s.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_string32(self, data):
+        buf = self._buf
+        try:
+            v2 = data
+            if len(v2) > 32 and self.check_array:
+                raise XDRError('array length too long for data')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_string64(self, data):
+        buf = self._buf
+        try:
+            v2 = data
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    pack_SequenceNumber = pack_int64
+
+    pack_TimePoint = pack_uint64
+
+    def pack_DataValue(self, data):
+        buf = self._buf
+        try:
+            v2 = data
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AssetCode4(self, data):
+        buf = self._buf
+        try:
+            buf += _S_4s.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AssetCode12(self, data):
+        buf = self._buf
+        try:
+            buf += _S_12s.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AssetType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_AssetType:
+                raise XDRError('value=%s not in enum AssetType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Asset(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_AssetType:
+                raise XDRError('value=%s not in enum AssetType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.ASSET_TYPE_NATIVE:
+                pass
+            elif data.type == const.ASSET_TYPE_CREDIT_ALPHANUM4:
+                buf += _S_4s.pack(data.alphaNum4.assetCode)
+                self.pack_PublicKey(data.alphaNum4.issuer)
+            elif data.type == const.ASSET_TYPE_CREDIT_ALPHANUM12:
+                buf += _S_12s.pack(data.alphaNum12.assetCode)
+                self.pack_PublicKey(data.alphaNum12.issuer)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Price(self, data):
+        buf = self._buf
+        try:
+            buf += _S_ii.pack(data.n, data.d)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Liabilities(self, data):
+        buf = self._buf
+        try:
+            buf += _S_qq.pack(data.buying, data.selling)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ThresholdIndexes(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_ThresholdIndexes:
+                raise XDRError('value=%s not in enum ThresholdIndexes' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerEntryType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_LedgerEntryType:
+                raise XDRError('value=%s not in enum LedgerEntryType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Signer(self, data):
+        buf = self._buf
+        try:
+            self.pack_SignerKey(data.key)
+            buf += _S_I.pack(data.weight)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AccountFlags(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_AccountFlags:
+                raise XDRError('value=%s not in enum AccountFlags' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AccountEntry(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.accountID)
+            buf += _S_qqI.pack(data.balance, data.seqNum, data.numSubEntries)
+            v2 = data.inflationDest
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.inflationDest')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_PublicKey
+            for i2 in v2:
+                pack_i2(i2)
+            buf += _S_I.pack(data.flags)
+            v2 = data.homeDomain
+            if len(v2) > 32 and self.check_array:
+                raise XDRError('array length too long for data.homeDomain')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+            buf += _S_4s.pack(data.thresholds)
+            v2 = data.signers
+            if len(v2) > 20 and self.check_array:
+                raise XDRError('array length too long for data.signers')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_Signer
+            for i2 in v2:
+                pack_i2(i2)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            elif data.ext.v == 1:
+                self.pack_Liabilities(data.ext.v1.liabilities)
+                buf += _S_i.pack(data.ext.v1.ext.v)
+                if data.ext.v1.ext.v == 0:
+                    pass
+                else:
+                    raise XDRError('bad switch=%s' % data.ext.v1.ext.v)
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TrustLineFlags(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_TrustLineFlags:
+                raise XDRError('value=%s not in enum TrustLineFlags' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TrustLineEntry(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.accountID)
+            self.pack_Asset(data.asset)
+            buf += _S_qqI.pack(data.balance, data.limit, data.flags)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            elif data.ext.v == 1:
+                self.pack_Liabilities(data.ext.v1.liabilities)
+                buf += _S_i.pack(data.ext.v1.ext.v)
+                if data.ext.v1.ext.v == 0:
+                    pass
+                else:
+                    raise XDRError('bad switch=%s' % data.ext.v1.ext.v)
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_OfferEntryFlags(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_OfferEntryFlags:
+                raise XDRError('value=%s not in enum OfferEntryFlags' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_OfferEntry(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.sellerID)
+            buf += _S_q.pack(data.offerID)
+            self.pack_Asset(data.selling)
+            self.pack_Asset(data.buying)
+            buf += _S_q.pack(data.amount)
+            self.pack_Price(data.price)
+            buf += _S_I.pack(data.flags)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_DataEntry(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.accountID)
+            v2 = data.dataName
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data.dataName')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+            v2 = data.dataValue
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data.dataValue')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_LedgerEntry(self, data):
+        buf = self._buf
+        try:
+            buf += _S_I.pack(data.lastModifiedLedgerSeq)
+            if self.check_enum and data.data.type not in _ENUM_LedgerEntryType:
+                raise XDRError('value=%s not in enum LedgerEntryType' % data.data.type)
+            buf += _S_i.pack(data.data.type)
+            if data.data.type == const.ACCOUNT:
+                self.pack_AccountEntry(data.data.account)
+            elif data.data.type == const.TRUSTLINE:
+                self.pack_TrustLineEntry(data.data.trustLine)
+            elif data.data.type == const.OFFER:
+                self.pack_OfferEntry(data.data.offer)
+            elif data.data.type == const.DATA:
+                self.pack_DataEntry(data.data.data)
+            else:
+                raise XDRError('bad switch=%s' % data.data.type)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_EnvelopeType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_EnvelopeType:
+                raise XDRError('value=%s not in enum EnvelopeType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_MuxedAccount(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_CryptoKeyType:
+                raise XDRError('value=%s not in enum CryptoKeyType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.KEY_TYPE_ED25519:
+                buf += _S_32s.pack(data.ed25519)
+            elif data.type == const.KEY_TYPE_MUXED_ED25519:
+                buf += _S_Q.pack(data.med25519.id)
+                buf += _S_32s.pack(data.med25519.ed25519)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_DecoratedSignature(self, data):
+        buf = self._buf
+        try:
+            buf += _S_4s.pack(data.hint)
+            v2 = data.signature
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data.signature')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_OperationType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_OperationType:
+                raise XDRError('value=%s not in enum OperationType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_CreateAccountOp(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.destination)
+            buf += _S_q.pack(data.startingBalance)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PaymentOp(self, data):
+        buf = self._buf
+        try:
+            self.pack_MuxedAccount(data.destination)
+            self.pack_Asset(data.asset)
+            buf += _S_q.pack(data.amount)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PathPaymentStrictReceiveOp(self, data):
+        buf = self._buf
+        try:
+            self.pack_Asset(data.sendAsset)
+            buf += _S_q.pack(data.sendMax)
+            self.pack_MuxedAccount(data.destination)
+            self.pack_Asset(data.destAsset)
+            buf += _S_q.pack(data.destAmount)
+            v2 = data.path
+            if len(v2) > 5 and self.check_array:
+                raise XDRError('array length too long for data.path')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_Asset
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PathPaymentStrictSendOp(self, data):
+        buf = self._buf
+        try:
+            self.pack_Asset(data.sendAsset)
+            buf += _S_q.pack(data.sendAmount)
+            self.pack_MuxedAccount(data.destination)
+            self.pack_Asset(data.destAsset)
+            buf += _S_q.pack(data.destMin)
+            v2 = data.path
+            if len(v2) > 5 and self.check_array:
+                raise XDRError('array length too long for data.path')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_Asset
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageSellOfferOp(self, data):
+        buf = self._buf
+        try:
+            self.pack_Asset(data.selling)
+            self.pack_Asset(data.buying)
+            buf += _S_q.pack(data.amount)
+            self.pack_Price(data.price)
+            buf += _S_q.pack(data.offerID)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageBuyOfferOp(self, data):
+        buf = self._buf
+        try:
+            self.pack_Asset(data.selling)
+            self.pack_Asset(data.buying)
+            buf += _S_q.pack(data.buyAmount)
+            self.pack_Price(data.price)
+            buf += _S_q.pack(data.offerID)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_CreatePassiveSellOfferOp(self, data):
+        buf = self._buf
+        try:
+            self.pack_Asset(data.selling)
+            self.pack_Asset(data.buying)
+            buf += _S_q.pack(data.amount)
+            self.pack_Price(data.price)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SetOptionsOp(self, data):
+        buf = self._buf
+        try:
+            v2 = data.inflationDest
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.inflationDest')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_PublicKey
+            for i2 in v2:
+                pack_i2(i2)
+            v2 = data.clearFlags
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.clearFlags')
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                buf += _S_I.pack(i2)
+            v2 = data.setFlags
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.setFlags')
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                buf += _S_I.pack(i2)
+            v2 = data.masterWeight
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.masterWeight')
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                buf += _S_I.pack(i2)
+            v2 = data.lowThreshold
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.lowThreshold')
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                buf += _S_I.pack(i2)
+            v2 = data.medThreshold
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.medThreshold')
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                buf += _S_I.pack(i2)
+            v2 = data.highThreshold
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.highThreshold')
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                buf += _S_I.pack(i2)
+            v2 = data.homeDomain
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.homeDomain')
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                v3 = i2
+                if len(v3) > 32 and self.check_array:
+                    raise XDRError('array length too long for i2')
+                buf += _S_I.pack(len(v3))
+                buf += v3
+                buf += _PAD[len(v3) & 3]
+            v2 = data.signer
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.signer')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_Signer
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ChangeTrustOp(self, data):
+        buf = self._buf
+        try:
+            self.pack_Asset(data.line)
+            buf += _S_q.pack(data.limit)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AllowTrustOp(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.trustor)
+            if self.check_enum and data.asset.type not in _ENUM_AssetType:
+                raise XDRError('value=%s not in enum AssetType' % data.asset.type)
+            buf += _S_i.pack(data.asset.type)
+            if data.asset.type == const.ASSET_TYPE_CREDIT_ALPHANUM4:
+                buf += _S_4s.pack(data.asset.assetCode4)
+            elif data.asset.type == const.ASSET_TYPE_CREDIT_ALPHANUM12:
+                buf += _S_12s.pack(data.asset.assetCode12)
+            else:
+                raise XDRError('bad switch=%s' % data.asset.type)
+            buf += _S_I.pack(data.authorize)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageDataOp(self, data):
+        buf = self._buf
+        try:
+            v2 = data.dataName
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data.dataName')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+            v2 = data.dataValue
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.dataValue')
+            buf += _S_I.pack(len(v2))
+            for i2 in v2:
+                v3 = i2
+                if len(v3) > 64 and self.check_array:
+                    raise XDRError('array length too long for i2')
+                buf += _S_I.pack(len(v3))
+                buf += v3
+                buf += _PAD[len(v3) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_BumpSequenceOp(self, data):
+        buf = self._buf
+        try:
+            buf += _S_q.pack(data.bumpTo)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Operation(self, data):
+        buf = self._buf
+        try:
+            v2 = data.sourceAccount
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.sourceAccount')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_MuxedAccount
+            for i2 in v2:
+                pack_i2(i2)
+            if self.check_enum and data.body.type not in _ENUM_OperationType:
+                raise XDRError('value=%s not in enum OperationType' % data.body.type)
+            buf += _S_i.pack(data.body.type)
+            if data.body.type == const.CREATE_ACCOUNT:
+                self.pack_CreateAccountOp(data.body.createAccountOp)
+            elif data.body.type == const.PAYMENT:
+                self.pack_PaymentOp(data.body.paymentOp)
+            elif data.body.type == const.PATH_PAYMENT_STRICT_RECEIVE:
+                self.pack_PathPaymentStrictReceiveOp(data.body.pathPaymentStrictReceiveOp)
+            elif data.body.type == const.MANAGE_SELL_OFFER:
+                self.pack_ManageSellOfferOp(data.body.manageSellOfferOp)
+            elif data.body.type == const.CREATE_PASSIVE_SELL_OFFER:
+                self.pack_CreatePassiveSellOfferOp(data.body.createPassiveSellOfferOp)
+            elif data.body.type == const.SET_OPTIONS:
+                self.pack_SetOptionsOp(data.body.setOptionsOp)
+            elif data.body.type == const.CHANGE_TRUST:
+                self.pack_ChangeTrustOp(data.body.changeTrustOp)
+            elif data.body.type == const.ALLOW_TRUST:
+                self.pack_AllowTrustOp(data.body.allowTrustOp)
+            elif data.body.type == const.ACCOUNT_MERGE:
+                self.pack_MuxedAccount(data.body.destination)
+            elif data.body.type == const.INFLATION:
+                pass
+            elif data.body.type == const.MANAGE_DATA:
+                self.pack_ManageDataOp(data.body.manageDataOp)
+            elif data.body.type == const.BUMP_SEQUENCE:
+                self.pack_BumpSequenceOp(data.body.bumpSequenceOp)
+            elif data.body.type == const.MANAGE_BUY_OFFER:
+                self.pack_ManageBuyOfferOp(data.body.manageBuyOfferOp)
+            elif data.body.type == const.PATH_PAYMENT_STRICT_SEND:
+                self.pack_PathPaymentStrictSendOp(data.body.pathPaymentStrictSendOp)
+            else:
+                raise XDRError('bad switch=%s' % data.body.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_MemoType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_MemoType:
+                raise XDRError('value=%s not in enum MemoType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Memo(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_MemoType:
+                raise XDRError('value=%s not in enum MemoType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.MEMO_NONE:
+                pass
+            elif data.type == const.MEMO_TEXT:
+                v3 = data.text
+                if len(v3) > 28 and self.check_array:
+                    raise XDRError('array length too long for data.text')
+                buf += _S_I.pack(len(v3))
+                buf += v3
+                buf += _PAD[len(v3) & 3]
+            elif data.type == const.MEMO_ID:
+                buf += _S_Q.pack(data.id)
+            elif data.type == const.MEMO_HASH:
+                buf += _S_32s.pack(data.hash)
+            elif data.type == const.MEMO_RETURN:
+                buf += _S_32s.pack(data.retHash)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TimeBounds(self, data):
+        buf = self._buf
+        try:
+            buf += _S_QQ.pack(data.minTime, data.maxTime)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionV0(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.sourceAccountEd25519)
+            buf += _S_Iq.pack(data.fee, data.seqNum)
+            v2 = data.timeBounds
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.timeBounds')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_TimeBounds
+            for i2 in v2:
+                pack_i2(i2)
+            self.pack_Memo(data.memo)
+            v2 = data.operations
+            if len(v2) > const.MAX_OPS_PER_TX and self.check_array:
+                raise XDRError('array length too long for data.operations')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_Operation
+            for i2 in v2:
+                pack_i2(i2)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionV0Envelope(self, data):
+        buf = self._buf
+        try:
+            self.pack_TransactionV0(data.tx)
+            v2 = data.signatures
+            if len(v2) > 20 and self.check_array:
+                raise XDRError('array length too long for data.signatures')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_DecoratedSignature
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Transaction(self, data):
+        buf = self._buf
+        try:
+            self.pack_MuxedAccount(data.sourceAccount)
+            buf += _S_Iq.pack(data.fee, data.seqNum)
+            v2 = data.timeBounds
+            if len(v2) > 1 and self.check_array:
+                raise XDRError('array length too long for data.timeBounds')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_TimeBounds
+            for i2 in v2:
+                pack_i2(i2)
+            self.pack_Memo(data.memo)
+            v2 = data.operations
+            if len(v2) > const.MAX_OPS_PER_TX and self.check_array:
+                raise XDRError('array length too long for data.operations')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_Operation
+            for i2 in v2:
+                pack_i2(i2)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionV1Envelope(self, data):
+        buf = self._buf
+        try:
+            self.pack_Transaction(data.tx)
+            v2 = data.signatures
+            if len(v2) > 20 and self.check_array:
+                raise XDRError('array length too long for data.signatures')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_DecoratedSignature
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_FeeBumpTransaction(self, data):
+        buf = self._buf
+        try:
+            self.pack_MuxedAccount(data.feeSource)
+            buf += _S_q.pack(data.fee)
+            if self.check_enum and data.innerTx.type not in _ENUM_EnvelopeType:
+                raise XDRError('value=%s not in enum EnvelopeType' % data.innerTx.type)
+            buf += _S_i.pack(data.innerTx.type)
+            if data.innerTx.type == const.ENVELOPE_TYPE_TX:
+                self.pack_TransactionV1Envelope(data.innerTx.v1)
+            else:
+                raise XDRError('bad switch=%s' % data.innerTx.type)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_FeeBumpTransactionEnvelope(self, data):
+        buf = self._buf
+        try:
+            self.pack_FeeBumpTransaction(data.tx)
+            v2 = data.signatures
+            if len(v2) > 20 and self.check_array:
+                raise XDRError('array length too long for data.signatures')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_DecoratedSignature
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionEnvelope(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_EnvelopeType:
+                raise XDRError('value=%s not in enum EnvelopeType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.ENVELOPE_TYPE_TX_V0:
+                self.pack_TransactionV0Envelope(data.v0)
+            elif data.type == const.ENVELOPE_TYPE_TX:
+                self.pack_TransactionV1Envelope(data.v1)
+            elif data.type == const.ENVELOPE_TYPE_TX_FEE_BUMP:
+                self.pack_FeeBumpTransactionEnvelope(data.feeBump)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionSignaturePayload(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.networkId)
+            if self.check_enum and data.taggedTransaction.type not in _ENUM_EnvelopeType:
+                raise XDRError('value=%s not in enum EnvelopeType' % data.taggedTransaction.type)
+            buf += _S_i.pack(data.taggedTransaction.type)
+            if data.taggedTransaction.type == const.ENVELOPE_TYPE_TX:
+                self.pack_Transaction(data.taggedTransaction.tx)
+            elif data.taggedTransaction.type == const.ENVELOPE_TYPE_TX_FEE_BUMP:
+                self.pack_FeeBumpTransaction(data.taggedTransaction.feeBump)
+            else:
+                raise XDRError('bad switch=%s' % data.taggedTransaction.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ClaimOfferAtom(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.sellerID)
+            buf += _S_q.pack(data.offerID)
+            self.pack_Asset(data.assetSold)
+            buf += _S_q.pack(data.amountSold)
+            self.pack_Asset(data.assetBought)
+            buf += _S_q.pack(data.amountBought)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_CreateAccountResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_CreateAccountResultCode:
+                raise XDRError('value=%s not in enum CreateAccountResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_CreateAccountResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_CreateAccountResultCode:
+                raise XDRError('value=%s not in enum CreateAccountResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.CREATE_ACCOUNT_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PaymentResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_PaymentResultCode:
+                raise XDRError('value=%s not in enum PaymentResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PaymentResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_PaymentResultCode:
+                raise XDRError('value=%s not in enum PaymentResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.PAYMENT_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PathPaymentStrictReceiveResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_PathPaymentStrictReceiveResultCode:
+                raise XDRError('value=%s not in enum PathPaymentStrictReceiveResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SimplePaymentResult(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.destination)
+            self.pack_Asset(data.asset)
+            buf += _S_q.pack(data.amount)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PathPaymentStrictReceiveResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_PathPaymentStrictReceiveResultCode:
+                raise XDRError('value=%s not in enum PathPaymentStrictReceiveResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.PATH_PAYMENT_STRICT_RECEIVE_SUCCESS:
+                v3 = data.success.offers
+                buf += _S_I.pack(len(v3))
+                pack_i3 = self.pack_ClaimOfferAtom
+                for i3 in v3:
+                    pack_i3(i3)
+                self.pack_SimplePaymentResult(data.success.last)
+            elif data.code == const.PATH_PAYMENT_STRICT_RECEIVE_NO_ISSUER:
+                self.pack_Asset(data.noIssuer)
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PathPaymentStrictSendResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_PathPaymentStrictSendResultCode:
+                raise XDRError('value=%s not in enum PathPaymentStrictSendResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PathPaymentStrictSendResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_PathPaymentStrictSendResultCode:
+                raise XDRError('value=%s not in enum PathPaymentStrictSendResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.PATH_PAYMENT_STRICT_SEND_SUCCESS:
+                v3 = data.success.offers
+                buf += _S_I.pack(len(v3))
+                pack_i3 = self.pack_ClaimOfferAtom
+                for i3 in v3:
+                    pack_i3(i3)
+                self.pack_SimplePaymentResult(data.success.last)
+            elif data.code == const.PATH_PAYMENT_STRICT_SEND_NO_ISSUER:
+                self.pack_Asset(data.noIssuer)
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageSellOfferResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_ManageSellOfferResultCode:
+                raise XDRError('value=%s not in enum ManageSellOfferResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageOfferEffect(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_ManageOfferEffect:
+                raise XDRError('value=%s not in enum ManageOfferEffect' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageOfferSuccessResult(self, data):
+        buf = self._buf
+        try:
+            v2 = data.offersClaimed
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_ClaimOfferAtom
+            for i2 in v2:
+                pack_i2(i2)
+            if self.check_enum and data.offer.effect not in _ENUM_ManageOfferEffect:
+                raise XDRError('value=%s not in enum ManageOfferEffect' % data.offer.effect)
+            buf += _S_i.pack(data.offer.effect)
+            if data.offer.effect in (const.MANAGE_OFFER_CREATED, const.MANAGE_OFFER_UPDATED):
+                self.pack_OfferEntry(data.offer.offer)
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageSellOfferResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_ManageSellOfferResultCode:
+                raise XDRError('value=%s not in enum ManageSellOfferResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.MANAGE_SELL_OFFER_SUCCESS:
+                self.pack_ManageOfferSuccessResult(data.success)
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageBuyOfferResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_ManageBuyOfferResultCode:
+                raise XDRError('value=%s not in enum ManageBuyOfferResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageBuyOfferResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_ManageBuyOfferResultCode:
+                raise XDRError('value=%s not in enum ManageBuyOfferResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.MANAGE_BUY_OFFER_SUCCESS:
+                self.pack_ManageOfferSuccessResult(data.success)
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SetOptionsResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_SetOptionsResultCode:
+                raise XDRError('value=%s not in enum SetOptionsResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SetOptionsResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_SetOptionsResultCode:
+                raise XDRError('value=%s not in enum SetOptionsResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.SET_OPTIONS_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ChangeTrustResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_ChangeTrustResultCode:
+                raise XDRError('value=%s not in enum ChangeTrustResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ChangeTrustResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_ChangeTrustResultCode:
+                raise XDRError('value=%s not in enum ChangeTrustResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.CHANGE_TRUST_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AllowTrustResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_AllowTrustResultCode:
+                raise XDRError('value=%s not in enum AllowTrustResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AllowTrustResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_AllowTrustResultCode:
+                raise XDRError('value=%s not in enum AllowTrustResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.ALLOW_TRUST_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AccountMergeResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_AccountMergeResultCode:
+                raise XDRError('value=%s not in enum AccountMergeResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AccountMergeResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_AccountMergeResultCode:
+                raise XDRError('value=%s not in enum AccountMergeResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.ACCOUNT_MERGE_SUCCESS:
+                buf += _S_q.pack(data.sourceAccountBalance)
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_InflationResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_InflationResultCode:
+                raise XDRError('value=%s not in enum InflationResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_InflationPayout(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.destination)
+            buf += _S_q.pack(data.amount)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_InflationResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_InflationResultCode:
+                raise XDRError('value=%s not in enum InflationResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.INFLATION_SUCCESS:
+                v3 = data.payouts
+                buf += _S_I.pack(len(v3))
+                pack_i3 = self.pack_InflationPayout
+                for i3 in v3:
+                    pack_i3(i3)
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageDataResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_ManageDataResultCode:
+                raise XDRError('value=%s not in enum ManageDataResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ManageDataResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_ManageDataResultCode:
+                raise XDRError('value=%s not in enum ManageDataResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.MANAGE_DATA_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_BumpSequenceResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_BumpSequenceResultCode:
+                raise XDRError('value=%s not in enum BumpSequenceResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_BumpSequenceResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_BumpSequenceResultCode:
+                raise XDRError('value=%s not in enum BumpSequenceResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.BUMP_SEQUENCE_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_OperationResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_OperationResultCode:
+                raise XDRError('value=%s not in enum OperationResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_OperationResult(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_OperationResultCode:
+                raise XDRError('value=%s not in enum OperationResultCode' % data.code)
+            buf += _S_i.pack(data.code)
+            if data.code == const.opINNER:
+                if self.check_enum and data.tr.type not in _ENUM_OperationType:
+                    raise XDRError('value=%s not in enum OperationType' % data.tr.type)
+                buf += _S_i.pack(data.tr.type)
+                if data.tr.type == const.CREATE_ACCOUNT:
+                    self.pack_CreateAccountResult(data.tr.createAccountResult)
+                elif data.tr.type == const.PAYMENT:
+                    self.pack_PaymentResult(data.tr.paymentResult)
+                elif data.tr.type == const.PATH_PAYMENT_STRICT_RECEIVE:
+                    self.pack_PathPaymentStrictReceiveResult(data.tr.pathPaymentStrictReceiveResult)
+                elif data.tr.type == const.MANAGE_SELL_OFFER:
+                    self.pack_ManageSellOfferResult(data.tr.manageSellOfferResult)
+                elif data.tr.type == const.CREATE_PASSIVE_SELL_OFFER:
+                    self.pack_ManageSellOfferResult(data.tr.createPassiveSellOfferResult)
+                elif data.tr.type == const.SET_OPTIONS:
+                    self.pack_SetOptionsResult(data.tr.setOptionsResult)
+                elif data.tr.type == const.CHANGE_TRUST:
+                    self.pack_ChangeTrustResult(data.tr.changeTrustResult)
+                elif data.tr.type == const.ALLOW_TRUST:
+                    self.pack_AllowTrustResult(data.tr.allowTrustResult)
+                elif data.tr.type == const.ACCOUNT_MERGE:
+                    self.pack_AccountMergeResult(data.tr.accountMergeResult)
+                elif data.tr.type == const.INFLATION:
+                    self.pack_InflationResult(data.tr.inflationResult)
+                elif data.tr.type == const.MANAGE_DATA:
+                    self.pack_ManageDataResult(data.tr.manageDataResult)
+                elif data.tr.type == const.BUMP_SEQUENCE:
+                    self.pack_BumpSequenceResult(data.tr.bumpSeqResult)
+                elif data.tr.type == const.MANAGE_BUY_OFFER:
+                    self.pack_ManageBuyOfferResult(data.tr.manageBuyOfferResult)
+                elif data.tr.type == const.PATH_PAYMENT_STRICT_SEND:
+                    self.pack_PathPaymentStrictSendResult(data.tr.pathPaymentStrictSendResult)
+                else:
+                    raise XDRError('bad switch=%s' % data.tr.type)
+            else:
+                pass
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionResultCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_TransactionResultCode:
+                raise XDRError('value=%s not in enum TransactionResultCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_InnerTransactionResult(self, data):
+        buf = self._buf
+        try:
+            buf += _S_q.pack(data.feeCharged)
+            if self.check_enum and data.result.code not in _ENUM_TransactionResultCode:
+                raise XDRError('value=%s not in enum TransactionResultCode' % data.result.code)
+            buf += _S_i.pack(data.result.code)
+            if data.result.code in (const.txSUCCESS, const.txFAILED):
+                v3 = data.result.results
+                buf += _S_I.pack(len(v3))
+                pack_i3 = self.pack_OperationResult
+                for i3 in v3:
+                    pack_i3(i3)
+            elif data.result.code in (const.txTOO_EARLY, const.txTOO_LATE, const.txMISSING_OPERATION, const.txBAD_SEQ, const.txBAD_AUTH, const.txINSUFFICIENT_BALANCE, const.txNO_ACCOUNT, const.txINSUFFICIENT_FEE, const.txBAD_AUTH_EXTRA, const.txINTERNAL_ERROR, const.txNOT_SUPPORTED):
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.result.code)
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_InnerTransactionResultPair(self, data):
+        buf = self._buf
+        try:
+            buf += _S_32s.pack(data.transactionHash)
+            self.pack_InnerTransactionResult(data.result)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TransactionResult(self, data):
+        buf = self._buf
+        try:
+            buf += _S_q.pack(data.feeCharged)
+            if self.check_enum and data.result.code not in _ENUM_TransactionResultCode:
+                raise XDRError('value=%s not in enum TransactionResultCode' % data.result.code)
+            buf += _S_i.pack(data.result.code)
+            if data.result.code in (const.txFEE_BUMP_INNER_SUCCESS, const.txFEE_BUMP_INNER_FAILED):
+                self.pack_InnerTransactionResultPair(data.result.innerResultPair)
+            elif data.result.code in (const.txSUCCESS, const.txFAILED):
+                v3 = data.result.results
+                buf += _S_I.pack(len(v3))
+                pack_i3 = self.pack_OperationResult
+                for i3 in v3:
+                    pack_i3(i3)
+            else:
+                pass
+            buf += _S_i.pack(data.ext.v)
+            if data.ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % data.ext.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_ErrorCode(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_ErrorCode:
+                raise XDRError('value=%s not in enum ErrorCode' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Error(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.code not in _ENUM_ErrorCode:
+                raise XDRError('value=%s not in enum ErrorCode' % data.code)
+            buf += _S_i.pack(data.code)
+            v2 = data.msg
+            if len(v2) > 100 and self.check_array:
+                raise XDRError('array length too long for data.msg')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AuthCert(self, data):
+        buf = self._buf
+        try:
+            self.pack_Curve25519Public(data.pubkey)
+            buf += _S_Q.pack(data.expiration)
+            v2 = data.sig
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data.sig')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Hello(self, data):
+        buf = self._buf
+        try:
+            buf += _S_III.pack(data.ledgerVersion, data.overlayVersion, data.overlayMinVersion)
+            buf += _S_32s.pack(data.networkID)
+            v2 = data.versionStr
+            if len(v2) > 100 and self.check_array:
+                raise XDRError('array length too long for data.versionStr')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+            buf += _S_i.pack(data.listeningPort)
+            self.pack_PublicKey(data.peerID)
+            self.pack_AuthCert(data.cert)
+            buf += _S_32s.pack(data.nonce)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_Auth(self, data):
+        buf = self._buf
+        try:
+            buf += _S_i.pack(data.unused)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_IPAddrType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_IPAddrType:
+                raise XDRError('value=%s not in enum IPAddrType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PeerAddress(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.ip.type not in _ENUM_IPAddrType:
+                raise XDRError('value=%s not in enum IPAddrType' % data.ip.type)
+            buf += _S_i.pack(data.ip.type)
+            if data.ip.type == const.IPv4:
+                buf += _S_4s.pack(data.ip.ipv4)
+            elif data.ip.type == const.IPv6:
+                buf += _S_16s.pack(data.ip.ipv6)
+            else:
+                raise XDRError('bad switch=%s' % data.ip.type)
+            buf += _S_II.pack(data.port, data.numFailures)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_MessageType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_MessageType:
+                raise XDRError('value=%s not in enum MessageType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_DontHave(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_MessageType:
+                raise XDRError('value=%s not in enum MessageType' % data.type)
+            buf += _S_i.pack(data.type)
+            buf += _S_32s.pack(data.reqHash)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SurveyMessageCommandType(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data not in _ENUM_SurveyMessageCommandType:
+                raise XDRError('value=%s not in enum SurveyMessageCommandType' % data)
+            buf += _S_i.pack(data)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SurveyRequestMessage(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.surveyorPeerID)
+            self.pack_PublicKey(data.surveyedPeerID)
+            buf += _S_I.pack(data.ledgerNum)
+            self.pack_Curve25519Public(data.encryptionKey)
+            if self.check_enum and data.commandType not in _ENUM_SurveyMessageCommandType:
+                raise XDRError('value=%s not in enum SurveyMessageCommandType' % data.commandType)
+            buf += _S_i.pack(data.commandType)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SignedSurveyRequestMessage(self, data):
+        buf = self._buf
+        try:
+            v2 = data.requestSignature
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data.requestSignature')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+            self.pack_SurveyRequestMessage(data.request)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_EncryptedBody(self, data):
+        buf = self._buf
+        try:
+            v2 = data
+            if len(v2) > 64000 and self.check_array:
+                raise XDRError('array length too long for data')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SurveyResponseMessage(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.surveyorPeerID)
+            self.pack_PublicKey(data.surveyedPeerID)
+            buf += _S_I.pack(data.ledgerNum)
+            if self.check_enum and data.commandType not in _ENUM_SurveyMessageCommandType:
+                raise XDRError('value=%s not in enum SurveyMessageCommandType' % data.commandType)
+            buf += _S_i.pack(data.commandType)
+            v2 = data.encryptedBody
+            if len(v2) > 64000 and self.check_array:
+                raise XDRError('array length too long for data.encryptedBody')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SignedSurveyResponseMessage(self, data):
+        buf = self._buf
+        try:
+            v2 = data.responseSignature
+            if len(v2) > 64 and self.check_array:
+                raise XDRError('array length too long for data.responseSignature')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+            self.pack_SurveyResponseMessage(data.response)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PeerStats(self, data):
+        buf = self._buf
+        try:
+            self.pack_PublicKey(data.id)
+            v2 = data.versionStr
+            if len(v2) > 100 and self.check_array:
+                raise XDRError('array length too long for data.versionStr')
+            buf += _S_I.pack(len(v2))
+            buf += v2
+            buf += _PAD[len(v2) & 3]
+            buf += _S_QQQQQQQQQQQQQ.pack(data.messagesRead, data.messagesWritten, data.bytesRead, data.bytesWritten, data.secondsConnected, data.uniqueFloodBytesRecv, data.duplicateFloodBytesRecv, data.uniqueFetchBytesRecv, data.duplicateFetchBytesRecv, data.uniqueFloodMessageRecv, data.duplicateFloodMessageRecv, data.uniqueFetchMessageRecv, data.duplicateFetchMessageRecv)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_PeerStatList(self, data):
+        buf = self._buf
+        try:
+            v2 = data
+            if len(v2) > 25 and self.check_array:
+                raise XDRError('array length too long for data')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_PeerStats
+            for i2 in v2:
+                pack_i2(i2)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_TopologyResponseBody(self, data):
+        buf = self._buf
+        try:
+            v2 = data.inboundPeers
+            if len(v2) > 25 and self.check_array:
+                raise XDRError('array length too long for data.inboundPeers')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_PeerStats
+            for i2 in v2:
+                pack_i2(i2)
+            v2 = data.outboundPeers
+            if len(v2) > 25 and self.check_array:
+                raise XDRError('array length too long for data.outboundPeers')
+            buf += _S_I.pack(len(v2))
+            pack_i2 = self.pack_PeerStats
+            for i2 in v2:
+                pack_i2(i2)
+            buf += _S_II.pack(data.totalInboundPeerCount, data.totalOutboundPeerCount)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_SurveyResponseBody(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_SurveyMessageCommandType:
+                raise XDRError('value=%s not in enum SurveyMessageCommandType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.SURVEY_TOPOLOGY:
+                self.pack_TopologyResponseBody(data.topologyResponseBody)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_StellarMessage(self, data):
+        buf = self._buf
+        try:
+            if self.check_enum and data.type not in _ENUM_MessageType:
+                raise XDRError('value=%s not in enum MessageType' % data.type)
+            buf += _S_i.pack(data.type)
+            if data.type == const.ERROR_MSG:
+                self.pack_Error(data.error)
+            elif data.type == const.HELLO:
+                self.pack_Hello(data.hello)
+            elif data.type == const.AUTH:
+                self.pack_Auth(data.auth)
+            elif data.type == const.DONT_HAVE:
+                self.pack_DontHave(data.dontHave)
+            elif data.type == const.GET_PEERS:
+                pass
+            elif data.type == const.PEERS:
+                v3 = data.peers
+                if len(v3) > 100 and self.check_array:
+                    raise XDRError('array length too long for data.peers')
+                buf += _S_I.pack(len(v3))
+                pack_i3 = self.pack_PeerAddress
+                for i3 in v3:
+                    pack_i3(i3)
+            elif data.type == const.GET_TX_SET:
+                buf += _S_32s.pack(data.txSetHash)
+            elif data.type == const.TX_SET:
+                self.pack_TransactionSet(data.txSet)
+            elif data.type == const.TRANSACTION:
+                self.pack_TransactionEnvelope(data.transaction)
+            elif data.type == const.SURVEY_REQUEST:
+                self.pack_SignedSurveyRequestMessage(data.signedSurveyRequestMessage)
+            elif data.type == const.SURVEY_RESPONSE:
+                self.pack_SignedSurveyResponseMessage(data.signedSurveyResponseMessage)
+            elif data.type == const.GET_SCP_QUORUMSET:
+                buf += _S_32s.pack(data.qSetHash)
+            elif data.type == const.SCP_QUORUMSET:
+                self.pack_SCPQuorumSet(data.qSet)
+            elif data.type == const.SCP_MESSAGE:
+                self.pack_SCPEnvelope(data.envelope)
+            elif data.type == const.GET_SCP_STATE:
+                buf += _S_I.pack(data.getSCPLedgerSeq)
+            else:
+                raise XDRError('bad switch=%s' % data.type)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+    def pack_AuthenticatedMessage(self, data):
+        buf = self._buf
+        try:
+            buf += _S_I.pack(data.v)
+            if data.v == 0:
+                buf += _S_Q.pack(data.v0.sequence)
+                self.pack_StellarMessage(data.v0.message)
+                self.pack_HmacSha256Mac(data.v0.mac)
+            else:
+                raise XDRError('bad switch=%s' % data.v)
+        except struct.error as e:
+            raise ConversionError(e.args[0]) from None
+
+
+class StellarXDRUnpacker(object):
+    def __init__(self, data, check_enum=True, check_array=True,
+                 zero_copy=False):
+        self.check_enum = check_enum
+        self.check_array = check_array
+        self.zero_copy = zero_copy
+        self.reset(data)
+
+    def reset(self, data):
+        # data may be any buffer-protocol object (bytes, bytearray, mmap,
+        # memoryview). In zero_copy mode the buffer is only wrapped, opaque
+        # and string fields are returned as memoryview slices of it and the
+        # buffer must outlive them.
+        if self.zero_copy:
+            self._buf = memoryview(data).cast('B')
+        elif isinstance(data, bytes):
+            self._buf = data
+        else:
+            self._buf = bytes(data)
+        self._pos = 0
+
+    def get_position(self):
+        return self._pos
+
+    def set_position(self, position):
+        self._pos = position
+
+    def get_buffer(self):
+        return self._buf
+
+    def done(self):
+        if self._pos < len(self._buf):
+            raise XDRError('unextracted data remains')
+
+    def unpack_int(self):
+        try:
+            x = _S_i.unpack_from(self._buf, self._pos)[0]
+        except struct.error:
+            raise EOFError from None
+        self._pos += 4
+        return x
+
+    def unpack_uint(self):
+        try:
+            x = _S_I.unpack_from(self._buf, self._pos)[0]
+        except struct.error:
+            raise EOFError from None
+        self._pos += 4
+        return x
+
+    def unpack_hyper(self):
+        try:
+            x = _S_q.unpack_from(self._buf, self._pos)[0]
+        except struct.error:
+            raise EOFError from None
+        self._pos += 8
+        return x
+
+    def unpack_uhyper(self):
+        try:
+            x = _S_Q.unpack_from(self._buf, self._pos)[0]
+        except struct.error:
+            raise EOFError from None
+        self._pos += 8
+        return x
+
+    def unpack_float(self):
+        try:
+            x = _S_f.unpack_from(self._buf, self._pos)[0]
+        except struct.error:
+            raise EOFError from None
+        self._pos += 4
+        return x
+
+    def unpack_double(self):
+        try:
+            x = _S_d.unpack_from(self._buf, self._pos)[0]
+        except struct.error:
+            raise EOFError from None
+        self._pos += 8
+        return x
+
+    def unpack_bool(self):
+        return bool(self.unpack_int())
+
+    def unpack_fstring(self, n):
+        if n < 0:
+            raise ValueError('fstring size must be nonnegative')
+        i = self._pos
+        j = i + (n + 3) // 4 * 4
+        if j > len(self._buf):
+            raise EOFError
+        self._pos = j
+        return self._buf[i:i + n]
+
+    def unpack_string(self):
+        n = self.unpack_uint()
+        return self.unpack_fstring(n)
+
+    def unpack_list(self, unpack_item):
+        list = []
+        while True:
+            x = self.unpack_uint()
+            if x == 0:
+                break
+            if x != 1:
+                raise ConversionError('0 or 1 expected, got %r' % (x,))
+            list.append(unpack_item())
+        return list
+
+    def unpack_farray(self, n, unpack_item):
+        return [unpack_item() for _ in range(n)]
+
+    def unpack_array(self, unpack_item):
+        n = self.unpack_uint()
+        return self.unpack_farray(n, unpack_item)
+
+    unpack_enum = unpack_int
+    unpack_unsigned = unpack_uint
+    unpack_quadruple = unpack_double
+    unpack_fopaque = unpack_fstring
+    unpack_opaque = unpack_string
+    unpack_bytes = unpack_string
+
+    # The skip_* methods advance the position past a value without
+    # building it, to find the boundaries of the values of a buffer.
+    def skip_int(self):
+        self._pos += 4
+
+    def skip_hyper(self):
+        self._pos += 8
+
+    def skip_string(self):
+        n = self.unpack_uint()
+        self._pos += (n + 3) & ~3
+
+    skip_uint = skip_int
+    skip_float = skip_int
+    skip_bool = skip_int
+    skip_enum = skip_int
+    skip_unsigned = skip_int
+    skip_uhyper = skip_hyper
+    skip_double = skip_hyper
+    skip_quadruple = skip_hyper
+    skip_opaque = skip_string
+    skip_bytes = skip_string
+
+    def unpack_Hash(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 32
+        if end > len(buf):
+            raise EOFError
+        data = buf[start:start + 32]
+        return data
+
+    def unpack_uint256(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 32
+        if end > len(buf):
+            raise EOFError
+        data = buf[start:start + 32]
+        return data
+
+    unpack_uint32 = unpack_uint
+
+    unpack_int32 = unpack_int
+
+    unpack_uint64 = unpack_uhyper
+
+    unpack_int64 = unpack_hyper
+
+    def unpack_CryptoKeyType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_CryptoKeyType:
+                raise XDRError('value=%s not in enum CryptoKeyType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PublicKeyType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_PublicKeyType:
+                raise XDRError('value=%s not in enum PublicKeyType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SignerKeyType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_SignerKeyType:
+                raise XDRError('value=%s not in enum SignerKeyType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PublicKey(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_PublicKeyType:
+                raise XDRError('value=%s not in enum PublicKeyType' % disc)
+            if disc == const.PUBLIC_KEY_TYPE_ED25519:
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_ed25519 = buf[start:start + 32]
+                data = types.PublicKey(disc, ed25519=f_ed25519)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SignerKey(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_SignerKeyType:
+                raise XDRError('value=%s not in enum SignerKeyType' % disc)
+            if disc == const.SIGNER_KEY_TYPE_ED25519:
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_ed25519 = buf[start:start + 32]
+                data = types.SignerKey(disc, ed25519=f_ed25519)
+            elif disc == const.SIGNER_KEY_TYPE_PRE_AUTH_TX:
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_preAuthTx = buf[start:start + 32]
+                data = types.SignerKey(disc, preAuthTx=f_preAuthTx)
+            elif disc == const.SIGNER_KEY_TYPE_HASH_X:
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_hashX = buf[start:start + 32]
+                data = types.SignerKey(disc, hashX=f_hashX)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Signature(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for data')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            data = buf[start:start + n]
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SignatureHint(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 4
+        if end > len(buf):
+            raise EOFError
+        data = buf[start:start + 4]
+        return data
+
+    unpack_NodeID = unpack_PublicKey
+
+    def unpack_Curve25519Secret(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 32
+        if end > len(buf):
+            raise EOFError
+        f_key = buf[start:start + 32]
+        data = types.Curve25519Secret(f_key)
+        return data
+
+    def unpack_Curve25519Public(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 32
+        if end > len(buf):
+            raise EOFError
+        f_key = buf[start:start + 32]
+        data = types.Curve25519Public(f_key)
+        return data
+
+    def unpack_HmacSha256Key(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 32
+        if end > len(buf):
+            raise EOFError
+        f_key = buf[start:start + 32]
+        data = types.HmacSha256Key(f_key)
+        return data
+
+    def unpack_HmacSha256Mac(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 32
+        if end > len(buf):
+            raise EOFError
+        f_mac = buf[start:start + 32]
+        data = types.HmacSha256Mac(f_mac)
+        return data
+
+    def unpack_Value(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            data = buf[start:start + n]
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SCPBallot(self):
+        buf = self._buf
+        try:
+            f_counter = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_value = buf[start:start + n]
+            data = types.SCPBallot(f_counter, f_value)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SCPStatementType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_SCPStatementType:
+                raise XDRError('value=%s not in enum SCPStatementType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SCPNomination(self):
+        buf = self._buf
+        try:
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_quorumSetHash = buf[start:start + 32]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            l2 = []
+            for _ in range(n):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                start = self._pos
+                self._pos = end = start + ((n + 3) & ~3)
+                if end > len(buf):
+                    raise EOFError
+                i2 = buf[start:start + n]
+                l2.append(i2)
+            f_votes = l2
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            l2 = []
+            for _ in range(n):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                start = self._pos
+                self._pos = end = start + ((n + 3) & ~3)
+                if end > len(buf):
+                    raise EOFError
+                i2 = buf[start:start + n]
+                l2.append(i2)
+            f_accepted = l2
+            data = types.SCPNomination(f_quorumSetHash, f_votes, f_accepted)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SCPStatement(self):
+        buf = self._buf
+        try:
+            f_nodeID = self.unpack_PublicKey()
+            f_slotIndex = _S_Q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_pledges = nullclass()
+            f_pledges.type = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_pledges.type not in _ENUM_SCPStatementType:
+                raise XDRError('value=%s not in enum SCPStatementType' % f_pledges.type)
+            if f_pledges.type == const.SCP_ST_PREPARE:
+                f_pledges.prepare = nullclass()
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_pledges.prepare.quorumSetHash = buf[start:start + 32]
+                f_pledges.prepare.ballot = self.unpack_SCPBallot()
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if n > 1 and self.check_array:
+                    raise XDRError('array length too long for f_pledges.prepare.prepared')
+                unpack_i3 = self.unpack_SCPBallot
+                f_pledges.prepare.prepared = [unpack_i3() for _ in range(n)]
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if n > 1 and self.check_array:
+                    raise XDRError('array length too long for f_pledges.prepare.preparedPrime')
+                unpack_i3 = self.unpack_SCPBallot
+                f_pledges.prepare.preparedPrime = [unpack_i3() for _ in range(n)]
+                f_pledges.prepare.nC, f_pledges.prepare.nH = _S_II.unpack_from(buf, self._pos)
+                self._pos += 8
+            elif f_pledges.type == const.SCP_ST_CONFIRM:
+                f_pledges.confirm = nullclass()
+                f_pledges.confirm.ballot = self.unpack_SCPBallot()
+                f_pledges.confirm.nPrepared, f_pledges.confirm.nCommit, f_pledges.confirm.nH = _S_III.unpack_from(buf, self._pos)
+                self._pos += 12
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_pledges.confirm.quorumSetHash = buf[start:start + 32]
+            elif f_pledges.type == const.SCP_ST_EXTERNALIZE:
+                f_pledges.externalize = nullclass()
+                f_pledges.externalize.commit = self.unpack_SCPBallot()
+                f_pledges.externalize.nH = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_pledges.externalize.commitQuorumSetHash = buf[start:start + 32]
+            elif f_pledges.type == const.SCP_ST_NOMINATE:
+                f_pledges.nominate = self.unpack_SCPNomination()
+            else:
+                raise XDRError('bad switch=%s' % f_pledges.type)
+            data = types.SCPStatement(f_nodeID, f_slotIndex, f_pledges)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SCPEnvelope(self):
+        buf = self._buf
+        try:
+            f_statement = self.unpack_SCPStatement()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for f_signature')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_signature = buf[start:start + n]
+            data = types.SCPEnvelope(f_statement, f_signature)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SCPQuorumSet(self):
+        buf = self._buf
+        try:
+            f_threshold = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_PublicKey
+            f_validators = [unpack_i2() for _ in range(n)]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_SCPQuorumSet
+            f_innerSets = [unpack_i2() for _ in range(n)]
+            data = types.SCPQuorumSet(f_threshold, f_validators, f_innerSets)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_UpgradeType(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 128 and self.check_array:
+                raise XDRError('array length too long for data')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            data = buf[start:start + n]
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_StellarValueType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_StellarValueType:
+                raise XDRError('value=%s not in enum StellarValueType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerCloseValueSignature(self):
+        buf = self._buf
+        try:
+            f_nodeID = self.unpack_PublicKey()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for f_signature')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_signature = buf[start:start + n]
+            data = types.LedgerCloseValueSignature(f_nodeID, f_signature)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_StellarValue(self):
+        buf = self._buf
+        try:
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_txSetHash = buf[start:start + 32]
+            f_closeTime = _S_Q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 6 and self.check_array:
+                raise XDRError('array length too long for f_upgrades')
+            l2 = []
+            for _ in range(n):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if n > 128 and self.check_array:
+                    raise XDRError('array length too long for i2')
+                start = self._pos
+                self._pos = end = start + ((n + 3) & ~3)
+                if end > len(buf):
+                    raise EOFError
+                i2 = buf[start:start + n]
+                l2.append(i2)
+            f_upgrades = l2
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_ext.v not in _ENUM_StellarValueType:
+                raise XDRError('value=%s not in enum StellarValueType' % f_ext.v)
+            if f_ext.v == const.STELLAR_VALUE_BASIC:
+                pass
+            elif f_ext.v == const.STELLAR_VALUE_SIGNED:
+                f_ext.lcValueSignature = self.unpack_LedgerCloseValueSignature()
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.StellarValue(f_txSetHash, f_closeTime, f_upgrades, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerHeader(self):
+        buf = self._buf
+        try:
+            f_ledgerVersion = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_previousLedgerHash = buf[start:start + 32]
+            f_scpValue = self.unpack_StellarValue()
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_txSetResultHash = buf[start:start + 32]
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_bucketListHash = buf[start:start + 32]
+            f_ledgerSeq, f_totalCoins, f_feePool, f_inflationSeq, f_idPool, f_baseFee, f_baseReserve, f_maxTxSetSize = _S_IqqIQIII.unpack_from(buf, self._pos)
+            self._pos += 44
+            n = 4
+            l2 = []
+            for _ in range(n):
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                i2 = buf[start:start + 32]
+                l2.append(i2)
+            f_skipList = l2
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.LedgerHeader(f_ledgerVersion, f_previousLedgerHash, f_scpValue, f_txSetResultHash, f_bucketListHash, f_ledgerSeq, f_totalCoins, f_feePool, f_inflationSeq, f_idPool, f_baseFee, f_baseReserve, f_maxTxSetSize, f_skipList, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerUpgradeType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_LedgerUpgradeType:
+                raise XDRError('value=%s not in enum LedgerUpgradeType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerUpgrade(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_LedgerUpgradeType:
+                raise XDRError('value=%s not in enum LedgerUpgradeType' % disc)
+            if disc == const.LEDGER_UPGRADE_VERSION:
+                f_newLedgerVersion = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                data = types.LedgerUpgrade(disc, newLedgerVersion=f_newLedgerVersion)
+            elif disc == const.LEDGER_UPGRADE_BASE_FEE:
+                f_newBaseFee = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                data = types.LedgerUpgrade(disc, newBaseFee=f_newBaseFee)
+            elif disc == const.LEDGER_UPGRADE_MAX_TX_SET_SIZE:
+                f_newMaxTxSetSize = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                data = types.LedgerUpgrade(disc, newMaxTxSetSize=f_newMaxTxSetSize)
+            elif disc == const.LEDGER_UPGRADE_BASE_RESERVE:
+                f_newBaseReserve = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                data = types.LedgerUpgrade(disc, newBaseReserve=f_newBaseReserve)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerKey(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_LedgerEntryType:
+                raise XDRError('value=%s not in enum LedgerEntryType' % disc)
+            if disc == const.ACCOUNT:
+                f_account = nullclass()
+                f_account.accountID = self.unpack_PublicKey()
+                data = types.LedgerKey(disc, account=f_account)
+            elif disc == const.TRUSTLINE:
+                f_trustLine = nullclass()
+                f_trustLine.accountID = self.unpack_PublicKey()
+                f_trustLine.asset = self.unpack_Asset()
+                data = types.LedgerKey(disc, trustLine=f_trustLine)
+            elif disc == const.OFFER:
+                f_offer = nullclass()
+                f_offer.sellerID = self.unpack_PublicKey()
+                f_offer.offerID = _S_q.unpack_from(buf, self._pos)[0]
+                self._pos += 8
+                data = types.LedgerKey(disc, offer=f_offer)
+            elif disc == const.DATA:
+                f_data = nullclass()
+                f_data.accountID = self.unpack_PublicKey()
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if n > 64 and self.check_array:
+                    raise XDRError('array length too long for f_data.dataName')
+                start = self._pos
+                self._pos = end = start + ((n + 3) & ~3)
+                if end > len(buf):
+                    raise EOFError
+                f_data.dataName = buf[start:start + n]
+                data = types.LedgerKey(disc, data=f_data)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_BucketEntryType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_BucketEntryType:
+                raise XDRError('value=%s not in enum BucketEntryType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_BucketMetadata(self):
+        buf = self._buf
+        try:
+            f_ledgerVersion = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.BucketMetadata(f_ledgerVersion, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_BucketEntry(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_BucketEntryType:
+                raise XDRError('value=%s not in enum BucketEntryType' % disc)
+            if disc in (const.LIVEENTRY, const.INITENTRY):
+                f_liveEntry = self.unpack_LedgerEntry()
+                data = types.BucketEntry(disc, liveEntry=f_liveEntry)
+            elif disc == const.DEADENTRY:
+                f_deadEntry = self.unpack_LedgerKey()
+                data = types.BucketEntry(disc, deadEntry=f_deadEntry)
+            elif disc == const.METAENTRY:
+                f_metaEntry = self.unpack_BucketMetadata()
+                data = types.BucketEntry(disc, metaEntry=f_metaEntry)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionSet(self):
+        buf = self._buf
+        try:
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_previousLedgerHash = buf[start:start + 32]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_TransactionEnvelope
+            f_txs = [unpack_i2() for _ in range(n)]
+            data = types.TransactionSet(f_previousLedgerHash, f_txs)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionResultPair(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 32
+        if end > len(buf):
+            raise EOFError
+        f_transactionHash = buf[start:start + 32]
+        f_result = self.unpack_TransactionResult()
+        data = types.TransactionResultPair(f_transactionHash, f_result)
+        return data
+
+    def unpack_TransactionResultSet(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_TransactionResultPair
+            f_results = [unpack_i2() for _ in range(n)]
+            data = types.TransactionResultSet(f_results)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionHistoryEntry(self):
+        buf = self._buf
+        try:
+            f_ledgerSeq = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            f_txSet = self.unpack_TransactionSet()
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.TransactionHistoryEntry(f_ledgerSeq, f_txSet, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionHistoryResultEntry(self):
+        buf = self._buf
+        try:
+            f_ledgerSeq = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            f_txResultSet = self.unpack_TransactionResultSet()
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.TransactionHistoryResultEntry(f_ledgerSeq, f_txResultSet, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerHeaderHistoryEntry(self):
+        buf = self._buf
+        try:
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_hash = buf[start:start + 32]
+            f_header = self.unpack_LedgerHeader()
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.LedgerHeaderHistoryEntry(f_hash, f_header, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerSCPMessages(self):
+        buf = self._buf
+        try:
+            f_ledgerSeq = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_SCPEnvelope
+            f_messages = [unpack_i2() for _ in range(n)]
+            data = types.LedgerSCPMessages(f_ledgerSeq, f_messages)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SCPHistoryEntryV0(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_SCPQuorumSet
+            f_quorumSets = [unpack_i2() for _ in range(n)]
+            f_ledgerMessages = self.unpack_LedgerSCPMessages()
+            data = types.SCPHistoryEntryV0(f_quorumSets, f_ledgerMessages)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SCPHistoryEntry(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                f_v0 = self.unpack_SCPHistoryEntryV0()
+                data = types.SCPHistoryEntry(disc, v0=f_v0)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerEntryChangeType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_LedgerEntryChangeType:
+                raise XDRError('value=%s not in enum LedgerEntryChangeType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerEntryChange(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_LedgerEntryChangeType:
+                raise XDRError('value=%s not in enum LedgerEntryChangeType' % disc)
+            if disc == const.LEDGER_ENTRY_CREATED:
+                f_created = self.unpack_LedgerEntry()
+                data = types.LedgerEntryChange(disc, created=f_created)
+            elif disc == const.LEDGER_ENTRY_UPDATED:
+                f_updated = self.unpack_LedgerEntry()
+                data = types.LedgerEntryChange(disc, updated=f_updated)
+            elif disc == const.LEDGER_ENTRY_REMOVED:
+                f_removed = self.unpack_LedgerKey()
+                data = types.LedgerEntryChange(disc, removed=f_removed)
+            elif disc == const.LEDGER_ENTRY_STATE:
+                f_state = self.unpack_LedgerEntry()
+                data = types.LedgerEntryChange(disc, state=f_state)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerEntryChanges(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_LedgerEntryChange
+            data = [unpack_i2() for _ in range(n)]
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_OperationMeta(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_LedgerEntryChange
+            f_changes = [unpack_i2() for _ in range(n)]
+            data = types.OperationMeta(f_changes)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionMetaV1(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_LedgerEntryChange
+            f_txChanges = [unpack_i2() for _ in range(n)]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_OperationMeta
+            f_operations = [unpack_i2() for _ in range(n)]
+            data = types.TransactionMetaV1(f_txChanges, f_operations)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionMetaV2(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_LedgerEntryChange
+            f_txChangesBefore = [unpack_i2() for _ in range(n)]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_OperationMeta
+            f_operations = [unpack_i2() for _ in range(n)]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_LedgerEntryChange
+            f_txChangesAfter = [unpack_i2() for _ in range(n)]
+            data = types.TransactionMetaV2(f_txChangesBefore, f_operations, f_txChangesAfter)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionMeta(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                unpack_i3 = self.unpack_OperationMeta
+                f_operations = [unpack_i3() for _ in range(n)]
+                data = types.TransactionMeta(disc, operations=f_operations)
+            elif disc == 1:
+                f_v1 = self.unpack_TransactionMetaV1()
+                data = types.TransactionMeta(disc, v1=f_v1)
+            elif disc == 2:
+                f_v2 = self.unpack_TransactionMetaV2()
+                data = types.TransactionMeta(disc, v2=f_v2)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionResultMeta(self):
+        buf = self._buf
+        try:
+            f_result = self.unpack_TransactionResultPair()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_LedgerEntryChange
+            f_feeProcessing = [unpack_i2() for _ in range(n)]
+            f_txApplyProcessing = self.unpack_TransactionMeta()
+            data = types.TransactionResultMeta(f_result, f_feeProcessing, f_txApplyProcessing)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_UpgradeEntryMeta(self):
+        buf = self._buf
+        try:
+            f_upgrade = self.unpack_LedgerUpgrade()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_LedgerEntryChange
+            f_changes = [unpack_i2() for _ in range(n)]
+            data = types.UpgradeEntryMeta(f_upgrade, f_changes)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerCloseMetaV0(self):
+        buf = self._buf
+        try:
+            f_ledgerHeader = self.unpack_LedgerHeaderHistoryEntry()
+            f_txSet = self.unpack_TransactionSet()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_TransactionResultMeta
+            f_txProcessing = [unpack_i2() for _ in range(n)]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_UpgradeEntryMeta
+            f_upgradesProcessing = [unpack_i2() for _ in range(n)]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_SCPHistoryEntry
+            f_scpInfo = [unpack_i2() for _ in range(n)]
+            data = types.LedgerCloseMetaV0(f_ledgerHeader, f_txSet, f_txProcessing, f_upgradesProcessing, f_scpInfo)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerCloseMeta(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                f_v0 = self.unpack_LedgerCloseMetaV0()
+                data = types.LedgerCloseMeta(disc, v0=f_v0)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    unpack_AccountID = unpack_PublicKey
+
+    def unpack_Thresholds(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 4
+        if end > len(buf):
+            raise EOFError
+        data = buf[start:start + 4]
+        return data
+
+    def unpack_string32(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 32 and self.check_array:
+                raise XDRError('array length too long for data')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            data = buf[start:start + n]
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_string64(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for data')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            data = buf[start:start + n]
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    unpack_SequenceNumber = unpack_int64
+
+    unpack_TimePoint = unpack_uint64
+
+    def unpack_DataValue(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for data')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            data = buf[start:start + n]
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_AssetCode4(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 4
+        if end > len(buf):
+            raise EOFError
+        data = buf[start:start + 4]
+        return data
+
+    def unpack_AssetCode12(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 12
+        if end > len(buf):
+            raise EOFError
+        data = buf[start:start + 12]
+        return data
+
+    def unpack_AssetType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_AssetType:
+                raise XDRError('value=%s not in enum AssetType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Asset(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_AssetType:
+                raise XDRError('value=%s not in enum AssetType' % disc)
+            if disc == const.ASSET_TYPE_NATIVE:
+                data = types.Asset(disc)
+            elif disc == const.ASSET_TYPE_CREDIT_ALPHANUM4:
+                f_alphaNum4 = nullclass()
+                start = self._pos
+                self._pos = end = start + 4
+                if end > len(buf):
+                    raise EOFError
+                f_alphaNum4.assetCode = buf[start:start + 4]
+                f_alphaNum4.issuer = self.unpack_PublicKey()
+                data = types.Asset(disc, alphaNum4=f_alphaNum4)
+            elif disc == const.ASSET_TYPE_CREDIT_ALPHANUM12:
+                f_alphaNum12 = nullclass()
+                start = self._pos
+                self._pos = end = start + 12
+                if end > len(buf):
+                    raise EOFError
+                f_alphaNum12.assetCode = buf[start:start + 12]
+                f_alphaNum12.issuer = self.unpack_PublicKey()
+                data = types.Asset(disc, alphaNum12=f_alphaNum12)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Price(self):
+        buf = self._buf
+        try:
+            f_n, f_d = _S_ii.unpack_from(buf, self._pos)
+            self._pos += 8
+            data = types.Price(f_n, f_d)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Liabilities(self):
+        buf = self._buf
+        try:
+            f_buying, f_selling = _S_qq.unpack_from(buf, self._pos)
+            self._pos += 16
+            data = types.Liabilities(f_buying, f_selling)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ThresholdIndexes(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_ThresholdIndexes:
+                raise XDRError('value=%s not in enum ThresholdIndexes' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerEntryType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_LedgerEntryType:
+                raise XDRError('value=%s not in enum LedgerEntryType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Signer(self):
+        buf = self._buf
+        try:
+            f_key = self.unpack_SignerKey()
+            f_weight = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            data = types.Signer(f_key, f_weight)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_AccountFlags(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_AccountFlags:
+                raise XDRError('value=%s not in enum AccountFlags' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_AccountEntry(self):
+        buf = self._buf
+        try:
+            f_accountID = self.unpack_PublicKey()
+            f_balance, f_seqNum, f_numSubEntries = _S_qqI.unpack_from(buf, self._pos)
+            self._pos += 20
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_inflationDest')
+            unpack_i2 = self.unpack_PublicKey
+            f_inflationDest = [unpack_i2() for _ in range(n)]
+            f_flags = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 32 and self.check_array:
+                raise XDRError('array length too long for f_homeDomain')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_homeDomain = buf[start:start + n]
+            start = self._pos
+            self._pos = end = start + 4
+            if end > len(buf):
+                raise EOFError
+            f_thresholds = buf[start:start + 4]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 20 and self.check_array:
+                raise XDRError('array length too long for f_signers')
+            unpack_i2 = self.unpack_Signer
+            f_signers = [unpack_i2() for _ in range(n)]
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            elif f_ext.v == 1:
+                f_ext.v1 = nullclass()
+                f_ext.v1.liabilities = self.unpack_Liabilities()
+                f_ext.v1.ext = nullclass()
+                f_ext.v1.ext.v = _S_i.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if f_ext.v1.ext.v == 0:
+                    pass
+                else:
+                    raise XDRError('bad switch=%s' % f_ext.v1.ext.v)
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.AccountEntry(f_accountID, f_balance, f_seqNum, f_numSubEntries, f_inflationDest, f_flags, f_homeDomain, f_thresholds, f_signers, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TrustLineFlags(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_TrustLineFlags:
+                raise XDRError('value=%s not in enum TrustLineFlags' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TrustLineEntry(self):
+        buf = self._buf
+        try:
+            f_accountID = self.unpack_PublicKey()
+            f_asset = self.unpack_Asset()
+            f_balance, f_limit, f_flags = _S_qqI.unpack_from(buf, self._pos)
+            self._pos += 20
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            elif f_ext.v == 1:
+                f_ext.v1 = nullclass()
+                f_ext.v1.liabilities = self.unpack_Liabilities()
+                f_ext.v1.ext = nullclass()
+                f_ext.v1.ext.v = _S_i.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if f_ext.v1.ext.v == 0:
+                    pass
+                else:
+                    raise XDRError('bad switch=%s' % f_ext.v1.ext.v)
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.TrustLineEntry(f_accountID, f_asset, f_balance, f_limit, f_flags, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_OfferEntryFlags(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_OfferEntryFlags:
+                raise XDRError('value=%s not in enum OfferEntryFlags' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_OfferEntry(self):
+        buf = self._buf
+        try:
+            f_sellerID = self.unpack_PublicKey()
+            f_offerID = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_selling = self.unpack_Asset()
+            f_buying = self.unpack_Asset()
+            f_amount = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_price = self.unpack_Price()
+            f_flags = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.OfferEntry(f_sellerID, f_offerID, f_selling, f_buying, f_amount, f_price, f_flags, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_DataEntry(self):
+        buf = self._buf
+        try:
+            f_accountID = self.unpack_PublicKey()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for f_dataName')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_dataName = buf[start:start + n]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for f_dataValue')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_dataValue = buf[start:start + n]
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.DataEntry(f_accountID, f_dataName, f_dataValue, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_LedgerEntry(self):
+        buf = self._buf
+        try:
+            f_lastModifiedLedgerSeq = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            f_data = nullclass()
+            f_data.type = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_data.type not in _ENUM_LedgerEntryType:
+                raise XDRError('value=%s not in enum LedgerEntryType' % f_data.type)
+            if f_data.type == const.ACCOUNT:
+                f_data.account = self.unpack_AccountEntry()
+            elif f_data.type == const.TRUSTLINE:
+                f_data.trustLine = self.unpack_TrustLineEntry()
+            elif f_data.type == const.OFFER:
+                f_data.offer = self.unpack_OfferEntry()
+            elif f_data.type == const.DATA:
+                f_data.data = self.unpack_DataEntry()
+            else:
+                raise XDRError('bad switch=%s' % f_data.type)
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.LedgerEntry(f_lastModifiedLedgerSeq, f_data, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_EnvelopeType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_EnvelopeType:
+                raise XDRError('value=%s not in enum EnvelopeType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_MuxedAccount(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_CryptoKeyType:
+                raise XDRError('value=%s not in enum CryptoKeyType' % disc)
+            if disc == const.KEY_TYPE_ED25519:
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_ed25519 = buf[start:start + 32]
+                data = types.MuxedAccount(disc, ed25519=f_ed25519)
+            elif disc == const.KEY_TYPE_MUXED_ED25519:
+                f_med25519 = nullclass()
+                f_med25519.id = _S_Q.unpack_from(buf, self._pos)[0]
+                self._pos += 8
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_med25519.ed25519 = buf[start:start + 32]
+                data = types.MuxedAccount(disc, med25519=f_med25519)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_DecoratedSignature(self):
+        buf = self._buf
+        try:
+            start = self._pos
+            self._pos = end = start + 4
+            if end > len(buf):
+                raise EOFError
+            f_hint = buf[start:start + 4]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for f_signature')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_signature = buf[start:start + n]
+            data = types.DecoratedSignature(f_hint, f_signature)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_OperationType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_OperationType:
+                raise XDRError('value=%s not in enum OperationType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_CreateAccountOp(self):
+        buf = self._buf
+        try:
+            f_destination = self.unpack_PublicKey()
+            f_startingBalance = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            data = types.CreateAccountOp(f_destination, f_startingBalance)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PaymentOp(self):
+        buf = self._buf
+        try:
+            f_destination = self.unpack_MuxedAccount()
+            f_asset = self.unpack_Asset()
+            f_amount = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            data = types.PaymentOp(f_destination, f_asset, f_amount)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PathPaymentStrictReceiveOp(self):
+        buf = self._buf
+        try:
+            f_sendAsset = self.unpack_Asset()
+            f_sendMax = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_destination = self.unpack_MuxedAccount()
+            f_destAsset = self.unpack_Asset()
+            f_destAmount = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 5 and self.check_array:
+                raise XDRError('array length too long for f_path')
+            unpack_i2 = self.unpack_Asset
+            f_path = [unpack_i2() for _ in range(n)]
+            data = types.PathPaymentStrictReceiveOp(f_sendAsset, f_sendMax, f_destination, f_destAsset, f_destAmount, f_path)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PathPaymentStrictSendOp(self):
+        buf = self._buf
+        try:
+            f_sendAsset = self.unpack_Asset()
+            f_sendAmount = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_destination = self.unpack_MuxedAccount()
+            f_destAsset = self.unpack_Asset()
+            f_destMin = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 5 and self.check_array:
+                raise XDRError('array length too long for f_path')
+            unpack_i2 = self.unpack_Asset
+            f_path = [unpack_i2() for _ in range(n)]
+            data = types.PathPaymentStrictSendOp(f_sendAsset, f_sendAmount, f_destination, f_destAsset, f_destMin, f_path)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageSellOfferOp(self):
+        buf = self._buf
+        try:
+            f_selling = self.unpack_Asset()
+            f_buying = self.unpack_Asset()
+            f_amount = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_price = self.unpack_Price()
+            f_offerID = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            data = types.ManageSellOfferOp(f_selling, f_buying, f_amount, f_price, f_offerID)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageBuyOfferOp(self):
+        buf = self._buf
+        try:
+            f_selling = self.unpack_Asset()
+            f_buying = self.unpack_Asset()
+            f_buyAmount = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_price = self.unpack_Price()
+            f_offerID = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            data = types.ManageBuyOfferOp(f_selling, f_buying, f_buyAmount, f_price, f_offerID)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_CreatePassiveSellOfferOp(self):
+        buf = self._buf
+        try:
+            f_selling = self.unpack_Asset()
+            f_buying = self.unpack_Asset()
+            f_amount = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_price = self.unpack_Price()
+            data = types.CreatePassiveSellOfferOp(f_selling, f_buying, f_amount, f_price)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SetOptionsOp(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_inflationDest')
+            unpack_i2 = self.unpack_PublicKey
+            f_inflationDest = [unpack_i2() for _ in range(n)]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_clearFlags')
+            l2 = []
+            for _ in range(n):
+                i2 = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                l2.append(i2)
+            f_clearFlags = l2
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_setFlags')
+            l2 = []
+            for _ in range(n):
+                i2 = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                l2.append(i2)
+            f_setFlags = l2
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_masterWeight')
+            l2 = []
+            for _ in range(n):
+                i2 = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                l2.append(i2)
+            f_masterWeight = l2
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_lowThreshold')
+            l2 = []
+            for _ in range(n):
+                i2 = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                l2.append(i2)
+            f_lowThreshold = l2
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_medThreshold')
+            l2 = []
+            for _ in range(n):
+                i2 = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                l2.append(i2)
+            f_medThreshold = l2
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_highThreshold')
+            l2 = []
+            for _ in range(n):
+                i2 = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                l2.append(i2)
+            f_highThreshold = l2
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_homeDomain')
+            l2 = []
+            for _ in range(n):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if n > 32 and self.check_array:
+                    raise XDRError('array length too long for i2')
+                start = self._pos
+                self._pos = end = start + ((n + 3) & ~3)
+                if end > len(buf):
+                    raise EOFError
+                i2 = buf[start:start + n]
+                l2.append(i2)
+            f_homeDomain = l2
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_signer')
+            unpack_i2 = self.unpack_Signer
+            f_signer = [unpack_i2() for _ in range(n)]
+            data = types.SetOptionsOp(f_inflationDest, f_clearFlags, f_setFlags, f_masterWeight, f_lowThreshold, f_medThreshold, f_highThreshold, f_homeDomain, f_signer)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ChangeTrustOp(self):
+        buf = self._buf
+        try:
+            f_line = self.unpack_Asset()
+            f_limit = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            data = types.ChangeTrustOp(f_line, f_limit)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_AllowTrustOp(self):
+        buf = self._buf
+        try:
+            f_trustor = self.unpack_PublicKey()
+            f_asset = nullclass()
+            f_asset.type = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_asset.type not in _ENUM_AssetType:
+                raise XDRError('value=%s not in enum AssetType' % f_asset.type)
+            if f_asset.type == const.ASSET_TYPE_CREDIT_ALPHANUM4:
+                start = self._pos
+                self._pos = end = start + 4
+                if end > len(buf):
+                    raise EOFError
+                f_asset.assetCode4 = buf[start:start + 4]
+            elif f_asset.type == const.ASSET_TYPE_CREDIT_ALPHANUM12:
+                start = self._pos
+                self._pos = end = start + 12
+                if end > len(buf):
+                    raise EOFError
+                f_asset.assetCode12 = buf[start:start + 12]
+            else:
+                raise XDRError('bad switch=%s' % f_asset.type)
+            f_authorize = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            data = types.AllowTrustOp(f_trustor, f_asset, f_authorize)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageDataOp(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for f_dataName')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_dataName = buf[start:start + n]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_dataValue')
+            l2 = []
+            for _ in range(n):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if n > 64 and self.check_array:
+                    raise XDRError('array length too long for i2')
+                start = self._pos
+                self._pos = end = start + ((n + 3) & ~3)
+                if end > len(buf):
+                    raise EOFError
+                i2 = buf[start:start + n]
+                l2.append(i2)
+            f_dataValue = l2
+            data = types.ManageDataOp(f_dataName, f_dataValue)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_BumpSequenceOp(self):
+        buf = self._buf
+        try:
+            f_bumpTo = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            data = types.BumpSequenceOp(f_bumpTo)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Operation(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_sourceAccount')
+            unpack_i2 = self.unpack_MuxedAccount
+            f_sourceAccount = [unpack_i2() for _ in range(n)]
+            f_body = nullclass()
+            f_body.type = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_body.type not in _ENUM_OperationType:
+                raise XDRError('value=%s not in enum OperationType' % f_body.type)
+            if f_body.type == const.CREATE_ACCOUNT:
+                f_body.createAccountOp = self.unpack_CreateAccountOp()
+            elif f_body.type == const.PAYMENT:
+                f_body.paymentOp = self.unpack_PaymentOp()
+            elif f_body.type == const.PATH_PAYMENT_STRICT_RECEIVE:
+                f_body.pathPaymentStrictReceiveOp = self.unpack_PathPaymentStrictReceiveOp()
+            elif f_body.type == const.MANAGE_SELL_OFFER:
+                f_body.manageSellOfferOp = self.unpack_ManageSellOfferOp()
+            elif f_body.type == const.CREATE_PASSIVE_SELL_OFFER:
+                f_body.createPassiveSellOfferOp = self.unpack_CreatePassiveSellOfferOp()
+            elif f_body.type == const.SET_OPTIONS:
+                f_body.setOptionsOp = self.unpack_SetOptionsOp()
+            elif f_body.type == const.CHANGE_TRUST:
+                f_body.changeTrustOp = self.unpack_ChangeTrustOp()
+            elif f_body.type == const.ALLOW_TRUST:
+                f_body.allowTrustOp = self.unpack_AllowTrustOp()
+            elif f_body.type == const.ACCOUNT_MERGE:
+                f_body.destination = self.unpack_MuxedAccount()
+            elif f_body.type == const.INFLATION:
+                pass
+            elif f_body.type == const.MANAGE_DATA:
+                f_body.manageDataOp = self.unpack_ManageDataOp()
+            elif f_body.type == const.BUMP_SEQUENCE:
+                f_body.bumpSequenceOp = self.unpack_BumpSequenceOp()
+            elif f_body.type == const.MANAGE_BUY_OFFER:
+                f_body.manageBuyOfferOp = self.unpack_ManageBuyOfferOp()
+            elif f_body.type == const.PATH_PAYMENT_STRICT_SEND:
+                f_body.pathPaymentStrictSendOp = self.unpack_PathPaymentStrictSendOp()
+            else:
+                raise XDRError('bad switch=%s' % f_body.type)
+            data = types.Operation(f_sourceAccount, f_body)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_MemoType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_MemoType:
+                raise XDRError('value=%s not in enum MemoType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Memo(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_MemoType:
+                raise XDRError('value=%s not in enum MemoType' % disc)
+            if disc == const.MEMO_NONE:
+                data = types.Memo(disc)
+            elif disc == const.MEMO_TEXT:
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if n > 28 and self.check_array:
+                    raise XDRError('array length too long for f_text')
+                start = self._pos
+                self._pos = end = start + ((n + 3) & ~3)
+                if end > len(buf):
+                    raise EOFError
+                f_text = buf[start:start + n]
+                data = types.Memo(disc, text=f_text)
+            elif disc == const.MEMO_ID:
+                f_id = _S_Q.unpack_from(buf, self._pos)[0]
+                self._pos += 8
+                data = types.Memo(disc, id=f_id)
+            elif disc == const.MEMO_HASH:
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_hash = buf[start:start + 32]
+                data = types.Memo(disc, hash=f_hash)
+            elif disc == const.MEMO_RETURN:
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_retHash = buf[start:start + 32]
+                data = types.Memo(disc, retHash=f_retHash)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TimeBounds(self):
+        buf = self._buf
+        try:
+            f_minTime, f_maxTime = _S_QQ.unpack_from(buf, self._pos)
+            self._pos += 16
+            data = types.TimeBounds(f_minTime, f_maxTime)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionV0(self):
+        buf = self._buf
+        try:
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_sourceAccountEd25519 = buf[start:start + 32]
+            f_fee, f_seqNum = _S_Iq.unpack_from(buf, self._pos)
+            self._pos += 12
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_timeBounds')
+            unpack_i2 = self.unpack_TimeBounds
+            f_timeBounds = [unpack_i2() for _ in range(n)]
+            f_memo = self.unpack_Memo()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > const.MAX_OPS_PER_TX and self.check_array:
+                raise XDRError('array length too long for f_operations')
+            unpack_i2 = self.unpack_Operation
+            f_operations = [unpack_i2() for _ in range(n)]
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.TransactionV0(f_sourceAccountEd25519, f_fee, f_seqNum, f_timeBounds, f_memo, f_operations, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionV0Envelope(self):
+        buf = self._buf
+        try:
+            f_tx = self.unpack_TransactionV0()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 20 and self.check_array:
+                raise XDRError('array length too long for f_signatures')
+            unpack_i2 = self.unpack_DecoratedSignature
+            f_signatures = [unpack_i2() for _ in range(n)]
+            data = types.TransactionV0Envelope(f_tx, f_signatures)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Transaction(self):
+        buf = self._buf
+        try:
+            f_sourceAccount = self.unpack_MuxedAccount()
+            f_fee, f_seqNum = _S_Iq.unpack_from(buf, self._pos)
+            self._pos += 12
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 1 and self.check_array:
+                raise XDRError('array length too long for f_timeBounds')
+            unpack_i2 = self.unpack_TimeBounds
+            f_timeBounds = [unpack_i2() for _ in range(n)]
+            f_memo = self.unpack_Memo()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > const.MAX_OPS_PER_TX and self.check_array:
+                raise XDRError('array length too long for f_operations')
+            unpack_i2 = self.unpack_Operation
+            f_operations = [unpack_i2() for _ in range(n)]
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.Transaction(f_sourceAccount, f_fee, f_seqNum, f_timeBounds, f_memo, f_operations, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionV1Envelope(self):
+        buf = self._buf
+        try:
+            f_tx = self.unpack_Transaction()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 20 and self.check_array:
+                raise XDRError('array length too long for f_signatures')
+            unpack_i2 = self.unpack_DecoratedSignature
+            f_signatures = [unpack_i2() for _ in range(n)]
+            data = types.TransactionV1Envelope(f_tx, f_signatures)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_FeeBumpTransaction(self):
+        buf = self._buf
+        try:
+            f_feeSource = self.unpack_MuxedAccount()
+            f_fee = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_innerTx = nullclass()
+            f_innerTx.type = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_innerTx.type not in _ENUM_EnvelopeType:
+                raise XDRError('value=%s not in enum EnvelopeType' % f_innerTx.type)
+            if f_innerTx.type == const.ENVELOPE_TYPE_TX:
+                f_innerTx.v1 = self.unpack_TransactionV1Envelope()
+            else:
+                raise XDRError('bad switch=%s' % f_innerTx.type)
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.FeeBumpTransaction(f_feeSource, f_fee, f_innerTx, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_FeeBumpTransactionEnvelope(self):
+        buf = self._buf
+        try:
+            f_tx = self.unpack_FeeBumpTransaction()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 20 and self.check_array:
+                raise XDRError('array length too long for f_signatures')
+            unpack_i2 = self.unpack_DecoratedSignature
+            f_signatures = [unpack_i2() for _ in range(n)]
+            data = types.FeeBumpTransactionEnvelope(f_tx, f_signatures)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionEnvelope(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_EnvelopeType:
+                raise XDRError('value=%s not in enum EnvelopeType' % disc)
+            if disc == const.ENVELOPE_TYPE_TX_V0:
+                f_v0 = self.unpack_TransactionV0Envelope()
+                data = types.TransactionEnvelope(disc, v0=f_v0)
+            elif disc == const.ENVELOPE_TYPE_TX:
+                f_v1 = self.unpack_TransactionV1Envelope()
+                data = types.TransactionEnvelope(disc, v1=f_v1)
+            elif disc == const.ENVELOPE_TYPE_TX_FEE_BUMP:
+                f_feeBump = self.unpack_FeeBumpTransactionEnvelope()
+                data = types.TransactionEnvelope(disc, feeBump=f_feeBump)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionSignaturePayload(self):
+        buf = self._buf
+        try:
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_networkId = buf[start:start + 32]
+            f_taggedTransaction = nullclass()
+            f_taggedTransaction.type = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_taggedTransaction.type not in _ENUM_EnvelopeType:
+                raise XDRError('value=%s not in enum EnvelopeType' % f_taggedTransaction.type)
+            if f_taggedTransaction.type == const.ENVELOPE_TYPE_TX:
+                f_taggedTransaction.tx = self.unpack_Transaction()
+            elif f_taggedTransaction.type == const.ENVELOPE_TYPE_TX_FEE_BUMP:
+                f_taggedTransaction.feeBump = self.unpack_FeeBumpTransaction()
+            else:
+                raise XDRError('bad switch=%s' % f_taggedTransaction.type)
+            data = types.TransactionSignaturePayload(f_networkId, f_taggedTransaction)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ClaimOfferAtom(self):
+        buf = self._buf
+        try:
+            f_sellerID = self.unpack_PublicKey()
+            f_offerID = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_assetSold = self.unpack_Asset()
+            f_amountSold = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_assetBought = self.unpack_Asset()
+            f_amountBought = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            data = types.ClaimOfferAtom(f_sellerID, f_offerID, f_assetSold, f_amountSold, f_assetBought, f_amountBought)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_CreateAccountResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_CreateAccountResultCode:
+                raise XDRError('value=%s not in enum CreateAccountResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_CreateAccountResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_CreateAccountResultCode:
+                raise XDRError('value=%s not in enum CreateAccountResultCode' % disc)
+            if disc == const.CREATE_ACCOUNT_SUCCESS:
+                data = types.CreateAccountResult(disc)
+            else:
+                data = types.CreateAccountResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PaymentResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_PaymentResultCode:
+                raise XDRError('value=%s not in enum PaymentResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PaymentResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_PaymentResultCode:
+                raise XDRError('value=%s not in enum PaymentResultCode' % disc)
+            if disc == const.PAYMENT_SUCCESS:
+                data = types.PaymentResult(disc)
+            else:
+                data = types.PaymentResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PathPaymentStrictReceiveResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_PathPaymentStrictReceiveResultCode:
+                raise XDRError('value=%s not in enum PathPaymentStrictReceiveResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SimplePaymentResult(self):
+        buf = self._buf
+        try:
+            f_destination = self.unpack_PublicKey()
+            f_asset = self.unpack_Asset()
+            f_amount = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            data = types.SimplePaymentResult(f_destination, f_asset, f_amount)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PathPaymentStrictReceiveResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_PathPaymentStrictReceiveResultCode:
+                raise XDRError('value=%s not in enum PathPaymentStrictReceiveResultCode' % disc)
+            if disc == const.PATH_PAYMENT_STRICT_RECEIVE_SUCCESS:
+                f_success = nullclass()
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                unpack_i3 = self.unpack_ClaimOfferAtom
+                f_success.offers = [unpack_i3() for _ in range(n)]
+                f_success.last = self.unpack_SimplePaymentResult()
+                data = types.PathPaymentStrictReceiveResult(disc, success=f_success)
+            elif disc == const.PATH_PAYMENT_STRICT_RECEIVE_NO_ISSUER:
+                f_noIssuer = self.unpack_Asset()
+                data = types.PathPaymentStrictReceiveResult(disc, noIssuer=f_noIssuer)
+            else:
+                data = types.PathPaymentStrictReceiveResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PathPaymentStrictSendResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_PathPaymentStrictSendResultCode:
+                raise XDRError('value=%s not in enum PathPaymentStrictSendResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PathPaymentStrictSendResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_PathPaymentStrictSendResultCode:
+                raise XDRError('value=%s not in enum PathPaymentStrictSendResultCode' % disc)
+            if disc == const.PATH_PAYMENT_STRICT_SEND_SUCCESS:
+                f_success = nullclass()
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                unpack_i3 = self.unpack_ClaimOfferAtom
+                f_success.offers = [unpack_i3() for _ in range(n)]
+                f_success.last = self.unpack_SimplePaymentResult()
+                data = types.PathPaymentStrictSendResult(disc, success=f_success)
+            elif disc == const.PATH_PAYMENT_STRICT_SEND_NO_ISSUER:
+                f_noIssuer = self.unpack_Asset()
+                data = types.PathPaymentStrictSendResult(disc, noIssuer=f_noIssuer)
+            else:
+                data = types.PathPaymentStrictSendResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageSellOfferResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_ManageSellOfferResultCode:
+                raise XDRError('value=%s not in enum ManageSellOfferResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageOfferEffect(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_ManageOfferEffect:
+                raise XDRError('value=%s not in enum ManageOfferEffect' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageOfferSuccessResult(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            unpack_i2 = self.unpack_ClaimOfferAtom
+            f_offersClaimed = [unpack_i2() for _ in range(n)]
+            f_offer = nullclass()
+            f_offer.effect = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_offer.effect not in _ENUM_ManageOfferEffect:
+                raise XDRError('value=%s not in enum ManageOfferEffect' % f_offer.effect)
+            if f_offer.effect in (const.MANAGE_OFFER_CREATED, const.MANAGE_OFFER_UPDATED):
+                f_offer.offer = self.unpack_OfferEntry()
+            else:
+                pass
+            data = types.ManageOfferSuccessResult(f_offersClaimed, f_offer)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageSellOfferResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_ManageSellOfferResultCode:
+                raise XDRError('value=%s not in enum ManageSellOfferResultCode' % disc)
+            if disc == const.MANAGE_SELL_OFFER_SUCCESS:
+                f_success = self.unpack_ManageOfferSuccessResult()
+                data = types.ManageSellOfferResult(disc, success=f_success)
+            else:
+                data = types.ManageSellOfferResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageBuyOfferResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_ManageBuyOfferResultCode:
+                raise XDRError('value=%s not in enum ManageBuyOfferResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageBuyOfferResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_ManageBuyOfferResultCode:
+                raise XDRError('value=%s not in enum ManageBuyOfferResultCode' % disc)
+            if disc == const.MANAGE_BUY_OFFER_SUCCESS:
+                f_success = self.unpack_ManageOfferSuccessResult()
+                data = types.ManageBuyOfferResult(disc, success=f_success)
+            else:
+                data = types.ManageBuyOfferResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SetOptionsResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_SetOptionsResultCode:
+                raise XDRError('value=%s not in enum SetOptionsResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SetOptionsResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_SetOptionsResultCode:
+                raise XDRError('value=%s not in enum SetOptionsResultCode' % disc)
+            if disc == const.SET_OPTIONS_SUCCESS:
+                data = types.SetOptionsResult(disc)
+            else:
+                data = types.SetOptionsResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ChangeTrustResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_ChangeTrustResultCode:
+                raise XDRError('value=%s not in enum ChangeTrustResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ChangeTrustResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_ChangeTrustResultCode:
+                raise XDRError('value=%s not in enum ChangeTrustResultCode' % disc)
+            if disc == const.CHANGE_TRUST_SUCCESS:
+                data = types.ChangeTrustResult(disc)
+            else:
+                data = types.ChangeTrustResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_AllowTrustResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_AllowTrustResultCode:
+                raise XDRError('value=%s not in enum AllowTrustResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_AllowTrustResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_AllowTrustResultCode:
+                raise XDRError('value=%s not in enum AllowTrustResultCode' % disc)
+            if disc == const.ALLOW_TRUST_SUCCESS:
+                data = types.AllowTrustResult(disc)
+            else:
+                data = types.AllowTrustResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_AccountMergeResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_AccountMergeResultCode:
+                raise XDRError('value=%s not in enum AccountMergeResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_AccountMergeResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_AccountMergeResultCode:
+                raise XDRError('value=%s not in enum AccountMergeResultCode' % disc)
+            if disc == const.ACCOUNT_MERGE_SUCCESS:
+                f_sourceAccountBalance = _S_q.unpack_from(buf, self._pos)[0]
+                self._pos += 8
+                data = types.AccountMergeResult(disc, sourceAccountBalance=f_sourceAccountBalance)
+            else:
+                data = types.AccountMergeResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_InflationResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_InflationResultCode:
+                raise XDRError('value=%s not in enum InflationResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_InflationPayout(self):
+        buf = self._buf
+        try:
+            f_destination = self.unpack_PublicKey()
+            f_amount = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            data = types.InflationPayout(f_destination, f_amount)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_InflationResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_InflationResultCode:
+                raise XDRError('value=%s not in enum InflationResultCode' % disc)
+            if disc == const.INFLATION_SUCCESS:
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                unpack_i3 = self.unpack_InflationPayout
+                f_payouts = [unpack_i3() for _ in range(n)]
+                data = types.InflationResult(disc, payouts=f_payouts)
+            else:
+                data = types.InflationResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageDataResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_ManageDataResultCode:
+                raise XDRError('value=%s not in enum ManageDataResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ManageDataResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_ManageDataResultCode:
+                raise XDRError('value=%s not in enum ManageDataResultCode' % disc)
+            if disc == const.MANAGE_DATA_SUCCESS:
+                data = types.ManageDataResult(disc)
+            else:
+                data = types.ManageDataResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_BumpSequenceResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_BumpSequenceResultCode:
+                raise XDRError('value=%s not in enum BumpSequenceResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_BumpSequenceResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_BumpSequenceResultCode:
+                raise XDRError('value=%s not in enum BumpSequenceResultCode' % disc)
+            if disc == const.BUMP_SEQUENCE_SUCCESS:
+                data = types.BumpSequenceResult(disc)
+            else:
+                data = types.BumpSequenceResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_OperationResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_OperationResultCode:
+                raise XDRError('value=%s not in enum OperationResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_OperationResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_OperationResultCode:
+                raise XDRError('value=%s not in enum OperationResultCode' % disc)
+            if disc == const.opINNER:
+                f_tr = nullclass()
+                f_tr.type = _S_i.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if self.check_enum and f_tr.type not in _ENUM_OperationType:
+                    raise XDRError('value=%s not in enum OperationType' % f_tr.type)
+                if f_tr.type == const.CREATE_ACCOUNT:
+                    f_tr.createAccountResult = self.unpack_CreateAccountResult()
+                elif f_tr.type == const.PAYMENT:
+                    f_tr.paymentResult = self.unpack_PaymentResult()
+                elif f_tr.type == const.PATH_PAYMENT_STRICT_RECEIVE:
+                    f_tr.pathPaymentStrictReceiveResult = self.unpack_PathPaymentStrictReceiveResult()
+                elif f_tr.type == const.MANAGE_SELL_OFFER:
+                    f_tr.manageSellOfferResult = self.unpack_ManageSellOfferResult()
+                elif f_tr.type == const.CREATE_PASSIVE_SELL_OFFER:
+                    f_tr.createPassiveSellOfferResult = self.unpack_ManageSellOfferResult()
+                elif f_tr.type == const.SET_OPTIONS:
+                    f_tr.setOptionsResult = self.unpack_SetOptionsResult()
+                elif f_tr.type == const.CHANGE_TRUST:
+                    f_tr.changeTrustResult = self.unpack_ChangeTrustResult()
+                elif f_tr.type == const.ALLOW_TRUST:
+                    f_tr.allowTrustResult = self.unpack_AllowTrustResult()
+                elif f_tr.type == const.ACCOUNT_MERGE:
+                    f_tr.accountMergeResult = self.unpack_AccountMergeResult()
+                elif f_tr.type == const.INFLATION:
+                    f_tr.inflationResult = self.unpack_InflationResult()
+                elif f_tr.type == const.MANAGE_DATA:
+                    f_tr.manageDataResult = self.unpack_ManageDataResult()
+                elif f_tr.type == const.BUMP_SEQUENCE:
+                    f_tr.bumpSeqResult = self.unpack_BumpSequenceResult()
+                elif f_tr.type == const.MANAGE_BUY_OFFER:
+                    f_tr.manageBuyOfferResult = self.unpack_ManageBuyOfferResult()
+                elif f_tr.type == const.PATH_PAYMENT_STRICT_SEND:
+                    f_tr.pathPaymentStrictSendResult = self.unpack_PathPaymentStrictSendResult()
+                else:
+                    raise XDRError('bad switch=%s' % f_tr.type)
+                data = types.OperationResult(disc, tr=f_tr)
+            else:
+                data = types.OperationResult(disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TransactionResultCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_TransactionResultCode:
+                raise XDRError('value=%s not in enum TransactionResultCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_InnerTransactionResult(self):
+        buf = self._buf
+        try:
+            f_feeCharged = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_result = nullclass()
+            f_result.code = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_result.code not in _ENUM_TransactionResultCode:
+                raise XDRError('value=%s not in enum TransactionResultCode' % f_result.code)
+            if f_result.code in (const.txSUCCESS, const.txFAILED):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                unpack_i3 = self.unpack_OperationResult
+                f_result.results = [unpack_i3() for _ in range(n)]
+            elif f_result.code in (const.txTOO_EARLY, const.txTOO_LATE, const.txMISSING_OPERATION, const.txBAD_SEQ, const.txBAD_AUTH, const.txINSUFFICIENT_BALANCE, const.txNO_ACCOUNT, const.txINSUFFICIENT_FEE, const.txBAD_AUTH_EXTRA, const.txINTERNAL_ERROR, const.txNOT_SUPPORTED):
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_result.code)
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.InnerTransactionResult(f_feeCharged, f_result, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_InnerTransactionResultPair(self):
+        buf = self._buf
+        start = self._pos
+        self._pos = end = start + 32
+        if end > len(buf):
+            raise EOFError
+        f_transactionHash = buf[start:start + 32]
+        f_result = self.unpack_InnerTransactionResult()
+        data = types.InnerTransactionResultPair(f_transactionHash, f_result)
+        return data
+
+    def unpack_TransactionResult(self):
+        buf = self._buf
+        try:
+            f_feeCharged = _S_q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            f_result = nullclass()
+            f_result.code = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_result.code not in _ENUM_TransactionResultCode:
+                raise XDRError('value=%s not in enum TransactionResultCode' % f_result.code)
+            if f_result.code in (const.txFEE_BUMP_INNER_SUCCESS, const.txFEE_BUMP_INNER_FAILED):
+                f_result.innerResultPair = self.unpack_InnerTransactionResultPair()
+            elif f_result.code in (const.txSUCCESS, const.txFAILED):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                unpack_i3 = self.unpack_OperationResult
+                f_result.results = [unpack_i3() for _ in range(n)]
+            else:
+                pass
+            f_ext = nullclass()
+            f_ext.v = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if f_ext.v == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % f_ext.v)
+            data = types.TransactionResult(f_feeCharged, f_result, f_ext)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_ErrorCode(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_ErrorCode:
+                raise XDRError('value=%s not in enum ErrorCode' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Error(self):
+        buf = self._buf
+        try:
+            f_code = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_code not in _ENUM_ErrorCode:
+                raise XDRError('value=%s not in enum ErrorCode' % f_code)
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 100 and self.check_array:
+                raise XDRError('array length too long for f_msg')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_msg = buf[start:start + n]
+            data = types.Error(f_code, f_msg)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_AuthCert(self):
+        buf = self._buf
+        try:
+            f_pubkey = self.unpack_Curve25519Public()
+            f_expiration = _S_Q.unpack_from(buf, self._pos)[0]
+            self._pos += 8
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for f_sig')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_sig = buf[start:start + n]
+            data = types.AuthCert(f_pubkey, f_expiration, f_sig)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Hello(self):
+        buf = self._buf
+        try:
+            f_ledgerVersion, f_overlayVersion, f_overlayMinVersion = _S_III.unpack_from(buf, self._pos)
+            self._pos += 12
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_networkID = buf[start:start + 32]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 100 and self.check_array:
+                raise XDRError('array length too long for f_versionStr')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_versionStr = buf[start:start + n]
+            f_listeningPort = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            f_peerID = self.unpack_PublicKey()
+            f_cert = self.unpack_AuthCert()
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_nonce = buf[start:start + 32]
+            data = types.Hello(f_ledgerVersion, f_overlayVersion, f_overlayMinVersion, f_networkID, f_versionStr, f_listeningPort, f_peerID, f_cert, f_nonce)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_Auth(self):
+        buf = self._buf
+        try:
+            f_unused = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            data = types.Auth(f_unused)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_IPAddrType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_IPAddrType:
+                raise XDRError('value=%s not in enum IPAddrType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PeerAddress(self):
+        buf = self._buf
+        try:
+            f_ip = nullclass()
+            f_ip.type = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_ip.type not in _ENUM_IPAddrType:
+                raise XDRError('value=%s not in enum IPAddrType' % f_ip.type)
+            if f_ip.type == const.IPv4:
+                start = self._pos
+                self._pos = end = start + 4
+                if end > len(buf):
+                    raise EOFError
+                f_ip.ipv4 = buf[start:start + 4]
+            elif f_ip.type == const.IPv6:
+                start = self._pos
+                self._pos = end = start + 16
+                if end > len(buf):
+                    raise EOFError
+                f_ip.ipv6 = buf[start:start + 16]
+            else:
+                raise XDRError('bad switch=%s' % f_ip.type)
+            f_port, f_numFailures = _S_II.unpack_from(buf, self._pos)
+            self._pos += 8
+            data = types.PeerAddress(f_ip, f_port, f_numFailures)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_MessageType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_MessageType:
+                raise XDRError('value=%s not in enum MessageType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_DontHave(self):
+        buf = self._buf
+        try:
+            f_type = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_type not in _ENUM_MessageType:
+                raise XDRError('value=%s not in enum MessageType' % f_type)
+            start = self._pos
+            self._pos = end = start + 32
+            if end > len(buf):
+                raise EOFError
+            f_reqHash = buf[start:start + 32]
+            data = types.DontHave(f_type, f_reqHash)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SurveyMessageCommandType(self):
+        buf = self._buf
+        try:
+            data = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and data not in _ENUM_SurveyMessageCommandType:
+                raise XDRError('value=%s not in enum SurveyMessageCommandType' % data)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SurveyRequestMessage(self):
+        buf = self._buf
+        try:
+            f_surveyorPeerID = self.unpack_PublicKey()
+            f_surveyedPeerID = self.unpack_PublicKey()
+            f_ledgerNum = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            f_encryptionKey = self.unpack_Curve25519Public()
+            f_commandType = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_commandType not in _ENUM_SurveyMessageCommandType:
+                raise XDRError('value=%s not in enum SurveyMessageCommandType' % f_commandType)
+            data = types.SurveyRequestMessage(f_surveyorPeerID, f_surveyedPeerID, f_ledgerNum, f_encryptionKey, f_commandType)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SignedSurveyRequestMessage(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for f_requestSignature')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_requestSignature = buf[start:start + n]
+            f_request = self.unpack_SurveyRequestMessage()
+            data = types.SignedSurveyRequestMessage(f_requestSignature, f_request)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_EncryptedBody(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64000 and self.check_array:
+                raise XDRError('array length too long for data')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            data = buf[start:start + n]
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SurveyResponseMessage(self):
+        buf = self._buf
+        try:
+            f_surveyorPeerID = self.unpack_PublicKey()
+            f_surveyedPeerID = self.unpack_PublicKey()
+            f_ledgerNum = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            f_commandType = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and f_commandType not in _ENUM_SurveyMessageCommandType:
+                raise XDRError('value=%s not in enum SurveyMessageCommandType' % f_commandType)
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64000 and self.check_array:
+                raise XDRError('array length too long for f_encryptedBody')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_encryptedBody = buf[start:start + n]
+            data = types.SurveyResponseMessage(f_surveyorPeerID, f_surveyedPeerID, f_ledgerNum, f_commandType, f_encryptedBody)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SignedSurveyResponseMessage(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 64 and self.check_array:
+                raise XDRError('array length too long for f_responseSignature')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_responseSignature = buf[start:start + n]
+            f_response = self.unpack_SurveyResponseMessage()
+            data = types.SignedSurveyResponseMessage(f_responseSignature, f_response)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PeerStats(self):
+        buf = self._buf
+        try:
+            f_id = self.unpack_PublicKey()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 100 and self.check_array:
+                raise XDRError('array length too long for f_versionStr')
+            start = self._pos
+            self._pos = end = start + ((n + 3) & ~3)
+            if end > len(buf):
+                raise EOFError
+            f_versionStr = buf[start:start + n]
+            f_messagesRead, f_messagesWritten, f_bytesRead, f_bytesWritten, f_secondsConnected, f_uniqueFloodBytesRecv, f_duplicateFloodBytesRecv, f_uniqueFetchBytesRecv, f_duplicateFetchBytesRecv, f_uniqueFloodMessageRecv, f_duplicateFloodMessageRecv, f_uniqueFetchMessageRecv, f_duplicateFetchMessageRecv = _S_QQQQQQQQQQQQQ.unpack_from(buf, self._pos)
+            self._pos += 104
+            data = types.PeerStats(f_id, f_versionStr, f_messagesRead, f_messagesWritten, f_bytesRead, f_bytesWritten, f_secondsConnected, f_uniqueFloodBytesRecv, f_duplicateFloodBytesRecv, f_uniqueFetchBytesRecv, f_duplicateFetchBytesRecv, f_uniqueFloodMessageRecv, f_duplicateFloodMessageRecv, f_uniqueFetchMessageRecv, f_duplicateFetchMessageRecv)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_PeerStatList(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 25 and self.check_array:
+                raise XDRError('array length too long for data')
+            unpack_i2 = self.unpack_PeerStats
+            data = [unpack_i2() for _ in range(n)]
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_TopologyResponseBody(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 25 and self.check_array:
+                raise XDRError('array length too long for f_inboundPeers')
+            unpack_i2 = self.unpack_PeerStats
+            f_inboundPeers = [unpack_i2() for _ in range(n)]
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if n > 25 and self.check_array:
+                raise XDRError('array length too long for f_outboundPeers')
+            unpack_i2 = self.unpack_PeerStats
+            f_outboundPeers = [unpack_i2() for _ in range(n)]
+            f_totalInboundPeerCount, f_totalOutboundPeerCount = _S_II.unpack_from(buf, self._pos)
+            self._pos += 8
+            data = types.TopologyResponseBody(f_inboundPeers, f_outboundPeers, f_totalInboundPeerCount, f_totalOutboundPeerCount)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_SurveyResponseBody(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_SurveyMessageCommandType:
+                raise XDRError('value=%s not in enum SurveyMessageCommandType' % disc)
+            if disc == const.SURVEY_TOPOLOGY:
+                f_topologyResponseBody = self.unpack_TopologyResponseBody()
+                data = types.SurveyResponseBody(disc, topologyResponseBody=f_topologyResponseBody)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_StellarMessage(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if self.check_enum and disc not in _ENUM_MessageType:
+                raise XDRError('value=%s not in enum MessageType' % disc)
+            if disc == const.ERROR_MSG:
+                f_error = self.unpack_Error()
+                data = types.StellarMessage(disc, error=f_error)
+            elif disc == const.HELLO:
+                f_hello = self.unpack_Hello()
+                data = types.StellarMessage(disc, hello=f_hello)
+            elif disc == const.AUTH:
+                f_auth = self.unpack_Auth()
+                data = types.StellarMessage(disc, auth=f_auth)
+            elif disc == const.DONT_HAVE:
+                f_dontHave = self.unpack_DontHave()
+                data = types.StellarMessage(disc, dontHave=f_dontHave)
+            elif disc == const.GET_PEERS:
+                data = types.StellarMessage(disc)
+            elif disc == const.PEERS:
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if n > 100 and self.check_array:
+                    raise XDRError('array length too long for f_peers')
+                unpack_i3 = self.unpack_PeerAddress
+                f_peers = [unpack_i3() for _ in range(n)]
+                data = types.StellarMessage(disc, peers=f_peers)
+            elif disc == const.GET_TX_SET:
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_txSetHash = buf[start:start + 32]
+                data = types.StellarMessage(disc, txSetHash=f_txSetHash)
+            elif disc == const.TX_SET:
+                f_txSet = self.unpack_TransactionSet()
+                data = types.StellarMessage(disc, txSet=f_txSet)
+            elif disc == const.TRANSACTION:
+                f_transaction = self.unpack_TransactionEnvelope()
+                data = types.StellarMessage(disc, transaction=f_transaction)
+            elif disc == const.SURVEY_REQUEST:
+                f_signedSurveyRequestMessage = self.unpack_SignedSurveyRequestMessage()
+                data = types.StellarMessage(disc, signedSurveyRequestMessage=f_signedSurveyRequestMessage)
+            elif disc == const.SURVEY_RESPONSE:
+                f_signedSurveyResponseMessage = self.unpack_SignedSurveyResponseMessage()
+                data = types.StellarMessage(disc, signedSurveyResponseMessage=f_signedSurveyResponseMessage)
+            elif disc == const.GET_SCP_QUORUMSET:
+                start = self._pos
+                self._pos = end = start + 32
+                if end > len(buf):
+                    raise EOFError
+                f_qSetHash = buf[start:start + 32]
+                data = types.StellarMessage(disc, qSetHash=f_qSetHash)
+            elif disc == const.SCP_QUORUMSET:
+                f_qSet = self.unpack_SCPQuorumSet()
+                data = types.StellarMessage(disc, qSet=f_qSet)
+            elif disc == const.SCP_MESSAGE:
+                f_envelope = self.unpack_SCPEnvelope()
+                data = types.StellarMessage(disc, envelope=f_envelope)
+            elif disc == const.GET_SCP_STATE:
+                f_getSCPLedgerSeq = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                data = types.StellarMessage(disc, getSCPLedgerSeq=f_getSCPLedgerSeq)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def unpack_AuthenticatedMessage(self):
+        buf = self._buf
+        try:
+            disc = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                f_v0 = nullclass()
+                f_v0.sequence = _S_Q.unpack_from(buf, self._pos)[0]
+                self._pos += 8
+                f_v0.message = self.unpack_StellarMessage()
+                f_v0.mac = self.unpack_HmacSha256Mac()
+                data = types.AuthenticatedMessage(disc, v0=f_v0)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        return data
+
+    def skip_Hash(self):
+        buf = self._buf
+        self._pos += 32
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_uint256(self):
+        buf = self._buf
+        self._pos += 32
+        if self._pos > len(buf):
+            raise EOFError
+
+    skip_uint32 = skip_uint
+
+    skip_int32 = skip_int
+
+    skip_uint64 = skip_uhyper
+
+    skip_int64 = skip_hyper
+
+    def skip_CryptoKeyType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PublicKeyType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SignerKeyType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PublicKey(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.PUBLIC_KEY_TYPE_ED25519:
+                self._pos += 32
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SignerKey(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.SIGNER_KEY_TYPE_ED25519:
+                self._pos += 32
+            elif disc == const.SIGNER_KEY_TYPE_PRE_AUTH_TX:
+                self._pos += 32
+            elif disc == const.SIGNER_KEY_TYPE_HASH_X:
+                self._pos += 32
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Signature(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SignatureHint(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    skip_NodeID = skip_PublicKey
+
+    def skip_Curve25519Secret(self):
+        buf = self._buf
+        self._pos += 32
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Curve25519Public(self):
+        buf = self._buf
+        self._pos += 32
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_HmacSha256Key(self):
+        buf = self._buf
+        self._pos += 32
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_HmacSha256Mac(self):
+        buf = self._buf
+        self._pos += 32
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Value(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SCPBallot(self):
+        buf = self._buf
+        try:
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SCPStatementType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SCPNomination(self):
+        buf = self._buf
+        try:
+            self._pos += 32
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            for _ in range(n):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                self._pos += (n + 3) & ~3
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            for _ in range(n):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SCPStatement(self):
+        buf = self._buf
+        try:
+            self.skip_PublicKey()
+            self._pos += 8
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.SCP_ST_PREPARE:
+                self._pos += 32
+                self.skip_SCPBallot()
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                skip_i3 = self.skip_SCPBallot
+                for _ in range(n):
+                    skip_i3()
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                skip_i3 = self.skip_SCPBallot
+                for _ in range(n):
+                    skip_i3()
+                self._pos += 8
+            elif disc == const.SCP_ST_CONFIRM:
+                self.skip_SCPBallot()
+                self._pos += 44
+            elif disc == const.SCP_ST_EXTERNALIZE:
+                self.skip_SCPBallot()
+                self._pos += 36
+            elif disc == const.SCP_ST_NOMINATE:
+                self.skip_SCPNomination()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SCPEnvelope(self):
+        buf = self._buf
+        try:
+            self.skip_SCPStatement()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SCPQuorumSet(self):
+        buf = self._buf
+        try:
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_PublicKey
+            for _ in range(n):
+                skip_i2()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_SCPQuorumSet
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_UpgradeType(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_StellarValueType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerCloseValueSignature(self):
+        buf = self._buf
+        try:
+            self.skip_PublicKey()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_StellarValue(self):
+        buf = self._buf
+        try:
+            self._pos += 40
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            for _ in range(n):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                self._pos += (n + 3) & ~3
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.STELLAR_VALUE_BASIC:
+                pass
+            elif disc == const.STELLAR_VALUE_SIGNED:
+                self.skip_LedgerCloseValueSignature()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerHeader(self):
+        buf = self._buf
+        try:
+            self._pos += 36
+            self.skip_StellarValue()
+            self._pos += 108
+            n = 4
+            self._pos += n * 32
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerUpgradeType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerUpgrade(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.LEDGER_UPGRADE_VERSION:
+                self._pos += 4
+            elif disc == const.LEDGER_UPGRADE_BASE_FEE:
+                self._pos += 4
+            elif disc == const.LEDGER_UPGRADE_MAX_TX_SET_SIZE:
+                self._pos += 4
+            elif disc == const.LEDGER_UPGRADE_BASE_RESERVE:
+                self._pos += 4
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerKey(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.ACCOUNT:
+                self.skip_PublicKey()
+            elif disc == const.TRUSTLINE:
+                self.skip_PublicKey()
+                self.skip_Asset()
+            elif disc == const.OFFER:
+                self.skip_PublicKey()
+                self._pos += 8
+            elif disc == const.DATA:
+                self.skip_PublicKey()
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                self._pos += (n + 3) & ~3
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_BucketEntryType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_BucketMetadata(self):
+        buf = self._buf
+        try:
+            self._pos += 4
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_BucketEntry(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc in (const.LIVEENTRY, const.INITENTRY):
+                self.skip_LedgerEntry()
+            elif disc == const.DEADENTRY:
+                self.skip_LedgerKey()
+            elif disc == const.METAENTRY:
+                self.skip_BucketMetadata()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionSet(self):
+        buf = self._buf
+        try:
+            self._pos += 32
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_TransactionEnvelope
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionResultPair(self):
+        buf = self._buf
+        self._pos += 32
+        self.skip_TransactionResult()
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionResultSet(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_TransactionResultPair
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionHistoryEntry(self):
+        buf = self._buf
+        try:
+            self._pos += 4
+            self.skip_TransactionSet()
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionHistoryResultEntry(self):
+        buf = self._buf
+        try:
+            self._pos += 4
+            self.skip_TransactionResultSet()
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerHeaderHistoryEntry(self):
+        buf = self._buf
+        try:
+            self._pos += 32
+            self.skip_LedgerHeader()
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerSCPMessages(self):
+        buf = self._buf
+        try:
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_SCPEnvelope
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SCPHistoryEntryV0(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_SCPQuorumSet
+            for _ in range(n):
+                skip_i2()
+            self.skip_LedgerSCPMessages()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SCPHistoryEntry(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                self.skip_SCPHistoryEntryV0()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerEntryChangeType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerEntryChange(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.LEDGER_ENTRY_CREATED:
+                self.skip_LedgerEntry()
+            elif disc == const.LEDGER_ENTRY_UPDATED:
+                self.skip_LedgerEntry()
+            elif disc == const.LEDGER_ENTRY_REMOVED:
+                self.skip_LedgerKey()
+            elif disc == const.LEDGER_ENTRY_STATE:
+                self.skip_LedgerEntry()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerEntryChanges(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_LedgerEntryChange
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_OperationMeta(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_LedgerEntryChange
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionMetaV1(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_LedgerEntryChange
+            for _ in range(n):
+                skip_i2()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_OperationMeta
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionMetaV2(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_LedgerEntryChange
+            for _ in range(n):
+                skip_i2()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_OperationMeta
+            for _ in range(n):
+                skip_i2()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_LedgerEntryChange
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionMeta(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                skip_i3 = self.skip_OperationMeta
+                for _ in range(n):
+                    skip_i3()
+            elif disc == 1:
+                self.skip_TransactionMetaV1()
+            elif disc == 2:
+                self.skip_TransactionMetaV2()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionResultMeta(self):
+        buf = self._buf
+        try:
+            self.skip_TransactionResultPair()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_LedgerEntryChange
+            for _ in range(n):
+                skip_i2()
+            self.skip_TransactionMeta()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_UpgradeEntryMeta(self):
+        buf = self._buf
+        try:
+            self.skip_LedgerUpgrade()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_LedgerEntryChange
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerCloseMetaV0(self):
+        buf = self._buf
+        try:
+            self.skip_LedgerHeaderHistoryEntry()
+            self.skip_TransactionSet()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_TransactionResultMeta
+            for _ in range(n):
+                skip_i2()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_UpgradeEntryMeta
+            for _ in range(n):
+                skip_i2()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_SCPHistoryEntry
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerCloseMeta(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                self.skip_LedgerCloseMetaV0()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    skip_AccountID = skip_PublicKey
+
+    def skip_Thresholds(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_string32(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_string64(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    skip_SequenceNumber = skip_int64
+
+    skip_TimePoint = skip_uint64
+
+    def skip_DataValue(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AssetCode4(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AssetCode12(self):
+        buf = self._buf
+        self._pos += 12
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AssetType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Asset(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.ASSET_TYPE_NATIVE:
+                pass
+            elif disc == const.ASSET_TYPE_CREDIT_ALPHANUM4:
+                self._pos += 4
+                self.skip_PublicKey()
+            elif disc == const.ASSET_TYPE_CREDIT_ALPHANUM12:
+                self._pos += 12
+                self.skip_PublicKey()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Price(self):
+        buf = self._buf
+        self._pos += 8
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Liabilities(self):
+        buf = self._buf
+        self._pos += 16
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ThresholdIndexes(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerEntryType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Signer(self):
+        buf = self._buf
+        self.skip_SignerKey()
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AccountFlags(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AccountEntry(self):
+        buf = self._buf
+        try:
+            self.skip_PublicKey()
+            self._pos += 20
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_PublicKey
+            for _ in range(n):
+                skip_i2()
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_Signer
+            for _ in range(n):
+                skip_i2()
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            elif disc == 1:
+                self.skip_Liabilities()
+                disc = _S_i.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if disc == 0:
+                    pass
+                else:
+                    raise XDRError('bad switch=%s' % disc)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TrustLineFlags(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TrustLineEntry(self):
+        buf = self._buf
+        try:
+            self.skip_PublicKey()
+            self.skip_Asset()
+            self._pos += 20
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            elif disc == 1:
+                self.skip_Liabilities()
+                disc = _S_i.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if disc == 0:
+                    pass
+                else:
+                    raise XDRError('bad switch=%s' % disc)
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_OfferEntryFlags(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_OfferEntry(self):
+        buf = self._buf
+        try:
+            self.skip_PublicKey()
+            self._pos += 8
+            self.skip_Asset()
+            self.skip_Asset()
+            self._pos += 8
+            self.skip_Price()
+            self._pos += 4
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_DataEntry(self):
+        buf = self._buf
+        try:
+            self.skip_PublicKey()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_LedgerEntry(self):
+        buf = self._buf
+        try:
+            self._pos += 4
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.ACCOUNT:
+                self.skip_AccountEntry()
+            elif disc == const.TRUSTLINE:
+                self.skip_TrustLineEntry()
+            elif disc == const.OFFER:
+                self.skip_OfferEntry()
+            elif disc == const.DATA:
+                self.skip_DataEntry()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_EnvelopeType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_MuxedAccount(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.KEY_TYPE_ED25519:
+                self._pos += 32
+            elif disc == const.KEY_TYPE_MUXED_ED25519:
+                self._pos += 40
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_DecoratedSignature(self):
+        buf = self._buf
+        try:
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_OperationType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_CreateAccountOp(self):
+        buf = self._buf
+        self.skip_PublicKey()
+        self._pos += 8
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PaymentOp(self):
+        buf = self._buf
+        self.skip_MuxedAccount()
+        self.skip_Asset()
+        self._pos += 8
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PathPaymentStrictReceiveOp(self):
+        buf = self._buf
+        try:
+            self.skip_Asset()
+            self._pos += 8
+            self.skip_MuxedAccount()
+            self.skip_Asset()
+            self._pos += 8
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_Asset
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PathPaymentStrictSendOp(self):
+        buf = self._buf
+        try:
+            self.skip_Asset()
+            self._pos += 8
+            self.skip_MuxedAccount()
+            self.skip_Asset()
+            self._pos += 8
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_Asset
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageSellOfferOp(self):
+        buf = self._buf
+        self.skip_Asset()
+        self.skip_Asset()
+        self._pos += 8
+        self.skip_Price()
+        self._pos += 8
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageBuyOfferOp(self):
+        buf = self._buf
+        self.skip_Asset()
+        self.skip_Asset()
+        self._pos += 8
+        self.skip_Price()
+        self._pos += 8
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_CreatePassiveSellOfferOp(self):
+        buf = self._buf
+        self.skip_Asset()
+        self.skip_Asset()
+        self._pos += 8
+        self.skip_Price()
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SetOptionsOp(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_PublicKey
+            for _ in range(n):
+                skip_i2()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += n * 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += n * 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += n * 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += n * 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += n * 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += n * 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            for _ in range(n):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                self._pos += (n + 3) & ~3
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_Signer
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ChangeTrustOp(self):
+        buf = self._buf
+        self.skip_Asset()
+        self._pos += 8
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AllowTrustOp(self):
+        buf = self._buf
+        try:
+            self.skip_PublicKey()
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.ASSET_TYPE_CREDIT_ALPHANUM4:
+                self._pos += 4
+            elif disc == const.ASSET_TYPE_CREDIT_ALPHANUM12:
+                self._pos += 12
+            else:
+                raise XDRError('bad switch=%s' % disc)
+            self._pos += 4
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageDataOp(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            for _ in range(n):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_BumpSequenceOp(self):
+        buf = self._buf
+        self._pos += 8
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Operation(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_MuxedAccount
+            for _ in range(n):
+                skip_i2()
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.CREATE_ACCOUNT:
+                self.skip_CreateAccountOp()
+            elif disc == const.PAYMENT:
+                self.skip_PaymentOp()
+            elif disc == const.PATH_PAYMENT_STRICT_RECEIVE:
+                self.skip_PathPaymentStrictReceiveOp()
+            elif disc == const.MANAGE_SELL_OFFER:
+                self.skip_ManageSellOfferOp()
+            elif disc == const.CREATE_PASSIVE_SELL_OFFER:
+                self.skip_CreatePassiveSellOfferOp()
+            elif disc == const.SET_OPTIONS:
+                self.skip_SetOptionsOp()
+            elif disc == const.CHANGE_TRUST:
+                self.skip_ChangeTrustOp()
+            elif disc == const.ALLOW_TRUST:
+                self.skip_AllowTrustOp()
+            elif disc == const.ACCOUNT_MERGE:
+                self.skip_MuxedAccount()
+            elif disc == const.INFLATION:
+                pass
+            elif disc == const.MANAGE_DATA:
+                self.skip_ManageDataOp()
+            elif disc == const.BUMP_SEQUENCE:
+                self.skip_BumpSequenceOp()
+            elif disc == const.MANAGE_BUY_OFFER:
+                self.skip_ManageBuyOfferOp()
+            elif disc == const.PATH_PAYMENT_STRICT_SEND:
+                self.skip_PathPaymentStrictSendOp()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_MemoType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Memo(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.MEMO_NONE:
+                pass
+            elif disc == const.MEMO_TEXT:
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                self._pos += (n + 3) & ~3
+            elif disc == const.MEMO_ID:
+                self._pos += 8
+            elif disc == const.MEMO_HASH:
+                self._pos += 32
+            elif disc == const.MEMO_RETURN:
+                self._pos += 32
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TimeBounds(self):
+        buf = self._buf
+        self._pos += 16
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionV0(self):
+        buf = self._buf
+        try:
+            self._pos += 44
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_TimeBounds
+            for _ in range(n):
+                skip_i2()
+            self.skip_Memo()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_Operation
+            for _ in range(n):
+                skip_i2()
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionV0Envelope(self):
+        buf = self._buf
+        try:
+            self.skip_TransactionV0()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_DecoratedSignature
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Transaction(self):
+        buf = self._buf
+        try:
+            self.skip_MuxedAccount()
+            self._pos += 12
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_TimeBounds
+            for _ in range(n):
+                skip_i2()
+            self.skip_Memo()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_Operation
+            for _ in range(n):
+                skip_i2()
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionV1Envelope(self):
+        buf = self._buf
+        try:
+            self.skip_Transaction()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_DecoratedSignature
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_FeeBumpTransaction(self):
+        buf = self._buf
+        try:
+            self.skip_MuxedAccount()
+            self._pos += 8
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.ENVELOPE_TYPE_TX:
+                self.skip_TransactionV1Envelope()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_FeeBumpTransactionEnvelope(self):
+        buf = self._buf
+        try:
+            self.skip_FeeBumpTransaction()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_DecoratedSignature
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionEnvelope(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.ENVELOPE_TYPE_TX_V0:
+                self.skip_TransactionV0Envelope()
+            elif disc == const.ENVELOPE_TYPE_TX:
+                self.skip_TransactionV1Envelope()
+            elif disc == const.ENVELOPE_TYPE_TX_FEE_BUMP:
+                self.skip_FeeBumpTransactionEnvelope()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionSignaturePayload(self):
+        buf = self._buf
+        try:
+            self._pos += 32
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.ENVELOPE_TYPE_TX:
+                self.skip_Transaction()
+            elif disc == const.ENVELOPE_TYPE_TX_FEE_BUMP:
+                self.skip_FeeBumpTransaction()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ClaimOfferAtom(self):
+        buf = self._buf
+        self.skip_PublicKey()
+        self._pos += 8
+        self.skip_Asset()
+        self._pos += 8
+        self.skip_Asset()
+        self._pos += 8
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_CreateAccountResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_CreateAccountResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.CREATE_ACCOUNT_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PaymentResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PaymentResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.PAYMENT_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PathPaymentStrictReceiveResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SimplePaymentResult(self):
+        buf = self._buf
+        self.skip_PublicKey()
+        self.skip_Asset()
+        self._pos += 8
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PathPaymentStrictReceiveResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.PATH_PAYMENT_STRICT_RECEIVE_SUCCESS:
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                skip_i3 = self.skip_ClaimOfferAtom
+                for _ in range(n):
+                    skip_i3()
+                self.skip_SimplePaymentResult()
+            elif disc == const.PATH_PAYMENT_STRICT_RECEIVE_NO_ISSUER:
+                self.skip_Asset()
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PathPaymentStrictSendResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PathPaymentStrictSendResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.PATH_PAYMENT_STRICT_SEND_SUCCESS:
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                skip_i3 = self.skip_ClaimOfferAtom
+                for _ in range(n):
+                    skip_i3()
+                self.skip_SimplePaymentResult()
+            elif disc == const.PATH_PAYMENT_STRICT_SEND_NO_ISSUER:
+                self.skip_Asset()
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageSellOfferResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageOfferEffect(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageOfferSuccessResult(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_ClaimOfferAtom
+            for _ in range(n):
+                skip_i2()
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc in (const.MANAGE_OFFER_CREATED, const.MANAGE_OFFER_UPDATED):
+                self.skip_OfferEntry()
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageSellOfferResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.MANAGE_SELL_OFFER_SUCCESS:
+                self.skip_ManageOfferSuccessResult()
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageBuyOfferResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageBuyOfferResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.MANAGE_BUY_OFFER_SUCCESS:
+                self.skip_ManageOfferSuccessResult()
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SetOptionsResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SetOptionsResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.SET_OPTIONS_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ChangeTrustResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ChangeTrustResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.CHANGE_TRUST_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AllowTrustResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AllowTrustResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.ALLOW_TRUST_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AccountMergeResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AccountMergeResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.ACCOUNT_MERGE_SUCCESS:
+                self._pos += 8
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_InflationResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_InflationPayout(self):
+        buf = self._buf
+        self.skip_PublicKey()
+        self._pos += 8
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_InflationResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.INFLATION_SUCCESS:
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                skip_i3 = self.skip_InflationPayout
+                for _ in range(n):
+                    skip_i3()
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageDataResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ManageDataResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.MANAGE_DATA_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_BumpSequenceResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_BumpSequenceResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.BUMP_SEQUENCE_SUCCESS:
+                pass
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_OperationResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_OperationResult(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.opINNER:
+                disc = _S_i.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                if disc == const.CREATE_ACCOUNT:
+                    self.skip_CreateAccountResult()
+                elif disc == const.PAYMENT:
+                    self.skip_PaymentResult()
+                elif disc == const.PATH_PAYMENT_STRICT_RECEIVE:
+                    self.skip_PathPaymentStrictReceiveResult()
+                elif disc == const.MANAGE_SELL_OFFER:
+                    self.skip_ManageSellOfferResult()
+                elif disc == const.CREATE_PASSIVE_SELL_OFFER:
+                    self.skip_ManageSellOfferResult()
+                elif disc == const.SET_OPTIONS:
+                    self.skip_SetOptionsResult()
+                elif disc == const.CHANGE_TRUST:
+                    self.skip_ChangeTrustResult()
+                elif disc == const.ALLOW_TRUST:
+                    self.skip_AllowTrustResult()
+                elif disc == const.ACCOUNT_MERGE:
+                    self.skip_AccountMergeResult()
+                elif disc == const.INFLATION:
+                    self.skip_InflationResult()
+                elif disc == const.MANAGE_DATA:
+                    self.skip_ManageDataResult()
+                elif disc == const.BUMP_SEQUENCE:
+                    self.skip_BumpSequenceResult()
+                elif disc == const.MANAGE_BUY_OFFER:
+                    self.skip_ManageBuyOfferResult()
+                elif disc == const.PATH_PAYMENT_STRICT_SEND:
+                    self.skip_PathPaymentStrictSendResult()
+                else:
+                    raise XDRError('bad switch=%s' % disc)
+            else:
+                pass
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionResultCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_InnerTransactionResult(self):
+        buf = self._buf
+        try:
+            self._pos += 8
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc in (const.txSUCCESS, const.txFAILED):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                skip_i3 = self.skip_OperationResult
+                for _ in range(n):
+                    skip_i3()
+            elif disc in (const.txTOO_EARLY, const.txTOO_LATE, const.txMISSING_OPERATION, const.txBAD_SEQ, const.txBAD_AUTH, const.txINSUFFICIENT_BALANCE, const.txNO_ACCOUNT, const.txINSUFFICIENT_FEE, const.txBAD_AUTH_EXTRA, const.txINTERNAL_ERROR, const.txNOT_SUPPORTED):
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_InnerTransactionResultPair(self):
+        buf = self._buf
+        self._pos += 32
+        self.skip_InnerTransactionResult()
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TransactionResult(self):
+        buf = self._buf
+        try:
+            self._pos += 8
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc in (const.txFEE_BUMP_INNER_SUCCESS, const.txFEE_BUMP_INNER_FAILED):
+                self.skip_InnerTransactionResultPair()
+            elif disc in (const.txSUCCESS, const.txFAILED):
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                skip_i3 = self.skip_OperationResult
+                for _ in range(n):
+                    skip_i3()
+            else:
+                pass
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                pass
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_ErrorCode(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Error(self):
+        buf = self._buf
+        try:
+            self._pos += 4
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AuthCert(self):
+        buf = self._buf
+        try:
+            self.skip_Curve25519Public()
+            self._pos += 8
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Hello(self):
+        buf = self._buf
+        try:
+            self._pos += 44
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+            self._pos += 4
+            self.skip_PublicKey()
+            self.skip_AuthCert()
+            self._pos += 32
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_Auth(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_IPAddrType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PeerAddress(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.IPv4:
+                self._pos += 4
+            elif disc == const.IPv6:
+                self._pos += 16
+            else:
+                raise XDRError('bad switch=%s' % disc)
+            self._pos += 8
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_MessageType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_DontHave(self):
+        buf = self._buf
+        self._pos += 36
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SurveyMessageCommandType(self):
+        buf = self._buf
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SurveyRequestMessage(self):
+        buf = self._buf
+        self.skip_PublicKey()
+        self.skip_PublicKey()
+        self._pos += 4
+        self.skip_Curve25519Public()
+        self._pos += 4
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SignedSurveyRequestMessage(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+            self.skip_SurveyRequestMessage()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_EncryptedBody(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SurveyResponseMessage(self):
+        buf = self._buf
+        try:
+            self.skip_PublicKey()
+            self.skip_PublicKey()
+            self._pos += 8
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SignedSurveyResponseMessage(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+            self.skip_SurveyResponseMessage()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PeerStats(self):
+        buf = self._buf
+        try:
+            self.skip_PublicKey()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            self._pos += (n + 3) & ~3
+            self._pos += 104
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_PeerStatList(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_PeerStats
+            for _ in range(n):
+                skip_i2()
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_TopologyResponseBody(self):
+        buf = self._buf
+        try:
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_PeerStats
+            for _ in range(n):
+                skip_i2()
+            n = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            skip_i2 = self.skip_PeerStats
+            for _ in range(n):
+                skip_i2()
+            self._pos += 8
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_SurveyResponseBody(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.SURVEY_TOPOLOGY:
+                self.skip_TopologyResponseBody()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_StellarMessage(self):
+        buf = self._buf
+        try:
+            disc = _S_i.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == const.ERROR_MSG:
+                self.skip_Error()
+            elif disc == const.HELLO:
+                self.skip_Hello()
+            elif disc == const.AUTH:
+                self.skip_Auth()
+            elif disc == const.DONT_HAVE:
+                self.skip_DontHave()
+            elif disc == const.GET_PEERS:
+                pass
+            elif disc == const.PEERS:
+                n = _S_I.unpack_from(buf, self._pos)[0]
+                self._pos += 4
+                skip_i3 = self.skip_PeerAddress
+                for _ in range(n):
+                    skip_i3()
+            elif disc == const.GET_TX_SET:
+                self._pos += 32
+            elif disc == const.TX_SET:
+                self.skip_TransactionSet()
+            elif disc == const.TRANSACTION:
+                self.skip_TransactionEnvelope()
+            elif disc == const.SURVEY_REQUEST:
+                self.skip_SignedSurveyRequestMessage()
+            elif disc == const.SURVEY_RESPONSE:
+                self.skip_SignedSurveyResponseMessage()
+            elif disc == const.GET_SCP_QUORUMSET:
+                self._pos += 32
+            elif disc == const.SCP_QUORUMSET:
+                self.skip_SCPQuorumSet()
+            elif disc == const.SCP_MESSAGE:
+                self.skip_SCPEnvelope()
+            elif disc == const.GET_SCP_STATE:
+                self._pos += 4
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
+    def skip_AuthenticatedMessage(self):
+        buf = self._buf
+        try:
+            disc = _S_I.unpack_from(buf, self._pos)[0]
+            self._pos += 4
+            if disc == 0:
+                self._pos += 8
+                self.skip_StellarMessage()
+                self.skip_HmacSha256Mac()
+            else:
+                raise XDRError('bad switch=%s' % disc)
+        except struct.error:
+            raise EOFError from None
+        if self._pos > len(buf):
+            raise EOFError
+
@@ -1,8 +1,16 @@
-# Generated by xdrgen.py from ../../.xdr/ on Sun Apr 19 10:58:36 2020
+# Generated by xdrgen.py from ../../.xdr/ on Fri Oct 16 20:26:47 2026
 import base64
+import os
 
 from . import StellarXDR_const as const
-from . import StellarXDR_pack as pack
+
+# The codec backend is chosen once, at import time. The default is the
+# specialized StellarXDR_fastpack module, set STELLAR_SDK_XDR_BACKEND=xdrlib to use
+# the xdrlib based StellarXDR_pack module instead.
+if os.environ.get("STELLAR_SDK_XDR_BACKEND") == "xdrlib":
+    from . import StellarXDR_pack as pack
+else:
+    from . import StellarXDR_fastpack as pack
 class PublicKey:
     # XDR definition:
     # union PublicKey switch(PublicKeyType type) {
@@ -1 +1,3 @@
-from . import StellarXDR_pack as Xdr
+# Xdr is whichever codec backend StellarXDR_type selected at import time,
+# see STELLAR_SDK_XDR_BACKEND.
+from .StellarXDR_type import pack as Xdr
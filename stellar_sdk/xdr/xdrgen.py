@@ -2,6 +2,7 @@
 from __future__ import print_function
 
 import os
+import struct
 import sys
 import time
 
@@ -1495,6 +1496,516 @@ class type_info(Info):
         return pack + limit
 
 
+##########################################################################
+#                                                                        #
+#                          Fast backend                                  #
+#                                                                        #
+##########################################################################
+#
+# The fast backend packs and unpacks exactly the same wire format as the
+# xdrlib based classes above, but it is specialized at generation time:
+# typedefs are resolved, runs of scalar struct members are fused into one
+# precompiled struct.Struct, enum values are checked against module level
+# frozensets and no filter hooks are emitted.
+
+fast_scalar_formats = {
+    "int": "i",
+    "uint": "I",
+    "unsigned": "I",
+    "hyper": "q",
+    "uhyper": "Q",
+    "float": "f",
+    "double": "d",
+    "quadruple": "d",
+}
+
+
+def fast_struct(fmt):
+    """Returns the name of the module level struct.Struct for fmt"""
+    if fmt not in fast_structs:
+        fast_structs[fmt] = "_S_%s" % fmt
+    return fast_structs[fmt]
+
+
+def fast_enum(info):
+    """Returns the name of the module level frozenset of info's values"""
+    name = "_ENUM_%s" % info.id
+    fast_enums[name] = ["const.%s" % l.id for l in info.body]
+    return name
+
+
+def fast_value(value):
+    """Put 'const.' in front if needed"""
+    if value[0].isdigit() or value[0] == '-':
+        return value
+    return "const." + value
+
+
+def fast_int(value):
+    """Returns the integer value of a constant or a constant name"""
+    while not (value[0].isdigit() or value[0] == '-'):
+        value = name_dict[value].value
+    return int(value.rstrip('L'), 0)
+
+
+def fast_resolve(decl):
+    """Follow plain typedefs until reaching a primitive, an array or a
+    named enum, struct or union"""
+    while not decl.array and decl.type in name_dict:
+        info = name_dict[decl.type]
+        if not isinstance(info, type_info):
+            break
+        decl = info
+    return decl
+
+
+def fast_scalar(decl):
+    """Returns the struct format character of decl, or None"""
+    decl = fast_resolve(decl)
+    if decl.array:
+        return None
+    return fast_scalar_formats.get(decl.type)
+
+
+def fast_level(prefix):
+    return len(prefix) // INDENT
+
+
+def fast_element(decl):
+    element = type_info(decl.type, decl.lineno)
+    element.id = decl.id
+    return element
+
+
+def fast_pack(decl, data, prefix):
+    decl = fast_resolve(decl)
+    if decl.type == 'void':
+        return "%spass\n" % prefix
+    if decl.array:
+        return fast_pack_array(decl, data, prefix)
+    fmt = fast_scalar_formats.get(decl.type)
+    if fmt is not None:
+        return "%sbuf += %s.pack(%s)\n" % (prefix, fast_struct(fmt), data)
+    if decl.type == 'bool':
+        return "%sbuf += _TRUE if %s else _FALSE\n" % (prefix, data)
+    info = name_dict.get(decl.type)
+    if isinstance(info, enum_info):
+        return fast_pack_enum(info, data, prefix)
+    if isinstance(info, (struct_info, union_info)):
+        return "%sself.pack_%s(%s)\n" % (prefix, info.id, data)
+    if decl.type == 'struct':
+        return fast_pack_struct(decl.body, data, prefix)
+    if decl.type == 'union':
+        return fast_pack_union(decl.body, data, prefix)
+    raise NotImplementedError("fast backend can't pack %s" % decl)
+
+
+def fast_pack_enum(info, data, prefix):
+    return "%sif self.check_enum and %s not in %s:\n" \
+           "%s%sraise XDRError('value=%%s not in enum %s' %% %s)\n" \
+           "%sbuf += %s.pack(%s)\n" % \
+           (prefix, data, fast_enum(info), prefix, indent, info.id, data,
+            prefix, fast_struct('i'), data)
+
+
+def fast_pack_struct(body, data, prefix):
+    out = ''
+    run = []
+    for decl in body + [None]:
+        fmt = decl is not None and fast_scalar(decl)
+        if fmt:
+            run.append((fmt, "%s.%s" % (data, decl.id)))
+            continue
+        if run:
+            out += "%sbuf += %s.pack(%s)\n" % \
+                   (prefix, fast_struct(''.join(r[0] for r in run)),
+                    ', '.join(r[1] for r in run))
+            run = []
+        if decl is not None:
+            out += fast_pack(decl, "%s.%s" % (data, decl.id), prefix)
+    return out
+
+
+def fast_cases(switch, cases, prefix, first):
+    values = [fast_value(c) for c in cases]
+    if len(values) == 1:
+        cond = "%s == %s" % (switch, values[0])
+    else:
+        cond = "%s in (%s)" % (switch, ', '.join(values))
+    return "%s%s %s:\n" % (prefix, first, cond)
+
+
+def fast_pack_union(body, data, prefix):
+    switch = body[0].declarations[0]
+    disc = "%s.%s" % (data, switch.id)
+    out = fast_pack(switch, disc, prefix)
+    first = 'if'
+    for l in body[1:-1]:
+        out += fast_cases(disc, l.cases, prefix, first)
+        out += ''.join([fast_pack(d, "%s.%s" % (data, d.id), prefix + indent)
+                        for d in l.declarations])
+        first = 'elif'
+    default = body[-1].declarations
+    out += "%selse:\n" % prefix
+    if default:
+        out += fast_pack(default[0], "%s.%s" % (data, default[0].id),
+                         prefix + indent)
+    else:
+        out += "%s%sraise XDRError('bad switch=%%s' %% %s)\n" % \
+               (prefix, indent, disc)
+    return out
+
+
+def fast_pack_array(decl, data, prefix):
+    level = fast_level(prefix)
+    if decl.type in ('opaque', 'string') and decl.fixed:
+        size = fast_int(decl.len)
+        pad = -size % 4
+        fmt = "%ds%dx" % (size, pad) if pad else "%ds" % size
+        return "%sbuf += %s.pack(%s)\n" % (prefix, fast_struct(fmt), data)
+    value = "v%d" % level
+    out = "%s%s = %s\n" % (prefix, value, data)
+    if decl.fixed:
+        out += "%sif len(%s) != %s:\n" \
+               "%s%sraise ValueError('wrong array size')\n" % \
+               (prefix, value, fast_value(decl.len), prefix, indent)
+    else:
+        if decl.len is not None:
+            out += "%sif len(%s) > %s and self.check_array:\n" \
+                   "%s%sraise XDRError('array length too long for %s')\n" % \
+                   (prefix, value, fast_value(decl.len), prefix, indent, data)
+        out += "%sbuf += %s.pack(len(%s))\n" % \
+               (prefix, fast_struct('I'), value)
+    if decl.type in ('opaque', 'string'):
+        return out + "%sbuf += %s\n%sbuf += _PAD[len(%s) & 3]\n" % \
+               (prefix, value, prefix, value)
+    element = fast_resolve(fast_element(decl))
+    info = name_dict.get(element.type)
+    item = "i%d" % level
+    if not element.array and isinstance(info, (struct_info, union_info)):
+        out += "%spack_%s = self.pack_%s\n" % (prefix, item, info.id)
+        return out + "%sfor %s in %s:\n%s%spack_%s(%s)\n" % \
+               (prefix, item, value, prefix, indent, item, item)
+    return out + "%sfor %s in %s:\n" % (prefix, item, value) + \
+           fast_pack(element, item, prefix + indent)
+
+
+def fast_unpack(decl, target, prefix):
+    decl = fast_resolve(decl)
+    if decl.type == 'void':
+        return "%spass\n" % prefix
+    if decl.array:
+        return fast_unpack_array(decl, target, prefix)
+    fmt = fast_scalar_formats.get(decl.type)
+    if fmt is not None:
+        return "%s%s = %s.unpack_from(buf, self._pos)[0]\n" \
+               "%sself._pos += %d\n" % \
+               (prefix, target, fast_struct(fmt), prefix, struct.calcsize('>' + fmt))
+    if decl.type == 'bool':
+        return "%s%s = %s.unpack_from(buf, self._pos)[0] != 0\n" \
+               "%sself._pos += 4\n" % (prefix, target, fast_struct('i'), prefix)
+    info = name_dict.get(decl.type)
+    if isinstance(info, enum_info):
+        return fast_unpack_enum(info, target, prefix)
+    if isinstance(info, (struct_info, union_info)):
+        return "%s%s = self.unpack_%s()\n" % (prefix, target, info.id)
+    if decl.type == 'struct':
+        return "%s%s = nullclass()\n" % (prefix, target) + \
+               fast_unpack_struct(decl.body, target + '.%s', prefix)
+    if decl.type == 'union':
+        return "%s%s = nullclass()\n" % (prefix, target) + \
+               fast_unpack_union(decl.body, target, prefix)
+    raise NotImplementedError("fast backend can't unpack %s" % decl)
+
+
+def fast_unpack_enum(info, target, prefix):
+    return "%s%s = %s.unpack_from(buf, self._pos)[0]\n" \
+           "%sself._pos += 4\n" \
+           "%sif self.check_enum and %s not in %s:\n" \
+           "%s%sraise XDRError('value=%%s not in enum %s' %% %s)\n" % \
+           (prefix, target, fast_struct('i'), prefix,
+            prefix, target, fast_enum(info), prefix, indent, info.id, target)
+
+
+def fast_unpack_struct(body, target, prefix):
+    """target is a format string which turns a member id into an lvalue"""
+    out = ''
+    run = []
+    for decl in body + [None]:
+        fmt = decl is not None and fast_scalar(decl)
+        if fmt:
+            run.append((fmt, target % decl.id))
+            continue
+        if len(run) == 1:
+            out += "%s%s = %s.unpack_from(buf, self._pos)[0]\n" \
+                   "%sself._pos += %d\n" % \
+                   (prefix, run[0][1], fast_struct(run[0][0]), prefix,
+                    struct.calcsize('>' + run[0][0]))
+        elif run:
+            fmt = ''.join(r[0] for r in run)
+            out += "%s%s = %s.unpack_from(buf, self._pos)\n" \
+                   "%sself._pos += %d\n" % \
+                   (prefix, ', '.join(r[1] for r in run), fast_struct(fmt),
+                    prefix, struct.calcsize('>' + fmt))
+        run = []
+        if decl is not None:
+            out += fast_unpack(decl, target % decl.id, prefix)
+    return out
+
+
+def fast_unpack_union(body, target, prefix, classname=None):
+    """Unpacks into the attributes of target, or, when classname is given,
+    binds target to a new classname instance built from the active arm"""
+    switch = body[0].declarations[0]
+    if classname is None:
+        disc = "%s.%s" % (target, switch.id)
+    else:
+        disc = 'disc'
+    out = fast_unpack(switch, disc, prefix)
+
+    def arm(decls, prefix):
+        if classname is None:
+            return ''.join([fast_unpack(d, "%s.%s" % (target, d.id), prefix)
+                            for d in decls])
+        decls = [d for d in decls if d.type != 'void']
+        if not decls:
+            return "%s%s = %s(disc)\n" % (prefix, target, classname)
+        value = "f_%s" % decls[0].id
+        return fast_unpack(decls[0], value, prefix) + \
+               "%s%s = %s(disc, %s=%s)\n" % \
+               (prefix, target, classname, decls[0].id, value)
+
+    first = 'if'
+    for l in body[1:-1]:
+        out += fast_cases(disc, l.cases, prefix, first)
+        out += arm(l.declarations, prefix + indent)
+        first = 'elif'
+    default = body[-1].declarations
+    out += "%selse:\n" % prefix
+    if default:
+        out += arm(default, prefix + indent)
+    else:
+        out += "%s%sraise XDRError('bad switch=%%s' %% %s)\n" % \
+               (prefix, indent, disc)
+    return out
+
+
+def fast_unpack_array(decl, target, prefix):
+    level = fast_level(prefix)
+    if decl.type in ('opaque', 'string') and decl.fixed:
+        # Sliced rather than unpacked with "%ds" so that a memoryview
+        # buffer yields memoryview fields.
+        size = fast_int(decl.len)
+        return "%sstart = self._pos\n" \
+               "%sself._pos = end = start + %d\n" \
+               "%sif end > len(buf):\n" \
+               "%s%sraise EOFError\n" \
+               "%s%s = buf[start:start + %d]\n" % \
+               (prefix, prefix, size + (-size % 4), prefix, prefix, indent,
+                prefix, target, size)
+    if decl.fixed:
+        out = "%sn = %s\n" % (prefix, fast_value(decl.len))
+    else:
+        out = "%sn = %s.unpack_from(buf, self._pos)[0]\n" \
+              "%sself._pos += 4\n" % (prefix, fast_struct('I'), prefix)
+        if decl.len is not None:
+            out += "%sif n > %s and self.check_array:\n" \
+                   "%s%sraise XDRError('array length too long for %s')\n" % \
+                   (prefix, fast_value(decl.len), prefix, indent, target)
+    if decl.type in ('opaque', 'string'):
+        return out + "%sstart = self._pos\n" \
+                     "%sself._pos = end = start + ((n + 3) & ~3)\n" \
+                     "%sif end > len(buf):\n" \
+                     "%s%sraise EOFError\n" \
+                     "%s%s = buf[start:start + n]\n" % \
+               (prefix, prefix, prefix, prefix, indent, prefix, target)
+    element = fast_resolve(fast_element(decl))
+    info = name_dict.get(element.type)
+    item = "i%d" % level
+    if not element.array and isinstance(info, (struct_info, union_info)):
+        out += "%sunpack_%s = self.unpack_%s\n" % (prefix, item, info.id)
+        return out + "%s%s = [unpack_%s() for _ in range(n)]\n" % \
+               (prefix, target, item)
+    items = "l%d" % level
+    return out + "%s%s = []\n" % (prefix, items) + \
+           "%sfor _ in range(n):\n" % prefix + \
+           fast_unpack(element, item, prefix + indent) + \
+           "%s%s%s.append(%s)\n" % (prefix, indent, items, item) + \
+           "%s%s = %s\n" % (prefix, target, items)
+
+
+def fast_method(header, body, error):
+    """Wraps body so that struct errors surface as error"""
+    if '_S_' not in body:
+        return header + body
+    body = ''.join([indent + line + '\n' for line in body.splitlines()])
+    target = " as e" if "e.args" in error else ""
+    return "%s%stry:\n%s%sexcept struct.error%s:\n%s%sraise %s\n" % \
+           (header, indent2, body, indent2, target, indent2, indent, error)
+
+
+def fast_pack_output(info):
+    if isinstance(info, const_info):
+        return None
+    if isinstance(info, type_info) and not info.array:
+        return "%spack_%s = pack_%s\n" % (indent, info.id, info.type)
+    header = "%sdef pack_%s(self, data):\n%sbuf = self._buf\n" % \
+             (indent, info.id, indent2)
+    if isinstance(info, type_info):
+        body = fast_pack_array(info, 'data', indent2)
+    elif isinstance(info, enum_info):
+        body = fast_pack_enum(info, 'data', indent2)
+    elif isinstance(info, struct_info):
+        body = fast_pack_struct(info.body, 'data', indent2)
+    else:
+        body = fast_pack_union(info.body, 'data', indent2)
+    return fast_method(header, body, "ConversionError(e.args[0]) from None")
+
+
+def fast_unpack_output(info):
+    if isinstance(info, const_info):
+        return None
+    if isinstance(info, type_info) and not info.array:
+        return "%sunpack_%s = unpack_%s\n" % (indent, info.id, info.type)
+    header = "%sdef unpack_%s(self):\n%sbuf = self._buf\n" % \
+             (indent, info.id, indent2)
+    if isinstance(info, type_info):
+        body = fast_unpack_array(info, 'data', indent2)
+    elif isinstance(info, enum_info):
+        body = fast_unpack_enum(info, 'data', indent2)
+    elif isinstance(info, struct_info):
+        varlist = [l.id for l in info.body if l.type != 'void']
+        body = fast_unpack_struct(info.body, 'f_%s', indent2) + \
+               "%sdata = types.%s(%s)\n" % \
+               (indent2, info.id, ', '.join(['f_%s' % v for v in varlist]))
+    else:
+        body = fast_unpack_union(info.body, 'data', indent2,
+                                 "types.%s" % info.id)
+    return fast_method(header, body, "EOFError from None") + \
+           "%sreturn data\n" % indent2
+
+
+def fast_skip(decl, prefix):
+    """Advances the position past decl without building any object"""
+    decl = fast_resolve(decl)
+    if decl.type == 'void':
+        return "%spass\n" % prefix
+    if decl.array:
+        return fast_skip_array(decl, prefix)
+    fmt = fast_scalar(decl)
+    if fmt is not None:
+        return "%sself._pos += %d\n" % (prefix, struct.calcsize('>' + fmt))
+    info = name_dict.get(decl.type)
+    if decl.type == 'bool' or isinstance(info, enum_info):
+        return "%sself._pos += 4\n" % prefix
+    if isinstance(info, (struct_info, union_info)):
+        return "%sself.skip_%s()\n" % (prefix, info.id)
+    if decl.type == 'struct':
+        return fast_skip_struct(decl.body, prefix)
+    if decl.type == 'union':
+        return fast_skip_union(decl.body, prefix)
+    raise NotImplementedError("fast backend can't skip %s" % decl)
+
+
+def fast_skip_size(decl):
+    """Returns the encoded size of decl if it is fixed, else None"""
+    decl = fast_resolve(decl)
+    if decl.array:
+        if decl.type in ('opaque', 'string') and decl.fixed:
+            size = fast_int(decl.len)
+            return size + (-size % 4)
+        return None
+    fmt = fast_scalar(decl)
+    if fmt is not None:
+        return struct.calcsize('>' + fmt)
+    if decl.type == 'bool' or isinstance(name_dict.get(decl.type), enum_info):
+        return 4
+    return None
+
+
+def fast_skip_struct(body, prefix):
+    out = ''
+    size = 0
+    for decl in body + [None]:
+        fixed = decl is not None and fast_skip_size(decl)
+        if fixed:
+            size += fixed
+            continue
+        if size:
+            out += "%sself._pos += %d\n" % (prefix, size)
+        size = 0
+        if decl is not None:
+            out += fast_skip(decl, prefix)
+    return out or "%spass\n" % prefix
+
+
+def fast_skip_union(body, prefix):
+    switch = body[0].declarations[0]
+    fmt = fast_scalar(switch) or 'i'
+    out = "%sdisc = %s.unpack_from(buf, self._pos)[0]\n" \
+          "%sself._pos += 4\n" % (prefix, fast_struct(fmt), prefix)
+    first = 'if'
+    for l in body[1:-1]:
+        out += fast_cases('disc', l.cases, prefix, first)
+        out += fast_skip_struct(l.declarations, prefix + indent)
+        first = 'elif'
+    default = body[-1].declarations
+    out += "%selse:\n" % prefix
+    if default:
+        out += fast_skip_struct(default, prefix + indent)
+    else:
+        out += "%s%sraise XDRError('bad switch=%%s' %% disc)\n" % \
+               (prefix, indent)
+    return out
+
+
+def fast_skip_array(decl, prefix):
+    level = fast_level(prefix)
+    if decl.type in ('opaque', 'string') and decl.fixed:
+        return "%sself._pos += %d\n" % (prefix, fast_skip_size(decl))
+    if decl.fixed:
+        out = "%sn = %s\n" % (prefix, fast_value(decl.len))
+    else:
+        out = "%sn = %s.unpack_from(buf, self._pos)[0]\n" \
+              "%sself._pos += 4\n" % (prefix, fast_struct('I'), prefix)
+    if decl.type in ('opaque', 'string'):
+        return out + "%sself._pos += (n + 3) & ~3\n" % prefix
+    element = fast_resolve(fast_element(decl))
+    size = fast_skip_size(element)
+    if size is not None:
+        return out + "%sself._pos += n * %d\n" % (prefix, size)
+    info = name_dict.get(element.type)
+    item = "i%d" % level
+    if not element.array and isinstance(info, (struct_info, union_info)):
+        out += "%sskip_%s = self.skip_%s\n" % (prefix, item, info.id)
+        return out + "%sfor _ in range(n):\n%s%sskip_%s()\n" % \
+               (prefix, prefix, indent, item)
+    return out + "%sfor _ in range(n):\n" % prefix + \
+           fast_skip(element, prefix + indent)
+
+
+def fast_skip_output(info):
+    if isinstance(info, const_info):
+        return None
+    if isinstance(info, type_info) and not info.array:
+        return "%sskip_%s = skip_%s\n" % (indent, info.id, info.type)
+    header = "%sdef skip_%s(self):\n%sbuf = self._buf\n" % \
+             (indent, info.id, indent2)
+    if isinstance(info, type_info):
+        body = fast_skip_array(info, indent2)
+    elif isinstance(info, enum_info):
+        body = "%sself._pos += 4\n" % indent2
+    elif isinstance(info, struct_info):
+        body = fast_skip_struct(info.body, indent2)
+    else:
+        body = fast_skip_union(info.body, indent2)
+    # The lengths are not read when all the sizes are fixed, an overrun is
+    # only detected here.
+    return fast_method(header, body, "EOFError from None") + \
+           "%sif self._pos > len(buf):\n%s%sraise EOFError\n" % \
+           (indent2, indent2, indent)
+
+
 ##########################################################################
 #                                                                        #
 #                          Main Loop                                     #
@@ -1508,6 +2019,8 @@ use_filters = True  # Option which causes hooks to be generated which
 allow_attr_passthrough = True  # Option which allows substructure attrs to
 # be referenced directly, in cases where there
 # is a unique substructure to search.
+fast_structs = {}  # struct format -> name of its precompiled struct.Struct
+fast_enums = {}  # frozenset name -> list of enum values
 pack_header = """\
 from . import %s as const
 from . import %s as types
@@ -1563,15 +2076,246 @@ unpacker_start = ''.join([
     for k, v in known_basics.items()
 ])
 
+type_header = """\
+import base64
+import os
+
+from . import %s as const
+
+# The codec backend is chosen once, at import time. The default is the
+# specialized %s module, set %s=xdrlib to use
+# the xdrlib based %s module instead.
+if os.environ.get("%s") == "xdrlib":
+    from . import %s as pack
+else:
+    from . import %s as pack
+"""
 
-def run(infile, filters=True, pass_attrs=True, debug=False):
+backend_env = "STELLAR_SDK_XDR_BACKEND"
+
+fastpack_header = """\
+import struct
+
+from . import %s as const
+from . import %s as types
+
+
+class XDRError(Exception):
+    pass
+
+
+class ConversionError(XDRError):
+    pass
+
+
+class nullclass(object):
+    pass
+
+
+_TRUE = b"\\0\\0\\0\\1"
+_FALSE = b"\\0\\0\\0\\0"
+_PAD = (b"", b"\\0\\0\\0", b"\\0\\0", b"\\0")
+
+"""
+
+fastpack_basics = (("int", "i", 4), ("uint", "I", 4), ("hyper", "q", 8),
+                   ("uhyper", "Q", 8), ("float", "f", 4), ("double", "d", 8))
+
+fastpack_init = """\
+class %sPacker(object):
+%sdef __init__(self, check_enum=True, check_array=True):
+%sself.check_enum = check_enum
+%sself.check_array = check_array
+%sself.reset()
+
+%sdef reset(self):
+%sself._buf = bytearray()
+
+%sdef get_buffer(self):
+%sreturn bytes(self._buf)
+
+%sget_buf = get_buffer
+
+""" % ("%s", indent, indent2, indent2, indent2, indent, indent2, indent,
+       indent2, indent)
+
+fastpack_start = ''.join([
+    "%sdef pack_%s(self, x):\n"
+    "%stry:\n"
+    "%s%sself._buf += _S_%s.pack(x)\n"
+    "%sexcept struct.error as e:\n"
+    "%s%sraise ConversionError(e.args[0]) from None\n\n" %
+    (indent, name, indent2, indent2, indent, fmt, indent2, indent2, indent)
+    for name, fmt, size in fastpack_basics
+]) + """\
+    def pack_bool(self, x):
+        self._buf += _TRUE if x else _FALSE
+
+    def pack_fstring(self, n, s):
+        if n < 0:
+            raise ValueError('fstring size must be nonnegative')
+        data = s[:n]
+        self._buf += data
+        self._buf += bytes((n + 3) // 4 * 4 - len(data))
+
+    def pack_string(self, s):
+        n = len(s)
+        self.pack_uint(n)
+        self.pack_fstring(n, s)
+
+    def pack_list(self, list, pack_item):
+        for item in list:
+            self.pack_uint(1)
+            pack_item(item)
+        self.pack_uint(0)
+
+    def pack_farray(self, n, list, pack_item):
+        if len(list) != n:
+            raise ValueError('wrong array size')
+        for item in list:
+            pack_item(item)
+
+    def pack_array(self, list, pack_item):
+        n = len(list)
+        self.pack_uint(n)
+        self.pack_farray(n, list, pack_item)
+
+    pack_enum = pack_int
+    pack_unsigned = pack_uint
+    pack_quadruple = pack_double
+    pack_fopaque = pack_fstring
+    pack_opaque = pack_string
+    pack_bytes = pack_string
+
+"""
+
+fastunpack_init = """\
+class %sUnpacker(object):
+    def __init__(self, data, check_enum=True, check_array=True,
+                 zero_copy=False):
+        self.check_enum = check_enum
+        self.check_array = check_array
+        self.zero_copy = zero_copy
+        self.reset(data)
+
+    def reset(self, data):
+        # data may be any buffer-protocol object (bytes, bytearray, mmap,
+        # memoryview). In zero_copy mode the buffer is only wrapped, opaque
+        # and string fields are returned as memoryview slices of it and the
+        # buffer must outlive them.
+        if self.zero_copy:
+            self._buf = memoryview(data).cast('B')
+        elif isinstance(data, bytes):
+            self._buf = data
+        else:
+            self._buf = bytes(data)
+        self._pos = 0
+
+    def get_position(self):
+        return self._pos
+
+    def set_position(self, position):
+        self._pos = position
+
+    def get_buffer(self):
+        return self._buf
+
+    def done(self):
+        if self._pos < len(self._buf):
+            raise XDRError('unextracted data remains')
+
+"""
+
+fastunpack_start = ''.join([
+    "%sdef unpack_%s(self):\n"
+    "%stry:\n"
+    "%s%sx = _S_%s.unpack_from(self._buf, self._pos)[0]\n"
+    "%sexcept struct.error:\n"
+    "%s%sraise EOFError from None\n"
+    "%sself._pos += %d\n"
+    "%sreturn x\n\n" %
+    (indent, name, indent2, indent2, indent, fmt, indent2, indent2, indent,
+     indent2, size, indent2)
+    for name, fmt, size in fastpack_basics
+]) + """\
+    def unpack_bool(self):
+        return bool(self.unpack_int())
+
+    def unpack_fstring(self, n):
+        if n < 0:
+            raise ValueError('fstring size must be nonnegative')
+        i = self._pos
+        j = i + (n + 3) // 4 * 4
+        if j > len(self._buf):
+            raise EOFError
+        self._pos = j
+        return self._buf[i:i + n]
+
+    def unpack_string(self):
+        n = self.unpack_uint()
+        return self.unpack_fstring(n)
+
+    def unpack_list(self, unpack_item):
+        list = []
+        while True:
+            x = self.unpack_uint()
+            if x == 0:
+                break
+            if x != 1:
+                raise ConversionError('0 or 1 expected, got %r' % (x,))
+            list.append(unpack_item())
+        return list
+
+    def unpack_farray(self, n, unpack_item):
+        return [unpack_item() for _ in range(n)]
+
+    def unpack_array(self, unpack_item):
+        n = self.unpack_uint()
+        return self.unpack_farray(n, unpack_item)
+
+    unpack_enum = unpack_int
+    unpack_unsigned = unpack_uint
+    unpack_quadruple = unpack_double
+    unpack_fopaque = unpack_fstring
+    unpack_opaque = unpack_string
+    unpack_bytes = unpack_string
+
+    # The skip_* methods advance the position past a value without
+    # building it, to find the boundaries of the values of a buffer.
+    def skip_int(self):
+        self._pos += 4
+
+    def skip_hyper(self):
+        self._pos += 8
+
+    def skip_string(self):
+        n = self.unpack_uint()
+        self._pos += (n + 3) & ~3
+
+    skip_uint = skip_int
+    skip_float = skip_int
+    skip_bool = skip_int
+    skip_enum = skip_int
+    skip_unsigned = skip_int
+    skip_uhyper = skip_hyper
+    skip_double = skip_hyper
+    skip_quadruple = skip_hyper
+    skip_opaque = skip_string
+    skip_bytes = skip_string
+
+"""
+
+
+def run(infile, filters=True, pass_attrs=True, debug=False, fast=True):
     global use_filters, allow_attr_passthrough
     use_filters = filters
     allow_attr_passthrough = pass_attrs
 
     # Parse the input data with yacc
-    global name_dict
+    global name_dict, fast_structs, fast_enums
     name_dict = {}
+    fast_structs = {}
+    fast_enums = {}
 
     import ply.yacc as yacc
     parser = yacc.yacc(debug=0, write_tables=0)
@@ -1603,8 +2347,12 @@ def run(infile, filters=True, pass_attrs=True, debug=False):
     constants_file = name_base + "_const"
     types_file = name_base + "_type"
     packer_file = name_base + "_pack"
+    fast_packer_file = name_base + "_fastpack"
     print("Will use output files {0:s}.py, {1:s}.py, and {2:s}.py".format(
         constants_file, types_file, packer_file))
+    if fast:
+        print("Will use output file {0:s}.py for the fast backend".format(
+            fast_packer_file))
 
     if error_occurred:
         print("Error occurred, did not write output files")
@@ -1616,9 +2364,14 @@ def run(infile, filters=True, pass_attrs=True, debug=False):
     const_fd.write(comment_string)
     type_fd = open(types_file + ".py", "w", newline='\n')
     type_fd.write(comment_string)
-    type_fd.write("import base64\n\n")
-    type_fd.write("from . import %s as const\n" % constants_file)
-    type_fd.write("from . import %s as pack\n" % packer_file)
+    if fast:
+        type_fd.write(type_header % (
+            constants_file, fast_packer_file, backend_env, packer_file,
+            backend_env, packer_file, fast_packer_file))
+    else:
+        type_fd.write("import base64\n\n")
+        type_fd.write("from . import %s as const\n" % constants_file)
+        type_fd.write("from . import %s as pack\n" % packer_file)
     pack_fd = open(packer_file + ".py", "w", newline='\n')
     pack_fd.write(comment_string)
     pack_fd.write(pack_header % (constants_file, types_file))
@@ -1655,10 +2408,44 @@ def run(infile, filters=True, pass_attrs=True, debug=False):
     const_fd.close()
     type_fd.close()
     pack_fd.close()
+    if fast:
+        write_fast_backend(fast_packer_file, comment_string, type_list,
+                           name_base)
     print('Done')
     return
 
 
+def write_fast_backend(fast_packer_file, comment_string, type_list, name_base):
+    for name, fmt, size in fastpack_basics:
+        fast_struct(fmt)
+    packers = [fast_pack_output(value) for value in type_list]
+    unpackers = [fast_unpack_output(value) for value in type_list]
+    skippers = [fast_skip_output(value) for value in type_list]
+    fast_fd = open(fast_packer_file + ".py", "w", newline='\n')
+    fast_fd.write(comment_string)
+    fast_fd.write(fastpack_header % (constants_file, types_file))
+    for fmt, name in sorted(fast_structs.items(), key=lambda x: x[1]):
+        fast_fd.write("%s = struct.Struct('>%s')\n" % (name, fmt))
+    fast_fd.write('\n')
+    for name, values in fast_enums.items():
+        fast_fd.write("%s = frozenset([%s])\n" % (name, ', '.join(values)))
+    fast_fd.write('\n\n')
+    fast_fd.write(fastpack_init % name_base)
+    fast_fd.write(fastpack_start)
+    for output in packers:
+        if output is not None:
+            fast_fd.write(output)
+            fast_fd.write('\n')
+    fast_fd.write('\n')
+    fast_fd.write(fastunpack_init % name_base)
+    fast_fd.write(fastunpack_start)
+    for output in unpackers + skippers:
+        if output is not None:
+            fast_fd.write(output)
+            fast_fd.write('\n')
+    fast_fd.close()
+
+
 def readfile(file_path, parser):
     global file_list
     with open(file_path) as content:
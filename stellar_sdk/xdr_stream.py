@@ -0,0 +1,127 @@
+import gzip
+import io
+import os
+import struct
+from typing import Any, BinaryIO, Iterator, Optional, Type, Union
+
+from .exceptions import ValueError
+from .xdr import Xdr
+
+__all__ = ["read_xdr_records"]
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+_RECORD_MARK = struct.Struct(">I")
+_LAST_FRAGMENT = 0x80000000
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def read_xdr_records(
+    source: Union[str, os.PathLike, BinaryIO],
+    xdr_type: Union[str, Type],
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> Iterator[Any]:
+    """Iterate over a file of record-marked XDR objects, such as the
+    ``transactions``, ``results``, ``ledger`` and ``bucket`` files of a
+    history archive or a ledger meta stream.
+
+    Every record is framed as described in
+    `RFC 5531 <https://tools.ietf.org/html/rfc5531#section-11>`__: one or more
+    fragments, each prefixed with a 4-byte big-endian header whose high bit
+    marks the last fragment and whose low 31 bits are the fragment length.
+    Gzip compressed files are detected and decompressed on the fly. Records
+    are decoded one at a time, so memory usage is bounded by the size of
+    the largest record plus ``buffer_size``.
+
+    An example::
+
+        from stellar_sdk.xdr_stream import read_xdr_records
+
+        for entry in read_xdr_records(
+            "transactions-0000003f.xdr.gz", "TransactionHistoryEntry"
+        ):
+            print(entry.ledgerSeq)
+
+    :param source: path of the file, or a binary file object opened for reading.
+        A file object supporting neither ``peek`` nor ``seek`` (ex. an unbuffered
+        pipe or socket) is read through a buffer of ``buffer_size`` bytes. A file
+        object passed in is not closed by this function.
+    :param xdr_type: the XDR type of the records, either its name (ex. ``"LedgerCloseMeta"``)
+        or the generated class (ex. ``Xdr.types.LedgerCloseMeta``).
+    :param buffer_size: size of the read buffer in bytes.
+    :return: a generator yielding the decoded XDR objects.
+    :raises: :exc:`ValueError <stellar_sdk.exceptions.ValueError>`: if ``xdr_type`` is not
+        an XDR type or, while iterating, if the file ends in the middle of a record.
+    """
+    if not isinstance(xdr_type, str):
+        xdr_type = xdr_type.__name__
+    unpack_name = "unpack_" + xdr_type
+    if not hasattr(Xdr.StellarXDRUnpacker, unpack_name):
+        raise ValueError("{} is not a valid XDR type.".format(xdr_type))
+    return _read_records(source, unpack_name, buffer_size)
+
+
+def _read_records(
+    source: Union[str, os.PathLike, BinaryIO], unpack_name: str, buffer_size: int
+) -> Iterator[Any]:
+    if isinstance(source, (str, os.PathLike)):
+        raw = open(source, "rb", buffering=buffer_size)
+    else:
+        raw = source
+    buffered: Optional[io.BufferedReader] = None
+    decompressed: Optional[io.BufferedReader] = None
+    try:
+        fp = raw
+        if not hasattr(fp, "peek") and not _is_seekable(fp):
+            # The gzip magic is peeked from the buffer of the stream.
+            fp = buffered = io.BufferedReader(fp, buffer_size)
+        if _is_gzip(fp):
+            fp = decompressed = io.BufferedReader(
+                gzip.GzipFile(fileobj=fp), buffer_size
+            )
+        read = fp.read
+        while True:
+            header = read(4)
+            if not header:
+                return
+            fragments = []
+            while True:
+                if len(header) != 4:
+                    raise ValueError("Unexpected end of file in a record mark.")
+                mark = _RECORD_MARK.unpack(header)[0]
+                length = mark & ~_LAST_FRAGMENT
+                fragment = read(length)
+                if len(fragment) != length:
+                    raise ValueError("Unexpected end of file in a record.")
+                fragments.append(fragment)
+                if mark & _LAST_FRAGMENT:
+                    break
+                header = read(4)
+            record = fragments[0] if len(fragments) == 1 else b"".join(fragments)
+            unpacker = Xdr.StellarXDRUnpacker(record)
+            data = getattr(unpacker, unpack_name)()
+            unpacker.done()
+            yield data
+    finally:
+        if decompressed is not None:
+            # The GzipFile does not close the file object it reads from.
+            decompressed.close()
+        if buffered is not None:
+            # Closing the buffer would close the stream of the caller.
+            buffered.detach()
+        if raw is not source:
+            raw.close()
+
+
+def _is_seekable(fp: BinaryIO) -> bool:
+    seekable = getattr(fp, "seekable", None)
+    return seekable is not None and seekable()
+
+
+def _is_gzip(fp: BinaryIO) -> bool:
+    if hasattr(fp, "peek"):
+        return fp.peek(2)[:2] == _GZIP_MAGIC
+    position = fp.tell()
+    magic = fp.read(2)
+    fp.seek(position)
+    return magic == _GZIP_MAGIC
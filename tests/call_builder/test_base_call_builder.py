@@ -1,10 +1,22 @@
+import asyncio
+import json
+import time
+
 import pytest
+from werkzeug import Response
 
 from stellar_sdk.__version__ import __version__
-from stellar_sdk.call_builder import BaseCallBuilder
+from stellar_sdk.call_builder import BaseCallBuilder, OperationsCallBuilder
 from stellar_sdk.client.aiohttp_client import AiohttpClient
 from stellar_sdk.client.requests_client import RequestsClient
-from stellar_sdk.exceptions import BadRequestError, NotFoundError, NotPageableError
+from stellar_sdk.exceptions import (
+    BadRequestError,
+    NotFoundError,
+    NotPageableError,
+    TypeError,
+    ValueError,
+)
+from stellar_sdk.records import OperationRecord, PaymentOperationRecord
 
 
 class TestBaseCallBuilder:
@@ -230,3 +242,207 @@ class TestBaseCallBuilder:
             resp["url"]
             == "https://httpbin.org/get?version=1.2&auth=myPassw0wd&limit=10&cursor=10086&order=desc"
         )
+
+
+def inject_paged_server(httpserver, total=7):
+    def handler(request):
+        cursor = int(request.args.get("cursor", 0))
+        limit = int(request.args.get("limit", 10))
+        records = [
+            {"id": str(i)} for i in range(cursor + 1, min(cursor + limit, total) + 1)
+        ]
+        next_cursor = records[-1]["id"] if records else cursor
+        body = {
+            "_links": {
+                "next": {
+                    "href": httpserver.url_for(
+                        "/operations?cursor={}&limit={}".format(next_cursor, limit)
+                    )
+                }
+            },
+            "_embedded": {"records": records},
+        }
+        return Response(json.dumps(body), content_type="application/json")
+
+    httpserver.expect_request("/operations").respond_with_handler(handler)
+    httpserver.expect_request("/ledgers/1").respond_with_json({"sequence": 1})
+    return httpserver.url_for("/")
+
+
+class TestIterRecords:
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test_iter_records_sync(self, httpserver, prefetch):
+        horizon_url = inject_paged_server(httpserver)
+        call_builder = BaseCallBuilder(horizon_url, RequestsClient()).limit(3)
+        call_builder.endpoint = "operations"
+        records = list(call_builder.iter_records(prefetch=prefetch))
+        assert [r["id"] for r in records] == [str(i) for i in range(1, 8)]
+        # 3 full pages and the empty one
+        assert len(httpserver.log) == 4
+
+    @pytest.mark.parametrize("prefetch", [0, 1])
+    def test_iter_records_max_records_sync(self, httpserver, prefetch):
+        horizon_url = inject_paged_server(httpserver)
+        call_builder = BaseCallBuilder(horizon_url, RequestsClient()).limit(3)
+        call_builder.endpoint = "operations"
+        records = list(call_builder.iter_records(prefetch=prefetch, max_records=4))
+        assert [r["id"] for r in records] == ["1", "2", "3", "4"]
+        assert len(httpserver.log) == 2
+
+    def test_iter_records_break_sync(self, httpserver):
+        horizon_url = inject_paged_server(httpserver, total=100)
+        call_builder = BaseCallBuilder(horizon_url, RequestsClient()).limit(2)
+        call_builder.endpoint = "operations"
+        records = call_builder.iter_records(prefetch=2)
+        assert next(records)["id"] == "1"
+        records.close()
+        time.sleep(0.3)
+        # the first page and at most 2 prefetched pages
+        assert len(httpserver.log) <= 3
+
+    def test_iter_records_not_pageable_raise_sync(self, httpserver):
+        horizon_url = inject_paged_server(httpserver)
+        call_builder = BaseCallBuilder(horizon_url, RequestsClient())
+        call_builder.endpoint = "ledgers/1"
+        with pytest.raises(NotPageableError, match="The resource is not a collection."):
+            list(call_builder.iter_records())
+
+    def test_iter_records_request_error_raise_sync(self, httpserver):
+        httpserver.expect_request("/operations").respond_with_json(
+            {"status": 400}, status=400
+        )
+        call_builder = BaseCallBuilder(httpserver.url_for("/"), RequestsClient())
+        call_builder.endpoint = "operations"
+        with pytest.raises(BadRequestError):
+            list(call_builder.iter_records(prefetch=1))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    async def test_aiter_records_async(self, httpserver, prefetch):
+        horizon_url = inject_paged_server(httpserver)
+        async with AiohttpClient() as client:
+            call_builder = BaseCallBuilder(horizon_url, client).limit(3)
+            call_builder.endpoint = "operations"
+            records = [r async for r in call_builder.aiter_records(prefetch=prefetch)]
+        assert [r["id"] for r in records] == [str(i) for i in range(1, 8)]
+        assert len(httpserver.log) == 4
+
+    @pytest.mark.asyncio
+    async def test_aiter_records_max_records_async(self, httpserver):
+        horizon_url = inject_paged_server(httpserver)
+        async with AiohttpClient() as client:
+            call_builder = BaseCallBuilder(horizon_url, client).limit(3)
+            call_builder.endpoint = "operations"
+            records = call_builder.aiter_records(max_records=5)
+            ids = [r["id"] async for r in records]
+        assert ids == ["1", "2", "3", "4", "5"]
+        assert len(httpserver.log) == 2
+
+    @pytest.mark.asyncio
+    async def test_aiter_records_break_async(self, httpserver):
+        horizon_url = inject_paged_server(httpserver, total=100)
+        async with AiohttpClient() as client:
+            call_builder = BaseCallBuilder(horizon_url, client).limit(2)
+            call_builder.endpoint = "operations"
+            records = call_builder.aiter_records(prefetch=2)
+            async for record in records:
+                assert record["id"] == "1"
+                break
+            await records.aclose()
+            await asyncio.sleep(0.1)
+        assert len(httpserver.log) <= 3
+
+    @pytest.mark.asyncio
+    async def test_aiter_records_request_error_raise_async(self, httpserver):
+        httpserver.expect_request("/operations").respond_with_json(
+            {"status": 400}, status=400
+        )
+        async with AiohttpClient() as client:
+            call_builder = BaseCallBuilder(httpserver.url_for("/"), client)
+            call_builder.endpoint = "operations"
+            with pytest.raises(BadRequestError):
+                [r async for r in call_builder.aiter_records(prefetch=1)]
+
+    @pytest.mark.asyncio
+    async def test_client_type_raise(self):
+        with pytest.raises(
+            TypeError, match="iter_records requires a synchronous client"
+        ):
+            BaseCallBuilder(
+                "https://horizon.stellar.org", AiohttpClient()
+            ).iter_records()
+        with pytest.raises(
+            TypeError, match="aiter_records requires an asynchronous client"
+        ):
+            BaseCallBuilder(
+                "https://horizon.stellar.org", RequestsClient()
+            ).aiter_records()
+
+    @pytest.mark.parametrize(
+        "prefetch, max_records, message",
+        [
+            (-1, None, "prefetch should not be negative, got -1."),
+            (1, -1, "max_records should not be negative, got -1."),
+        ],
+    )
+    def test_invalid_args_raise(self, prefetch, max_records, message):
+        call_builder = BaseCallBuilder("https://horizon.stellar.org", RequestsClient())
+        with pytest.raises(ValueError, match=message):
+            call_builder.iter_records(prefetch, max_records)
+
+
+class TestTypedRecords:
+    def test_call_collection_sync(self, httpserver):
+        horizon_url = inject_paged_server(httpserver)
+        resp = OperationsCallBuilder(horizon_url, RequestsClient()).typed().call()
+        records = resp["_embedded"]["records"]
+        assert [type(r) for r in records] == [OperationRecord] * 7
+        assert [r.id for r in records] == [str(i) for i in range(1, 8)]
+        assert "_links" in resp
+
+    def test_call_resource_sync(self, httpserver):
+        httpserver.expect_request("/operations/1").respond_with_json(
+            {
+                "_links": {"self": {"href": "/operations/1"}},
+                "id": "1",
+                "type": "payment",
+                "amount": "1.5000000",
+            }
+        )
+        call_builder = OperationsCallBuilder(httpserver.url_for("/"), RequestsClient())
+        record = call_builder.operation(1).typed().call()
+        assert isinstance(record, PaymentOperationRecord)
+        assert record.amount == 15000000
+        assert record.links is None
+        record = call_builder.typed(keep_links=True).call()
+        assert record.links == {"self": {"href": "/operations/1"}}
+
+    def test_iter_records_sync(self, httpserver):
+        horizon_url = inject_paged_server(httpserver)
+        call_builder = OperationsCallBuilder(horizon_url, RequestsClient()).limit(3)
+        records = list(call_builder.typed().iter_records())
+        assert [r.id for r in records] == [str(i) for i in range(1, 8)]
+        assert all(isinstance(r, OperationRecord) for r in records)
+
+    @pytest.mark.asyncio
+    async def test_aiter_records_async(self, httpserver):
+        horizon_url = inject_paged_server(httpserver)
+        async with AiohttpClient() as client:
+            call_builder = OperationsCallBuilder(horizon_url, client).limit(3)
+            records = [r async for r in call_builder.typed().aiter_records()]
+        assert [r["id"] for r in records] == [str(i) for i in range(1, 8)]
+        assert all(isinstance(r, OperationRecord) for r in records)
+
+    def test_not_typed(self, httpserver):
+        horizon_url = inject_paged_server(httpserver)
+        records = list(
+            OperationsCallBuilder(horizon_url, RequestsClient()).iter_records()
+        )
+        assert records[0] == {"id": "1"}
+
+    def test_unsupported_call_builder_raise(self):
+        call_builder = BaseCallBuilder("https://horizon.stellar.org", RequestsClient())
+        with pytest.raises(
+            TypeError, match="BaseCallBuilder does not support typed records."
+        ):
+            call_builder.typed()
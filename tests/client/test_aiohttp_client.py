@@ -59,3 +59,18 @@ class TestAiohttpClient:
             json = resp.json()
             assert json["args"] == params
             assert json["headers"]["User-Agent"] == USER_AGENT
+
+    @pytest.mark.asyncio
+    async def test_json_decoder(self, httpserver):
+        httpserver.expect_request("/get").respond_with_json({"hello": "world"})
+        decoded = []
+
+        def decoder(data):
+            decoded.append(data)
+            return {"decoded": True}
+
+        async with AiohttpClient(json_decoder=decoder) as client:
+            resp = await client.get(httpserver.url_for("/get"))
+        assert resp.json() == {"decoded": True}
+        assert decoded == [resp.content]
+        assert isinstance(resp.content, bytes)
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from stellar_sdk.client.coalescing import RequestCoalescer
+from stellar_sdk.client.response import Response
+from stellar_sdk.exceptions import ConnectionError
+
+
+class TestRequestCoalescer:
+    def test_run_merges_concurrent_requests(self):
+        coalescer = RequestCoalescer()
+        sent = []
+        barrier = threading.Barrier(8)
+
+        def send(url, params):
+            sent.append((url, params))
+            time.sleep(0.1)
+            return Response(200, '{"fee": "100"}', {}, url)
+
+        def get(params):
+            barrier.wait()
+            return coalescer.run("http://horizon.local/fee_stats", params, send)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            params = [{"a": "1", "b": "2"}] * 4 + [{"b": "2", "a": "1"}] * 3 + [None]
+            responses = list(executor.map(get, params))
+
+        assert len(sent) == 2
+        assert responses[0] is responses[6]
+        assert responses[0].json() is not responses[1].json()
+        assert (coalescer.requests, coalescer.coalesced) == (8, 6)
+
+        # nothing is cached once the request has completed
+        coalescer.run("http://horizon.local/fee_stats", None, send)
+        assert len(sent) == 3
+
+    def test_run_shares_exception(self):
+        coalescer = RequestCoalescer()
+        started = threading.Event()
+
+        def send(url, params):
+            started.set()
+            time.sleep(0.1)
+            raise ConnectionError("connection refused")
+
+        def follower():
+            started.wait()
+            return coalescer.run("http://horizon.local/ledgers", None, send)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(follower)
+            with pytest.raises(ConnectionError):
+                coalescer.run("http://horizon.local/ledgers", None, send)
+            with pytest.raises(ConnectionError):
+                future.result()
+        assert coalescer.coalesced == 1
+        assert not coalescer._futures
+
+    @pytest.mark.asyncio
+    async def test_arun_merges_concurrent_requests(self):
+        coalescer = RequestCoalescer()
+        sent = []
+
+        async def send(url, params):
+            sent.append(url)
+            await asyncio.sleep(0.05)
+            return Response(200, '{"id": "GA"}', {}, url)
+
+        url = "http://horizon.local/accounts/GA"
+        responses = await asyncio.gather(
+            *[coalescer.arun(url, None, send) for _ in range(20)]
+        )
+        assert sent == [url]
+        assert all(resp is responses[0] for resp in responses)
+        assert (coalescer.requests, coalescer.coalesced) == (20, 19)
+        assert not coalescer._tasks
+        assert repr(coalescer) == "<RequestCoalescer [requests=20, coalesced=19]>"
+        coalescer.reset_counters()
+        assert (coalescer.requests, coalescer.coalesced) == (0, 0)
+
+    @pytest.mark.asyncio
+    async def test_arun_cancelled_caller(self):
+        coalescer = RequestCoalescer()
+
+        async def send(url, params):
+            await asyncio.sleep(0.05)
+            return Response(200, "{}", {}, url)
+
+        url = "http://horizon.local/ledgers"
+        first = asyncio.ensure_future(coalescer.arun(url, None, send))
+        second = asyncio.ensure_future(coalescer.arun(url, None, send))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        resp = await second
+        assert resp.status_code == 200
@@ -0,0 +1,211 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from stellar_sdk.client.aiohttp_client import AiohttpClient
+from stellar_sdk.client.hedging import HedgingPolicy
+from stellar_sdk.client.requests_client import RequestsClient
+from stellar_sdk.exceptions import ValueError
+
+
+def start_sync_node(delays):
+    """Serves ``{"path": ...}``, the n-th request sleeps ``delays[n]`` seconds."""
+    calls = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            index = len(calls)
+            calls.append(self.path)
+            time.sleep(delays[index] if index < len(delays) else 0)
+            body = ('{"path": "%s", "call": %d}' % (self.path, index)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://127.0.0.1:{}".format(server.server_port), calls
+
+
+class TestHedgingPolicy:
+    def test_observed_delay(self):
+        policy = HedgingPolicy(percentile=90, window=10, min_samples=5)
+        for latency in range(1, 5):
+            policy._record_latency(latency)
+        assert policy.hedging_delay() is None
+        for latency in range(5, 11):
+            policy._record_latency(latency)
+        assert policy.hedging_delay() == 9
+
+    def test_fixed_delay_and_alternate_url(self):
+        policy = HedgingPolicy(
+            delay=0.1, alternate_url=lambda url: url.replace("h1", "h2")
+        )
+        assert policy.hedging_delay() == 0.1
+        assert policy.hedge_url("http://h1/ledgers") == "http://h2/ledgers"
+        assert HedgingPolicy().hedge_url("http://h1/ledgers") == "http://h1/ledgers"
+
+    def test_reset_counters(self):
+        policy = HedgingPolicy()
+        policy._record_request()
+        policy._record_hedge_fired()
+        policy._record_hedge_won()
+        assert repr(policy) == (
+            "<HedgingPolicy [requests=1, hedges_fired=1, hedges_won=1]>"
+        )
+        policy.reset_counters()
+        assert (policy.requests, policy.hedges_fired, policy.hedges_won) == (0, 0, 0)
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"delay": -1}, "delay should not be negative"),
+            ({"percentile": 0}, r"percentile should be in \(0, 100\]"),
+            ({"window": 0}, "window should be greater than 0"),
+            ({"window": 5, "min_samples": 6}, r"min_samples should be in \[1, window\]"),
+        ],
+    )
+    def test_invalid_args_raise(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            HedgingPolicy(**kwargs)
+
+
+class TestRequestsClientHedging:
+    def test_hedge_wins(self):
+        server, url, calls = start_sync_node([0.5])
+        policy = HedgingPolicy(delay=0.05)
+        try:
+            with RequestsClient(hedging=policy) as client:
+                start = time.monotonic()
+                resp = client.get(url + "/ledgers")
+                assert time.monotonic() - start < 0.4
+                assert resp.json() == {"path": "/ledgers", "call": 1}
+        finally:
+            server.shutdown()
+        assert calls == ["/ledgers", "/ledgers"]
+        assert (policy.requests, policy.hedges_fired, policy.hedges_won) == (1, 1, 1)
+
+    def test_hedge_latency_recorded_from_its_start(self):
+        server, url, calls = start_sync_node([0.5])
+        policy = HedgingPolicy(delay=0.1)
+        try:
+            with RequestsClient(hedging=policy) as client:
+                client.get(url + "/ledgers")
+        finally:
+            server.shutdown()
+        assert policy.hedges_won == 1
+        # The hedge was sent 0.1 seconds after the original request.
+        assert len(policy._latencies) == 1
+        assert policy._latencies[0] < 0.1
+
+    def test_one_executor_for_concurrent_requests(self, monkeypatch):
+        server, url, calls = start_sync_node([])
+        executors = []
+        executor_class = concurrent.futures.ThreadPoolExecutor
+
+        def create_executor(*args, **kwargs):
+            time.sleep(0.05)
+            executors.append(executor_class(*args, **kwargs))
+            return executors[-1]
+
+        monkeypatch.setattr(concurrent.futures, "ThreadPoolExecutor", create_executor)
+        policy = HedgingPolicy(delay=1)
+        try:
+            with RequestsClient(hedging=policy) as client:
+                threads = [
+                    threading.Thread(target=client.get, args=(url + "/ledgers",))
+                    for _ in range(4)
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            server.shutdown()
+        assert len(calls) == 4
+        assert len(executors) == 1
+
+    def test_fast_request_not_hedged(self):
+        server, url, calls = start_sync_node([])
+        policy = HedgingPolicy(delay=1)
+        try:
+            with RequestsClient(hedging=policy) as client:
+                assert client.get(url + "/ledgers").json()["call"] == 0
+        finally:
+            server.shutdown()
+        assert calls == ["/ledgers"]
+        assert (policy.requests, policy.hedges_fired, policy.hedges_won) == (1, 0, 0)
+
+    def test_no_hedge_before_min_samples(self):
+        server, url, calls = start_sync_node([0.1, 0.1])
+        policy = HedgingPolicy(min_samples=2, window=10)
+        try:
+            with RequestsClient(hedging=policy) as client:
+                client.get(url + "/ledgers")
+                client.get(url + "/ledgers")
+        finally:
+            server.shutdown()
+        assert len(calls) == 2
+        assert policy.hedges_fired == 0
+        assert policy.hedging_delay() is not None
+
+
+async def start_async_node(name, delay=0.0):
+    async def handler(request):
+        await asyncio.sleep(delay)
+        return web.json_response({"node": name})
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+class TestAiohttpClientHedging:
+    @pytest.mark.asyncio
+    async def test_hedge_to_alternate_url(self):
+        slow = await start_async_node("slow", delay=1)
+        fast = await start_async_node("fast")
+        slow_url, fast_url = str(slow.make_url("")), str(fast.make_url(""))
+        policy = HedgingPolicy(
+            delay=0.05, alternate_url=lambda url: url.replace(slow_url, fast_url)
+        )
+        try:
+            async with AiohttpClient(hedging=policy) as client:
+                start = time.monotonic()
+                resp = await client.get(slow_url + "/ledgers")
+                assert time.monotonic() - start < 0.5
+                assert resp.json() == {"node": "fast"}
+        finally:
+            await slow.close()
+            await fast.close()
+        assert (policy.requests, policy.hedges_fired, policy.hedges_won) == (1, 1, 1)
+        # The hedge was sent 0.05 seconds after the original request.
+        assert len(policy._latencies) == 1
+        assert policy._latencies[0] < 0.05
+
+    @pytest.mark.asyncio
+    async def test_primary_wins(self):
+        node = await start_async_node("node", delay=0.1)
+        policy = HedgingPolicy(delay=0.02)
+        try:
+            async with AiohttpClient(hedging=policy) as client:
+                resp = await client.get(str(node.make_url("/ledgers")))
+                assert resp.status_code == 200
+        finally:
+            await node.close()
+        assert policy.hedges_fired == 1
+        assert policy.hedges_won in (0, 1)
@@ -0,0 +1,22 @@
+import json
+import sys
+
+from stellar_sdk.client import json_decoder
+
+
+class TestJsonDecoder:
+    def test_default_json_decoder(self):
+        decoded = json_decoder.default_json_decoder(b'{"a": ["b", 1, null]}')
+        assert decoded == {"a": ["b", 1, None]}
+
+    def test_find_json_decoder(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "ujson", None)
+        assert json_decoder._find_json_decoder() is json.loads
+
+    def test_find_orjson(self, monkeypatch):
+        class FakeOrjson:
+            loads = object()
+
+        monkeypatch.setitem(sys.modules, "orjson", FakeOrjson)
+        assert json_decoder._find_json_decoder() is FakeOrjson.loads
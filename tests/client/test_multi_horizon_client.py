@@ -0,0 +1,257 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from stellar_sdk import Server
+from stellar_sdk.client.aiohttp_client import AiohttpClient
+from stellar_sdk.client.base_sync_client import BaseSyncClient
+from stellar_sdk.client.multi_horizon_client import (
+    AsyncMultiHorizonClient,
+    MultiHorizonClient,
+)
+from stellar_sdk.client.response import Response
+from stellar_sdk.exceptions import ConnectionError, ValueError
+
+NODE_1 = "http://horizon-1.local"
+NODE_2 = "http://horizon-2.local"
+NODE_3 = "http://horizon-3.local"
+
+
+class FakeClient(BaseSyncClient):
+    """Answers the requests with the status code of the node, a node whose
+    status is ``None`` raises a connection error."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.delays = {}
+        self.requests = []
+
+    def __respond(self, method, url):
+        self.requests.append((method, url))
+        base = url[: url.index("/", len("http://"))] if url.count("/") > 2 else url
+        time.sleep(self.delays.get(base, 0))
+        status = self.statuses[base]
+        if status is None:
+            raise ConnectionError("connection refused")
+        return Response(status, '{"node": "%s"}' % base, {}, url)
+
+    def get(self, url, params=None):
+        return self.__respond("GET", url)
+
+    def post(self, url, data=None):
+        return self.__respond("POST", url)
+
+    def stream(self, url, params=None):
+        self.requests.append(("STREAM", url))
+        yield {"url": url}
+
+    def close(self):
+        pass
+
+
+class TestMultiHorizonClient:
+    def test_routes_to_fastest_node(self):
+        fake = FakeClient({NODE_1: 200, NODE_2: 200})
+        fake.delays = {NODE_1: 0.02}
+        client = MultiHorizonClient([NODE_1, NODE_2], fake)
+        # both nodes are measured first
+        client.get(NODE_1 + "/ledgers")
+        client.get(NODE_1 + "/ledgers")
+        assert client.nodes[0].latency > client.nodes[1].latency
+        fake.requests.clear()
+        for _ in range(3):
+            resp = client.get(NODE_1 + "/accounts/GA?limit=1", {"order": "asc"})
+            assert resp.json() == {"node": NODE_2}
+        assert fake.requests == [("GET", NODE_2 + "/accounts/GA?limit=1")] * 3
+
+    def test_failover(self):
+        fake = FakeClient({NODE_1: None, NODE_2: 503, NODE_3: 200})
+        client = MultiHorizonClient([NODE_1, NODE_2, NODE_3], fake)
+        resp = client.get(NODE_1 + "/ledgers")
+        assert resp.status_code == 200
+        assert [url for _, url in fake.requests] == [
+            NODE_1 + "/ledgers",
+            NODE_2 + "/ledgers",
+            NODE_3 + "/ledgers",
+        ]
+        assert client.nodes[0].consecutive_failures == 1
+        assert client.nodes[1].error_rate == pytest.approx(0.3)
+        assert client.nodes[2].error_rate == 0
+
+    def test_all_nodes_fail(self):
+        client = MultiHorizonClient(
+            [NODE_1, NODE_2], FakeClient({NODE_1: None, NODE_2: None})
+        )
+        with pytest.raises(ConnectionError):
+            client.get(NODE_1 + "/ledgers")
+        client = MultiHorizonClient(
+            [NODE_1, NODE_2], FakeClient({NODE_1: 500, NODE_2: 502})
+        )
+        assert client.get(NODE_1 + "/ledgers").status_code == 502
+
+    def test_node_down_and_half_open_probe(self):
+        fake = FakeClient({NODE_1: 500, NODE_2: 200})
+        client = MultiHorizonClient(
+            [NODE_1, NODE_2], fake, failure_threshold=2, recovery_timeout=0.2
+        )
+        node_1 = client.nodes[0]
+        client.nodes[1].latency = 1  # node 1 is tried first while it is up
+        client.get(NODE_1 + "/ledgers")
+        assert not node_1.is_down
+        client.get(NODE_1 + "/ledgers")
+        assert node_1.is_down
+
+        fake.requests.clear()
+        client.get(NODE_1 + "/ledgers")
+        assert fake.requests == [("GET", NODE_2 + "/ledgers")]
+
+        # the failed probe puts the node down again
+        time.sleep(0.25)
+        fake.requests.clear()
+        client.get(NODE_1 + "/ledgers")
+        assert fake.requests == [
+            ("GET", NODE_1 + "/ledgers"),
+            ("GET", NODE_2 + "/ledgers"),
+        ]
+        assert node_1.is_down
+
+        # the successful probe puts it up
+        time.sleep(0.25)
+        fake.statuses[NODE_1] = 200
+        fake.requests.clear()
+        client.get(NODE_1 + "/ledgers")
+        assert fake.requests == [("GET", NODE_1 + "/ledgers")]
+        assert not node_1.is_down
+        assert node_1.consecutive_failures == 0
+
+    def test_post_to_primary(self):
+        fake = FakeClient({NODE_1: 200, NODE_2: 200})
+        client = MultiHorizonClient([NODE_1, NODE_2], fake)
+        client.nodes[0].latency = 10
+        client.nodes[1].latency = 0.1
+        client.post(NODE_2 + "/transactions", {"tx": "AAAA"})
+        assert fake.requests == [("POST", NODE_1 + "/transactions")]
+        fake.statuses[NODE_1] = None
+        with pytest.raises(ConnectionError):
+            client.post(NODE_1 + "/transactions", {"tx": "AAAA"})
+
+    def test_stream_on_best_node(self):
+        fake = FakeClient({NODE_1: 200, NODE_2: 200})
+        client = MultiHorizonClient([NODE_1, NODE_2], fake)
+        client.nodes[0].latency = 10
+        client.nodes[1].latency = 0.1
+        events = client.stream(NODE_1 + "/ledgers", {"cursor": "now"})
+        assert next(events) == {"url": NODE_2 + "/ledgers"}
+
+    def test_foreign_url(self):
+        fake = FakeClient({"http://other.local": 200, NODE_1 + "0.other": 200})
+        client = MultiHorizonClient([NODE_1, NODE_2], fake)
+        client.get("http://other.local/path")
+        client.get(NODE_1 + "0.other/path")
+        assert [url for _, url in fake.requests] == [
+            "http://other.local/path",
+            NODE_1 + "0.other/path",
+        ]
+
+    def test_check_health(self):
+        fake = FakeClient({NODE_1: 200, NODE_2: None})
+        client = MultiHorizonClient([NODE_1, NODE_2], fake, failure_threshold=1)
+        client.check_health()
+        assert not client.nodes[0].is_down
+        assert client.nodes[0].latency is not None
+        assert client.nodes[1].is_down
+
+    def test_server_uses_primary_url(self):
+        client = MultiHorizonClient([NODE_1 + "/", NODE_2], FakeClient({}))
+        server = Server(client=client)
+        assert server.horizon_url == NODE_1
+        assert server.ledgers().horizon_url == NODE_1
+        assert Server(client=FakeClient({})).horizon_url == (
+            "https://horizon-testnet.stellar.org/"
+        )
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"horizon_urls": []}, "At least one Horizon URL is required."),
+            ({"failure_threshold": 0}, "failure_threshold should be greater than 0"),
+            ({"recovery_timeout": -1}, "recovery_timeout should not be negative"),
+            ({"ewma_alpha": 0}, r"ewma_alpha should be in \(0, 1\]"),
+        ],
+    )
+    def test_invalid_args_raise(self, kwargs, message):
+        kwargs = {"horizon_urls": [NODE_1], "client": FakeClient({}), **kwargs}
+        with pytest.raises(ValueError, match=message):
+            MultiHorizonClient(**kwargs)
+
+
+async def start_node(name, status=200, delay=0.0):
+    async def handler(request):
+        await asyncio.sleep(delay)
+        return web.json_response({"node": name, "path": request.path_qs}, status=status)
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+class TestAsyncMultiHorizonClient:
+    @pytest.mark.asyncio
+    async def test_routing_and_failover(self):
+        slow = await start_node("slow", delay=0.05)
+        fast = await start_node("fast")
+        broken = await start_node("broken", status=500)
+        urls = [str(server.make_url("")) for server in (slow, fast, broken)]
+        try:
+            async with AsyncMultiHorizonClient(
+                urls, AiohttpClient(), failure_threshold=1, recovery_timeout=60
+            ) as client:
+                await client.check_health()
+                assert client.nodes[2].is_down
+                assert client.nodes[1].latency < client.nodes[0].latency
+
+                async with Server(client=client) as server:
+                    resp = await server.ledgers().limit(1).call()
+                    assert resp == {"node": "fast", "path": "/ledgers?limit=1"}
+
+                    await fast.close()
+                    resp = await server.ledgers().call()
+                    assert resp["node"] == "slow"
+                    assert client.nodes[1].is_down
+
+                    resp = await client.post(urls[1] + "/transactions", {"tx": "A"})
+                    assert resp.json()["node"] == "slow"
+        finally:
+            for server in (slow, fast, broken):
+                await server.close()
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe(self):
+        node_1 = await start_node("node_1", status=503)
+        node_2 = await start_node("node_2")
+        urls = [str(node_1.make_url("")), str(node_2.make_url(""))]
+        try:
+            async with AsyncMultiHorizonClient(
+                urls, AiohttpClient(), failure_threshold=1, recovery_timeout=0.1
+            ) as client:
+                client.nodes[1].latency = 1
+                resp = await client.get(urls[0] + "/ledgers")
+                assert resp.json()["node"] == "node_2"
+                assert client.nodes[0].is_down
+
+                resp = await client.get(urls[0] + "/ledgers")
+                assert resp.json()["node"] == "node_2"
+                await asyncio.sleep(0.15)
+                # the probe fails and the request fails over
+                resp = await client.get(urls[0] + "/ledgers")
+                assert resp.json()["node"] == "node_2"
+                assert client.nodes[0].is_down
+                assert client.nodes[0].consecutive_failures == 2
+        finally:
+            await node_1.close()
+            await node_2.close()
@@ -0,0 +1,105 @@
+import asyncio
+import email.utils
+import time
+
+import pytest
+
+from stellar_sdk.client.rate_limit import RateLimiter
+from stellar_sdk.client.response import Response
+from stellar_sdk.exceptions import ValueError
+
+
+def response(status_code=200, **headers):
+    headers = {key.replace("_", "-"): str(value) for key, value in headers.items()}
+    return Response(status_code, "{}", headers, "http://horizon.local/ledgers")
+
+
+class TestRateLimiter:
+    def test_burst_is_spread_out(self):
+        limiter = RateLimiter(limit=5, period=0.5)
+        start = time.monotonic()
+        for _ in range(7):
+            limiter.run(lambda: response())
+        # 5 tokens, then 2 tokens refilled at 10 per second
+        assert 0.15 < time.monotonic() - start < 0.35
+        assert (limiter.requests, limiter.throttled) == (7, 2)
+        assert limiter.total_wait == pytest.approx(0.2, abs=0.05)
+
+    def test_learns_from_headers(self):
+        limiter = RateLimiter()
+        limiter.update(
+            response(X_Ratelimit_Limit=100, X_Ratelimit_Remaining=10, X_Ratelimit_Reset=5)
+        )
+        assert limiter.limit == 100
+        assert limiter.remaining == pytest.approx(10, abs=0.1)
+        assert limiter.wait_time == 0
+
+        limiter.update(
+            response(x_ratelimit_limit=100, x_ratelimit_remaining=0, x_ratelimit_reset=5)
+        )
+        assert limiter.wait_time == pytest.approx(5, abs=0.1)
+        # the 100 requests are available again after the reset
+        assert limiter._rate == pytest.approx(20)
+
+    def test_ignores_invalid_headers(self):
+        limiter = RateLimiter(limit=10)
+        limiter.update(response(X_Ratelimit_Limit="abc", Retry_After="soon"))
+        assert limiter.limit == 10
+        assert limiter.wait_time == 0
+
+    def test_retry_after(self):
+        limiter = RateLimiter(max_retries=1)
+        responses = [response(429, Retry_After="0.1"), response(200)]
+        start = time.monotonic()
+        resp = limiter.run(lambda: responses.pop(0), retry=True)
+        assert resp.status_code == 200
+        assert time.monotonic() - start >= 0.1
+        assert (limiter.requests, limiter.throttled, limiter.rejected) == (2, 1, 1)
+
+    def test_retry_after_http_date(self):
+        limiter = RateLimiter()
+        date = email.utils.formatdate(time.time() + 30, usegmt=True)
+        limiter.update(response(503, Retry_After=date))
+        assert 28 < limiter.wait_time <= 30
+
+    def test_no_retry(self):
+        limiter = RateLimiter(max_retries=3)
+        sent = []
+
+        def send():
+            sent.append(1)
+            return response(503)
+
+        assert limiter.run(send).status_code == 503
+        assert len(sent) == 1
+        assert limiter.run(send, retry=True).status_code == 503
+        assert len(sent) == 5
+
+    @pytest.mark.asyncio
+    async def test_arun(self):
+        limiter = RateLimiter(limit=2, period=0.2)
+
+        async def send():
+            return response()
+
+        start = time.monotonic()
+        await asyncio.gather(*[limiter.arun(send) for _ in range(4)])
+        assert time.monotonic() - start >= 0.19
+        assert limiter.throttled == 2
+        assert repr(limiter) == (
+            "<RateLimiter [limit=2, requests=4, throttled=2, rejected=0]>"
+        )
+        limiter.reset_counters()
+        assert (limiter.requests, limiter.throttled, limiter.total_wait) == (0, 0, 0)
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            ({"limit": 0}, "limit should be greater than 0"),
+            ({"period": 0}, "period should be greater than 0"),
+            ({"max_retries": -1}, "max_retries should not be negative"),
+        ],
+    )
+    def test_invalid_args_raise(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            RateLimiter(**kwargs)
@@ -1,6 +1,10 @@
+import json
+
 import pytest
 
+from stellar_sdk.client.rate_limit import RateLimiter
 from stellar_sdk.client.requests_client import RequestsClient, USER_AGENT
+from stellar_sdk.exceptions import StreamClientError
 
 
 class TestRequestsClient:
@@ -43,6 +47,59 @@ class TestRequestsClient:
             if len(resp) == 2:
                 break
 
+    def test_stream_events(self, httpserver):
+        body = (
+            b'retry: 10\nevent: open\ndata: "hello"\n\n'
+            b'id: 1-1\ndata: {"id": "1"}\n\n'
+            b'id: 2-1\ndata: {"id": "2"}\n\n'
+        )
+        httpserver.expect_request("/ledgers").respond_with_data(
+            body, content_type="text/event-stream"
+        )
+        client = RequestsClient()
+        events = client.stream(httpserver.url_for("/ledgers"), {"cursor": "now"})
+        assert [next(events) for _ in range(3)] == [{"id": "1"}, {"id": "2"}, {"id": "1"}]
+        # the stream reconnects from the last cursor
+        assert httpserver.log[1][0].args["cursor"] == "2-1"
+
+    def test_stream_status_error(self, httpserver):
+        httpserver.expect_request("/ledgers").respond_with_data("", status=404)
+        client = RequestsClient()
+        with pytest.raises(StreamClientError, match="status code: 404"):
+            next(client.stream(httpserver.url_for("/ledgers"), {"cursor": "1-1"}))
+
+    def test_json_decoder(self, httpserver):
+        httpserver.expect_request("/get").respond_with_json({"hello": "world"})
+        decoded = []
+
+        def decoder(data):
+            decoded.append(data)
+            return json.loads(data)
+
+        client = RequestsClient(json_decoder=decoder)
+        resp = client.get(httpserver.url_for("/get"))
+        assert resp.json() == {"hello": "world"}
+        assert decoded == [resp.content]
+        assert isinstance(resp.content, bytes)
+
+    @pytest.mark.parametrize("method", ["GET", "POST"])
+    def test_rate_limiter_retries_rejected_requests(self, httpserver, method):
+        limiter = RateLimiter(max_retries=1)
+        client = RequestsClient(num_retries=3, rate_limiter=limiter)
+        httpserver.expect_request("/ledgers").respond_with_data(
+            "{}", status=429, headers={"Retry-After": "0.1"}
+        )
+        url = httpserver.url_for("/ledgers")
+        if method == "GET":
+            resp = client.get(url)
+        else:
+            resp = client.post(url)
+        assert resp.status_code == 429
+        # The retry handler of the session leaves the rejected requests to the limiter.
+        sent = 2 if method == "GET" else 1
+        assert len(httpserver.log) == sent
+        assert (limiter.requests, limiter.rejected) == (sent, sent)
+
     def test_with(self):
         with RequestsClient() as client:
             url = "http://httpbin.org/get"
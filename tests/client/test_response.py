@@ -36,3 +36,63 @@ class TestResponse:
         resp4 = "BAD TYPE"
 
         assert resp1 == resp2 != resp3 != resp4
+
+    def test_content(self):
+        resp = Response(
+            status_code=200,
+            text=None,
+            headers={"Content-Type": "application/json"},
+            url="https://httpbin.org",
+            content='{"a": "ü"}'.encode(),
+        )
+        assert resp.json() == {"a": "ü"}
+        assert resp.text == '{"a": "ü"}'
+
+    def test_content_charset(self):
+        resp = Response(
+            status_code=200,
+            text=None,
+            headers={"content-type": 'text/plain; charset="latin-1"'},
+            url="https://httpbin.org",
+            content="ü".encode("latin-1"),
+        )
+        assert resp.text == "ü"
+        resp = Response(
+            status_code=200,
+            text=None,
+            headers={"Content-Type": "text/plain; charset=unknown"},
+            url="https://httpbin.org",
+            content="ü".encode(),
+        )
+        assert resp.text == "ü"
+
+    def test_json_decoder(self):
+        decoded = []
+
+        def decoder(data):
+            decoded.append(data)
+            return {"decoded": True}
+
+        resp = Response(
+            status_code=200,
+            text=None,
+            headers={},
+            url="https://httpbin.org",
+            content=b'{"a": "b"}',
+            json_decoder=decoder,
+        )
+        assert resp.json() == {"decoded": True}
+        assert decoded == [b'{"a": "b"}']
+
+    def test_equal_content(self):
+        resp1 = Response(
+            status_code=200, text='{"a": "b"}', headers={}, url="https://httpbin.org"
+        )
+        resp2 = Response(
+            status_code=200,
+            text=None,
+            headers={},
+            url="https://httpbin.org",
+            content=b'{"a": "b"}',
+        )
+        assert resp1 == resp2
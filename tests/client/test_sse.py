@@ -0,0 +1,70 @@
+import pytest
+
+from stellar_sdk.client.sse import Event, SSEParser
+from stellar_sdk.exceptions import ValueError
+
+STREAM = (
+    b'retry: 1000\nevent: open\ndata: "hello"\n\n'
+    b'id: 1-1\ndata: {"id": "1"}\n\n'
+    b": keep alive\n\n"
+    b'id: 2-1\nevent: message\ndata: {"a":\ndata: 1}\n\n'
+    b'event: close\ndata: "byebye"\n\n'
+)
+EVENTS = [
+    Event(b'{"id": "1"}', "1-1"),
+    Event(b'{"a":\n1}', "2-1", "message"),
+]
+
+
+def feed_all(parser, chunks):
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    return events
+
+
+class TestSSEParser:
+    def test_whole_stream(self):
+        parser = SSEParser()
+        assert parser.feed(STREAM) == EVENTS
+        assert parser.last_event_id == "2-1"
+        assert parser.retry == 1000
+        assert not parser._buffer
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+    def test_chunked(self, size):
+        chunks = [STREAM[i : i + size] for i in range(0, len(STREAM), size)]
+        assert feed_all(SSEParser(), chunks) == EVENTS
+
+    @pytest.mark.parametrize("newline", [b"\r\n", b"\r"])
+    def test_line_endings(self, newline):
+        stream = STREAM.replace(b"\n", newline)
+        for size in (1, 5, len(stream)):
+            chunks = [stream[i : i + size] for i in range(0, len(stream), size)]
+            assert feed_all(SSEParser(), chunks) == EVENTS
+
+    def test_incomplete_event(self):
+        parser = SSEParser()
+        assert parser.feed(b'id: 1\ndata: {"a": 1}\n') == []
+        assert parser.feed(b"\n") == [Event(b'{"a": 1}', "1")]
+
+    def test_fields(self):
+        parser = SSEParser()
+        events = parser.feed(
+            b"data\n\n"  # a field without colon
+            b"id: 3\nretry: soon\ndata:no space\n\n"
+            b"id: 4\0\nunknown: field\n\n"  # an id with NUL is ignored
+            b"data: after\n\n"
+        )
+        assert events == [Event(b"", None), Event(b"no space", "3"), Event(b"after", "3")]
+        assert parser.retry is None
+
+    def test_max_event_size(self):
+        parser = SSEParser(max_event_size=16)
+        assert parser.feed(b"data: 0123456789\n\n") == [Event(b"0123456789")]
+        with pytest.raises(ValueError, match="larger than max_event_size"):
+            parser.feed(b"data: 0123456789abcdef")
+
+    def test_invalid_max_event_size_raise(self):
+        with pytest.raises(ValueError, match="max_event_size should be greater than 0"):
+            SSEParser(max_event_size=0)
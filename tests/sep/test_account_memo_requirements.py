@@ -1,3 +1,5 @@
+import types
+
 import pytest
 
 from stellar_sdk import (
@@ -10,6 +12,7 @@ from stellar_sdk import (
 )
 from stellar_sdk.exceptions import BadRequestError
 from stellar_sdk.sep.exceptions import AccountRequiresMemoError
+from stellar_sdk.server import _MemoRequiredCache
 
 
 class TestAccountMemoRequirements:
@@ -989,6 +992,180 @@ class TestAccountMemoRequirements:
             )
             await server.submit_transaction(fee_bump_tx)
 
+    def test_check_memo_required_reports_first_failing_destination_sync(
+        self, httpserver
+    ):
+        self.__inject_mock_server(httpserver)
+        horizon_url = httpserver.url_for("/")
+        server = Server(horizon_url, memo_required_check_concurrency=3)
+        keypair = Keypair.from_secret(
+            "SDQXFKA32UVQHUTLYJ42N56ZUEM5PNVVI4XE7EA5QFMLA2DHDCQX3GPY"
+        )
+        account = Account(keypair.public_key, 1)
+        transaction = (
+            TransactionBuilder(account)
+            .append_payment_op(self.DESTINATION_ACCOUNT_NO_MEMO_REQUIRED, "10", "XLM")
+            .append_payment_op(self.DESTINATION_ACCOUNT_NO_FOUND, "10", "XLM")
+            .append_payment_op(self.DESTINATION_ACCOUNT_MEMO_REQUIRED_B, "10", "XLM")
+            .append_payment_op(self.DESTINATION_ACCOUNT_FETCH_ERROR, "10", "XLM")
+            .append_payment_op(self.DESTINATION_ACCOUNT_MEMO_REQUIRED_A, "10", "XLM")
+            .build()
+        )
+        transaction.sign(keypair)
+        with pytest.raises(AccountRequiresMemoError) as err:
+            server.submit_transaction(transaction)
+        assert err.value.account_id == self.DESTINATION_ACCOUNT_MEMO_REQUIRED_B
+        assert err.value.operation_index == 2
+
+    @pytest.mark.asyncio
+    async def test_check_memo_required_reports_first_failing_destination_async(
+        self, httpserver
+    ):
+        self.__inject_mock_server(httpserver)
+        horizon_url = httpserver.url_for("/")
+        keypair = Keypair.from_secret(
+            "SDQXFKA32UVQHUTLYJ42N56ZUEM5PNVVI4XE7EA5QFMLA2DHDCQX3GPY"
+        )
+        account = Account(keypair.public_key, 1)
+        async with Server(
+            horizon_url, AiohttpClient(), memo_required_check_concurrency=3
+        ) as server:
+            transaction = (
+                TransactionBuilder(account)
+                .append_payment_op(
+                    self.DESTINATION_ACCOUNT_NO_MEMO_REQUIRED, "10", "XLM"
+                )
+                .append_payment_op(self.DESTINATION_ACCOUNT_NO_FOUND, "10", "XLM")
+                .append_payment_op(self.DESTINATION_ACCOUNT_FETCH_ERROR, "10", "XLM")
+                .append_payment_op(
+                    self.DESTINATION_ACCOUNT_MEMO_REQUIRED_B, "10", "XLM"
+                )
+                .build()
+            )
+            transaction.sign(keypair)
+            with pytest.raises(BadRequestError) as err:
+                await server.submit_transaction(transaction)
+            assert err.value.status == 400
+
+    def test_check_memo_required_cache_sync(self, httpserver):
+        self.__inject_mock_server(httpserver)
+        horizon_url = httpserver.url_for("/")
+        server = Server(horizon_url, memo_required_cache_ttl=60)
+        keypair = Keypair.from_secret(
+            "SDQXFKA32UVQHUTLYJ42N56ZUEM5PNVVI4XE7EA5QFMLA2DHDCQX3GPY"
+        )
+        account = Account(keypair.public_key, 1)
+        transaction = (
+            TransactionBuilder(account)
+            .append_payment_op(self.DESTINATION_ACCOUNT_NO_MEMO_REQUIRED, "10", "XLM")
+            .append_payment_op(self.DESTINATION_ACCOUNT_NO_FOUND, "10", "XLM")
+            .build()
+        )
+        transaction.sign(keypair)
+        server.submit_transaction(transaction)
+        server.submit_transaction(transaction)
+        paths = [request.path for request, _ in httpserver.log]
+        # not found accounts are not cached, they may be created at any time
+        assert (
+            paths.count("/accounts/%s" % self.DESTINATION_ACCOUNT_NO_MEMO_REQUIRED) == 1
+        )
+        assert paths.count("/accounts/%s" % self.DESTINATION_ACCOUNT_NO_FOUND) == 2
+
+    @pytest.mark.asyncio
+    async def test_check_memo_required_cache_disabled_async(self, httpserver):
+        self.__inject_mock_server(httpserver)
+        horizon_url = httpserver.url_for("/")
+        keypair = Keypair.from_secret(
+            "SDQXFKA32UVQHUTLYJ42N56ZUEM5PNVVI4XE7EA5QFMLA2DHDCQX3GPY"
+        )
+        account = Account(keypair.public_key, 1)
+        # the cache is disabled by default
+        async with Server(horizon_url, AiohttpClient()) as server:
+            transaction = (
+                TransactionBuilder(account)
+                .append_payment_op(
+                    self.DESTINATION_ACCOUNT_NO_MEMO_REQUIRED, "10", "XLM"
+                )
+                .build()
+            )
+            transaction.sign(keypair)
+            await server.submit_transaction(transaction)
+            await server.submit_transaction(transaction)
+        paths = [request.path for request, _ in httpserver.log]
+        assert (
+            paths.count("/accounts/%s" % self.DESTINATION_ACCOUNT_NO_MEMO_REQUIRED) == 2
+        )
+
+    def test_check_memo_required_executor_sync(self, httpserver):
+        self.__inject_mock_server(httpserver)
+        horizon_url = httpserver.url_for("/")
+        server = Server(horizon_url)
+        executor = server._memo_required_executor
+        keypair = Keypair.from_secret(
+            "SDQXFKA32UVQHUTLYJ42N56ZUEM5PNVVI4XE7EA5QFMLA2DHDCQX3GPY"
+        )
+        account = Account(keypair.public_key, 1)
+        transaction = (
+            TransactionBuilder(account)
+            .append_payment_op(self.DESTINATION_ACCOUNT_NO_MEMO_REQUIRED, "10", "XLM")
+            .append_payment_op(self.DESTINATION_ACCOUNT_NO_FOUND, "10", "XLM")
+            .build()
+        )
+        transaction.sign(keypair)
+        # the pool is created by the first check loading several accounts
+        assert executor is None
+        server.submit_transaction(transaction)
+        executor = server._memo_required_executor
+        assert executor is not None
+        server.submit_transaction(transaction)
+        assert server._memo_required_executor is executor
+        server.close()
+        assert server._memo_required_executor is None
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+        # a closed server still checks the memo requirements
+        server.submit_transaction(transaction)
+        assert server._memo_required_executor is not executor
+
+    def test_memo_required_cache_bounded(self, monkeypatch):
+        now = [100.0]
+        clock = types.SimpleNamespace(monotonic=lambda: now[0])
+        monkeypatch.setattr("stellar_sdk.server.time", clock)
+        cache = _MemoRequiredCache(ttl=10, maxsize=3)
+        for i in range(5):
+            cache.set(str(i), True)
+        # the oldest entries are evicted
+        assert list(cache._data) == ["2", "3", "4"]
+        assert cache.get("0") is None
+        cache.set("2", False)
+        assert list(cache._data) == ["3", "4", "2"]
+        now[0] = 105.0
+        cache.set("5", True)
+        assert list(cache._data) == ["4", "2", "5"]
+        # the expired entries are purged on the next insertion
+        now[0] = 111.0
+        cache.set("6", True)
+        assert list(cache._data) == ["5", "6"]
+        assert cache.get("5") is True
+        assert cache.get("6") is True
+
+    @pytest.mark.parametrize(
+        "kwargs, message",
+        [
+            (
+                {"memo_required_check_concurrency": 0},
+                "memo_required_check_concurrency should be greater than 0",
+            ),
+            (
+                {"memo_required_cache_ttl": -1},
+                "memo_required_cache_ttl should not be negative",
+            ),
+        ],
+    )
+    def test_invalid_memo_required_check_options_raise(self, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            Server(**kwargs)
+
     def __inject_mock_server(self, httpserver):
         memo_required_response = {"data": {"config.memo_required": "MQ=="}}
         no_memo_required_response = {"data": {}}
@@ -0,0 +1,69 @@
+import pytest
+
+from stellar_sdk import Keypair, Network
+from stellar_sdk.exceptions import Ed25519PublicKeyInvalidError
+from stellar_sdk.operation import BumpSequence
+from stellar_sdk.sep.ed25519_public_key_signer import Ed25519PublicKeySigner
+from stellar_sdk.sep.signature_verifier import SignatureVerifier
+from stellar_sdk.transaction import Transaction
+from stellar_sdk.transaction_envelope import TransactionEnvelope
+
+
+def make_envelope(source, sequence=1):
+    tx = Transaction(source, sequence, 100, [BumpSequence(0)], v1=True)
+    return TransactionEnvelope(tx, Network.TESTNET_NETWORK_PASSPHRASE)
+
+
+class TestSignatureVerifier:
+    def test_verify(self):
+        kp1, kp2, kp3 = Keypair.random(), Keypair.random(), Keypair.random()
+        signers = [
+            Ed25519PublicKeySigner(kp.public_key, weight)
+            for kp, weight in [(kp1, 1), (kp2, 2), (kp3, 3)]
+        ]
+        te = make_envelope(kp1)
+        te.sign(kp3)
+        te.sign(kp1)
+        te.sign_hashx(b"\x00" * 32)
+        verifier = SignatureVerifier(signers)
+        assert verifier.verify(te) == [signers[0], signers[2]]
+
+    def test_verify_signature_used_once(self):
+        kp = Keypair.random()
+        signer = Ed25519PublicKeySigner(kp.public_key)
+        te = make_envelope(kp)
+        te.sign(kp)
+        assert SignatureVerifier([signer, signer]).verify(te) == [signer]
+        te.signatures.append(te.signatures[0])
+        assert SignatureVerifier([signer, signer]).verify(te) == [signer, signer]
+
+    def test_verify_hint_collision(self):
+        kp = Keypair.random()
+        te = make_envelope(kp)
+        forged = kp.sign_decorated(b"\x00" * 32)
+        te.signatures.append(forged)
+        te.sign(kp)
+        signer = Ed25519PublicKeySigner(kp.public_key)
+        assert SignatureVerifier([signer]).verify(te) == [signer]
+
+    def test_verify_many(self):
+        kp1, kp2 = Keypair.random(), Keypair.random()
+        signers = [
+            Ed25519PublicKeySigner(kp1.public_key),
+            Ed25519PublicKeySigner(kp2.public_key),
+        ]
+        envelopes = [make_envelope(kp1, i) for i in range(4)]
+        envelopes[0].sign(kp1)
+        envelopes[1].sign(kp2)
+        envelopes[2].sign(kp1)
+        envelopes[2].sign(kp2)
+        assert SignatureVerifier(signers).verify_many(envelopes) == [
+            [signers[0]],
+            [signers[1]],
+            signers,
+            [],
+        ]
+
+    def test_invalid_signer_raise(self):
+        with pytest.raises(Ed25519PublicKeyInvalidError):
+            SignatureVerifier([Ed25519PublicKeySigner("GINVALID")])
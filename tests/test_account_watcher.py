@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+
+from stellar_sdk.account_watcher import AccountWatcher
+from stellar_sdk.call_builder.ledgers_call_builder import LedgersCallBuilder
+from stellar_sdk.call_builder.payments_call_builder import PaymentsCallBuilder
+from stellar_sdk.client.base_async_client import BaseAsyncClient
+from stellar_sdk.client.base_sync_client import BaseSyncClient
+from stellar_sdk.exceptions import Ed25519PublicKeyInvalidError, TypeError, ValueError
+from stellar_sdk.records import OperationRecord
+from stellar_sdk.strkey import StrKey
+
+HORIZON_URL = "https://horizon.stellar.org"
+ALICE, BOB, CAROL = (
+    StrKey.encode_ed25519_public_key(bytes([i]) * 32) for i in range(1, 4)
+)
+
+
+def payment(id, source, to):
+    return {"id": id, "type": "payment", "source_account": source, "from": source, "to": to}
+
+
+EVENTS = [
+    payment("1", ALICE, BOB),
+    payment("2", CAROL, CAROL),
+    payment("3", BOB, ALICE),
+    {"id": "4", "type": "bump_sequence", "source_account": "not an account"},
+]
+
+
+class FakeSyncClient(BaseSyncClient):
+    def __init__(self, events):
+        self.events = events
+        self.urls = []
+
+    def get(self, url, params=None):
+        raise NotImplementedError
+
+    def post(self, url, data=None):
+        raise NotImplementedError
+
+    def stream(self, url, params=None):
+        self.urls.append(url)
+        for event in self.events:
+            yield dict(event)
+
+    def close(self):
+        pass
+
+
+class FakeAsyncClient(BaseAsyncClient):
+    def __init__(self, events):
+        self.events = events
+
+    async def get(self, url, params=None):
+        raise NotImplementedError
+
+    async def post(self, url, data=None):
+        raise NotImplementedError
+
+    async def stream(self, url, params=None):
+        for event in self.events:
+            yield dict(event)
+
+    async def close(self):
+        pass
+
+
+class TestAccountWatcher:
+    def test_run(self):
+        client = FakeSyncClient(EVENTS)
+        watcher = AccountWatcher(PaymentsCallBuilder(HORIZON_URL, client))
+        received = []
+        watcher.add_account(ALICE, lambda account, event: received.append((account, event["id"])))
+        watcher.add_account(CAROL, lambda account, event: received.append((account, event["id"])))
+        watcher.run()
+        assert client.urls == [HORIZON_URL + "/payments"]
+        # a payment to itself is dispatched once
+        assert received == [(ALICE, "1"), (CAROL, "2"), (ALICE, "3")]
+        assert (watcher.events, watcher.matched_events, watcher.handler_calls) == (4, 3, 3)
+        assert watcher.max_dispatch_time >= watcher.mean_dispatch_time > 0
+        watcher.reset_counters()
+        assert watcher.events == 0
+
+    def test_add_and_remove_while_running(self):
+        client = FakeSyncClient(EVENTS)
+        watcher = AccountWatcher(PaymentsCallBuilder(HORIZON_URL, client))
+        received = []
+
+        def on_alice(account, event):
+            received.append(event["id"])
+            # the next payments of Alice are not watched, Bob's are
+            watcher.remove_account(ALICE)
+            watcher.add_account(BOB, lambda account, event: received.append(account))
+
+        watcher.add_account(ALICE, on_alice)
+        watcher.run()
+        assert received == ["1", BOB]
+        assert ALICE not in watcher
+        assert BOB in watcher
+        assert "invalid" not in watcher
+        assert len(watcher) == 1
+
+    def test_handlers(self):
+        watcher = AccountWatcher(PaymentsCallBuilder(HORIZON_URL, FakeSyncClient([])))
+        calls = []
+
+        def first(account, event):
+            calls.append("first")
+
+        def second(account, event):
+            calls.append("second")
+
+        watcher.add_account(BOB, first)
+        watcher.add_account(BOB, first)
+        watcher.add_account(BOB, second)
+        assert watcher.dispatch(EVENTS[0]) == 2
+        watcher.remove_account(BOB, first)
+        assert watcher.dispatch(EVENTS[0]) == 1
+        assert calls == ["first", "second", "second"]
+        with pytest.raises(ValueError, match="is not watched"):
+            watcher.remove_account(BOB, first)
+        watcher.remove_account(BOB, second)
+        with pytest.raises(ValueError, match="is not watched"):
+            watcher.remove_account(BOB)
+        with pytest.raises(Ed25519PublicKeyInvalidError):
+            watcher.add_account("GABC", first)
+
+    def test_typed_records(self):
+        watcher = AccountWatcher(PaymentsCallBuilder(HORIZON_URL, FakeSyncClient([])))
+        received = []
+        watcher.add_account(BOB, lambda account, event: received.append(event))
+        record = OperationRecord.from_dict(payment("1", ALICE, BOB))
+        assert watcher.dispatch(record) == 1
+        assert received == [record]
+
+    @pytest.mark.asyncio
+    async def test_arun(self):
+        watcher = AccountWatcher(PaymentsCallBuilder(HORIZON_URL, FakeAsyncClient(EVENTS)))
+        received = []
+
+        async def on_payment(account, event):
+            await asyncio.sleep(0)
+            received.append(event["id"])
+
+        watcher.add_account(BOB, on_payment)
+        watcher.add_account(CAROL, lambda account, event: received.append(account))
+        await watcher.arun()
+        assert received == ["1", CAROL, "3"]
+        with pytest.raises(TypeError, match="Use arun"):
+            AccountWatcher(PaymentsCallBuilder(HORIZON_URL, FakeAsyncClient([]))).run()
+
+    def test_unsupported_call_builder_raise(self):
+        with pytest.raises(TypeError, match="got LedgersCallBuilder"):
+            AccountWatcher(LedgersCallBuilder(HORIZON_URL, FakeSyncClient([])))
@@ -0,0 +1,159 @@
+import json
+
+import pytest
+from werkzeug import Response
+
+from stellar_sdk import Server
+from stellar_sdk.backfill import backfill_records, _split_range
+from stellar_sdk.client.aiohttp_client import AiohttpClient
+from stellar_sdk.exceptions import BadRequestError, TypeError, ValueError
+
+LEDGERS = range(1, 21)
+OPERATIONS_PER_LEDGER = 3
+
+
+def paging_token(ledger, index):
+    return (ledger << 32) | (1 << 12) | index
+
+
+def inject_history_server(httpserver, fail_ledger=None):
+    tokens = [
+        paging_token(ledger, index)
+        for ledger in LEDGERS
+        for index in range(1, OPERATIONS_PER_LEDGER + 1)
+    ]
+    requests = []
+
+    def handler(request):
+        requests.append(dict(request.args))
+        assert request.args["order"] == "asc"
+        cursor = int(request.args["cursor"].split("-")[0])
+        limit = int(request.args["limit"])
+        if fail_ledger is not None and (cursor + 1) >> 32 >= fail_ledger:
+            return Response(json.dumps({"status": 400}), 400)
+        page = [t for t in tokens if t > cursor][:limit]
+        records = [{"id": str(t), "paging_token": str(t)} for t in page]
+        next_cursor = page[-1] if page else cursor
+        body = {
+            "_links": {
+                "next": {
+                    "href": httpserver.url_for(
+                        request.path
+                        + "?cursor={}&limit={}&order=asc".format(next_cursor, limit)
+                    )
+                }
+            },
+            "_embedded": {"records": records},
+        }
+        return Response(json.dumps(body), content_type="application/json")
+
+    httpserver.expect_request("/operations").respond_with_handler(handler)
+    httpserver.expect_request("/effects").respond_with_handler(handler)
+    return requests
+
+
+def expected_ids(start_ledger, end_ledger):
+    return [
+        str(paging_token(ledger, index))
+        for ledger in range(start_ledger, end_ledger + 1)
+        for index in range(1, OPERATIONS_PER_LEDGER + 1)
+    ]
+
+
+class TestBackfill:
+    def test_split_range(self):
+        assert _split_range(1, 10, 3) == [(1, 4), (5, 7), (8, 10)]
+        assert _split_range(5, 6, 4) == [(5, 5), (6, 6)]
+        assert _split_range(7, 7, 1) == [(7, 7)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "concurrency, partitions, limit", [(1, 1, 200), (2, 5, 2), (4, None, 4)]
+    )
+    async def test_backfill_records(self, httpserver, concurrency, partitions, limit):
+        requests = inject_history_server(httpserver)
+        async with Server(httpserver.url_for("/"), AiohttpClient()) as server:
+            records = [
+                record
+                async for record in backfill_records(
+                    server.operations(),
+                    3,
+                    17,
+                    concurrency=concurrency,
+                    partitions=partitions,
+                    limit=limit,
+                )
+            ]
+        assert [record["id"] for record in records] == expected_ids(3, 17)
+        starts = _split_range(3, 17, partitions or concurrency)
+        assert {str((first << 32) - 1) for first, _ in starts} <= {
+            r["cursor"] for r in requests
+        }
+        assert all(r["limit"] == str(limit) for r in requests)
+
+    @pytest.mark.asyncio
+    async def test_backfill_records_effects_cursor(self, httpserver):
+        requests = inject_history_server(httpserver)
+        async with Server(httpserver.url_for("/"), AiohttpClient()) as server:
+            records = [
+                record
+                async for record in backfill_records(
+                    server.effects(), 1, 2, partitions=2
+                )
+            ]
+        assert [record["id"] for record in records] == expected_ids(1, 2)
+        assert sorted(r["cursor"] for r in requests) == [
+            "{}-0".format((1 << 32) - 1),
+            "{}-0".format((2 << 32) - 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_backfill_records_break(self, httpserver):
+        inject_history_server(httpserver)
+        async with Server(httpserver.url_for("/"), AiohttpClient()) as server:
+            records = backfill_records(server.operations(), 1, 20, limit=2)
+            async for record in records:
+                assert record["id"] == expected_ids(1, 1)[0]
+                break
+            await records.aclose()
+
+    @pytest.mark.asyncio
+    async def test_backfill_records_error_raise(self, httpserver):
+        inject_history_server(httpserver, fail_ledger=11)
+        async with Server(httpserver.url_for("/"), AiohttpClient()) as server:
+            ids = []
+            with pytest.raises(BadRequestError):
+                async for record in backfill_records(
+                    server.operations(), 1, 20, partitions=2
+                ):
+                    ids.append(record["id"])
+        # the records of the partitions before the failing one are yielded
+        assert ids == expected_ids(1, 10)
+
+    def test_call_builder_type_raise(self):
+        server = Server("https://horizon.stellar.org")
+        with pytest.raises(
+            TypeError, match="backfill_records supports ledgers, transactions"
+        ):
+            backfill_records(server.accounts(), 1, 2)
+        with pytest.raises(
+            TypeError, match="backfill_records requires an asynchronous client."
+        ):
+            backfill_records(server.operations(), 1, 2)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "args, kwargs, message",
+        [
+            ((0, 10), {}, r"Invalid ledger range \[0, 10\]."),
+            ((10, 9), {}, r"Invalid ledger range \[10, 9\]."),
+            ((1, 10), {"concurrency": 0}, "concurrency should be greater than 0"),
+            ((1, 10), {"partitions": 0}, "partitions should be greater than 0"),
+            ((1, 10), {"limit": 0}, "limit should be greater than 0"),
+            ((1, 10), {"buffer_pages": 0}, "buffer_pages should be greater than 0"),
+        ],
+    )
+    async def test_invalid_args_raise(self, args, kwargs, message):
+        async with Server("https://horizon.stellar.org", AiohttpClient()) as server:
+            with pytest.raises(ValueError, match=message):
+                backfill_records(server.operations(), *args, **kwargs)
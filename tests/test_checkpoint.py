@@ -0,0 +1,261 @@
+import json
+import os
+
+import pytest
+
+from stellar_sdk.call_builder.ledgers_call_builder import LedgersCallBuilder
+from stellar_sdk.call_builder.payments_call_builder import PaymentsCallBuilder
+from stellar_sdk.checkpoint import (
+    Checkpointer,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from stellar_sdk.client.base_async_client import BaseAsyncClient
+from stellar_sdk.client.base_sync_client import BaseSyncClient
+from stellar_sdk.client.response import Response
+from stellar_sdk.exceptions import StreamClientError, ValueError
+
+HORIZON_URL = "https://horizon.stellar.org"
+
+
+def event(i):
+    return {"id": str(i), "paging_token": str(i)}
+
+
+def start(params):
+    cursor = (params or {}).get("cursor")
+    return 0 if cursor in (None, "now") else int(cursor) + 1
+
+
+def page(params, count):
+    first = start(params)
+    records = [event(i) for i in range(first, min(first + 2, count))]
+    body = {"_embedded": {"records": records}, "_links": {}}
+    if records:
+        body["_links"]["next"] = {
+            "href": HORIZON_URL + "/payments?cursor=" + records[-1]["paging_token"]
+        }
+    return body
+
+
+class FakeSyncClient(BaseSyncClient):
+    """Streams and pages ``count`` events, starting after the cursor,
+    the stream fails after ``fail_after`` events."""
+
+    def __init__(self, count, fail_after=None):
+        self.count = count
+        self.fail_after = fail_after
+        self.cursors = []
+
+    def get(self, url, params=None):
+        if params is None:
+            params = {"cursor": url.rsplit("=", 1)[1]}
+        self.cursors.append(params.get("cursor"))
+        body = json.dumps(page(params, self.count))
+        return Response(200, body, {}, url)
+
+    def post(self, url, data=None):
+        raise NotImplementedError
+
+    def stream(self, url, params=None):
+        self.cursors.append(params.get("cursor"))
+        for n, i in enumerate(range(start(params), self.count)):
+            if n == self.fail_after:
+                raise StreamClientError(str(i - 1), "failed")
+            yield event(i)
+
+    def close(self):
+        pass
+
+
+class FakeAsyncClient(BaseAsyncClient):
+    def __init__(self, count):
+        self.count = count
+        self.cursors = []
+
+    async def get(self, url, params=None):
+        if params is None:
+            params = {"cursor": url.rsplit("=", 1)[1]}
+        self.cursors.append(params.get("cursor"))
+        body = json.dumps(page(params, self.count))
+        return Response(200, body, {}, url)
+
+    async def post(self, url, data=None):
+        raise NotImplementedError
+
+    async def stream(self, url, params=None):
+        self.cursors.append(params.get("cursor"))
+        for i in range(start(params), self.count):
+            yield event(i)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        store = MemoryCheckpointStore()
+    elif request.param == "file":
+        store = FileCheckpointStore(str(tmp_path / "checkpoints.json"))
+    else:
+        store = SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+    yield store
+    store.close()
+
+
+class TestCheckpointStores:
+    def test_load_save(self, store):
+        assert store.load("payments") is None
+        store.save("payments", "1")
+        store.save("effects", "2")
+        store.save("payments", "3")
+        assert store.load("payments") == "3"
+        assert store.load("effects") == "2"
+
+    def test_file_store_persists(self, tmp_path):
+        path = str(tmp_path / "checkpoints.json")
+        FileCheckpointStore(path).save("payments", "12884905985")
+        assert FileCheckpointStore(path).load("payments") == "12884905985"
+        with open(path) as f:
+            assert json.load(f) == {"payments": "12884905985"}
+        assert os.listdir(str(tmp_path)) == ["checkpoints.json"]
+
+    def test_sqlite_store_persists(self, tmp_path):
+        path = str(tmp_path / "checkpoints.db")
+        store = SQLiteCheckpointStore(path, table="cursors")
+        store.save("payments", "12884905985")
+        store.close()
+        store = SQLiteCheckpointStore(path, table="cursors")
+        assert store.load("payments") == "12884905985"
+        store.close()
+
+    def test_sqlite_store_invalid_table(self, tmp_path):
+        with pytest.raises(ValueError, match="table should be an identifier"):
+            SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"), table="a; b")
+
+
+class TestCheckpointer:
+    def test_commit_every_events(self):
+        store = MemoryCheckpointStore()
+        checkpointer = Checkpointer(store, "payments", every_events=3, every_seconds=60)
+        for i in range(7):
+            checkpointer.track(str(i))
+        assert store.load("payments") == "5"
+        assert checkpointer.cursor == "6"
+        assert checkpointer.committed_cursor == "5"
+        assert checkpointer.commits == 2
+        checkpointer.commit()
+        checkpointer.commit()
+        assert store.load("payments") == "6"
+        assert checkpointer.commits == 3
+
+    def test_commit_every_seconds(self):
+        store = MemoryCheckpointStore()
+        checkpointer = Checkpointer(store, "payments", every_events=100, every_seconds=0)
+        checkpointer.track("1")
+        assert store.load("payments") == "1"
+
+    def test_resume(self):
+        store = MemoryCheckpointStore()
+        store.save("payments", "5")
+        checkpointer = Checkpointer(store, "payments", every_events=100)
+        assert checkpointer.resume() == "5"
+        checkpointer.track("8")
+        assert checkpointer.resume() == "8"
+
+    def test_invalid_args(self):
+        store = MemoryCheckpointStore()
+        with pytest.raises(ValueError, match="every_events should be greater than 0"):
+            Checkpointer(store, "payments", every_events=0)
+        with pytest.raises(ValueError, match="every_seconds should not be negative"):
+            Checkpointer(store, "payments", every_seconds=-1)
+
+
+class TestCallBuilderCheckpoint:
+    def test_default_key(self):
+        builder = (
+            PaymentsCallBuilder(HORIZON_URL, FakeSyncClient(0))
+            .for_account("GAAZI4TCR3TY5OJHCTJC2A4QSY6CJWJH5IAJTGKIN2ER7LBNVKOCCWN7")
+            .limit(10)
+            .cursor("now")
+        )
+        assert builder._checkpoint_key() == (
+            HORIZON_URL
+            + "/accounts/GAAZI4TCR3TY5OJHCTJC2A4QSY6CJWJH5IAJTGKIN2ER7LBNVKOCCWN7/payments?limit=10"
+        )
+
+    def test_stream_resumes_after_restart(self, store):
+        client = FakeSyncClient(10, fail_after=5)
+        builder = PaymentsCallBuilder(HORIZON_URL, client).cursor("now")
+        builder.checkpoint(store, "payments", every_events=2, every_seconds=60)
+        received = []
+        with pytest.raises(StreamClientError):
+            for payment in builder.stream():
+                received.append(payment["id"])
+        assert received == ["0", "1", "2", "3", "4"]
+        # The caller asked for the event after "4" when the stream failed.
+        assert store.load("payments") == "4"
+
+        # A new process.
+        client = FakeSyncClient(10)
+        builder = PaymentsCallBuilder(HORIZON_URL, client).cursor("now")
+        builder.checkpoint(store, "payments", every_events=2, every_seconds=60)
+        received = [payment["id"] for payment in builder.stream()]
+        assert client.cursors == ["4"]
+        assert received == ["5", "6", "7", "8", "9"]
+        assert store.load("payments") == "9"
+
+    def test_stream_closed(self, store):
+        builder = PaymentsCallBuilder(HORIZON_URL, FakeSyncClient(10))
+        builder.checkpoint(store, "payments", every_events=100, every_seconds=60)
+        for payment in builder.stream():
+            if payment["id"] == "4":
+                break
+        # The caller may not have processed the last event.
+        assert store.load("payments") == "3"
+
+    def test_stream_without_checkpoint(self, store):
+        client = FakeSyncClient(3)
+        builder = PaymentsCallBuilder(HORIZON_URL, client).cursor("1")
+        assert [payment["id"] for payment in builder.stream()] == ["2"]
+        assert client.cursors == ["1"]
+
+    def test_typed_stream(self, store):
+        builder = LedgersCallBuilder(HORIZON_URL, FakeSyncClient(3)).typed()
+        builder.checkpoint(store, every_events=1)
+        assert [ledger.id for ledger in builder.stream()] == ["0", "1", "2"]
+        assert store.load(HORIZON_URL + "/ledgers") == "2"
+
+    def test_iter_records_resumes(self, store):
+        store.save("payments", "4")
+        client = FakeSyncClient(9)
+        builder = PaymentsCallBuilder(HORIZON_URL, client)
+        builder.checkpoint(store, "payments", every_events=100, every_seconds=60)
+        records = builder.iter_records(max_records=3)
+        assert [record["id"] for record in records] == ["5", "6", "7"]
+        assert client.cursors[0] == "4"
+        assert store.load("payments") == "7"
+
+    @pytest.mark.asyncio
+    async def test_async_stream_resumes(self, store):
+        store.save("payments", "6")
+        client = FakeAsyncClient(10)
+        builder = PaymentsCallBuilder(HORIZON_URL, client).cursor("now")
+        builder.checkpoint(store, "payments", every_events=100, every_seconds=60)
+        received = [payment["id"] async for payment in builder.stream()]
+        assert client.cursors == ["6"]
+        assert received == ["7", "8", "9"]
+        assert store.load("payments") == "9"
+
+    @pytest.mark.asyncio
+    async def test_aiter_records_resumes(self, store):
+        store.save("payments", "2")
+        client = FakeAsyncClient(7)
+        builder = PaymentsCallBuilder(HORIZON_URL, client)
+        builder.checkpoint(store, "payments", every_events=2, every_seconds=60)
+        received = [record["id"] async for record in builder.aiter_records()]
+        assert received == ["3", "4", "5", "6"]
+        assert client.cursors[0] == "2"
+        assert store.load("payments") == "6"
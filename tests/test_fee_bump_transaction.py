@@ -108,6 +108,53 @@ class TestFeeBumpTransaction:
         assert restore_te.transaction.fee_source.public_key == fee_source2.public_key
         assert restore_te.transaction._fee_source_muxed is None
 
+    def test_signature_base_cache(self):
+        inner_keypair = Keypair.from_secret(
+            "SBKTIFHJSS3JJWEZO2W74DZSA45WZU56LOL3AY7GAW63BXPEJQFYV53E"
+        )
+        inner_source = Account(inner_keypair.public_key, 7)
+        destination = "GDQERENWDDSQZS7R7WKHZI3BSOYMV3FSWR7TFUYFTKQ447PIX6NREOJM"
+        inner_tx = (
+            TransactionBuilder(
+                inner_source, Network.TESTNET_NETWORK_PASSPHRASE, 200, v1=True
+            )
+            .append_payment_op(destination=destination, amount="2000", asset_code="XLM")
+            .add_time_bounds(0, 0)
+            .build()
+        )
+        fee_source = Keypair.from_secret(
+            "SB7ZMPZB3YMMK5CUWENXVLZWBK4KYX4YU5JBXQNZSK2DP2Q7V3LVTO5V"
+        )
+        fee_bump_tx = TransactionBuilder.build_fee_bump_transaction(
+            fee_source.public_key, 200, inner_tx, Network.TESTNET_NETWORK_PASSPHRASE
+        )
+        signature_base = fee_bump_tx.signature_base()
+        tx_hash = fee_bump_tx.hash()
+        assert fee_bump_tx.signature_base() is signature_base
+        assert fee_bump_tx.hash() is tx_hash
+
+        def assert_invalidated():
+            nonlocal signature_base, tx_hash
+            expected = FeeBumpTransactionEnvelope.from_xdr(
+                fee_bump_tx.to_xdr(), Network.TESTNET_NETWORK_PASSPHRASE
+            )
+            assert fee_bump_tx.signature_base() is not signature_base
+            assert fee_bump_tx.signature_base() == expected.signature_base()
+            assert fee_bump_tx.hash() == expected.hash()
+            assert fee_bump_tx.hash() != tx_hash
+            signature_base = fee_bump_tx.signature_base()
+            tx_hash = fee_bump_tx.hash()
+
+        # The signatures of the inner transaction are part of the payload.
+        inner_tx.sign(inner_keypair)
+        assert_invalidated()
+        fee_bump_tx.transaction.base_fee = 300
+        assert_invalidated()
+        inner_tx.transaction.time_bounds.max_time = 99999
+        assert_invalidated()
+        fee_bump_tx.sign(fee_source)
+        assert fee_bump_tx.signature_base() is signature_base
+
     def test_tx_not_v1(self):
         inner_keypair = Keypair.from_secret(
             "SBKTIFHJSS3JJWEZO2W74DZSA45WZU56LOL3AY7GAW63BXPEJQFYV53E"
@@ -1,7 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
+from stellar_sdk.exceptions import MissingEd25519SecretSeedError
 from stellar_sdk.fee_bump_transaction_envelope import FeeBumpTransactionEnvelope
-from stellar_sdk.helpers import parse_transaction_envelope_from_xdr
+from stellar_sdk.helpers import parse_transaction_envelope_from_xdr, sign_many
+from stellar_sdk.keypair import Keypair
+from stellar_sdk.network import Network
+from stellar_sdk.operation import BumpSequence
+from stellar_sdk.transaction import Transaction
 from stellar_sdk.transaction_envelope import TransactionEnvelope
 
 
@@ -26,3 +33,48 @@ class TestHelpers:
     def test_parse_transaction_envelope_from_xdr(self, xdr, te_type):
         te = parse_transaction_envelope_from_xdr(xdr, "")
         assert isinstance(te, te_type)
+
+    @pytest.mark.parametrize("use_executor", [False, True])
+    def test_sign_many(self, use_executor):
+        kp1 = Keypair.from_secret(
+            "SCCS5ZBI7WVIJ4SW36WGOQQIWJYCL3VOAULSXX3FB57USIO25EDOYQHH"
+        )
+        kp2 = Keypair.random()
+        envelopes = []
+        for sequence in range(1, 6):
+            tx = Transaction(
+                kp1,
+                sequence,
+                100,
+                [BumpSequence(sequence + 100)],
+                v1=sequence % 2 == 0,
+            )
+            envelopes.append(
+                TransactionEnvelope(tx, Network.TESTNET_NETWORK_PASSPHRASE)
+            )
+        envelopes[0].sign(kp1)
+
+        if use_executor:
+            with ThreadPoolExecutor(2) as executor:
+                sign_many(envelopes, [kp1, kp2.secret, kp1], executor, chunk_size=2)
+        else:
+            sign_many(envelopes, [kp1, kp2.secret, kp1])
+
+        for envelope in envelopes:
+            assert len(envelope.signatures) == 2
+            tx_hash = envelope.hash()
+            for kp, signature in zip([kp1, kp2], envelope.signatures):
+                assert signature.hint == kp.signature_hint()
+                kp.verify(tx_hash, signature.signature)
+
+    def test_sign_many_missing_secret_raise(self):
+        kp = Keypair.random()
+        tx = Transaction(kp, 1, 100, [BumpSequence(2)])
+        te = TransactionEnvelope(tx, Network.TESTNET_NETWORK_PASSPHRASE)
+        signer = Keypair.from_public_key(kp.public_key)
+        with pytest.raises(MissingEd25519SecretSeedError):
+            sign_many([te], [signer])
+        with ThreadPoolExecutor(1) as executor:
+            with pytest.raises(MissingEd25519SecretSeedError):
+                sign_many([te], [signer], executor)
+        assert te.signatures == []
@@ -0,0 +1,64 @@
+import subprocess
+import sys
+
+import pytest
+
+import stellar_sdk
+from stellar_sdk import helpers, operation
+
+HEAVY_MODULES = (
+    "aiohttp",
+    "requests",
+    "mnemonic",
+    "toml",
+    "stellar_sdk.xdr",
+)
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+
+
+class TestInit:
+    @pytest.mark.skipif(
+        sys.version_info < (3, 7), reason="module __getattr__ requires Python 3.7"
+    )
+    def test_import_is_lazy(self):
+        out = run_python(
+            "import sys, stellar_sdk; "
+            "print(' '.join(m for m in sys.modules if m.split('.')[0] in {}))".format(
+                set(m.split(".")[0] for m in HEAVY_MODULES)
+            )
+        )
+        loaded = out.split()
+        for module in HEAVY_MODULES:
+            assert module not in loaded
+
+    def test_all(self):
+        names = set(stellar_sdk.__all__)
+        assert set(operation.__all__) <= names
+        assert set(helpers.__all__) <= names
+        for name in stellar_sdk.__all__:
+            assert getattr(stellar_sdk, name) is not None
+        assert set(stellar_sdk.__all__) <= set(dir(stellar_sdk))
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from stellar_sdk import *", namespace)
+        assert namespace["Keypair"] is stellar_sdk.keypair.Keypair
+        assert namespace["Flag"] is operation.Flag
+        assert namespace["sign_many"] is helpers.sign_many
+
+    def test_submodule_attribute(self):
+        assert stellar_sdk.strkey.StrKey is not None
+
+    def test_unknown_attribute_raise(self):
+        with pytest.raises(
+            AttributeError, match="module 'stellar_sdk' has no attribute 'unknown'"
+        ):
+            stellar_sdk.unknown
@@ -1,8 +1,9 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import nacl.signing as ed25519
-from stellar_sdk.sep.mnemonic import Language
+from stellar_sdk.sep.mnemonic import Language, StellarMnemonic
 
 from stellar_sdk.exceptions import ValueError, AttributeError, TypeError
 
@@ -474,3 +475,111 @@ class TestKeypair:
                     index=i,
                 )
                 assert data["accounts"][i] == (kp.public_key, kp.secret)
+
+    def test_from_mnemonic_phrase_range(self):
+        mnemonic = "illness spike retreat truth genius clock brain pass fit cave bargain toe"
+        kps = Keypair.from_mnemonic_phrase_range(mnemonic, start=0, count=3)
+        assert [(kp.public_key, kp.secret) for kp in kps] == [
+            (
+                "GDRXE2BQUC3AZNPVFSCEZ76NJ3WWL25FYFK6RGZGIEKWE4SOOHSUJUJ6",
+                "SBGWSG6BTNCKCOB3DIFBGCVMUPQFYPA2G4O34RMTB343OYPXU5DJDVMN",
+            ),
+            (
+                "GBAW5XGWORWVFE2XTJYDTLDHXTY2Q2MO73HYCGB3XMFMQ562Q2W2GJQX",
+                "SCEPFFWGAG5P2VX5DHIYK3XEMZYLTYWIPWYEKXFHSK25RVMIUNJ7CTIS",
+            ),
+            (
+                "GAY5PRAHJ2HIYBYCLZXTHID6SPVELOOYH2LBPH3LD4RUMXUW3DOYTLXW",
+                "SDAILLEZCSA67DUEP3XUPZJ7NYG7KGVRM46XA7K5QWWUIGADUZCZWTJP",
+            ),
+        ]
+        assert Keypair.from_mnemonic_phrase_range(mnemonic, count=0) == []
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 100])
+    def test_from_mnemonic_phrase_range_with_executor(self, chunk_size):
+        mnemonic = "cable spray genius state float twenty onion head street palace net private method loan turn phrase state blanket interest dry amazing dress blast tube"
+        passphrase = "p4ssphr4se"
+        with ThreadPoolExecutor(2) as executor:
+            kps = Keypair.from_mnemonic_phrase_range(
+                mnemonic, passphrase, 5, 7, executor, chunk_size
+            )
+        assert kps == [
+            Keypair.from_mnemonic_phrase(mnemonic, passphrase, index)
+            for index in range(5, 12)
+        ]
+
+    @pytest.mark.parametrize(
+        "start, count, chunk_size, message",
+        [
+            (-1, 1, 1, "start and count should not be negative."),
+            (0, -1, 1, "start and count should not be negative."),
+            (0, 1, 0, "chunk_size should be greater than 0."),
+        ],
+    )
+    def test_from_mnemonic_phrase_range_raise(self, start, count, chunk_size, message):
+        with pytest.raises(ValueError, match=message):
+            Keypair.from_mnemonic_phrase_range(
+                "illness spike retreat truth genius clock brain pass fit cave bargain toe",
+                start=start,
+                count=count,
+                chunk_size=chunk_size,
+            )
+
+    def test_mnemonic_account_path(self):
+        assert StellarMnemonic.STELLAR_ACCOUNT_PATH_FORMAT == "m/44'/148'/%d'"
+        assert StellarMnemonic.STELLAR_ACCOUNT_PATH_PREFIX == (44, 148)
+
+    def test_mnemonic_for_language(self):
+        mnemonic = StellarMnemonic.for_language(Language.KOREAN)
+        assert StellarMnemonic.for_language("korean") is mnemonic
+        assert StellarMnemonic.for_language() is not mnemonic
+        assert mnemonic.wordlist == StellarMnemonic(Language.KOREAN).wordlist
+
+    def test_public_key_cache(self):
+        public_key = "GAHK7EEG2WWHVKDNT4CEQFZGKF2LGDSW2IVM4S5DP42RBW3K6BTODB4A"
+        assert Keypair.public_key_cache_info() is None
+        assert Keypair.from_public_key(public_key) is not Keypair.from_public_key(
+            public_key
+        )
+        Keypair.enable_public_key_cache(2)
+        try:
+            kp = Keypair.from_public_key(public_key)
+            assert Keypair.from_public_key(public_key) is kp
+            assert kp.public_key == public_key
+            assert not kp.can_sign()
+            assert Keypair.public_key_cache_info() == (1, 1, 2, 1)
+            assert isinstance(kp, Keypair)
+            assert kp == Keypair.from_raw_ed25519_public_key(kp.raw_public_key())
+            assert Keypair.from_raw_ed25519_public_key(kp.raw_public_key()) == kp
+
+            signer = Keypair.random()
+            with pytest.raises(AttributeError, match="cannot be modified"):
+                kp.signing_key = signer.signing_key
+            with pytest.raises(AttributeError, match="cannot be modified"):
+                kp.verify_key = signer.verify_key
+            with pytest.raises(AttributeError, match="cannot be modified"):
+                del kp.verify_key
+            assert Keypair.from_public_key(public_key).public_key == public_key
+            assert not Keypair.from_public_key(public_key).can_sign()
+            assert Keypair.public_key_cache_info() == (3, 1, 2, 1)
+
+            other = [Keypair.random().public_key for _ in range(2)]
+            Keypair.from_public_key(other[0])
+            Keypair.from_public_key(public_key)
+            Keypair.from_public_key(other[1])  # evicts other[0]
+            assert Keypair.public_key_cache_info() == (4, 3, 2, 2)
+            assert Keypair.from_public_key(public_key) is kp
+            Keypair.from_public_key(other[0])
+            assert Keypair.public_key_cache_info() == (5, 4, 2, 2)
+
+            with pytest.raises(Ed25519PublicKeyInvalidError):
+                Keypair.from_public_key("GINVALID")
+            assert Keypair.public_key_cache_info().currsize == 2
+        finally:
+            Keypair.disable_public_key_cache()
+        assert Keypair.public_key_cache_info() is None
+        assert Keypair.from_public_key(public_key) is not kp
+
+    def test_enable_public_key_cache_raise(self):
+        with pytest.raises(ValueError, match="maxsize should be greater than 0."):
+            Keypair.enable_public_key_cache(0)
@@ -0,0 +1,145 @@
+import pytest
+
+from stellar_sdk.asset import Asset
+from stellar_sdk.exceptions import ValueError
+from stellar_sdk.fee_bump_transaction import FeeBumpTransaction
+from stellar_sdk.fee_bump_transaction_envelope import FeeBumpTransactionEnvelope
+from stellar_sdk.keypair import Keypair
+from stellar_sdk.lazy_transaction_envelope import LazyTransactionEnvelope
+from stellar_sdk.memo import IdMemo, Memo, TextMemo
+from stellar_sdk.network import Network
+from stellar_sdk.operation import (
+    AccountMerge,
+    AllowTrust,
+    BumpSequence,
+    ChangeTrust,
+    CreateAccount,
+    CreatePassiveSellOffer,
+    Inflation,
+    ManageBuyOffer,
+    ManageData,
+    ManageSellOffer,
+    Operation,
+    PathPaymentStrictReceive,
+    PathPaymentStrictSend,
+    Payment,
+    SetOptions,
+)
+from stellar_sdk.signer import Signer
+from stellar_sdk.transaction import Transaction
+from stellar_sdk.transaction_envelope import TransactionEnvelope
+
+V0_XDR = "AAAAAMvXcdYjKhx0qxnsDsczxKuqa/65lZz6sjjHHczyh50JAAAAyAAAAAAAAAABAAAAAQAAAAAAADA5AAAAAAAA3dUAAAACAAAAAAAAAGQAAAACAAAAAAAAAAEAAAAA0pjFgVcRZZHpMgnpXHpb/xIbLh0/YYto0PzI7+Xl5HAAAAAAAAAAAlQL5AAAAAAAAAAACgAAAAVoZWxsbwAAAAAAAAEAAAAFd29ybGQAAAAAAAAAAAAAAvKHnQkAAABAM4dg0J1LEFBmbDESJ5d+60WCuZC8lnA80g45qyEgz2oRBSNw1mOfZETnL/BgrebkG/K03oI2Wqcs9lvDKrDGDE0sOBsAAAAglOgiOlGKwWqMsRCrGVLvFNosELJkZFw4yLPYK9KyAAA="
+V1_XDR = "AAAAAgAAAADL13HWIyocdKsZ7A7HM8Srqmv+uZWc+rI4xx3M8oedCQAAAMgAAAAAAAAAAQAAAAEAAAAAAAAwOQAAAAAAAN3VAAAAAgAAAAAAAABkAAAAAQAAAAAAAAABAAAAANKYxYFXEWWR6TIJ6Vx6W/8SGy4dP2GLaND8yO/l5eRwAAAAAAAAAAJUC+QAAAAAAAAAAAHyh50JAAAAQCXOQnmno3he687bKRtDc6+BXRUf8t+RnTuHy+sKf35UjfFiQbIge+txehmg0N61JsFWfwbL0JtgOjzyeZw5JAs="
+SOURCE = "GDF5O4OWEMVBY5FLDHWA5RZTYSV2U276XGKZZ6VSHDDR3THSQ6OQS7UM"
+
+
+class TestLazyTransactionEnvelope:
+    @pytest.mark.parametrize("xdr, v1", [(V0_XDR, False), (V1_XDR, True)])
+    def test_from_xdr(self, xdr, v1):
+        te = LazyTransactionEnvelope.from_xdr(xdr, Network.PUBLIC_NETWORK_PASSPHRASE)
+        assert te.v1 is v1
+        assert te.source == SOURCE
+        assert te.fee == 200
+        assert te.sequence == 1
+        assert te.time_bounds.min_time == 12345
+        assert te.time_bounds.max_time == 56789
+        assert te._operations is None
+        assert te.to_xdr() == xdr
+
+    @pytest.mark.parametrize("xdr", [V0_XDR, V1_XDR])
+    def test_hash(self, xdr):
+        te = LazyTransactionEnvelope.from_xdr(xdr, Network.PUBLIC_NETWORK_PASSPHRASE)
+        expected = TransactionEnvelope.from_xdr(xdr, Network.PUBLIC_NETWORK_PASSPHRASE)
+        assert te.signature_base() == expected.signature_base()
+        assert te.hash() == expected.hash()
+        assert te.hash_hex() == expected.hash_hex()
+
+    @pytest.mark.parametrize("xdr", [V0_XDR, V1_XDR])
+    def test_hash_does_not_decode_body(self, xdr, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("decoded")
+
+        monkeypatch.setattr(Operation, "from_xdr_object", fail)
+        monkeypatch.setattr(Memo, "from_xdr_object", fail)
+        te = LazyTransactionEnvelope.from_xdr(xdr, Network.PUBLIC_NETWORK_PASSPHRASE)
+        te.hash()
+        assert te._memo is None
+        assert te._operations is None
+        assert te._signatures is None
+
+    def test_hash_all_operations(self):
+        destination = "GDJJRRMBK4IWLEPJGIE6SXD2LP7REGZODU7WDC3I2D6MR37F4XSHBKX2"
+        usd = Asset("USD", destination)
+        eurt = Asset("EURT0000000", destination)
+        ops = [
+            CreateAccount(destination, "10"),
+            Payment(destination, usd, "1", source=SOURCE),
+            PathPaymentStrictReceive(destination, usd, "1", eurt, "1", [Asset.native()]),
+            ManageSellOffer(usd, eurt, "1", "1.5", 12),
+            CreatePassiveSellOffer(usd, Asset.native(), "1", "0.5"),
+            SetOptions(
+                inflation_dest=destination,
+                master_weight=1,
+                signer=Signer.ed25519_public_key(destination, 1),
+                home_domain="example.com",
+            ),
+            ChangeTrust(eurt),
+            AllowTrust(destination, "USD", True),
+            AccountMerge(destination),
+            Inflation(),
+            ManageData("hello", None),
+            BumpSequence(100),
+            ManageBuyOffer(usd, eurt, "1", "1.5"),
+            PathPaymentStrictSend(destination, usd, "1", eurt, "1", []),
+        ]
+        tx = Transaction(SOURCE, 1, 1400, ops, TextMemo("lazy"))
+        te = TransactionEnvelope(tx, Network.PUBLIC_NETWORK_PASSPHRASE)
+        te.sign_hashx(b"a" * 32)
+        lazy_te = LazyTransactionEnvelope.from_xdr(
+            te.to_xdr(), Network.PUBLIC_NETWORK_PASSPHRASE
+        )
+        assert lazy_te.hash() == te.hash()
+        assert lazy_te.memo == TextMemo("lazy")
+        assert lazy_te.operations == ops
+
+    def test_lazy_fields(self):
+        te = LazyTransactionEnvelope.from_xdr(
+            V0_XDR, Network.PUBLIC_NETWORK_PASSPHRASE
+        )
+        expected = TransactionEnvelope.from_xdr(
+            V0_XDR, Network.PUBLIC_NETWORK_PASSPHRASE
+        )
+        assert te.memo == IdMemo(100)
+        assert len(te.operations) == 2
+        assert isinstance(te.operations[0], Payment)
+        assert isinstance(te.operations[1], ManageData)
+        assert te.operations == expected.transaction.operations
+        assert [s.to_xdr() for s in te.signatures] == [
+            s.to_xdr() for s in expected.signatures
+        ]
+        assert te.operations is te.operations
+
+    def test_signatures_verify(self):
+        te = LazyTransactionEnvelope.from_xdr(
+            V1_XDR, Network.PUBLIC_NETWORK_PASSPHRASE
+        )
+        Keypair.from_public_key(SOURCE).verify(te.hash(), te.signatures[0].signature)
+
+    @pytest.mark.parametrize("xdr", [V0_XDR, V1_XDR])
+    def test_to_transaction_envelope(self, xdr):
+        te = LazyTransactionEnvelope.from_xdr(xdr, Network.PUBLIC_NETWORK_PASSPHRASE)
+        restore_te = te.to_transaction_envelope()
+        assert isinstance(restore_te, TransactionEnvelope)
+        assert restore_te.to_xdr() == xdr
+
+    def test_fee_bump_raise(self):
+        inner_te = TransactionEnvelope.from_xdr(
+            V1_XDR, Network.PUBLIC_NETWORK_PASSPHRASE
+        )
+        fee_bump_tx = FeeBumpTransaction(SOURCE, 400, inner_te)
+        xdr = FeeBumpTransactionEnvelope(
+            fee_bump_tx, Network.PUBLIC_NETWORK_PASSPHRASE
+        ).to_xdr()
+        with pytest.raises(ValueError, match="Invalid EnvelopeType"):
+            LazyTransactionEnvelope.from_xdr(xdr, Network.PUBLIC_NETWORK_PASSPHRASE)
@@ -0,0 +1,246 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from stellar_sdk.exceptions import ValueError
+from stellar_sdk.price import Price
+from stellar_sdk.records import (
+    AccountRecord,
+    BalanceRecord,
+    EffectRecord,
+    ManageSellOfferOperationRecord,
+    OfferRecord,
+    OperationRecord,
+    PaymentOperationRecord,
+    TradeRecord,
+    to_stroops,
+)
+
+
+def payment_operation():
+    return {
+        "_links": {"self": {"href": "https://horizon.stellar.org/operations/1"}},
+        "id": "121693057904021505",
+        "paging_token": "121693057904021505",
+        "transaction_successful": True,
+        "source_account": "GCNY5OXYSY4FKHOPT2SPOQZAOEIGXB5LBYW3HVU3OWSTQITS65M5RCNY",
+        "type": "payment",
+        "type_i": 1,
+        "created_at": "2020-02-20T09:33:04Z",
+        "transaction_hash": "3389e9f0f1a65f19736cacf544c2e825313e8447f569233bb8db39aa607c8889",
+        "asset_type": "native",
+        "from": "GCNY5OXYSY4FKHOPT2SPOQZAOEIGXB5LBYW3HVU3OWSTQITS65M5RCNY",
+        "to": "GDJJRRMBK4IWLEJ7YMTFYSXLJ2AYNZT5TZE5NUL2TMDV7KKBMJY4OKWN",
+        "amount": "12.0000100",
+        "new_field": "x",
+    }
+
+
+class TestToStroops:
+    @pytest.mark.parametrize(
+        "amount, stroops",
+        [
+            ("0", 0),
+            ("10", 100000000),
+            ("10.0000100", 100000100),
+            ("0.0000001", 1),
+            (".5", 5000000),
+            ("-1.5", -15000000),
+            ("922337203685.4775807", 9223372036854775807),
+        ],
+    )
+    def test_to_stroops(self, amount, stroops):
+        assert to_stroops(amount) == stroops
+
+    @pytest.mark.parametrize(
+        "amount", ["", ".", "1.00000001", "1,5", "1e7", "abc", "1.-5", "--1"]
+    )
+    def test_to_stroops_invalid_raise(self, amount):
+        with pytest.raises(ValueError, match="Invalid amount"):
+            to_stroops(amount)
+
+
+class TestRecord:
+    def test_operation_record(self):
+        record = OperationRecord.from_dict(payment_operation())
+        assert isinstance(record, PaymentOperationRecord)
+        assert record.id == "121693057904021505"
+        assert record.amount == 120000100
+        assert (
+            record.from_ == "GCNY5OXYSY4FKHOPT2SPOQZAOEIGXB5LBYW3HVU3OWSTQITS65M5RCNY"
+        )
+        assert record.asset_code is None
+        assert record.created_at == datetime(2020, 2, 20, 9, 33, 4, tzinfo=timezone.utc)
+        assert record.links is None
+        assert record.extra == {"new_field": "x"}
+
+    def test_slots(self):
+        record = OperationRecord.from_dict(payment_operation())
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.amount = 1
+        with pytest.raises(AttributeError):
+            record.foo = 1
+
+    def test_lazy_decoding(self):
+        record = OperationRecord.from_dict(payment_operation())
+        assert record._amount == "12.0000100"
+        assert record.amount == 120000100
+        assert record._amount == 120000100
+        assert record.amount == 120000100
+
+    def test_invalid_field_raises_on_access(self):
+        data = payment_operation()
+        data["amount"] = "invalid"
+        record = OperationRecord.from_dict(data)
+        assert record.id == "121693057904021505"
+        with pytest.raises(ValueError):
+            record.amount
+
+    def test_keep_links(self):
+        record = OperationRecord.from_dict(payment_operation(), keep_links=True)
+        assert record.links == {
+            "self": {"href": "https://horizon.stellar.org/operations/1"}
+        }
+
+    def test_getitem(self):
+        record = OperationRecord.from_dict(payment_operation())
+        assert record["paging_token"] == "121693057904021505"
+        assert record["from"] == record.from_
+        assert record["amount"] == 120000100
+        assert record["new_field"] == "x"
+        assert record["_links"] is None
+        with pytest.raises(KeyError):
+            record["missing"]
+
+    def test_dict_methods(self):
+        data = payment_operation()
+        record = OperationRecord.from_dict(payment_operation())
+        del data["_links"]
+        assert sorted(record.keys()) == sorted(data)
+        assert record.keys()[-1] == "new_field"
+        assert dict(record.items()) == {
+            **data,
+            "created_at": datetime(2020, 2, 20, 9, 33, 4, tzinfo=timezone.utc),
+            "amount": 120000100,
+        }
+        assert "amount" in record
+        assert "new_field" in record
+        assert "_links" not in record
+        assert "asset_code" not in record
+        assert "missing" not in record
+        assert record.get("amount") == 120000100
+        assert record.get("new_field") == "x"
+        assert record.get("asset_code", "XLM") == "XLM"
+        assert record.get("missing") is None
+
+    def test_dict_methods_do_not_decode(self):
+        data = payment_operation()
+        data["amount"] = "invalid"
+        record = OperationRecord.from_dict(data)
+        assert "amount" in record
+        assert "amount" in record.keys()
+        with pytest.raises(ValueError):
+            record.items()
+
+    def test_unknown_operation_type(self):
+        record = OperationRecord.from_dict(
+            {"id": "1", "type": "new_operation", "foo": "bar"}
+        )
+        assert type(record) is OperationRecord
+        assert record.extra == {"foo": "bar"}
+
+    def test_offer_operation(self):
+        record = OperationRecord.from_dict(
+            {
+                "id": "1",
+                "type": "manage_sell_offer",
+                "amount": "100.0000000",
+                "price": "0.5000000",
+                "price_r": {"n": 1, "d": 2},
+                "offer_id": "123",
+            }
+        )
+        assert isinstance(record, ManageSellOfferOperationRecord)
+        assert record.amount == 1000000000
+        assert record.price == "0.5000000"
+        assert record.price_r == Price(1, 2)
+        assert record.offer_id == 123
+
+    def test_account_record(self):
+        record = AccountRecord.from_dict(
+            {
+                "id": "GDJJRRMBK4IWLEJ7YMTFYSXLJ2AYNZT5TZE5NUL2TMDV7KKBMJY4OKWN",
+                "sequence": "120192344791187458",
+                "balances": [
+                    {
+                        "balance": "1.0000000",
+                        "limit": "922337203685.4775807",
+                        "asset_type": "credit_alphanum4",
+                        "asset_code": "USD",
+                        "asset_issuer": "GCNY5OXYSY4FKHOPT2SPOQZAOEIGXB5LBYW3HVU3OWSTQITS65M5RCNY",
+                    },
+                    {"balance": "9999.9999900", "asset_type": "native"},
+                ],
+                "signers": [
+                    {
+                        "weight": 1,
+                        "key": "GDJJRRMBK4IWLEJ7YMTFYSXLJ2AYNZT5TZE5NUL2TMDV7KKBMJY4OKWN",
+                        "type": "ed25519_public_key",
+                    }
+                ],
+            }
+        )
+        assert record.sequence == 120192344791187458
+        assert [type(b) for b in record.balances] == [BalanceRecord, BalanceRecord]
+        assert record.balances[0].limit == 9223372036854775807
+        assert record.balances[1].balance == 99999999900
+        assert record.balances[1].limit is None
+        assert record.signers[0].weight == 1
+
+    def test_trade_and_offer_records(self):
+        trade = TradeRecord.from_dict(
+            {
+                "id": "107449584845914113-0",
+                "base_offer_id": "104078276",
+                "base_amount": "4433.2000000",
+                "counter_amount": "10.0000000",
+                "price": {"n": 5, "d": 2216},
+            }
+        )
+        assert trade.base_offer_id == 104078276
+        assert trade.base_amount == 44332000000
+        assert trade.price == Price(5, 2216)
+        offer = OfferRecord.from_dict(
+            {
+                "id": "2611",
+                "amount": "7.0000000",
+                "price_r": {"n": 1, "d": 100},
+                "selling": {"asset_type": "native"},
+            }
+        )
+        assert offer.id == 2611
+        assert offer.amount == 70000000
+        assert offer.selling == {"asset_type": "native"}
+
+    def test_effect_record(self):
+        effect = EffectRecord.from_dict(
+            {
+                "id": "0000000012884905985-0000000001",
+                "type": "account_created",
+                "starting_balance": "10000.0000000",
+                "account": "GDJJRRMBK4IWLEJ7YMTFYSXLJ2AYNZT5TZE5NUL2TMDV7KKBMJY4OKWN",
+            }
+        )
+        assert effect.starting_balance == 100000000000
+        assert effect.amount is None
+
+    def test_equal(self):
+        assert OperationRecord.from_dict(
+            payment_operation()
+        ) == OperationRecord.from_dict(payment_operation())
+        other = payment_operation()
+        other["amount"] = "1"
+        assert OperationRecord.from_dict(
+            payment_operation()
+        ) != OperationRecord.from_dict(other)
@@ -0,0 +1,196 @@
+import asyncio
+import time
+
+import pytest
+
+from stellar_sdk.call_builder.payments_call_builder import PaymentsCallBuilder
+from stellar_sdk.checkpoint import MemoryCheckpointStore
+from stellar_sdk.client.base_async_client import BaseAsyncClient
+from stellar_sdk.client.base_sync_client import BaseSyncClient
+from stellar_sdk.exceptions import StreamClientError, ValueError
+from stellar_sdk.stream_batching import Batch, abatch_stream, batch_stream
+
+HORIZON_URL = "https://horizon.stellar.org"
+
+
+def event(i):
+    return {"id": str(i), "paging_token": str(i)}
+
+
+def events(count, pauses=(), pause=0.3, error=None):
+    """Yield ``count`` events, pausing before the events in ``pauses``."""
+    for i in range(count):
+        if i in pauses:
+            time.sleep(pause)
+        yield event(i)
+    if error is not None:
+        raise error
+
+
+async def aevents(count, pauses=(), pause=0.3, error=None):
+    for i in range(count):
+        if i in pauses:
+            await asyncio.sleep(pause)
+        yield event(i)
+    if error is not None:
+        raise error
+
+
+def ids(batches):
+    return [[e["id"] for e in batch] for batch in batches]
+
+
+class FakeSyncClient(BaseSyncClient):
+    def __init__(self, count):
+        self.count = count
+        self.cursors = []
+
+    def get(self, url, params=None):
+        raise NotImplementedError
+
+    def post(self, url, data=None):
+        raise NotImplementedError
+
+    def stream(self, url, params=None):
+        self.cursors.append(params.get("cursor"))
+        return events(self.count)
+
+    def close(self):
+        pass
+
+
+class FakeAsyncClient(BaseAsyncClient):
+    def __init__(self, count):
+        self.count = count
+        self.cursors = []
+
+    async def get(self, url, params=None):
+        raise NotImplementedError
+
+    async def post(self, url, data=None):
+        raise NotImplementedError
+
+    async def stream(self, url, params=None):
+        cursor = params.get("cursor")
+        self.cursors.append(cursor)
+        start = 0 if cursor in (None, "now") else int(cursor) + 1
+        for i in range(start, self.count):
+            yield event(i)
+
+    async def close(self):
+        pass
+
+
+class TestBatchStream:
+    def test_max_size(self):
+        batches = list(batch_stream(events(7), max_size=3, max_linger=10))
+        assert ids(batches) == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+        assert [batch.cursor for batch in batches] == ["2", "5", "6"]
+        assert all(isinstance(batch, Batch) for batch in batches)
+
+    def test_max_linger(self):
+        start = time.monotonic()
+        batches = list(
+            batch_stream(events(5, pauses=(3,)), max_size=100, max_linger=0.1)
+        )
+        assert ids(batches) == [["0", "1", "2"], ["3", "4"]]
+        assert time.monotonic() - start < 1
+
+    def test_error(self):
+        error = StreamClientError("1", "failed")
+        batches = batch_stream(events(2, error=error), max_size=10, max_linger=10)
+        assert ids([next(batches)]) == [["0", "1"]]
+        with pytest.raises(StreamClientError):
+            next(batches)
+
+    def test_close(self):
+        batches = batch_stream(events(1000), max_size=2, max_linger=10)
+        assert ids([next(batches)]) == [["0", "1"]]
+        batches.close()
+
+    def test_empty(self):
+        assert list(batch_stream([], max_size=2)) == []
+
+    def test_invalid_args(self):
+        with pytest.raises(ValueError, match="max_size should be greater than 0"):
+            batch_stream([], max_size=0)
+        with pytest.raises(ValueError, match="max_linger should not be negative"):
+            batch_stream([], max_linger=-1)
+
+    @pytest.mark.asyncio
+    async def test_async_max_size(self):
+        batches = [
+            batch async for batch in abatch_stream(aevents(7), max_size=3, max_linger=10)
+        ]
+        assert ids(batches) == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+        assert [batch.cursor for batch in batches] == ["2", "5", "6"]
+
+    @pytest.mark.asyncio
+    async def test_async_max_linger(self):
+        batches = [
+            batch
+            async for batch in abatch_stream(
+                aevents(6, pauses=(2, 4)), max_size=100, max_linger=0.1
+            )
+        ]
+        assert ids(batches) == [["0", "1"], ["2", "3"], ["4", "5"]]
+
+    @pytest.mark.asyncio
+    async def test_async_error(self):
+        error = StreamClientError("1", "failed")
+        batches = abatch_stream(aevents(2, error=error), max_size=10, max_linger=10)
+        assert ids([await batches.__anext__()]) == [["0", "1"]]
+        with pytest.raises(StreamClientError):
+            await batches.__anext__()
+
+    @pytest.mark.asyncio
+    async def test_async_base_exception(self):
+        class Stop(BaseException):
+            pass
+
+        batches = abatch_stream(aevents(2, error=Stop()), max_size=10, max_linger=10)
+        assert ids([await batches.__anext__()]) == [["0", "1"]]
+        with pytest.raises(Stop):
+            await asyncio.wait_for(batches.__anext__(), 1)
+
+    @pytest.mark.asyncio
+    async def test_async_close(self):
+        batches = abatch_stream(aevents(1000), max_size=2, max_linger=10)
+        assert ids([await batches.__anext__()]) == [["0", "1"]]
+        await batches.aclose()
+
+
+class TestCallBuilderStreamBatches:
+    def test_stream_batches(self):
+        builder = PaymentsCallBuilder(HORIZON_URL, FakeSyncClient(5))
+        batches = list(builder.stream_batches(max_size=2, max_linger=10))
+        assert ids(batches) == [["0", "1"], ["2", "3"], ["4"]]
+
+    def test_stream_batches_checkpoint(self):
+        store = MemoryCheckpointStore()
+        builder = PaymentsCallBuilder(HORIZON_URL, FakeSyncClient(10))
+        builder.checkpoint(store, "payments", every_events=4, every_seconds=60)
+        batches = builder.stream_batches(max_size=3, max_linger=10)
+        next(batches)
+        next(batches)
+        assert store.load("payments") is None
+        next(batches)
+        # Two batches of 3 events are processed.
+        assert store.load("payments") == "5"
+        batches.close()
+        assert store.load("payments") == "5"
+        assert builder._checkpointer.commits == 1
+
+    @pytest.mark.asyncio
+    async def test_async_stream_batches_checkpoint(self):
+        store = MemoryCheckpointStore()
+        store.save("payments", "3")
+        client = FakeAsyncClient(10)
+        builder = PaymentsCallBuilder(HORIZON_URL, client).cursor("now")
+        builder.checkpoint(store, "payments", every_events=100, every_seconds=60)
+        batches = [
+            batch async for batch in builder.stream_batches(max_size=4, max_linger=10)
+        ]
+        assert client.cursors == ["3"]
+        assert ids(batches) == [["4", "5", "6", "7"], ["8", "9"]]
+        assert store.load("payments") == "9"
@@ -0,0 +1,200 @@
+import asyncio
+import json
+
+import pytest
+
+from stellar_sdk.call_builder.effects_call_builder import EffectsCallBuilder
+from stellar_sdk.call_builder.ledgers_call_builder import LedgersCallBuilder
+from stellar_sdk.call_builder.payments_call_builder import PaymentsCallBuilder
+from stellar_sdk.client.base_async_client import BaseAsyncClient
+from stellar_sdk.client.base_sync_client import BaseSyncClient
+from stellar_sdk.exceptions import StreamClientError, TypeError, ValueError
+from stellar_sdk.stream_supervisor import StreamSupervisor, SupervisedStream
+
+HORIZON_URL = "https://horizon.stellar.org"
+
+
+def event(i):
+    return {"id": str(i), "paging_token": str(i), "created_at": "2020-01-01T00:00:00Z"}
+
+
+class FakeAsyncClient(BaseAsyncClient):
+    """Streams the events after the cursor, and fails after ``fail_after`` events
+    on the first connection."""
+
+    def __init__(self, count, fail_after=None):
+        self.count = count
+        self.fail_after = fail_after
+        self.cursors = []
+
+    async def get(self, url, params=None):
+        raise NotImplementedError
+
+    async def post(self, url, data=None):
+        raise NotImplementedError
+
+    async def stream(self, url, params=None):
+        cursor = params.get("cursor")
+        self.cursors.append(cursor)
+        start = 0 if cursor in (None, "now") else int(cursor) + 1
+        for i in range(start, self.count):
+            if len(self.cursors) == 1 and i == self.fail_after:
+                raise StreamClientError(str(i - 1), "Failed to get stream message.")
+            await asyncio.sleep(0)
+            yield event(i)
+        while True:
+            await asyncio.sleep(1)
+
+    async def close(self):
+        pass
+
+
+async def take(stream, n):
+    return [(await stream.get())["id"] for _ in range(n)]
+
+
+class TestStreamSupervisor:
+    @pytest.mark.asyncio
+    async def test_streams_and_reconnects(self):
+        client = FakeAsyncClient(10, fail_after=4)
+        async with StreamSupervisor(retry_delay=0) as supervisor:
+            payments = supervisor.add_stream(
+                "payments", PaymentsCallBuilder(HORIZON_URL, client).cursor("now")
+            )
+            effects = supervisor.add_stream(
+                "effects", EffectsCallBuilder(HORIZON_URL, FakeAsyncClient(3))
+            )
+            assert await take(payments, 10) == [str(i) for i in range(10)]
+            assert await take(effects, 3) == ["0", "1", "2"]
+        assert client.cursors == ["now", "3"]
+        assert payments.reconnects == 1
+        assert isinstance(payments.last_error, StreamClientError)
+        assert payments.cursor == "9"
+        assert payments.lag > 0
+        stats = {s["name"]: s for s in supervisor.stats()}
+        assert stats["payments"]["received"] == 10
+        assert stats["effects"]["reconnects"] == 0
+
+    @pytest.mark.asyncio
+    async def test_block(self):
+        async with StreamSupervisor() as supervisor:
+            stream = supervisor.add_stream(
+                "payments", PaymentsCallBuilder(HORIZON_URL, FakeAsyncClient(10)), maxsize=3
+            )
+            await asyncio.sleep(0.05)
+            # the stream waits for the consumer
+            assert stream.qsize == 3
+            assert stream.received == 4
+            assert await take(stream, 10) == [str(i) for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self):
+        async with StreamSupervisor() as supervisor:
+            stream = supervisor.add_stream(
+                "payments",
+                PaymentsCallBuilder(HORIZON_URL, FakeAsyncClient(10)),
+                maxsize=3,
+                overflow="drop_oldest",
+            )
+            await asyncio.sleep(0.05)
+            assert stream.dropped == 7
+            assert await take(stream, 3) == ["7", "8", "9"]
+
+    @pytest.mark.asyncio
+    async def test_spill(self, tmp_path):
+        async with StreamSupervisor() as supervisor:
+            stream = supervisor.add_stream(
+                "payments",
+                PaymentsCallBuilder(HORIZON_URL, FakeAsyncClient(10)),
+                maxsize=3,
+                overflow="spill",
+                spill_dir=str(tmp_path),
+            )
+            await asyncio.sleep(0.05)
+            assert (stream.spilled, stream.qsize) == (7, 10)
+            assert await take(stream, 5) == ["0", "1", "2", "3", "4"]
+            assert await take(stream, 5) == ["5", "6", "7", "8", "9"]
+            assert stream.qsize == 0
+            assert stream._spill_file.tell() == 0
+
+    @pytest.mark.asyncio
+    async def test_add_and_remove_running(self):
+        async with StreamSupervisor() as supervisor:
+            stream = supervisor.add_stream(
+                "payments", PaymentsCallBuilder(HORIZON_URL, FakeAsyncClient(2))
+            )
+            async for payment in stream:
+                if payment["id"] == "1":
+                    break
+            await supervisor.remove_stream("payments")
+            assert not supervisor.streams
+            with pytest.raises(KeyError):
+                await supervisor.remove_stream("payments")
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_on_unexpected_error(self):
+        class FailingClient(FakeAsyncClient):
+            async def stream(self, url, params=None):
+                yield event(0)
+                raise RuntimeError("unexpected")
+
+        async with StreamSupervisor(retry_delay=0) as supervisor:
+            stream = supervisor.add_stream(
+                "payments", PaymentsCallBuilder(HORIZON_URL, FailingClient(1))
+            )
+            task = supervisor._tasks["payments"]
+            assert await take(stream, 1) == ["0"]
+            await asyncio.wait_for(task, 1)
+            # The error is kept by the stream, not raised by its task.
+            assert task.exception() is None
+            assert isinstance(stream.last_error, RuntimeError)
+            assert stream.reconnects == 0
+
+    def test_stream_added_before_the_event_loop(self):
+        supervisor = StreamSupervisor()
+        stream = supervisor.add_stream(
+            "payments", PaymentsCallBuilder(HORIZON_URL, FakeAsyncClient(2))
+        )
+        assert stream.qsize == 0
+
+        async def consume():
+            async with supervisor:
+                return await take(stream, 2)
+
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(consume()) == ["0", "1"]
+        finally:
+            loop.close()
+
+    def test_invalid_args_raise(self):
+        supervisor = StreamSupervisor()
+        builder = PaymentsCallBuilder(HORIZON_URL, FakeAsyncClient(0))
+        supervisor.add_stream("payments", builder)
+        with pytest.raises(ValueError, match="A stream named 'payments' already exists."):
+            supervisor.add_stream("payments", builder)
+        with pytest.raises(ValueError, match="overflow should be one of block, drop_oldest, spill"):
+            supervisor.add_stream("other", builder, overflow="ignore")
+        with pytest.raises(ValueError, match="maxsize should be greater than 0"):
+            supervisor.add_stream("other", builder, maxsize=0)
+        with pytest.raises(ValueError, match="retry_delay should not be negative"):
+            StreamSupervisor(retry_delay=-1)
+
+    def test_sync_client_raise(self):
+        class FakeSyncClient(BaseSyncClient):
+            def get(self, url, params=None):
+                pass
+
+            def post(self, url, data=None):
+                pass
+
+            def stream(self, url, params=None):
+                pass
+
+            def close(self):
+                pass
+
+        with pytest.raises(TypeError, match="requires an asynchronous client"):
+            StreamSupervisor().add_stream(
+                "ledgers", LedgersCallBuilder(HORIZON_URL, FakeSyncClient())
+            )
@@ -1,2 +1,108 @@
+import pytest
+
+from stellar_sdk.exceptions import (
+    Ed25519PublicKeyInvalidError,
+    TypeError,
+    ValueError,
+)
+from stellar_sdk.strkey import (
+    StrKey,
+    _calculate_checksum,
+    decode_check,
+    decode_many,
+    encode_check,
+    encode_many,
+    is_valid,
+    try_decode_check,
+)
+
+ACCOUNT_ID = "GAAQEAYEAUDAOCAJBIFQYDIOB4IBCEQTCQKRMFYYDENBWHA5DYPSABOV"
+ACCOUNT_ID_RAW = bytes(range(1, 33))
+SECRET = "SAAQEAYEAUDAOCAJBIFQYDIOB4IBCEQTCQKRMFYYDENBWHA5DYPSBF5K"
+
+
 class TestStrKey:
-    pass
+    def test_encode_decode_round_trip(self):
+        assert StrKey.encode_ed25519_public_key(ACCOUNT_ID_RAW) == ACCOUNT_ID
+        assert StrKey.decode_ed25519_public_key(ACCOUNT_ID) == ACCOUNT_ID_RAW
+
+    def test_checksum(self):
+        # CRC16-XModem check value
+        assert _calculate_checksum(b"123456789") == b"\xc3\x31"
+
+    def test_is_valid(self):
+        assert is_valid("ed25519_public_key", ACCOUNT_ID)
+        assert is_valid("ed25519_secret_seed", SECRET)
+        assert not is_valid("ed25519_secret_seed", ACCOUNT_ID)
+        assert not is_valid("ed25519_public_key", ACCOUNT_ID[:-1] + "A")
+        assert not is_valid("ed25519_public_key", ACCOUNT_ID[:-1])
+        assert not is_valid("ed25519_public_key", ACCOUNT_ID.lower())
+        assert not is_valid("ed25519_public_key", "")
+        assert not is_valid("unknown", ACCOUNT_ID)
+
+    def test_try_decode_check(self):
+        result = try_decode_check("ed25519_public_key", ACCOUNT_ID)
+        assert result.data == ACCOUNT_ID_RAW
+        assert result.error is None
+
+    @pytest.mark.parametrize(
+        "version_byte_name, encoded, error, message",
+        [
+            (
+                "ed25519_public_key",
+                ACCOUNT_ID[:-1] + "A",
+                ValueError,
+                "Invalid checksum",
+            ),
+            ("ed25519_public_key", SECRET, TypeError, "Invalid version byte."),
+            ("ed25519_public_key", ACCOUNT_ID[:-2], ValueError, "Incorrect padding."),
+            (
+                "ed25519_public_key",
+                ACCOUNT_ID[:-1] + "1",
+                ValueError,
+                "Incorrect padding.",
+            ),
+            (
+                "ed25519_public_key",
+                ACCOUNT_ID[:-1],
+                ValueError,
+                "Invalid encoded bytes.",
+            ),
+            ("ed25519_public_key", "", TypeError, "Invalid version byte."),
+            ("ed25519_public_key", "GÄ", ValueError, "ASCII"),
+            ("unknown", ACCOUNT_ID, TypeError, "not a valid version byte name"),
+        ],
+    )
+    def test_try_decode_check_error(self, version_byte_name, encoded, error, message):
+        result = try_decode_check(version_byte_name, encoded)
+        assert result.data is None
+        assert isinstance(result.error, error)
+        assert message in str(result.error)
+        with pytest.raises(error, match=message):
+            decode_check(version_byte_name, encoded)
+
+    def test_decode_public_key_invalid_raise(self):
+        with pytest.raises(Ed25519PublicKeyInvalidError):
+            StrKey.decode_ed25519_public_key(SECRET)
+
+    def test_encode_many(self):
+        data_list = [ACCOUNT_ID_RAW, bytes(32), b"\xff" * 32]
+        assert encode_many("ed25519_public_key", data_list) == [
+            encode_check("ed25519_public_key", data) for data in data_list
+        ]
+        assert encode_many("ed25519_public_key", []) == []
+
+    def test_encode_many_raise(self):
+        with pytest.raises(TypeError, match="not a valid version byte name"):
+            encode_many("unknown", [ACCOUNT_ID_RAW])
+        with pytest.raises(ValueError, match="cannot encode null data"):
+            encode_many("ed25519_public_key", [ACCOUNT_ID_RAW, None])
+
+    def test_decode_many(self):
+        data_list = [ACCOUNT_ID_RAW, bytes(32), b"\xff" * 32]
+        encoded_list = encode_many("pre_auth_tx", data_list)
+        assert decode_many("pre_auth_tx", encoded_list) == data_list
+
+    def test_decode_many_raise(self):
+        with pytest.raises(ValueError, match="Invalid checksum"):
+            decode_many("ed25519_public_key", [ACCOUNT_ID, ACCOUNT_ID[:-1] + "A"])
@@ -95,3 +95,87 @@ class TestTransactionEnvelope:
             SignatureExistError, match="The preimage has already signed."
         ):
             te.sign_hashx(hashx)
+
+    def test_signature_base_cache(self):
+        source = Keypair.from_secret(
+            "SCCS5ZBI7WVIJ4SW36WGOQQIWJYCL3VOAULSXX3FB57USIO25EDOYQHH"
+        )
+        destination = "GDJJRRMBK4IWLEPJGIE6SXD2LP7REGZODU7WDC3I2D6MR37F4XSHBKX2"
+        ops = [Payment(destination, Asset.native(), "1000.0")]
+        tx = Transaction(source, 1, 200, ops, IdMemo(100), TimeBounds(12345, 56789))
+        te = TransactionEnvelope(tx, Network.PUBLIC_NETWORK_PASSPHRASE)
+        signature_base = te.signature_base()
+        tx_hash = te.hash()
+        assert te.signature_base() is signature_base
+        assert te.hash() is tx_hash
+
+        def assert_invalidated(network_passphrase=Network.PUBLIC_NETWORK_PASSPHRASE):
+            nonlocal signature_base
+            expected = TransactionEnvelope.from_xdr(te.to_xdr(), network_passphrase)
+            assert te.signature_base() is not signature_base
+            assert te.signature_base() == expected.signature_base()
+            assert te.hash() == expected.hash()
+            signature_base = te.signature_base()
+
+        tx.sequence = 2
+        assert_invalidated()
+        tx.operations[0].amount = "10"
+        assert_invalidated()
+        tx.operations.append(ManageData("hello", "world"))
+        assert_invalidated()
+        tx.memo = IdMemo(101)
+        assert_invalidated()
+        # Changes made in place to nested objects.
+        tx.time_bounds.max_time = 99999
+        assert_invalidated()
+        tx.memo.memo_id = 102
+        assert_invalidated()
+        # The V0 and V1 payloads of a transaction are the same.
+        tx.v1 = False
+        assert te.signature_base() == signature_base
+        tx.v1 = True
+        assert te.signature_base() == signature_base
+        signature_base = te.signature_base()
+        # Changes below the operations are not tracked.
+        tx.operations[0].asset.code = "USD"
+        tx.operations[0].asset.issuer = destination
+        assert te.signature_base() is signature_base
+        te.invalidate()
+        assert_invalidated()
+        te.network_id = Network(Network.TESTNET_NETWORK_PASSPHRASE).network_id()
+        assert_invalidated(Network.TESTNET_NETWORK_PASSPHRASE)
+        assert te.hash() != tx_hash
+
+    def test_signature_base_packed_once(self, monkeypatch):
+        source = Keypair.from_secret(
+            "SCCS5ZBI7WVIJ4SW36WGOQQIWJYCL3VOAULSXX3FB57USIO25EDOYQHH"
+        )
+        destination = "GDJJRRMBK4IWLEPJGIE6SXD2LP7REGZODU7WDC3I2D6MR37F4XSHBKX2"
+        ops = [Payment(destination, Asset.native(), "1000.0")]
+        tx = Transaction(source, 1, 200, ops, IdMemo(100), TimeBounds(12345, 56789))
+        te = TransactionEnvelope(tx, Network.PUBLIC_NETWORK_PASSPHRASE)
+        packed = []
+        to_xdr_object = Transaction.to_xdr_object
+
+        def counting_to_xdr_object(self):
+            packed.append(self)
+            return to_xdr_object(self)
+
+        monkeypatch.setattr(Transaction, "to_xdr_object", counting_to_xdr_object)
+        for _ in range(5):
+            te.sign(Keypair.random())
+        assert len(packed) == 1
+        assert len(te.signatures) == 5
+
+    def test_signature_base_v0_matches_v1(self):
+        source = Keypair.from_secret(
+            "SCCS5ZBI7WVIJ4SW36WGOQQIWJYCL3VOAULSXX3FB57USIO25EDOYQHH"
+        )
+        destination = "GDJJRRMBK4IWLEPJGIE6SXD2LP7REGZODU7WDC3I2D6MR37F4XSHBKX2"
+        ops = [Payment(destination, Asset.native(), "1000.0")]
+        tx_v0 = Transaction(source, 1, 200, ops, IdMemo(100), None, False)
+        tx_v1 = Transaction(source, 1, 200, ops, IdMemo(100), None, True)
+        te_v0 = TransactionEnvelope(tx_v0, Network.PUBLIC_NETWORK_PASSPHRASE)
+        te_v1 = TransactionEnvelope(tx_v1, Network.PUBLIC_NETWORK_PASSPHRASE)
+        assert te_v0.signature_base() == te_v1.signature_base()
+        assert te_v0.hash() == te_v1.hash()
@@ -0,0 +1,160 @@
+import base64
+import mmap
+
+import pytest
+
+from stellar_sdk.xdr import StellarXDR_const as const
+from stellar_sdk.xdr import StellarXDR_fastpack as fastpack
+from stellar_sdk.xdr import StellarXDR_pack as xdrlibpack
+from stellar_sdk.xdr import StellarXDR_type as types
+
+ENVELOPES = [
+    # v0
+    "AAAAAMvXcdYjKhx0qxnsDsczxKuqa/65lZz6sjjHHczyh50JAAAAyAAAAAAAAAABAAAAAQAAAAAAADA5AAAAAAAA3dUAAAACAAAAAAAAAGQAAAACAAAAAAAAAAEAAAAA0pjFgVcRZZHpMgnpXHpb/xIbLh0/YYto0PzI7+Xl5HAAAAAAAAAAAlQL5AAAAAAAAAAACgAAAAVoZWxsbwAAAAAAAAEAAAAFd29ybGQAAAAAAAAAAAAAAvKHnQkAAABAM4dg0J1LEFBmbDESJ5d+60WCuZC8lnA80g45qyEgz2oRBSNw1mOfZETnL/BgrebkG/K03oI2Wqcs9lvDKrDGDE0sOBsAAAAglOgiOlGKwWqMsRCrGVLvFNosELJkZFw4yLPYK9KyAAA=",
+    # v1
+    "AAAAAgAAAADL13HWIyocdKsZ7A7HM8Srqmv+uZWc+rI4xx3M8oedCQAAAMgAAAAAAAAAAQAAAAEAAAAAAAAwOQAAAAAAAN3VAAAAAgAAAAAAAABkAAAAAQAAAAAAAAABAAAAANKYxYFXEWWR6TIJ6Vx6W/8SGy4dP2GLaND8yO/l5eRwAAAAAAAAAAJUC+QAAAAAAAAAAAHyh50JAAAAQCXOQnmno3he687bKRtDc6+BXRUf8t+RnTuHy+sKf35UjfFiQbIge+txehmg0N61JsFWfwbL0JtgOjzyeZw5JAs=",
+]
+
+
+def to_plain(obj):
+    if isinstance(obj, list):
+        return [to_plain(item) for item in obj]
+    if hasattr(obj, "__dict__"):
+        return {k: to_plain(v) for k, v in vars(obj).items()}
+    return obj
+
+
+class TestXdrBackend:
+    def test_default_backend(self):
+        assert types.pack in (fastpack, xdrlibpack)
+
+    @pytest.mark.parametrize("xdr", ENVELOPES)
+    def test_unpack_matches_xdrlib(self, xdr):
+        data = base64.b64decode(xdr)
+        expected = xdrlibpack.StellarXDRUnpacker(data).unpack_TransactionEnvelope()
+        unpacker = fastpack.StellarXDRUnpacker(data)
+        result = unpacker.unpack_TransactionEnvelope()
+        unpacker.done()
+        assert to_plain(result) == to_plain(expected)
+
+    @pytest.mark.parametrize("xdr", ENVELOPES)
+    def test_pack_matches_xdrlib(self, xdr):
+        data = base64.b64decode(xdr)
+        envelope = xdrlibpack.StellarXDRUnpacker(data).unpack_TransactionEnvelope()
+        expected = xdrlibpack.StellarXDRPacker()
+        expected.pack_TransactionEnvelope(envelope)
+        packer = fastpack.StellarXDRPacker()
+        packer.pack_TransactionEnvelope(envelope)
+        assert packer.get_buffer() == expected.get_buffer() == data
+
+    @pytest.mark.parametrize("xdr", ENVELOPES)
+    def test_skip(self, xdr):
+        data = base64.b64decode(xdr)
+        unpacker = fastpack.StellarXDRUnpacker(data)
+        unpacker.skip_TransactionEnvelope()
+        unpacker.done()
+        # Each operation ends where the next one starts.
+        envelope = fastpack.StellarXDRUnpacker(data).unpack_TransactionEnvelope()
+        for operation in (envelope.v1 or envelope.v0).tx.operations:
+            packer = fastpack.StellarXDRPacker()
+            packer.pack_Operation(operation)
+            op_data = packer.get_buffer()
+            unpacker = fastpack.StellarXDRUnpacker(op_data)
+            unpacker.skip_Operation()
+            unpacker.done()
+
+    def test_skip_truncated_raise(self):
+        data = base64.b64decode(ENVELOPES[1])
+        with pytest.raises(EOFError):
+            fastpack.StellarXDRUnpacker(data[:-1]).skip_TransactionEnvelope()
+
+    def test_basic_types(self):
+        packer = fastpack.StellarXDRPacker()
+        packer.pack_int(-1)
+        packer.pack_uhyper(2 ** 64 - 1)
+        packer.pack_bool(True)
+        packer.pack_opaque(b"hello")
+        expected = xdrlibpack.StellarXDRPacker()
+        expected.pack_int(-1)
+        expected.pack_uhyper(2 ** 64 - 1)
+        expected.pack_bool(True)
+        expected.pack_opaque(b"hello")
+        assert packer.get_buffer() == expected.get_buffer()
+
+        unpacker = fastpack.StellarXDRUnpacker(packer.get_buffer())
+        assert unpacker.unpack_int() == -1
+        assert unpacker.unpack_uhyper() == 2 ** 64 - 1
+        assert unpacker.unpack_bool() is True
+        assert unpacker.unpack_opaque() == b"hello"
+        unpacker.done()
+
+    def test_pack_out_of_range_raise(self):
+        packer = fastpack.StellarXDRPacker()
+        with pytest.raises(fastpack.ConversionError):
+            packer.pack_uint(-1)
+        with pytest.raises(fastpack.ConversionError):
+            packer.pack_TimeBounds(types.TimeBounds(-1, 0))
+
+    def test_pack_invalid_enum_raise(self):
+        packer = fastpack.StellarXDRPacker()
+        with pytest.raises(fastpack.XDRError, match="not in enum MemoType"):
+            packer.pack_Memo(types.Memo(type=100))
+
+    def test_pack_array_too_long_raise(self):
+        packer = fastpack.StellarXDRPacker()
+        with pytest.raises(fastpack.XDRError, match="array length too long"):
+            packer.pack_Memo(types.Memo(type=const.MEMO_TEXT, text=b"a" * 29))
+
+    def test_unpack_truncated_raise(self):
+        data = base64.b64decode(ENVELOPES[1])
+        with pytest.raises(EOFError):
+            fastpack.StellarXDRUnpacker(data[:-1]).unpack_TransactionEnvelope()
+
+    def test_unpack_unextracted_data_raise(self):
+        data = base64.b64decode(ENVELOPES[1]) + b"\0\0\0\0"
+        unpacker = fastpack.StellarXDRUnpacker(data)
+        unpacker.unpack_TransactionEnvelope()
+        with pytest.raises(fastpack.XDRError, match="unextracted data remains"):
+            unpacker.done()
+
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview])
+    def test_unpack_buffer_protocol(self, wrap):
+        data = base64.b64decode(ENVELOPES[1])
+        unpacker = fastpack.StellarXDRUnpacker(wrap(data))
+        result = unpacker.unpack_TransactionEnvelope()
+        signature = result.v1.signatures[0]
+        assert type(signature.hint) is bytes
+        assert type(signature.signature) is bytes
+        expected = fastpack.StellarXDRUnpacker(data).unpack_TransactionEnvelope()
+        assert to_plain(result) == to_plain(expected)
+
+    def test_unpack_zero_copy(self):
+        data = bytearray(base64.b64decode(ENVELOPES[1]))
+        unpacker = fastpack.StellarXDRUnpacker(data, zero_copy=True)
+        result = unpacker.unpack_TransactionEnvelope()
+        unpacker.done()
+        source = result.v1.tx.sourceAccount.ed25519
+        signature = result.v1.signatures[0]
+        assert isinstance(source, memoryview)
+        assert isinstance(signature.hint, memoryview)
+        assert isinstance(signature.signature, memoryview)
+        assert bytes(source) == data[8:40]
+        assert bytes(signature.signature) == data[-64:]
+        data[8] ^= 0xFF
+        assert source[0] == data[8]
+
+    def test_unpack_zero_copy_mmap(self, tmp_path):
+        data = base64.b64decode(ENVELOPES[1])
+        path = tmp_path / "envelope.xdr"
+        path.write_bytes(data)
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            unpacker = fastpack.StellarXDRUnpacker(mm, zero_copy=True)
+            result = unpacker.unpack_TransactionEnvelope()
+            unpacker.done()
+            signature = result.v1.signatures[0].signature
+            assert bytes(signature) == data[-64:]
+            # The slices export the buffer of the map, it cannot be closed
+            # while they are alive.
+            del unpacker, result, signature
@@ -0,0 +1,113 @@
+import base64
+import gzip
+import io
+import struct
+
+import pytest
+
+from stellar_sdk.exceptions import ValueError
+from stellar_sdk.xdr import Xdr
+from stellar_sdk.xdr_stream import read_xdr_records
+
+ENVELOPE = base64.b64decode(
+    "AAAAAgAAAADL13HWIyocdKsZ7A7HM8Srqmv+uZWc+rI4xx3M8oedCQAAAMgAAAAAAAAAAQAAAAEAAAAAAAAwOQAAAAAAAN3VAAAAAgAAAAAAAABkAAAAAQAAAAAAAAABAAAAANKYxYFXEWWR6TIJ6Vx6W/8SGy4dP2GLaND8yO/l5eRwAAAAAAAAAAJUC+QAAAAAAAAAAAHyh50JAAAAQCXOQnmno3he687bKRtDc6+BXRUf8t+RnTuHy+sKf35UjfFiQbIge+txehmg0N61JsFWfwbL0JtgOjzyeZw5JAs="
+)
+
+
+def time_bounds(i):
+    packer = Xdr.StellarXDRPacker()
+    packer.pack_TimeBounds(Xdr.types.TimeBounds(i, i + 1))
+    return packer.get_buffer()
+
+
+def record(data, fragment_size=None):
+    fragment_size = fragment_size or len(data)
+    out = b""
+    for start in range(0, len(data), fragment_size):
+        fragment = data[start : start + fragment_size]
+        last = start + fragment_size >= len(data)
+        out += struct.pack(">I", len(fragment) | (0x80000000 if last else 0))
+        out += fragment
+    return out
+
+
+class PipeStream(io.RawIOBase):
+    """A stream supporting neither ``peek`` nor ``seek``, like a pipe."""
+
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self._data.readinto(b)
+
+
+class TestXdrStream:
+    def test_read_plain_file(self, tmp_path):
+        path = tmp_path / "ledger.xdr"
+        path.write_bytes(b"".join(record(time_bounds(i)) for i in range(100)))
+        records = list(read_xdr_records(str(path), "TimeBounds"))
+        assert [r.minTime for r in records] == list(range(100))
+        assert [r.maxTime for r in records] == list(range(1, 101))
+
+    def test_read_gzip_file(self, tmp_path):
+        path = tmp_path / "ledger.xdr.gz"
+        with gzip.open(path, "wb") as f:
+            for i in range(100):
+                f.write(record(time_bounds(i)))
+        records = list(read_xdr_records(path, Xdr.types.TimeBounds, buffer_size=64))
+        assert [r.minTime for r in records] == list(range(100))
+
+    def test_read_file_object(self):
+        fp = io.BytesIO(record(ENVELOPE) + record(ENVELOPE, fragment_size=12))
+        records = list(read_xdr_records(fp, "TransactionEnvelope"))
+        assert len(records) == 2
+        for r in records:
+            assert r.type == Xdr.const.ENVELOPE_TYPE_TX
+            assert r.v1.tx.fee == 200
+        assert not fp.closed
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_read_unseekable_file_object(self, compress):
+        data = b"".join(record(time_bounds(i)) for i in range(100))
+        fp = PipeStream(gzip.compress(data) if compress else data)
+        records = list(read_xdr_records(fp, "TimeBounds", buffer_size=64))
+        assert [r.minTime for r in records] == list(range(100))
+        assert not fp.closed
+
+    def test_gzip_reader_closed(self, monkeypatch):
+        readers = []
+
+        class GzipFile(gzip.GzipFile):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                readers.append(self)
+
+        monkeypatch.setattr("stellar_sdk.xdr_stream.gzip.GzipFile", GzipFile)
+        fp = io.BytesIO(gzip.compress(record(time_bounds(1))))
+        records = read_xdr_records(fp, "TimeBounds")
+        assert next(records).minTime == 1
+        records.close()
+        assert len(readers) == 1 and readers[0].closed
+        assert not fp.closed
+
+    def test_read_empty_file(self):
+        assert list(read_xdr_records(io.BytesIO(b""), "TimeBounds")) == []
+
+    def test_invalid_xdr_type_raise(self):
+        with pytest.raises(ValueError, match="NotAType is not a valid XDR type."):
+            read_xdr_records(io.BytesIO(b""), "NotAType")
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            record(time_bounds(1))[:-1],
+            record(time_bounds(1))[:2],
+            record(time_bounds(1), fragment_size=8)[:12],
+        ],
+    )
+    def test_truncated_file_raise(self, data):
+        with pytest.raises(ValueError, match="Unexpected end of file"):
+            list(read_xdr_records(io.BytesIO(data), "TimeBounds"))